@@ -0,0 +1,58 @@
+"""Compares the time to build the sdk dataclasses from decoded json, with
+dacite and with the compiled converters of cryptomarket.converter.
+
+run from the root of the repository with: python benchmarks/bench_converter.py
+"""
+import timeit
+from enum import Enum
+
+from dacite import Config
+from dacite import from_dict as dacite_from_dict
+
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses import Candle, Order, Transaction
+from cryptomarket.dataclasses.report import Report
+from cryptomarket.dataclasses.wsTicker import WSTicker
+from cryptomarket.dataclasses.wsTrade import WSTrade
+
+PAYLOADS = {
+    WSTrade: {'t': 1626861109494, 'i': 1555634969, 'p': '30881.96', 'q': '12.66828', 's': 'buy'},
+    WSTicker: {'t': 1614815872000, 'a': '0.031175', 'A': '0.03329', 'b': '0.031148', 'B': '0.10565',
+               'c': '0.031210', 'o': '0.030781', 'h': '0.031788', 'l': '0.030733', 'v': '62.587',
+               'q': '1.951420577', 'p': '0.000429', 'P': '1.39', 'L': 1182694927},
+    Candle: {'timestamp': '2021-06-20T20:00:00.000Z', 'open': '0.050459', 'close': '0.050087',
+             'min': '0.050000', 'max': '0.050511', 'volume': '1326.628', 'volume_quote': '66.555987736'},
+    Order: {'id': 828680665, 'client_order_id': 'f4307c6e507e49019907c917b6d7a084', 'symbol': 'ETHBTC',
+            'side': 'sell', 'status': 'partiallyFilled', 'type': 'limit', 'time_in_force': 'GTC',
+            'quantity': '0.012', 'quantity_cumulative': '0.005', 'price': '0.046001', 'price_average': '0.046001',
+            'post_only': False, 'created_at': '2021-04-13T12:38:43.317Z', 'updated_at': '2021-04-13T12:38:43.317Z',
+            'trades': [{'id': 1361335, 'quantity': '0.005', 'price': '0.046001', 'fee': '0.0000002',
+                        'taker': True, 'timestamp': '2021-04-13T12:38:43.317Z'}]},
+    Report: {'id': 828680665, 'client_order_id': 'f4307c6e507e49019907c917b6d7a084', 'symbol': 'ETHBTC',
+             'side': 'sell', 'status': 'new', 'type': 'limit', 'time_in_force': 'GTC', 'quantity': '0.012',
+             'quantity_cumulative': '0', 'price': '0.046001', 'post_only': False,
+             'created_at': '2021-04-13T12:38:43.317Z', 'updated_at': '2021-04-13T12:38:43.317Z', 'report_type': 'new'},
+    Transaction: {'id': 3108434, 'status': 'SUCCESS', 'type': 'DEPOSIT', 'subtype': 'BLOCKCHAIN',
+                  'created_at': '2021-04-14T10:10:58.413Z', 'updated_at': '2021-04-14T10:18:13.455Z',
+                  'last_activity_at': '2021-04-14T10:18:13.455Z',
+                  'native': {'tx_id': '0c6ee92d-fdb3-4b6a-9d14-5c8e9e9b6a0c', 'index': 1, 'currency': 'ETH',
+                             'amount': '0.01', 'hash': '0xd1f0f9aa62d8e7d6c52d5e9a06b6e07c1b0b3f1b', 'address': '0xd959',
+                             'confirmations': 20, 'senders': ['0x0bd2']}},
+}
+
+
+def main(number: int = 20_000):
+    config = Config(cast=[Enum])
+    print(f'{"type":<12}{"dacite (us)":>14}{"compiled (us)":>16}{"speedup":>10}')
+    for data_class, data in PAYLOADS.items():
+        assert from_dict(data_class, data) == dacite_from_dict(data_class, data, config=config)
+        dacite_time = timeit.timeit(
+            lambda: dacite_from_dict(data_class, data, config=config), number=number)
+        compiled_time = timeit.timeit(
+            lambda: from_dict(data_class, data), number=number)
+        print(f'{data_class.__name__:<12}{dacite_time / number * 1e6:>14.2f}'
+              f'{compiled_time / number * 1e6:>16.2f}{dacite_time / compiled_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
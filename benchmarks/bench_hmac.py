@@ -0,0 +1,51 @@
+"""Measures the throughput of the signing of rest requests, with a new HMAC
+keyed for every request and with the HmacAuth signer, keyed once.
+
+run from the root of the repository with: python benchmarks/bench_hmac.py
+"""
+import timeit
+from base64 import b64encode
+from hashlib import sha256
+from hmac import HMAC
+from time import time
+
+from cryptomarket.hmac_auth import HmacAuth
+
+API_KEY = 'AB32B3201'
+SECRET_KEY = '21b12401f3c9e0b42d1f6e6a8a3b3b2c'
+REQUESTS = {
+    'GET with query': ('GET', '/api/3/spot/history/order', 'limit=100&symbols=ETHBTC', None),
+    'POST with body': ('POST', '/api/3/spot/order', None,
+                       b'{"symbol":"ETHBTC","side":"buy","quantity":"0.01","price":"0.046"}'),
+}
+
+
+def keyed_per_request(method, path, query, body, window='10000'):
+    """signs as every request did before, building the HMAC from the secret"""
+    message = [method, path]
+    if query:
+        message.append('?')
+        message.append(query)
+    if body:
+        message.append(body.decode())
+    timestamp = str(int(time() * 1000))
+    message.append(timestamp)
+    message.append(window)
+    signature = HMAC(key=SECRET_KEY.encode(), msg=''.join(message).encode(),
+                     digestmod=sha256).hexdigest()
+    data = [API_KEY, signature, timestamp, window]
+    return f'HS256 {b64encode(":".join(data).encode()).decode()}'
+
+
+def main(number: int = 100_000):
+    auth = HmacAuth(API_KEY, SECRET_KEY, window=10_000)
+    print(f'{"request":<16}{"keyed per request (us)":>24}{"keyed once (us)":>18}{"speedup":>10}')
+    for name, request in REQUESTS.items():
+        before = timeit.timeit(lambda: keyed_per_request(*request), number=number)
+        after = timeit.timeit(lambda: auth.get_credential(*request), number=number)
+        print(f'{name:<16}{before / number * 1e6:>24.2f}{after / number * 1e6:>18.2f}{before / after:>9.1f}x')
+    print(f'signatures per second, keyed once: {number / after:,.0f}')
+
+
+if __name__ == '__main__':
+    main()
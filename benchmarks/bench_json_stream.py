@@ -0,0 +1,55 @@
+"""Compares decoding a large response at once with decoding it incrementally,
+in time, time to the first item, and peak memory.
+
+run from the root of the repository with: python benchmarks/bench_json_stream.py
+"""
+import json
+import time
+import tracemalloc
+
+from cryptomarket.json_codec import get_codec
+from cryptomarket.json_stream import iter_items
+
+CHUNK_SIZE = 65536
+
+
+def order_books(symbols: int = 300, depth: int = 1000) -> bytes:
+    levels = [[f'{i}.123456', '1.0001'] for i in range(depth)]
+    book = {'timestamp': '2021-07-21T10:31:50.000Z', 'ask': levels, 'bid': levels}
+    return json.dumps({f'SYMBOL{i}': book for i in range(symbols)}).encode()
+
+
+def trades(number: int = 200_000) -> bytes:
+    return json.dumps([{'id': i, 'price': '30881.96', 'qty': '0.1', 'side': 'buy',
+                        'timestamp': '2021-07-21T10:31:50.000Z'} for i in range(number)]).encode()
+
+
+def measure(decode):
+    start = time.perf_counter()
+    first = None
+    for _ in decode():
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    tracemalloc.start()
+    for _ in decode():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main():
+    codec = get_codec()
+    print(f'{"payload":<24}{"mode":<8}{"first item (ms)":>17}{"total (ms)":>12}{"peak (MB)":>11}')
+    for name, body in [('full order books', order_books()), ('trades of a symbol', trades())]:
+        chunks = [body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+        modes = [(codec.name, lambda: [codec.loads(b''.join(chunks))]),
+                 ('stream', lambda: iter_items(iter(chunks)))]
+        for mode, decode in modes:
+            first, total, peak = measure(decode)
+            print(f'{name:<24}{mode:<8}{first * 1000:>17.1f}{total * 1000:>12.1f}{peak / 1e6:>11.1f}')
+
+
+if __name__ == '__main__':
+    main()
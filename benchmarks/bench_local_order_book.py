@@ -0,0 +1,66 @@
+"""Measures the time to apply full order book updates to a LocalOrderBook,
+as received and parsed to WSOrderBook objects, and the time of its queries,
+on a synthetic book.
+
+run from the root of the repository with: python benchmarks/bench_local_order_book.py
+"""
+import random
+import timeit
+from typing import Any, Dict
+
+from cryptomarket.dataclasses.wsOrderBook import WSOrderBook
+from cryptomarket.websockets import LocalOrderBook
+
+TICK = 0.000001
+MID = 0.05
+
+
+def price(ticks: int) -> str:
+    return f'{ticks * TICK:.6f}'
+
+
+def snapshot(depth: int) -> Dict[str, Any]:
+    mid = round(MID / TICK)
+    return {'t': 0, 's': 0,
+            'a': [[price(mid + 1 + i), '1.000'] for i in range(depth)],
+            'b': [[price(mid - 1 - i), '1.000'] for i in range(depth)]}
+
+
+def updates(count: int, depth: int, rng: random.Random):
+    """updates of a few levels each, mostly near the top of the book, a third of them removing a level"""
+    mid = round(MID / TICK)
+    result = []
+    for sequence in range(1, count + 1):
+        asks = [[price(mid + 1 + int(rng.expovariate(1 / (depth / 10))) % depth),
+                 '0' if rng.random() < 0.33 else f'{rng.uniform(0.001, 5):.3f}']
+                for _ in range(rng.randint(1, 4))]
+        bids = [[price(mid - 1 - int(rng.expovariate(1 / (depth / 10))) % depth),
+                 '0' if rng.random() < 0.33 else f'{rng.uniform(0.001, 5):.3f}']
+                for _ in range(rng.randint(1, 4))]
+        result.append({'t': sequence, 's': sequence, 'a': asks, 'b': bids})
+    return result
+
+
+def main(count: int = 50_000):
+    rng = random.Random(1)
+    print(f'{"depth":>6}{"update (us)":>14}{"parsed (us)":>14}{"best (us)":>12}{"top 10 (us)":>14}{"volume (us)":>14}')
+    for depth in (100, 1_000, 10_000):
+        stream = updates(count, depth, rng)
+        parsed = LocalOrderBook('ETHBTC')
+        parsed.apply_snapshot(WSOrderBook.from_dict(snapshot(depth)))
+        parsed_time = timeit.timeit(
+            lambda: [parsed.apply_update(WSOrderBook.from_dict(update)) for update in stream], number=1) / count
+        book = LocalOrderBook('ETHBTC')
+        book.apply_snapshot(snapshot(depth))
+        update_time = timeit.timeit(lambda: [book.apply_update(update) for update in stream], number=1) / count
+        assert book.synced and book.asks() == parsed.asks() and book.bids() == parsed.bids()
+        queries = 10_000
+        best_time = timeit.timeit(lambda: (book.best_bid(), book.best_ask()), number=queries) / queries / 2
+        top_time = timeit.timeit(lambda: book.bids(10), number=queries) / queries
+        volume_time = timeit.timeit(lambda: book.price_for_volume('ask', '20'), number=queries) / queries
+        print(f'{depth:>6}{update_time * 1e6:>14.2f}{parsed_time * 1e6:>14.2f}{best_time * 1e6:>12.2f}'
+              f'{top_time * 1e6:>14.2f}{volume_time * 1e6:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
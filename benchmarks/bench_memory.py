@@ -0,0 +1,59 @@
+"""Compares the memory per instance and the pickled size of the sdk dataclasses
+with a __dict__ (as plain dataclasses) and with __slots__ (as they are now).
+
+run from the root of the repository with: python benchmarks/bench_memory.py
+"""
+import dataclasses
+import pickle
+import tracemalloc
+
+from cryptomarket.dataclasses import Candle, OrderBookLevel, PublicTrade, WSTrade
+from cryptomarket.dataclasses.report import Report
+
+SAMPLES = {
+    Candle: dict(timestamp='2021-06-20T20:00:00.000Z', open='0.050459', close='0.050087', min='0.050000',
+                 max='0.050511', volume='1326.628', volume_quote='66.555987736'),
+    PublicTrade: dict(id=1555634969, price='30881.96', qty='12.66828', side='buy',
+                      timestamp='2021-07-21T10:31:49.494Z'),
+    WSTrade: dict(t=1626861109494, i=1555634969, p='30881.96', q='12.66828', s='buy'),
+    OrderBookLevel: dict(price='0.046001', quantity='0.0001'),
+    Report: dict(id=828680665, client_order_id='f4307c6e507e49019907c917b6d7a084', symbol='ETHBTC',
+                 side='sell', status='new', type='limit', time_in_force='GTC', quantity='0.012',
+                 quantity_cumulative='0', post_only=False, created_at='2021-04-13T12:38:43.317Z',
+                 updated_at='2021-04-13T12:38:43.317Z', price='0.046001'),
+}
+
+
+def with_dict(cls):
+    """a plain dataclass with the same fields, with instances that have a __dict__"""
+    return dataclasses.make_dataclass(
+        f'Dict{cls.__name__}',
+        [(field.name, field.type, field) for field in dataclasses.fields(cls)])
+
+
+def bytes_per_instance(cls, kwargs, number):
+    # the field values are shared, so only the instances are measured
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    instances = [cls(**kwargs) for _ in range(number)]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in end.compare_to(start, 'filename'))
+    del instances
+    return (size - 8 * number) / number  # minus the pointers of the list
+
+
+def main(number: int = 100_000):
+    print(f'{"type":<16}{"__dict__ (B)":>14}{"__slots__ (B)":>15}{"saved":>8}{"pickle before (B)":>20}{"pickle after (B)":>19}')
+    for cls, kwargs in SAMPLES.items():
+        dict_cls = with_dict(cls)
+        before = bytes_per_instance(dict_cls, kwargs, number)
+        after = bytes_per_instance(cls, kwargs, number)
+        # plain dataclasses can only be pickled if importable, so the pickled __dict__ state is measured
+        pickle_before = len(pickle.dumps((cls.__name__, dataclasses.asdict(cls(**kwargs))), protocol=pickle.HIGHEST_PROTOCOL))
+        pickle_after = len(pickle.dumps(cls(**kwargs), protocol=pickle.HIGHEST_PROTOCOL))
+        print(f'{cls.__name__:<16}{before:>14.0f}{after:>15.0f}{1 - after / before:>8.0%}{pickle_before:>20}{pickle_after:>19}')
+
+
+if __name__ == '__main__':
+    main()
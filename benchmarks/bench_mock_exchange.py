@@ -0,0 +1,55 @@
+"""Measures the sdk end to end against the local mock exchange: the latency of
+the phases of rest requests, and the rate of order book updates handled by the
+market data client.
+
+requires aiohttp (pip install cryptomarket[async])
+
+run from the root of the repository with: python benchmarks/bench_mock_exchange.py
+"""
+import threading
+import time
+
+from cryptomarket.client import Client
+from cryptomarket.metrics import RequestMetrics
+from cryptomarket.mock_exchange import API_KEY, API_SECRET, MockExchange
+from cryptomarket.websockets import MarketDataClient
+
+
+def bench_rest(exchange: MockExchange, number: int):
+    metrics = RequestMetrics()
+    client = Client(API_KEY, API_SECRET, base_url=exchange.rest_url, metrics=metrics)
+    for _ in range(number):
+        client.get_order_book_of_symbol('ETHBTC')
+        client.get_spot_trading_balances()
+    client.close()
+    print(f'{"endpoint":<28}{"phase":<10}{"p50 (ms)":>10}{"p99 (ms)":>10}')
+    for endpoint, phases in metrics.stats().items():
+        for phase, stats in phases.items():
+            print(f'{endpoint:<28}{phase:<10}{stats.p50 * 1000:>10.3f}{stats.p99 * 1000:>10.3f}')
+
+
+def bench_order_book_feed(exchange: MockExchange, seconds: float):
+    updates = 0
+    lock = threading.Lock()
+
+    def callback(order_books, notification_type):
+        nonlocal updates
+        with lock:
+            updates += len(order_books)
+    client = MarketDataClient(base_url=exchange.ws_url)
+    client.connect()
+    client.subscribe_to_full_order_book(callback, symbols=list(exchange.markets))
+    time.sleep(seconds)
+    client.close()
+    print(f'order book updates handled: {updates / seconds:.0f}/s '
+          f'(the exchange sends {exchange.market_data_rate * len(exchange.markets):.0f}/s)')
+
+
+def main(number: int = 500, seconds: float = 5.0):
+    with MockExchange(market_data_rate=200, seed=1) as exchange:
+        bench_rest(exchange, number)
+        bench_order_book_feed(exchange, seconds)
+
+
+if __name__ == '__main__':
+    main()
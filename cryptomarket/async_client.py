@@ -0,0 +1,2122 @@
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from typing_extensions import Literal
+
+import cryptomarket.args as args
+from cryptomarket.columnar import (CandleColumns, ConvertedCandlesColumns,
+                                  PricePointColumns, TradeColumns,
+                                  candle_columns, price_point_columns,
+                                  trade_columns)
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses import (Address, AmountLock, Balance, Candle,
+                                      Commission, Currency, Fee, Order,
+                                      OrderBook, Price, PriceHistory,
+                                      SubAccount, Symbol, Ticker, Trade,
+                                      Transaction, WhitelistedAddress)
+from cryptomarket.dataclasses.aclSettings import ACLSettings
+from cryptomarket.dataclasses.convertedCandles import ConvertedCandles
+from cryptomarket.dataclasses.convertedCandlesOfSymbol import \
+    ConvertedCandlesOfSymbol
+from cryptomarket.async_http_client import AsyncHttpClient
+from cryptomarket.dataclasses.publicTrade import PublicTrade
+from cryptomarket.http_client import api_url
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.lazy import (LazyMapping, LazySequence, lazy_mapping,
+                               lazy_order_book, lazy_order_books,
+                               lazy_sequences)
+from cryptomarket.pagination import (MAX_LIMIT, PageRequest, Paginator,
+                                     paginate_async)
+from cryptomarket.rate_limiter import RateLimiter
+
+
+class AsyncClient(object):
+    """Cryptomarket asyncio rest client.
+
+    Has the same methods of the Client, as coroutines. All requests share one connection pool, so many calls can be awaited concurrently.
+
+    Requires aiohttp (pip install cryptomarket[async]), or httpx for HTTP/2 (pip install cryptomarket[http2])
+
+    :param api_key: The API key
+    :param api_secret: The API secret
+    :param window: Maximum difference between the creation of the request and the moment of request processing in milliseconds. Max is 60_000. Defaul is 10_000
+    :param pool_size: Maximum number of simultaneous connections. 0 for no limit. Default is 100
+    :param rate_limiter: Optional. A RateLimiter that delays requests over the exchange rate limits instead of letting them fail. Default is no rate limiting
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode the bodies. Default is the default codec
+    :param transport: Optional. 'http1', or 'http2' to multiplex the requests in flight over one connection. Default is 'http1'
+    :param base_url: Optional. The url of the rest api, like the rest_url of a MockExchange. Default is the url of the exchange api"""
+
+    def __init__(self, api_key: str = "", secret_key: str = "", window: Optional[int] = None, pool_size: int = 100, rate_limiter: Optional[RateLimiter] = None, codec: Optional[Union[JsonCodec, str]] = None, transport: Optional[Union[str, Any]] = None, base_url: str = api_url):
+        self.httpClient = AsyncHttpClient(
+            api_key, secret_key, window, pool_size=pool_size, rate_limiter=rate_limiter, codec=codec, transport=transport,
+            base_url=base_url)
+        if not api_key is None and not secret_key is None:
+            self.httpClient.reset_authorization()
+
+        # aliases of trades
+        self.get_trades_by_symbol = self.get_trades_of_symbol
+        # aliases of orders
+        self.create_new_order = self.create_spot_order
+        self.create_new_spot_order = self.create_spot_order
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the underlying http connections
+        """
+        await self.httpClient.close_session()
+
+    async def _get(self, endpoint: str, params=None):
+        return await self.httpClient.get(endpoint, params)
+
+    async def _post(self, endpoint: str, params=None):
+        return await self.httpClient.post(endpoint, params)
+
+    async def _put(self, endpoint: str, params=None):
+        return await self.httpClient.put(endpoint, params)
+
+    async def _patch(self, endpoint: str, params=None):
+        return await self.httpClient.patch(endpoint, params)
+
+    async def _delete(self, endpoint: str, params=None):
+        return await self.httpClient.delete(endpoint, params)
+
+    def change_credentials(self, api_key: str, api_secret: str) -> None:
+        """
+        Changes the user credentials used for authentication in calls
+
+        :param apiKey:    the user public key used in new calls
+        :param apiSecret: the user secret key used in new calls
+        """
+        self.httpClient.api_key = api_key
+        self.httpClient.api_secret = api_secret
+        self.httpClient.reset_authorization()
+
+    def change_window(self, window: int) -> None:
+        """
+        Changes the window used in authenticated calls
+
+        :param window: acceptable time between request and server execution
+        """
+        self.httpClient.window = window
+        self.httpClient.reset_authorization()
+
+    # PUBLIC METHOD CALLS
+
+    async def get_currencies(self, currencies: Optional[List[str]] = None, preferred_network: Optional[str] = None, lazy: bool = False) -> Union[Dict[str, Currency], LazyMapping[Currency]]:
+        """Get a dict of all currencies or specified currencies
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#currencies
+
+        :param currencies: Optional. A list of currencies ids
+        :param preferred_network: Optional. Code of the default network for currencies
+        :param lazy: Optional. If True, the currencies are converted on first access instead of all at once. Default is False
+
+        :return: A dict of available currencies. indexed by currency id
+        """
+        params = args.DictBuilder().currencies(
+            currencies).preferred_network(preferred_network).build()
+        response = await self._get(endpoint='public/currency', params=params)
+        if lazy:
+            return lazy_mapping(Currency, response)
+        return {key: from_dict(data_class=Currency, data=response[key])
+                for key in response}
+
+    async def get_currency(self, currency: Optional[str] = None) -> Currency:
+        """Get the data of a currency
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#currencies
+
+        :param currency: A currency id
+
+        :return: A currency
+        """
+        response = await self._get(endpoint=f'public/currency/{currency}')
+        return from_dict(data_class=Currency, data=response)
+
+    async def get_symbols(self, symbols: Optional[List[str]] = None, lazy: bool = False) -> Union[Dict[str, Symbol], LazyMapping[Symbol]]:
+        """Get a dict of all symbols or for specified symbols
+
+        A symbol is the combination of the base currency (first one) and quote currency (second one)
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#symbols
+
+        :param symbols: Optional. A list of symbol ids
+        :param lazy: Optional. If True, the symbols are converted on first access instead of all at once. Default is False
+
+        :return: A dict of symbols traded on the exchange, indexed by symbol id
+        """
+        params = args.DictBuilder().symbols(symbols).build()
+        response = await self._get(endpoint='public/symbol/', params=params)
+        if lazy:
+            return lazy_mapping(Symbol, response)
+        return {key: from_dict(
+            data_class=Symbol,
+            data=response[key])
+            for key in response}
+
+    async def get_symbol(self, symbol: str) -> Symbol:
+        """Get a symbol by its id
+
+        A symbol is the combination of the base currency (first one) and quote currency (second one)
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#symbols
+
+        :param symbol: A symbol id
+
+        :return: A symbol traded on the exchange
+        """
+        response = await self._get(endpoint=f'public/symbol/{symbol}')
+        return from_dict(data_class=Symbol, data=response)
+
+    async def get_tickers(self, symbols: Optional[List[str]] = None, lazy: bool = False) -> Union[Dict[str, Ticker], LazyMapping[Ticker]]:
+        """Get a dict of tickers for all symbols or for specified symbols
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#tickers
+
+        :param symbols: Optional. A list of symbol ids
+        :param lazy: Optional. If True, the tickers are converted on first access instead of all at once. Default is False
+
+        :return: A dict of symbols traded on the exchange, indexed by symbol id
+        """
+        params = args.DictBuilder().symbols(symbols).build()
+        response = await self._get(endpoint='public/ticker/', params=params)
+        if lazy:
+            return lazy_mapping(Ticker, response)
+        return {key: from_dict(data_class=Ticker, data=response[key])
+                for key in response}
+
+    async def get_ticker(self, symbol: str) -> Ticker:
+        """Get the ticker of a symbol
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#tickers
+
+        :param symbol: A symbol id
+
+        :return: A symbol traded on the exchange
+        """
+        response = await self._get(endpoint=f'public/ticker/{symbol}')
+        return from_dict(data_class=Ticker, data=response)
+
+    async def get_prices(self, to: str, source: Optional[str] = None, lazy: bool = False) -> Union[Dict[str, Price], LazyMapping[Price]]:
+        """Get a dict of quotation prices of currencies
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#prices
+
+        :param to: Target currency code
+        :param source: Optional. Source currency rate
+        :param lazy: Optional. If True, the prices are converted on first access instead of all at once. Default is False
+
+        :return: A dict of quotation prices of currencies, indexed by source currency code
+        """
+        params = args.DictBuilder().from_(source).to(to).build()
+        response = await self._get(
+            endpoint=f'public/price/rate',
+            params=params
+        )
+        if lazy:
+            return lazy_mapping(Price, response)
+        return {key: from_dict(data_class=Price, data=response[key])
+                for key in response}
+
+    async def get_prices_history(
+        self,
+        to: str,
+        source: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, PriceHistory], Dict[str, PricePointColumns], LazyMapping[PriceHistory]]:
+        """Get quotation prices history
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#prices
+
+        :param to: Target currency code
+        :param source: Optional. Source currency rate
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 1. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the price histories are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64. Default is float64
+        :param lazy: Optional. If True, the price histories are converted on first access instead of all at once. Default is False
+
+        :return: A dict of quotation prices of currencies, indexed by source currency code
+        """
+        params = args.DictBuilder().from_(source).to(to).since(since).until(
+            until).period(period).sort(sort).limit(limit).build()
+        response = await self._get(
+            endpoint=f'public/price/history', params=params)
+        if columnar:
+            return {key: price_point_columns(response[key]['history'], price_scale)
+                    for key in response}
+        if lazy:
+            return lazy_mapping(PriceHistory, response)
+        return {key: from_dict(data_class=PriceHistory, data=response[key])
+                for key in response}
+
+    async def get_ticker_last_prices(self, symbols: Optional[List[str]] = None, lazy: bool = False) -> Union[Dict[str, Price], LazyMapping[Price]]:
+        """Get a dict of the ticker's last prices for all symbols or for the specified symbols
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#prices
+
+        :param symbols: Optional. A list of symbol ids
+        :param lazy: Optional. If True, the prices are converted on first access instead of all at once. Default is False
+
+        :return: A dict of ticker prices of currencies, indexed by symbol
+        """
+        params = args.DictBuilder().symbols(symbols).build()
+        response = await self._get(
+            endpoint=f'public/price/ticker', params=params)
+        if lazy:
+            return lazy_mapping(Price, response)
+        return {key: from_dict(data_class=Price, data=response[key])
+                for key in response}
+
+    async def get_ticker_last_price_of_symbol(self, symbol: str) -> Price:
+        """Get ticker's last prices of a symbol
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#prices
+
+        :param symbol: A symbol id
+
+        :return: The ticker's last price of a symbol
+        """
+        response = await self._get(endpoint=f'public/price/ticker/{symbol}')
+        return from_dict(data_class=Price, data=response)
+
+    async def get_trades(
+        self,
+        symbols: Optional[List[str]] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, List[PublicTrade]], Dict[str, TradeColumns], LazyMapping[LazySequence[PublicTrade]]]:
+        """Get a dict of trades for all symbols or for specified symbols
+
+        'from' param and 'till' param must have the same format, both id or both timestamp
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbols: Optional. A list of symbol ids
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the trades are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, quantities are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Default is float64
+        :param lazy: Optional. If True, the trades are converted on first access instead of all at once. Default is False
+
+        :return: A dict with a list of trades for each symbol of the query. Indexed by symbol
+        """
+        params = args.DictBuilder().symbols(symbols).sort(sort).by(
+            sort_by).since(since).till(till).limit(limit).build()
+        response = await self._get(endpoint='public/trades', params=params)
+        if columnar:
+            return {key: trade_columns(response[key], price_scale, quantity_scale) for key in response}
+        if lazy:
+            return lazy_sequences(PublicTrade, response)
+        return {key: [from_dict(data_class=PublicTrade, data=trade_data)
+                      for trade_data in response[key]]
+                for key in response}
+
+    async def get_trades_of_symbol(
+        self,
+        symbol: str,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[PublicTrade]:
+        """Get trades of a symbol
+
+        'from' param and 'till' param must have the same format, both id or both timestamp
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbol: A symbol id
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+
+        :return: A list of trades of the symbol
+        """
+        params = args.DictBuilder().sort(sort).by(sort_by).since(
+            since).till(till).limit(limit).offset(offset).build()
+        response = await self._get(
+            endpoint=f"public/trades/{symbol}", params=params)
+        return [from_dict(data_class=PublicTrade, data=trade_data)
+                for trade_data in response]
+
+    def iter_trades_of_symbol(
+        self,
+        symbol: str,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> AsyncIterator[PublicTrade]:
+        """Asynchronously iterates over all the trades of a symbol, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or timestamp of the last trade
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbol: A symbol id
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param page_size: Optional. Trades per request. Default is 1000. Min is 1. Max is 1000
+
+        :return: An async iterator of the trades of the symbol
+        """
+        by_id = sort_by == args.SortBy.ID
+        paginator = Paginator(
+            cursor_of=lambda trade: trade.id if by_id else trade.timestamp,
+            id_of=lambda trade: trade.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate_async(lambda page: self.get_trades_of_symbol(
+            symbol, sort_by=sort_by, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    async def get_order_books(
+        self,
+        symbols: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, OrderBook], LazyMapping[OrderBook]]:
+        """Get a dict of orderbooks for all symbols or for the specified symbols
+
+        An Order Book is an electronic list of buy and sell orders for a specific symbol, structured by price level
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#order-books
+
+        :param symbols: Optional. A list of symbol ids
+        :param depth: Optional. Order Book depth. Default value is 100. Set to 0 to view the full Order Book
+        :param lazy: Optional. If True, the order books and their levels are converted on first access instead of all at once. Default is False
+
+        :return: A dict with the order book for each queried symbol. indexed by symbol
+        """
+        params = args.DictBuilder().symbols(symbols).depth(depth).build()
+        response = await self._get(endpoint='public/orderbook', params=params)
+        if lazy:
+            return lazy_order_books(response)
+        return {key: OrderBook.from_dict(response[key]) for key in response}
+
+    async def get_order_book_of_symbol(
+        self,
+        symbol: str,
+        depth: Optional[int] = None,
+        lazy: bool = False,
+    ) -> OrderBook:
+        """Get order book of a symbol
+
+        An Order Book is an electronic list of buy and sell orders for a specific symbol, structured by price level
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#order-books
+
+        :param symbol: A symbol id
+        :param depth: Optional. Order Book depth. Default value is 100. Set to 0 to view the full Order Book
+        :param lazy: Optional. If True, the levels are converted on first access instead of all at once. Default is False
+
+        :return: The order book of the symbol
+        """
+        params = args.DictBuilder().depth(depth).build()
+        response = await self._get(
+            endpoint=f'public/orderbook/{symbol}', params=params)
+        if lazy:
+            return lazy_order_book(response)
+        return OrderBook.from_dict(response)
+
+    async def get_order_book_volume_of_symbol(
+        self,
+        symbol: str,
+        volume: Optional[int] = None
+    ) -> OrderBook:
+        """Get order book of a symbol with the desired volume for market depth search
+
+        An Order Book is an electronic list of buy and sell orders for a specific symbol, structured by price level
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#order-books
+
+        :param symbol: A symbol id
+        :param volume: Optional. Desired volume for market depth search
+
+        :return: The order book of the symbol
+        """
+        params = args.DictBuilder().volume(volume).build()
+        response = await self._get(
+            endpoint=f'public/orderbook/{symbol}', params=params)
+        return OrderBook.from_dict(response)
+
+    async def get_candles(
+        self,
+        symbols: Optional[List[str]] = None,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, List[Candle]], Dict[str, CandleColumns], LazyMapping[LazySequence[Candle]]]:
+        """Get a dict of candles for all symbols or for specified symbols
+
+        Candels are used for OHLC representation
+
+        The result contains candles with non-zero volume only (no trades = no candles)
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the candles are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, volumes are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Quote volumes are scaled by price_scale + quantity_scale if both are given. Default is float64
+        :param lazy: Optional. If True, the candles are converted on first access instead of all at once. Default is False
+
+        :return: A dict with a list of candles for each symbol of the query. indexed by symbol
+        """
+        params = args.DictBuilder().symbols(symbols).period(period).sort(
+            sort).since(since).till(till).limit(limit).build()
+        response = await self._get(endpoint='public/candles/', params=params)
+        if columnar:
+            return {key: candle_columns(response[key], price_scale, quantity_scale) for key in response}
+        if lazy:
+            return lazy_sequences(Candle, response)
+        return {key: [from_dict(data_class=Candle, data=candle_data)
+                      for candle_data in response[key]]
+                for key in response}
+
+    async def get_candles_of_symbol(
+        self,
+        symbol: str,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+    ) -> Union[List[Candle], CandleColumns]:
+        """Get candles of a symbol
+
+        Candels are used for OHLC representation
+
+        The result contains candles with non-zero volume only (no trades = no candles)
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+        :param columnar: Optional. If True, the candles are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, volumes are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Quote volumes are scaled by price_scale + quantity_scale if both are given. Default is float64
+
+        :return: A class with the target_currency and data with a dict with a list of candles for each symbol of the query. indexed by symbol
+        """
+        params = args.DictBuilder().period(period).sort(sort).since(
+            since).till(till).limit(limit).offset(offset).build()
+        response = await self._get(
+            endpoint=f"public/candles/{symbol}", params=params)
+        if columnar:
+            return candle_columns(response, price_scale, quantity_scale)
+        return [from_dict(data_class=Candle, data=candle_data)
+                for candle_data in response]
+
+    def iter_candles_of_symbol(
+        self,
+        symbol: str,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> AsyncIterator[Candle]:
+        """Asynchronously iterates over all the candles of a symbol, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the timestamp of the last candle
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param page_size: Optional. Candles per request. Default is 1000. Min is 1. Max is 1000
+
+        :return: An async iterator of the candles of the symbol
+        """
+        paginator = Paginator(
+            cursor_of=lambda candle: candle.timestamp,
+            id_of=lambda candle: candle.timestamp,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate_async(lambda page: self.get_candles_of_symbol(
+            symbol, period=period, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    async def get_converted_candles(
+        self,
+        target_currency: str,
+        symbols: Optional[List[str]] = None,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+    ) -> Union[ConvertedCandles, ConvertedCandlesColumns]:
+        """Gets candles regarding the last price converted to the target currency for all symbols or for the specified symbols
+
+        Candles are used for OHLC representation
+
+        The result contains candles with non-zero volume only (no trades = no candles).
+
+        Conversion from the symbol quote currency to the target currency is the mean of "best" bid price and "best" ask price in the order book. If there is no "best" bid of ask price, the last price is returned.
+
+        Requires no API key Access Rights.
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param target_currency: Target currency for conversion
+        :param symbols: Optional. A list of symbol ids. If empty then gets for all symbols
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the candles are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, volumes are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Quote volumes are scaled by price_scale + quantity_scale if both are given. Default is float64
+
+        :return: A class with the target_currency and data with a list of candles for the symbol of the query.
+        """
+        params = args.DictBuilder().target_currency(target_currency).symbols(symbols).period(period).sort(sort).since(
+            since).till(till).limit(limit).build()
+        response = await self._get(
+            endpoint="public/converted/candles", params=params)
+        if columnar:
+            return ConvertedCandlesColumns(
+                target_currency=response['target_currency'],
+                data={key: candle_columns(response['data'][key], price_scale, quantity_scale) for key in response['data']})
+        return from_dict(ConvertedCandles, response)
+
+    async def get_converted_candles_of_symbol(
+        self,
+        target_currency: str,
+        symbol: str,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> ConvertedCandlesOfSymbol:
+        """Gets candles regarding the last price converted to the target currency for the specified symbols
+
+        Candles are used for OHLC representation
+
+        The result contains candles with non-zero volume only (no trades = no candles).
+
+        Conversion from the symbol quote currency to the target currency is the mean of "best" bid price and "best" ask price in the order book. If there is no "best" bid of ask price, the last price is returned.
+
+        Requires no API key Access Rights.
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param target_currency: Target currency for conversion
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+
+        :return: A list of candles of a symbol
+        """
+        params = args.DictBuilder().target_currency(target_currency).period(period).sort(sort).since(
+            since).till(till).limit(limit).offset(offset).build()
+        response = await self._get(
+            endpoint=f"public/converted/candles/{symbol}", params=params)
+        return from_dict(ConvertedCandlesOfSymbol, response)
+
+    ###########
+    # STREAMS #
+    ###########
+
+    async def stream_trades(
+        self,
+        symbols: Optional[List[str]] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Tuple[str, List[PublicTrade]]]:
+        """Get the trades for all symbols or for specified symbols, one symbol at a time as the response is read
+
+        The response is decoded as it is read, so only the list of one symbol is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbols: Optional. A list of symbol ids
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (symbol, list of trades) tuples
+        """
+        params = args.DictBuilder().symbols(symbols).sort(sort).by(
+            sort_by).since(since).till(till).limit(limit).build()
+        async for key, trades in self.httpClient.stream_get('public/trades', params, chunk_size):
+            yield key, [from_dict(data_class=PublicTrade, data=trade_data) for trade_data in trades]
+
+    async def stream_trades_of_symbol(
+        self,
+        symbol: str,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[PublicTrade]:
+        """Get trades of a symbol, one trade at a time as the response is read
+
+        The response is decoded as it is read, so only one trade is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbol: A symbol id
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of the trades of the symbol
+        """
+        params = args.DictBuilder().sort(sort).by(sort_by).since(
+            since).till(till).limit(limit).offset(offset).build()
+        async for trade_data in self.httpClient.stream_get(f'public/trades/{symbol}', params, chunk_size):
+            yield from_dict(data_class=PublicTrade, data=trade_data)
+
+    async def stream_order_books(
+        self,
+        symbols: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Tuple[str, OrderBook]]:
+        """Get the order books for all symbols or for the specified symbols, one symbol at a time as the response is read
+
+        The response is decoded as it is read, so only the order book of one symbol is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#order-books
+
+        :param symbols: Optional. A list of symbol ids
+        :param depth: Optional. Order Book depth. Default value is 100. Set to 0 to view the full Order Book
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (symbol, order book) tuples
+        """
+        params = args.DictBuilder().symbols(symbols).depth(depth).build()
+        async for key, order_book in self.httpClient.stream_get('public/orderbook', params, chunk_size):
+            yield key, OrderBook.from_dict(order_book)
+
+    async def stream_candles(
+        self,
+        symbols: Optional[List[str]] = None,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Tuple[str, List[Candle]]]:
+        """Get the candles for all symbols or for specified symbols, one symbol at a time as the response is read
+
+        The response is decoded as it is read, so only the list of one symbol is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbols: Optional. A list of symbol ids
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (symbol, list of candles) tuples
+        """
+        params = args.DictBuilder().symbols(symbols).period(period).sort(
+            sort).since(since).till(till).limit(limit).build()
+        async for key, candles in self.httpClient.stream_get('public/candles/', params, chunk_size):
+            yield key, [from_dict(data_class=Candle, data=candle_data) for candle_data in candles]
+
+    async def stream_candles_of_symbol(
+        self,
+        symbol: str,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Candle]:
+        """Get candles of a symbol, one candle at a time as the response is read
+
+        The response is decoded as it is read, so only one candle is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of the candles of the symbol
+        """
+        params = args.DictBuilder().period(period).sort(sort).since(
+            since).till(till).limit(limit).offset(offset).build()
+        async for candle_data in self.httpClient.stream_get(f'public/candles/{symbol}', params, chunk_size):
+            yield from_dict(data_class=Candle, data=candle_data)
+
+    #################
+    # AUTHENTICATED #
+    #################
+
+    ###########
+    # TRADING #
+    ###########
+
+    async def get_spot_trading_balances(self) -> List[Balance]:
+        """Get the user's spot trading balance for all currencies with balance
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-spot-trading-balance
+
+
+        :return: A list of spot trading balances
+        """
+        response = await self._get(endpoint='spot/balance')
+        return [from_dict(data_class=Balance, data=balance_data)
+                for balance_data in response]
+
+    async def get_spot_trading_balance_of_currency(self, currency: str) -> Balance:
+        """Get the user spot trading balance of a currency
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-spot-trading-balance
+
+        :param currency: The currency code to query the balance
+
+        :return: the spot trading balance of a currency
+        """
+        response = await self._get(endpoint=f'spot/balance/{currency}')
+        return from_dict(data_class=Balance, data=response)
+
+    async def get_all_active_spot_orders(self, symbol: Optional[str] = None) -> List[Order]:
+        """Get the user's active spot orders
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-all-active-spot-orders
+
+        :param symbol: Optional. A symbol for filtering the active spot orders
+
+        :return: A list of orders
+        """
+        params = args.DictBuilder().symbol(symbol).build()
+        response = await self._get(endpoint='spot/order', params=params)
+        return [from_dict(data_class=Order, data=data)
+                for data in response]
+
+    async def get_active_spot_order(self, client_order_id: str) -> Order:
+        """Get an active spot order by its client order id
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-active-spot-orders
+
+        :param client order id: The client order id of the order
+
+        :return: A spot order of the account
+        """
+        response = await self._get(endpoint=f'spot/order/{client_order_id}')
+        return from_dict(data_class=Order, data=response)
+
+    async def create_spot_order(
+        self,
+        symbol: str,
+        side: Union[args.Side, Literal['buy', 'sell']],
+        quantity: str,
+        type: Optional[Union[args.OrderType, Literal[
+            'limit', 'market', 'stopLimit', 'stopMarket', 'takeProfitLimit', 'takeProfitMarket'
+        ]]] = None,
+        time_in_force: Optional[Union[args.TimeInForce, Literal[
+            'GTC', 'IOC', 'FOK', 'Day', 'GTD'
+        ]]] = None,
+        client_order_id: Optional[str] = None,
+        price: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        expire_time: Optional[str] = None,
+        strict_validate: Optional[bool] = None,
+        post_only: Optional[bool] = None,
+        take_rate: Optional[str] = None,
+        make_rate: Optional[str] = None
+    ) -> Order:
+        """Creates a new spot order
+
+        For fee, for price accuracy and quantity, and for order status information see the api docs
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#create-new-spot-order
+
+        :param symbol: Trading symbol
+        :param side: Either 'buy' or 'sell'
+        :param quantity: Order quantity
+        :param client order id: Optional. If given must be unique within the trading day, including all active orders. If not given, is generated by the server
+        :param type: Optional. 'limit', 'market', 'stopLimit', 'stopMarket', 'takeProfitLimit' or 'takeProfitMarket'. Default is 'limit'
+        :param time in force: Optional. 'GTC', 'IOC', 'FOK', 'Day', 'GTD'. Default to 'GTC'
+        :param price: Optional. Required for 'limit' and 'stopLimit'. limit price of the order
+        :param stop price: Optional. Required for 'stopLimit' and 'stopMarket' orders. stop price of the order
+        :param expire time: Optional. Required for orders with timeInForce = GDT
+        :param strict validate: Optional. If False, the server rounds half down for tickerSize and quantityIncrement. Example of ETHBTC: tickSize = '0.000001', then price '0.046016' is valid, '0.0460165' is invalid
+        :param post only: Optional. If True, your post_only order causes a match with a pre-existing order as a taker, then the order will be cancelled
+        :param take rate: Optional. Liquidity taker fee, a fraction of order volume, such as 0.001 (for 0.1% fee). Can only increase the fee. Used for fee markup.
+        :param make rate: Optional. Liquidity provider fee, a fraction of order volume, such as 0.001 (for 0.1% fee). Can only increase the fee. Used for fee markup.
+
+        :return: A new spot order
+        """
+        builder = args.DictBuilder().client_order_id(client_order_id).symbol(symbol).side(
+            side).quantity(quantity).order_type(type).price(price).stop_price(stop_price)
+        params = builder.time_in_force(time_in_force).expire_time(expire_time).strict_validate(
+            strict_validate).post_only(post_only).take_rate(take_rate).make_rate(make_rate).build()
+        response = await self._post(endpoint='spot/order', params=params)
+        return from_dict(data_class=Order, data=response)
+
+    async def create_spot_order_list(
+        self,
+        contingency_type: Union[args.ContingencyType, Literal['allOrNone', 'oneCancelOther', 'oneTriggerOneCancelOther']],
+        orders: List[args.OrderRequest],
+        order_list_id: Optional[str] = None,
+    ) -> List[Order]:
+        """creates a list of spot orders
+
+        Types or Contingency:
+        - ContingencyType.ALL_OR_NONE (ContingencyType.AON)
+        - ContingencyType.ONE_CANCEL_OTHER (ContingencyType.OCO)
+        - ContingencyType.ONE_TRIGGER_OTHER (ContingencyType.OTO)
+        - ContingencyType.ONE_TRIGGER_ONE_CANCEL_OTHER (ContingencyType.OTOCO)
+
+        Restriction in the number of orders:
+        - An AON list must have 2 or 3 orders
+        - An OCO list must have 2 or 3 orders, and only one can be a limit order
+        - An OTO list must have 2 or 3 orders
+        - An OTOCO must have 3 or 4 orders, and for the secondary only one can be a limit order
+
+        Symbol restrictions:
+        - For an AON order list, the symbol code of orders must be unique for each order in the list.
+        - For an OCO order list, there are no symbol code restrictions.
+        - For an OTO order list, there are no symbol code restrictions.
+        - For an OTOCO order list, the symbol code of orders must be the same for all orders in the list (placing orders in different order books is not supported).
+
+        OrderType restrictions:
+        - For an AON order list, orders must be OrderType.LIMIT or OrderType.MARKET
+        - For an OCO order list, orders must be OrderType.LIMIT, OrderType.STOP_LIMIT, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT_LIMIT or OrderType.TAKE_PROFIT_MARKET.
+        - An OCO order list cannot include more than one limit order (the same
+        applies to secondary orders in an OTOCO order list).
+        - For an OTO order list, there are no order type resctrictions.
+        - For an OTOCO order list, the first order must be OrderType.LIMIT, OrderType.MARKET, OrderType.STOP_LIMIT, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT_LIMIT or OrderType.TAKE_PROFIT_MARKET.
+        - For an OTOCO order list, the secondary orders have the same restrictions as an OCO order
+        - Default is OrderType.LIMIT
+
+        TimeInForce restrictions:
+        - For an AON order list, required and must be FOK
+        - For an OCO order list is optional, orders can be GTC, IOC (except limit orders), FOK (except limit orders), DAY or GTD
+        - For an OTOCO order list, the first order can be GTC, IOC, FOK, DAY, GTD
+        - For an OTOCO order list is optional, the secondary orders can be orders must be GTC, IOC (except limit orders), FOK (except limit orders), DAY or GTD
+
+        https://api.exchange.cryptomkt.com/#create-new-spot-order-list
+
+        :param contingency_type: order list type.
+        :param orders: the list of orders
+        :param order_list_id: order list identifier. If not provided, it will be generated by the system. Must be equal to the client order id of the first order in the request
+
+        :return: the list of the created orders
+        """
+        params = args.DictBuilder().contingency_type(contingency_type).orders(
+            orders).order_list_id(order_list_id).build()
+        response = await self._post(endpoint='spot/order/list', params=params)
+        return [from_dict(data_class=Order, data=data)
+                for data in response]
+
+    async def replace_spot_order(
+        self,
+        client_order_id: str,
+        new_client_order_id: str,
+        quantity: str,
+        price: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        strict_validate: Optional[bool] = None
+    ) -> Order:
+        """Replaces a spot order
+
+        For fee, for price accuracy and quantity, and for order status information see the api docs
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#replace-spot-order
+
+        :param client order id: client order id of the old order
+        :param new client order id: client order id for the new order
+        :param quantity: Order quantity
+        :param price: Required if order type is 'limit', 'stopLimit', or 'takeProfitLimit'. Order price
+        :param stop price: Required if order type is 'stopLimit', 'stopMarket', 'takeProfitLimit', or 'takeProfitMarket'. Order stop price
+        :param strict validate: Price and quantity will be checked for incrementation within the symbol’s tick size and quantity step. See the symbol's tick_size and quantity_increment
+
+        :return: The new spot order
+        """
+        params = args.DictBuilder().new_client_order_id(new_client_order_id).quantity(
+            quantity).price(price).stop_price(stop_price).strict_validate(strict_validate).build()
+        response = await self._patch(
+            endpoint=f'spot/order/{client_order_id}', params=params)
+        return from_dict(data_class=Order, data=response)
+
+    async def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Order]:
+        """Cancel all active spot orders, or all active orders for a specified symbol
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#cancel-all-spot-orders
+
+
+        :return: A list with the canceled spot order
+        """
+        params = args.DictBuilder().symbol(symbol).build()
+        response = await self._delete(endpoint='spot/order', params=params)
+        return [from_dict(data_class=Order, data=data)
+                for data in response]
+
+    async def cancel_spot_order(self, client_order_id: str) -> Order:
+        """Cancel the order with the client order id
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#cancel-spot-order
+
+        :param client order id: client order id of the order to cancel
+
+        :return: The canceled spot order
+        """
+        response = await self._delete(endpoint=f'spot/order/{client_order_id}')
+        return from_dict(data_class=Order, data=response)
+
+    async def get_all_trading_commissions(self) -> List[Commission]:
+        """Get the personal trading commission rates for all symbols
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-all-trading-commission
+
+
+        :return: A list of commission rates
+        """
+        response = await self._get(endpoint='spot/fee')
+        return [from_dict(data_class=Commission, data=data) for data in response]
+
+    async def get_trading_commission(self, symbol: str) -> Commission:
+        """Get the personal trading commission rate of a symbol
+
+        Requires the "Place/cancel orders" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-trading-commission
+
+        :param symbol: The symbol of the commission rate
+
+        :return: The commission rate of a symbol
+        """
+        response = await self._get(endpoint=f'spot/fee/{symbol}')
+        return from_dict(data_class=Commission, data=response)
+
+    ###################
+    # TRADING HISTORY #
+    ###################
+
+    async def get_spot_orders_history(
+        self,
+        symbols: Optional[List[str]] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Order]:
+        """Get all the spot orders
+
+        Orders without executions are deleted after 24 hours
+
+        'from' param and 'till' param must have the same format, both id or both timestamp
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#spot-orders-history
+
+        :param symbol: Optional. Filter orders by symbol
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Max is 1000
+        :param offset: Optional. Default is 0. Max is 100000
+
+        :return: A list of orders
+        """
+        params = args.DictBuilder().symbols(symbols).sort(sort).by(
+            sort_by).since(since).till(till).limit(limit).offset(offset).build()
+        response = await self._get(endpoint='spot/history/order', params=params)
+        return [from_dict(data_class=Order, data=data)
+                for data in response]
+
+    def iter_spot_orders_history(
+        self,
+        symbols: Optional[List[str]] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> AsyncIterator[Order]:
+        """Asynchronously iterates over all the spot orders, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or creation time of the last order
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#spot-orders-history
+
+        :param symbols: Optional. Filter orders by symbol
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param page_size: Optional. Orders per request. Default is 1000. Max is 1000
+
+        :return: An async iterator of orders
+        """
+        by_id = sort_by == args.SortBy.ID
+        paginator = Paginator(
+            cursor_of=lambda order: order.id if by_id else order.created_at,
+            id_of=lambda order: order.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate_async(lambda page: self.get_spot_orders_history(
+            symbols, sort_by=sort_by, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    async def get_spot_trades_history(
+        self,
+        order_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Trade]:
+        """Get the user's spot trading history
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#spot-trades-history
+
+        :param order id: Optional. Order unique identifier as assigned by the exchange
+        :param symbol: Optional. Filter orders by symbol
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Max is 1000
+        :param offset: Optional. Default is 0. Max is 100000
+
+        :return: A list of trades
+        """
+        params = args.DictBuilder().order_id(order_id).symbol(symbol).sort(
+            sort).by(sort_by).since(since).till(till).limit(limit).offset(offset).build()
+        response = await self._get(endpoint='spot/history/trade', params=params)
+        return [from_dict(data_class=Trade, data=data) for data in response]
+
+    def iter_spot_trades_history(
+        self,
+        order_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> AsyncIterator[Trade]:
+        """Asynchronously iterates over all the user's spot trades, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or timestamp of the last trade
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#spot-trades-history
+
+        :param order id: Optional. Order unique identifier as assigned by the exchange
+        :param symbol: Optional. Filter trades by symbol
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param page_size: Optional. Trades per request. Default is 1000. Max is 1000
+
+        :return: An async iterator of trades
+        """
+        by_id = sort_by == args.SortBy.ID
+        paginator = Paginator(
+            cursor_of=lambda trade: trade.id if by_id else trade.timestamp,
+            id_of=lambda trade: trade.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate_async(lambda page: self.get_spot_trades_history(
+            order_id, symbol, sort_by=sort_by, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    ######################
+    # WALLET MANAGEMENT  #
+    ######################
+
+    async def get_wallet_balances(self) -> List[Balance]:
+        """Get the user's wallet balances for all currencies with balance
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#wallet-balance
+
+
+        :return: A list of wallet balances
+        """
+        response = await self._get(endpoint='wallet/balance')
+        return [from_dict(data_class=Balance, data=data) for data in response]
+
+    async def get_wallet_balance_of_currency(self, currency: Optional[str] = None) -> Balance:
+        """Get the user's wallet balance of a currency
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#wallet-balance
+
+        :param currency: The currency code to query the balance
+
+        :return: The wallet balance of the currency
+        """
+        response = await self._get(endpoint=f'wallet/balance/{currency}')
+        return from_dict(data_class=Balance, data=response)
+
+    async def get_whitelisted_addresses(self) -> List[WhitelistedAddress]:
+        """Gets the list of whitelisted addresses
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-whitelisted-addresses
+
+        :return: A list of addresses
+        """
+        response = await self._get(endpoint=f'wallet/crypto/address/white-list')
+        return [from_dict(data_class=WhitelistedAddress, data=data) for data in response]
+
+    async def get_deposit_crypto_addresses(self) -> List[Address]:
+        """Get the current addresses of the user
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#deposit-crypto-address
+
+
+        :return: A list of currency addresses
+        """
+        response = await self._get(endpoint=f'wallet/crypto/address')
+        return [from_dict(data_class=Address, data=data) for data in response]
+
+    async def get_deposit_crypto_address_of_currency(self, currency: str) -> Address:
+        """Get the current addresses of a currency of the user
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#deposit-crypto-address
+
+        :param currency: Currency to get the address
+
+        :return: A currency address
+        """
+        params = args.DictBuilder().currency(currency).build()
+        response = await self._get(endpoint='wallet/crypto/address', params=params)
+        return [from_dict(data_class=Address, data=data) for data in response][0]
+
+    async def create_deposit_crypto_address(self, currency: str) -> Address:
+        """Creates a new address for a currency
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#deposit-crypto-address
+
+        :param currency: currency to create a new address
+
+        :return: The created address for the currency
+        """
+        params = args.DictBuilder().currency(currency).build()
+        response = await self._post(
+            endpoint=f'wallet/crypto/address', params=params)
+        return from_dict(data_class=Address, data=response)
+
+    async def last_10_deposit_crypto_address(self, currency: str) -> List[Address]:
+        """Get the last 10 unique addresses used for deposit, by currency
+
+        Addresses used a long time ago may be omitted, even if they are among the last 10 unique addresses
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#last-10-deposit-crypto-address
+
+        :param currency: currency to get the list of addresses
+
+        :return: A list of addresses
+        """
+        params = args.DictBuilder().currency(currency).build()
+        response = await self._get(
+            endpoint=f'wallet/crypto/address/recent-deposit', params=params)
+        return [from_dict(data_class=Address, data=data) for data in response]
+
+    async def last_10_withdrawal_crypto_address(self, currency: str) -> List[Address]:
+        """Get the last 10 unique addresses used for withdrawals, by currency
+
+        Addresses used a long time ago may be omitted, even if they are among the last 10 unique addresses
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#last-10-withdrawal-crypto-addresses
+
+        :param currency: currency to get the list of addresses
+
+        :return: A list of addresses
+        """
+        params = args.DictBuilder().currency(currency).build()
+        response = await self._get(
+            endpoint=f'wallet/crypto/address/recent-withdraw', params=params)
+        return [from_dict(data_class=Address, data=data) for data in response]
+
+    async def withdraw_crypto(
+        self,
+        currency: str,
+        amount: str,
+        address: str,
+        payment_id: Optional[str] = None,
+        include_fee: Optional[bool] = None,
+        auto_commit: Optional[bool] = None,
+        use_offchain: Optional[Literal['never',
+                                       'optionaly', 'required']] = None,
+        public_comment: Optional[str] = None
+    ) -> str:
+        """Please take note that changing security settings affects withdrawals:
+
+        - It is impossible to withdraw funds without enabling the two-factor authentication (2FA)
+
+        - Password reset blocks withdrawals for 72 hours
+
+        - Each time a new address is added to the whitelist, it takes 48 hours before that address becomes active for withdrawal
+
+        Successful response to the request does not necessarily mean the resulting transaction got executed immediately. It has to be processed first and may eventually be rolled back
+
+        To see whether a transaction has been finalized call :py:func:`.AsyncClient.get_transaction`
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#withdraw-crypto
+
+        :param currency: currency code of the crypto to withdraw
+        :param amount: amount to be sent to the specified address
+        :param address: address identifier
+        :param payment_id: Optional.
+        :param include_fee: Optional. If true then the amount includes fees. Default is false
+        :param auto_commit: Optional. If false then you should commit or rollback the transaction in an hour. Used in two phase commit schema. Default is true
+        :param use_offchain: Optional. Whether the withdrawal may be comitted offchain. Accepted values are 'never', 'optionaly' and 'required'.
+        :param public_comment: Optional. Maximum lenght is 255
+
+        :return: The transaction id
+        """
+        params = args.DictBuilder().currency(currency).address(address).amount(amount).use_offchain(use_offchain).payment_id(
+            payment_id).include_fee(include_fee).auto_commit(auto_commit).public_comment(public_comment).build()
+        return (await self._post(endpoint='wallet/crypto/withdraw', params=params))['id']
+
+    async def withdraw_crypto_commit(self, id: str) -> bool:
+        """Commit a withdrawal
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#withdraw-crypto-commit-or-rollback
+
+        :param id: the withdrawal transaction identifier
+
+        :return: The transaction result. true if the commit is successful
+        """
+        return (await self._put(endpoint=f'wallet/crypto/withdraw/{id}'))['result']
+
+    async def withdraw_crypto_rollback(self, id: str) -> bool:
+        """Rollback a withdrawal
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#withdraw-crypto-commit-or-rollback
+
+        :param id: the withdrawal transaction identifier
+
+        :return: The transaction result. true if the rollback is successful
+        """
+        return (await self._delete(endpoint=f'wallet/crypto/withdraw/{id}'))['result']
+
+    async def get_estimate_withdrawal_fee(self, currency: str, amount: str, network_code: Optional[str] = None) -> str:
+        """Get an estimate of the withdrawal fee
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#estimate-withdraw-fee
+
+        :param currency: the currency code for withdrawal
+        :param amount: the expected withdraw amount
+        :param network_code: Optional. network code
+
+        :return: The expected fee
+        """
+        params = args.DictBuilder().amount(amount).currency(
+            currency).network_code(network_code).build()
+        return (await self._get(endpoint='wallet/crypto/fee/estimate', params=params))['fee']
+
+    async def get_estimate_withdrawal_fees(self, fee_requests: List[args.FeeRequest]) -> List[Fee]:
+        """Get a list of estimates of withdrawal fees
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#estimate-withdraw-fee
+
+        :return: A list of expected withdrawal fees
+        """
+        params = [args.clean_nones(asdict(fee_request))
+                  for fee_request
+                  in fee_requests]
+        result = await self._post(
+            endpoint='wallet/crypto/fees/estimate', params=params)
+        return [Fee.from_dict(fee_data) for fee_data in result]
+
+    async def get_bulk_estimate_withdrawal_fees(self, fee_requests: List[args.FeeRequest]) -> List[Fee]:
+        """Get a list of estimates of withdrawal fees
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#bulk-estimate-withdrawal-fee
+
+        :return: A list of expected withdrawal fees
+        """
+        params = [args.clean_nones(asdict(fee_request))
+                  for fee_request
+                  in fee_requests]
+        result = await self._post(
+            endpoint='wallet/crypto/fee/estimate/bulk', params=params)
+        return [Fee.from_dict(fee_data) for fee_data in result]
+
+    async def get_withdrawal_fees_hash(self) -> str:
+        """Gets the hash of withdrawal fees
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-withdrawal-fees-hash
+
+        :return: the fees hash
+        """
+        return (await self._get(endpoint='wallet/crypto/fee/withdraw/hash'))['hash']
+
+    # def get_estimate_deposit_fee(self, currency: str, amount: str, network_code: Optional[str] = None) -> str:
+    #     """Get an estimate of the Deposit fee
+
+    #     Requires the "Payment information" API key Access Right
+
+    #     https://api.exchange.cryptomkt.com/#estimate-deposit-fee
+
+    #     :param currency: the currency code for deposit
+    #     :param amount: the expected deposit amount
+    #     :param network_code: Optional. network code
+
+    #     :return: The expected fee
+    #     """
+    #     params = args.DictBuilder().amount(amount).currency(
+    #         currency).network_code(network_code).build()
+    #     return await self._get(endpoint='wallet/crypto/fee/deposit/estimate', params=params)['fee']
+
+    # def get_bulk_estimate_deposit_fees(self, fee_requests: List[args.FeeRequest]) -> List[Fee]:
+    #     """Get a list of estimates of deposit fees
+
+    #     Requires the "Payment information" API key Access Right
+
+    #     https://api.exchange.cryptomkt.com/#bulk-estimate-deposit-fee
+
+    #     :return: A list of expected deposit fees
+    #     """
+    #     params = [asdict(fee_request) for fee_request in fee_requests]
+    #     result = await self._post(
+    #         endpoint='wallet/crypto/fee/deposit/estimate/bulk', params=params)
+    #     return [Fee.from_dict(fee_data) for fee_data in result]
+
+    async def check_if_crypto_address_belong_to_current_account(self, address: str) -> bool:
+        """Check if an address is from this account
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#check-if-crypto-address-belongs-to-current-account
+
+        :param address: address to check
+
+        :return: True if it is from the current account
+        """
+        params = args.DictBuilder().address(address).build()
+        return (await self._get(endpoint=f'wallet/crypto/address/check-mine', params=params))['result']
+
+    async def convert_between_currencies(
+        self,
+        from_currency: str,
+        to_currency: str,
+        amount: str
+    ) -> List[str]:
+        """Converts between currencies
+
+        Successful response to the request does not necessarily mean the resulting transaction got executed immediately. It has to be processed first and may eventually be rolled back
+
+        To see whether a transaction has been finalized, call getTransaction...#TODO:link the right function
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#convert-between-currencies
+
+        :param from currency: currency code of origin
+        :param to currency: currency code of destiny
+        :param amount: the amount to be converted
+
+        :return: A list of transaction identifiers of the convertion
+        """
+        params = args.DictBuilder().from_currency(from_currency).to_currency(
+            to_currency).amount(amount).build()
+        return (await self._post(endpoint='wallet/convert', params=params))['result']
+
+    async def transfer_between_wallet_and_exchange(
+        self,
+        currency: str,
+        amount: str,
+        source: Union[args.Account, Literal['wallet', 'spot']],
+        destination: Union[args.Account, Literal['wallet', 'spot']],
+    ) -> str:
+        """Transfer funds between account types
+
+        'source' param and 'destination' param must be different account types
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#transfer-between-wallet-and-exchange
+
+        :param currency: currency code for transfering
+        :param amount: amount to be transfered
+        :param source: transfer source account type. Either 'wallet' or 'spot'
+        :param destination: transfer source account type. Either 'wallet' or 'spot'
+
+        :return: the transaction identifier of the transfer
+        """
+        params = args.DictBuilder().currency(currency).amount(
+            amount).source(source).destination(destination).build()
+        return (await self._post(endpoint='wallet/transfer', params=params))[0]
+
+    async def transfer_money_to_another_user(
+        self,
+        currency: str,
+        amount: str,
+        identify_by: Union[args.IdentifyBy, Literal['email', 'username']],
+        identifier: str
+    ) -> Dict[str, str]:
+        """Transfer funds to another user
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#transfer-money-to-another-user
+
+        :param currency: currency code
+        :param amount: amount to be transfered
+        :param identify_by: type of identifier. Either 'email' or 'username'
+        :param identifier: the email or username of the recieving user
+
+        :return: the transaction identifier of the transfer
+        """
+        params = args.DictBuilder().currency(currency).amount(
+            amount).identify_by(identify_by).identifier(identifier).build()
+        return (await self._post(endpoint='wallet/internal/withdraw', params=params))['result']
+
+    async def get_transaction_history(
+        self,
+        ids: Optional[List[str]] = None,
+        currencies: Optional[List[str]] = None,
+        types: Optional[List[args.TransactionType]] = None,
+        subtypes: Optional[List[args.TransactionSubType]] = None,
+        statuses: Optional[List[args.TransactionStatus]] = None,
+        order_by: Optional[Union[args.OrderBy, Literal[
+            'created_at', 'updated_at', 'last_updated_at', 'id']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        id_from: Optional[int] = None,
+        id_till: Optional[int] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        group_transactions: Optional[bool] = None,
+    ) -> List[Transaction]:
+        """Get the transaction history of the account
+
+        Important:
+
+        - The list of supported transaction types may be expanded in future versions
+
+        - Some transaction subtypes are reserved for future use and do not purport to provide any functionality on the platform
+
+        - The list of supported transaction subtypes may be expanded in future versions
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-transactions-history
+
+        :param ids: Optional. List of transaction identifiers to query
+        :param types: Optional. List of types to query. valid types are: 'DEPOSIT', 'WITHDRAW', 'TRANSFER' and 'SWAP'
+        :param subtyes: Optional. List of subtypes to query. valid subtypes are: 'UNCLASSIFIED', 'BLOCKCHAIN', 'AIRDROP', 'AFFILIATE', 'STAKING', 'BUY_CRYPTO', 'OFFCHAIN', 'FIAT', 'SUB_ACCOUNT', 'WALLET_TO_SPOT', 'SPOT_TO_WALLET', 'WALLET_TO_DERIVATIVES', 'DERIVATIVES_TO_WALLET', 'CHAIN_SWITCH_FROM', 'CHAIN_SWITCH_TO' and 'INSTANT_EXCHANGE'
+        :param statuses: Optional. List of statuses to query. valid subtypes are: 'CREATED', 'PENDING', 'FAILED', 'SUCCESS' and 'ROLLED_BACK'
+        :param order_by: Optional. sorting parameter.'created_at', 'updated_at', 'last_activity_at' or 'id'. Default is 'created_at'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param id_from: Optional. Interval initial value when ordering by id. Min is 0
+        :param id_till: Optional. Interval end value when ordering by id. Min is 0
+        :param since: Optional. Interval initial value (inclusive). The value type depends on order_by.
+        :param till: Optional. Interval end value (inclusive). The value type depends on order_by.
+        :param limit: Optional. Transactions per query. Defaul is 100. Max is 1000
+        :param offset: Optional. Default is 0. Max is 100000
+        :param group_transactions: Optional. Optional. Flag indicating whether the returned transactions will be parts of a single operation. Default is false.
+
+        :return: A list of transactions
+        """
+        params = args.DictBuilder().currencies(currencies).transaction_types(types).transaction_subtypes(subtypes).transaction_statuses(statuses).id_from(
+            id_from).id_till(id_till).tx_ids(ids).order_by(order_by).sort(sort).since(since).till(till).limit(limit).offset(offset).group_transactions(group_transactions).build()
+        response = await self._get(endpoint='wallet/transactions', params=params)
+        return [from_dict(data_class=Transaction, data=data)
+                for data in response]
+
+    def iter_transaction_history(
+        self,
+        ids: Optional[List[str]] = None,
+        currencies: Optional[List[str]] = None,
+        types: Optional[List[args.TransactionType]] = None,
+        subtypes: Optional[List[args.TransactionSubType]] = None,
+        statuses: Optional[List[args.TransactionStatus]] = None,
+        order_by: Optional[Union[args.OrderBy, Literal[
+            'created_at', 'updated_at', 'last_updated_at', 'id']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        id_from: Optional[int] = None,
+        id_till: Optional[int] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        group_transactions: Optional[bool] = None,
+        page_size: int = MAX_LIMIT
+    ) -> AsyncIterator[Transaction]:
+        """Asynchronously iterates over the transaction history of the account, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or the ordering time of the last transaction
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-transactions-history
+
+        :param ids: Optional. List of transaction identifiers to query
+        :param types: Optional. List of types to query. valid types are: 'DEPOSIT', 'WITHDRAW', 'TRANSFER' and 'SWAP'
+        :param subtyes: Optional. List of subtypes to query. valid subtypes are: 'UNCLASSIFIED', 'BLOCKCHAIN', 'AIRDROP', 'AFFILIATE', 'STAKING', 'BUY_CRYPTO', 'OFFCHAIN', 'FIAT', 'SUB_ACCOUNT', 'WALLET_TO_SPOT', 'SPOT_TO_WALLET', 'WALLET_TO_DERIVATIVES', 'DERIVATIVES_TO_WALLET', 'CHAIN_SWITCH_FROM', 'CHAIN_SWITCH_TO' and 'INSTANT_EXCHANGE'
+        :param statuses: Optional. List of statuses to query. valid subtypes are: 'CREATED', 'PENDING', 'FAILED', 'SUCCESS' and 'ROLLED_BACK'
+        :param order_by: Optional. sorting parameter.'created_at', 'updated_at', 'last_activity_at' or 'id'. Default is 'created_at'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param id_from: Optional. Interval initial value when ordering by id. Min is 0
+        :param id_till: Optional. Interval end value when ordering by id. Min is 0
+        :param since: Optional. Interval initial value (inclusive). The value type depends on order_by.
+        :param till: Optional. Interval end value (inclusive). The value type depends on order_by.
+        :param group_transactions: Optional. Flag indicating whether the returned transactions will be parts of a single operation. Default is false.
+        :param page_size: Optional. Transactions per request. Default is 1000. Max is 1000
+
+        :return: An async iterator of transactions
+        """
+        order_field = getattr(order_by, 'value', order_by)
+        by_id = order_field == args.OrderBy.ID
+        if order_field not in ('updated_at', 'last_activity_at', 'id'):
+            order_field = 'created_at'
+        paginator = Paginator(
+            cursor_of=lambda transaction: getattr(transaction, order_field),
+            id_of=lambda transaction: transaction.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=id_from if by_id else since,
+            till=id_till if by_id else till,
+            page_size=page_size)
+
+        def fetch_page(page: PageRequest):
+            return self.get_transaction_history(
+                ids=ids,
+                currencies=currencies,
+                types=types,
+                subtypes=subtypes,
+                statuses=statuses,
+                order_by=order_by,
+                sort=sort,
+                id_from=page.since if by_id else id_from,
+                id_till=page.till if by_id else id_till,
+                since=since if by_id else page.since,
+                till=till if by_id else page.till,
+                limit=page.limit,
+                offset=page.offset,
+                group_transactions=group_transactions)
+        return paginate_async(fetch_page, paginator)
+
+    async def get_transaction(self, id: str) -> Transaction:
+        """Get a transaction by its identifier
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-transactions-history
+
+        :param id: The identifier of the transaction
+
+        :return: A transaction of the account
+        """
+        response = await self._get(endpoint=f'wallet/transactions/{id}')
+        return from_dict(data_class=Transaction, data=response)
+
+    async def check_if_offchain_is_available(
+        self,
+        currency: str,
+        address: str,
+        payment_id: Optional[str] = None
+    ) -> bool:
+        """get the status of the offchain
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#check-if-offchain-is-available
+
+        :param currency: currency code
+        :param address: address identifier
+        :param payment id: Optional.
+
+        :return: True if the offchain is available
+
+        .. code-block:: python
+        True
+        """
+        params = args.DictBuilder().currency(currency).address(
+            address).payment_id(payment_id).build()
+        return await self._post(endpoint='wallet/crypto/check-offchain-available', params=params)
+
+    async def get_amount_locks(self, currency, active, limit, offset, since, till) -> List[AmountLock]:
+        """Get the list of amount locks
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-amount-locks
+
+        :param currency: Optional. Currency code
+        :param active: Optional. value showing whether the lock is active
+        :param limit: Optional. Dafault is 100. Min is 0. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0
+        :param from: Optional. Interval initial value. As Datetime
+        :param till: Optional. Interval end value. As Datetime
+
+        :return: A list of locks
+        """
+        params = args.DictBuilder().currency(currency).active(active).limit(
+            limit).offset(offset).since(since).till(till).build()
+        response = await self._get(endpoint='wallet/amount-locks', params=params)
+        return [from_dict(data_class=AmountLock, data=data)
+                for data in response]
+
+    ######################
+    #    SUBACCOUNTS     #
+    ######################
+
+    async def get_sub_account_list(self) -> List[SubAccount]:
+        """Get the list of sub accounts
+
+        Requires no API key Access Rights. Requires to be authenticated
+
+        https://api.exchange.cryptomkt.com/#get-sub-accounts-list
+        """
+        response = await self._get(endpoint='sub-account')
+        return [from_dict(data_class=SubAccount, data=data)
+                for data in response["result"]]
+
+    async def freeze_sub_accounts(self, sub_account_ids: List[str]) -> bool:
+        """Freezes the sub accounts listed.
+        A frozen wouldn't be able to:
+        - login
+        - withdraw funds
+        - trade
+        - complete pending orders
+        - use API keys
+
+        For any sub-account listed, all orders will be canceled and all funds will be transferred form the Trading balance
+
+        Requires no API key Access Rights. Requires to be authenticated
+
+        https://api.exchange.cryptomkt.com/#freeze-sub-account
+
+        :param sub_account_ids: A list of sub account ids. Ids as hexadecimal code
+
+        :return: A boolean indicating whether the sub accounts where frozen. True if successful
+        """
+        params = args.DictBuilder().sub_account_ids(sub_account_ids).build()
+        return (await self._post(endpoint='sub-account/freeze', params=params))["result"]
+
+    async def activate_sub_accounts(self, sub_account_ids: List[str]):
+        """Activates sub accounts listed
+
+        unfreezes sub accounts
+
+        Requres no API key Access Rights. Requires to be authenticated
+
+        https://api.exchange.cryptomkt.com/#activate-sub-account
+
+        :param sub_account_ids: A list of sub account ids. Ids as hexadecimal code
+
+        :return: A boolean indicating whether the sub accounts where activated. True if successful
+        """
+        params = args.DictBuilder().sub_account_ids(sub_account_ids).build()
+        return (await self._post(endpoint='sub-account/activate', params=params))["result"]
+
+    async def transfer_funds(
+        self,
+        sub_account_id: str,
+        amount: str,
+        currency: str,
+        type: Union[args.TransferType, Literal['to_sub_account', 'from_sub_account']],
+    ) -> str:
+        """Transfer funds
+
+        Transfers funds from the super-account to a sub-account or from a sub-account to the super-account
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#transfer-funds
+
+        :param sub_account_id: id of the sub-account to transfer with the super-account
+        :param amount: amount of funds to transfer
+        :param currency: currency of transfer
+        :param type: 'to_sub_account' or 'from_sub_account'
+
+        :return: the transaction id
+        """
+        params = args.DictBuilder().sub_account_id(sub_account_id).amount(
+            amount).currency(currency).type(type).build()
+        return (await self._post(endpoint='sub-account/transfer', params=params))['result']
+
+    async def transfer_to_super_account(self, amount: str, currency: str) -> str:
+        """Creates and commits a transfer from a subaccount to its super account
+
+        Call is being sent by a subaccount
+
+        Created but not committed transfer will reserve pending amount on the sender
+        wallet affecting their ability to withdraw or transfer crypto to another
+        account. Incomplete withdrawals affect subaccount transfers the same way
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#transfer-to-super-account
+
+        :param amount:   the amount of currency to transfer
+        :param currency: the currency to transfer
+        :return: The transaction id of the tranfer
+        """
+        params = args.DictBuilder().amount(amount).currency(currency).build()
+        return (await self._post(endpoint='sub-account/transfer/sub-to-super', params=params))['result']
+
+    async def transfer_to_another_subaccount(self, sub_account_id: str, amount: str, currency: str) -> str:
+        """Creates and commits a transfer between the user (subaccount) and another
+        subaccount.
+
+        Call is being sent by a subaccount
+
+        Created but not committed transfer will reserve pending amount on the sender
+        wallet affecting their ability to withdraw or transfer crypto to another
+        account. Incomplete withdrawals affect subaccount transfers the same way
+
+        Requires the "Withdraw cryptocurrencies" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#transfer-across-subaccounts
+
+        :param sub_account_id: Identifier of a subaccount
+        :param amount:   the amount of currency to transfer
+        :param currency: the currency to transfer
+        :return: The transaction id of the tranfer
+        """
+        params = args.DictBuilder().sub_account_id(sub_account_id).amount(
+            amount).currency(currency).build()
+        return (await self._post(endpoint='sub-account/transfer/sub-to-sub', params=params))['result']
+
+    async def get_ACL_settings(self, sub_account_ids: List[str]) -> List[ACLSettings]:
+        """Get a list of withdrawal settings for all sub-accounts or for the specified sub-accounts
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-acl-settings
+
+        :param sub_account_ids: A list of sub account ids. Ids as hexadecimal code
+
+        :return: A list of ACL settings for subaccounts
+        """
+        params = args.DictBuilder().sub_account_ids(sub_account_ids).build()
+        response = await self._get(endpoint='sub-account/acl', params=params)
+        return [from_dict(data_class=ACLSettings, data=data)
+                for data in response["result"]]
+
+    async def change_ACL_settings(self, sub_account_ids: List[str], acl_settings: args.ACLSettings) -> List[ACLSettings]:
+        """Change the ACL settings of sub-accounts
+
+        Disables or enables withdrawals for a sub-account
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#change-acl-settings
+
+        :param sub_account_ids: A list of sub-account ids. Ids as hexadecimal code
+        :param acl_settgins: the new acl settings for the sub-accounts (id of dataclass ignored)
+
+        :return: A list of acl settings of the changed sub-accounts
+        """
+        params = args.DictBuilder().sub_account_ids(
+            sub_account_ids).acl_settings(acl_settings).build()
+        response = await self._post(endpoint='sub-account/acl', params=params)
+        return [from_dict(data_class=ACLSettings, data=data)
+                for data in response["result"]]
+
+    async def get_sub_account_balance(self, sub_account_id: str) -> Dict[str, List[Balance]]:
+        """Get the non-zero balances of a sub-account
+
+        Report will include the wallet and Trading balances.
+
+        Works independent of account state.
+
+        Requires the "Payment information" API key Access Right.
+
+        https://api.exchange.cryptomkt.com/#get-sub-account-balance
+
+        :param sub_account_id: id of the sub-account to get the balances
+
+        :return: a dict of list of balances, indexes are 'wallet' and 'spot'
+        """
+        response = await self._get(endpoint=f'sub-account/balance/{sub_account_id}')
+        return {key: [from_dict(data_class=Balance, data=data)
+                      for data in response["result"][key]]
+                for key in response["result"]}
+
+    async def get_sub_account_crypto_address(self, sub_account_id: str, currency: str) -> str:
+        """Get the sub-account crypto address for a currency.
+
+        Requires the "Payment information" API key Access Right.
+
+        https://api.exchange.cryptomkt.com/#get-sub-account-crypto-address
+
+        :param sub_account_id: id of the sub-account to get the crypto address
+        :param currency: the currency of the crypto address
+
+        :return: An Address
+        """
+        response = await self._get(
+            endpoint=f'sub-account/crypto/address/{sub_account_id}/{currency}')
+        return response["result"]["address"]
+
+    ###########
+    # ALIASES #
+    ###########
+
+    # market data
+    get_ticker_by_symbol = get_ticker
+    get_ticker_of_symbol = get_ticker
+    get_ticker_last_price = get_ticker_last_price_of_symbol
+    get_ticker_last_price_by_symbol = get_ticker_last_price_of_symbol
+    get_trades_by_symbol = get_trades_of_symbol
+    get_order_book_by_symbol = get_order_book_of_symbol
+    get_order_book = get_order_book_of_symbol
+    get_order_book_volume_by_symbol = get_order_book_volume_of_symbol
+    get_order_book_volume = get_order_book_volume_of_symbol
+    get_candles_by_symbol = get_candles_of_symbol
+    get_converted_candles_by_symbol = get_converted_candles_of_symbol
+
+    # spot trading
+    get_spot_trading_balance_by_currency = get_spot_trading_balance_of_currency
+    get_spot_trading_balance = get_spot_trading_balance_of_currency
+    get_trading_commissions = get_all_trading_commissions
+    get_trading_commission_by_symbol = get_trading_commission
+    get_trading_commission_of_symbol = get_trading_commission
+
+    # wallet management
+    get_wallet_balance = get_wallet_balance_of_currency
+    get_wallet_balance_by_currency = get_wallet_balance_of_currency
+    get_deposit_crypto_address = get_deposit_crypto_address_of_currency
+    get_deposit_crypto_address_by_currency = get_deposit_crypto_address_of_currency
@@ -0,0 +1,148 @@
+import json
+from typing import Any, AsyncIterator, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+from cryptomarket.exceptions import (CryptomarketAPIException,
+                                     CryptomarketSDKException)
+from cryptomarket.hmac_auth import HmacAuth
+from cryptomarket.http_client import api_url
+from cryptomarket.json_codec import JsonCodec, resolve_codec
+from cryptomarket.json_stream import aiter_items
+from cryptomarket.rate_limiter import RateLimiter
+from cryptomarket.transport import AiohttpTransport, AsyncHttp2Transport
+
+
+class _ReadResponse:
+    """A fully read response, with the interface of a requests response
+    expected by CryptomarketAPIException
+    """
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncHttpClient:
+    """asyncio http client, with a connection pool shared by all the requests.
+
+    Requires aiohttp (pip install cryptomarket[async]) for HTTP/1.1, or httpx (pip install cryptomarket[http2]) for HTTP/2
+
+    :param pool_size: Maximum number of simultaneous connections. 0 for no limit. Default is 100
+    :param rate_limiter: Optional. A rate limiter to delay requests over the exchange limits
+    :param codec: Optional. A JsonCodec, or the name of one, to encode and decode the bodies. Default is the default codec
+    :param transport: Optional. 'http1' for an AiohttpTransport, 'http2' for an AsyncHttp2Transport that multiplexes the requests in flight over one connection, or an async transport. Default is 'http1'
+    :param base_url: Optional. The url the endpoints are relative to, like the one of a MockExchange. Default is the url of the exchange api
+    """
+
+    def __init__(self, api_key: str, api_secret: str, window: Optional[int] = None, pool_size: int = 100, rate_limiter: Optional[RateLimiter] = None, codec: Optional[Union[JsonCodec, str]] = None, transport: Optional[Union[str, Any]] = None, base_url: str = api_url):
+        if transport is None or transport == 'http1':
+            transport = AiohttpTransport(pool_size=pool_size)
+        elif transport == 'http2':
+            transport = AsyncHttp2Transport(max_connections=pool_size or 10)
+        elif isinstance(transport, str):
+            raise CryptomarketSDKException(f'unknown transport: {transport}')
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.window = window
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self.codec = resolve_codec(codec)
+        self.auth: Optional[HmacAuth] = None
+        self.transport = transport
+        self.base_url = base_url.rstrip('/') + '/'
+        self.session_is_open = True
+
+    def _get_transport(self):
+        if not self.session_is_open:
+            raise CryptomarketSDKException('the client session is closed')
+        return self.transport
+
+    async def close_session(self):
+        await self.transport.close()
+        self.session_is_open = False
+
+    def reset_authorization(self):
+        assert self.session_is_open == True
+        self.auth = HmacAuth(self.api_key, self.api_secret, window=self.window)
+
+    async def get(self, endpoint, params=None):
+        return await self._request('GET', endpoint, query=params)
+
+    async def stream_get(self, endpoint, params=None, chunk_size: int = 65536) -> AsyncIterator[Any]:
+        """Makes a get request, and decodes the top level items of the response as they are read
+
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An async iterator of (key, value) tuples if the response is an object, or of elements if it is an array
+        """
+        url, headers = await self._prepare('GET', endpoint, query=params)
+        async with self._get_transport().stream(url, headers, chunk_size) as (status, chunks):
+            if not str(status).startswith('2'):
+                content = b''.join([chunk async for chunk in chunks])
+                raise CryptomarketAPIException(_ReadResponse(status, content))
+            try:
+                async for item in aiter_items(chunks):
+                    yield item
+            except ValueError:
+                raise Exception(f'Invalid Response: status {status}')
+
+    async def post(self, endpoint, params=None):
+        return await self._request(
+            'POST',
+            endpoint,
+            body=self.codec.dumps(params),
+            content_type='application/json')
+
+    async def put(self, endpoint, params=None):
+        return await self._request('PUT', endpoint, query=params)
+
+    async def patch(self, endpoint, params=None):
+        body = urlencode(params, doseq=True) if params else None
+        return await self._request(
+            'PATCH',
+            endpoint,
+            body=body,
+            content_type='application/x-www-form-urlencoded')
+
+    async def delete(self, endpoint, params=None):
+        return await self._request('DELETE', endpoint, query=params)
+
+    async def _request(self, method, endpoint, query=None, body=None, content_type=None):
+        url, headers = await self._prepare(method, endpoint, query, body, content_type)
+        status, content = await self._get_transport().request(method, url, body, headers)
+        return self._handle_response(_ReadResponse(status, content))
+
+    async def _prepare(self, method, endpoint, query=None, body=None, content_type=None):
+        """Waits for the rate limiter, and builds the encoded url and the headers of a request"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+        url = self.base_url + endpoint
+        query_string = urlencode(query, doseq=True) if query else ''
+        if query_string:
+            url += '?' + query_string
+        headers = {}
+        if content_type and body is not None:
+            headers['Content-Type'] = content_type
+        if self.auth is not None:
+            headers['Authorization'] = self.auth.get_credential(
+                method, urlsplit(url).path, query_string, body)
+        return url, headers
+
+    def _handle_response(self, response: _ReadResponse):
+        """Internal helper for handling API responses from the CryptoMarket server.
+        Raises the appropriate exceptions when necessary; otherwise, return the
+        response.
+        """
+        if not str(response.status_code).startswith('2'):
+            raise CryptomarketAPIException(response)
+        try:
+            return self.codec.loads(response.content)
+        except ValueError:
+            raise Exception(f'Invalid Response: {response.text}')
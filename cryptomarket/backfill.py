@@ -0,0 +1,222 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import (Callable, Dict, Hashable, Iterable, List, Optional, Tuple,
+                    TypeVar, Union)
+
+from typing_extensions import Literal
+
+import cryptomarket.args as args
+from cryptomarket.client import Client
+from cryptomarket.dataclasses import Candle, PriceHistory, PublicTrade
+from cryptomarket.pagination import (MAX_LIMIT, PageRequest, Paginator,
+                                     paginate)
+from cryptomarket.rate_limiter import RateLimiter
+
+T = TypeVar('T')
+
+Time = Union[str, datetime, int]
+"""A point in time, as an ISO 8601 string, a datetime, or milliseconds since epoch"""
+
+PERIOD_DURATIONS = {
+    'M1': timedelta(minutes=1),
+    'M3': timedelta(minutes=3),
+    'M5': timedelta(minutes=5),
+    'M15': timedelta(minutes=15),
+    'M30': timedelta(minutes=30),
+    'H1': timedelta(hours=1),
+    'H4': timedelta(hours=4),
+    'D1': timedelta(days=1),
+    'D7': timedelta(days=7),
+    '1M': timedelta(days=31),
+}
+
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+
+
+def to_datetime(time: Time) -> datetime:
+    """Converts a point in time to an aware datetime in UTC"""
+    if isinstance(time, datetime):
+        return time if time.tzinfo else time.replace(tzinfo=timezone.utc)
+    if isinstance(time, int):
+        return datetime.fromtimestamp(time / 1000, tz=timezone.utc)
+    parsed = datetime.fromisoformat(time.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def to_iso(time: datetime) -> str:
+    """Formats a datetime as the exchange does, with milliseconds and in UTC"""
+    time = time.astimezone(timezone.utc)
+    return time.strftime('%Y-%m-%dT%H:%M:%S.') + f'{time.microsecond // 1000:03d}Z'
+
+
+def split_range(since: Time, till: Time, span: timedelta) -> List[Tuple[datetime, datetime]]:
+    """Splits the interval [since, till] in contiguous windows of at most the span.
+
+    Windows do not overlap: each one ends a millisecond before the next one starts.
+    """
+    start = to_datetime(since)
+    end = to_datetime(till)
+    windows = []
+    while start <= end:
+        window_end = min(start + span - _ONE_MILLISECOND, end)
+        windows.append((start, window_end))
+        start = window_end + _ONE_MILLISECOND
+    return windows
+
+
+def merge(
+    pages: Iterable[List[T]],
+    key: Callable[[T], Hashable],
+    sort_key: Callable[[T], object],
+) -> List[T]:
+    """Merges pages of entries, without duplicates and sorted"""
+    unique = {}
+    for page in pages:
+        for entry in page:
+            unique.setdefault(key(entry), entry)
+    return sorted(unique.values(), key=sort_key)
+
+
+class Backfill:
+    """Fetches long time ranges of public history concurrently.
+
+    The range is split in windows that fit in one page, windows are fetched in a
+    bounded pool of workers, and the results are merged in timestamp order
+    without duplicates.
+
+    Requests go through the rate limiter of the client. If the client has no
+    rate limiter, the backfill uses its own.
+
+    :param client: The rest client used for the requests
+    :param max_workers: Optional. Maximum number of concurrent requests. Default is 8
+    :param rate_limiter: Optional. Rate limiter for the requests, used only if the client has none. Default is a RateLimiter with the exchange limits
+    """
+
+    def __init__(self, client: Client, max_workers: int = 8, rate_limiter: Optional[RateLimiter] = None):
+        self.client = client
+        self.max_workers = max_workers
+        self._rate_limiter = None
+        if client.httpClient.rate_limiter is None:
+            self._rate_limiter = rate_limiter or RateLimiter()
+
+    def _request(self, request: Callable[[], T]) -> T:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire('public/')
+        return request()
+
+    def _run(self, tasks: List[Callable[[], T]]) -> List[T]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda task: task(), tasks))
+
+    def candles(
+        self,
+        symbols: List[str],
+        period: Union[args.Period, Literal[
+            'M1', 'M3', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+        ]],
+        since: Time,
+        till: Time,
+    ) -> Dict[str, List[Candle]]:
+        """Get all the candles of the symbols in a time range
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbols: A list of symbol ids
+        :param period: A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month)
+        :param since: Initial value of the queried interval
+        :param till: Last value of the queried interval
+
+        :return: A dict with the candles of each symbol in ascending order. indexed by symbol
+        """
+        args.Period.check_value(period)
+        windows = split_range(since, till, PERIOD_DURATIONS[period] * MAX_LIMIT)
+
+        def fetch(symbol: str, start: datetime, end: datetime):
+            return lambda: self._request(lambda: self.client.get_candles_of_symbol(
+                symbol, period=period, sort=args.Sort.ASCENDING, since=to_iso(start), till=to_iso(end), limit=MAX_LIMIT))
+        tasks = [fetch(symbol, start, end)
+                 for symbol in symbols for start, end in windows]
+        pages = self._run(tasks)
+        return {symbol: merge(pages[index * len(windows):(index + 1) * len(windows)],
+                              key=lambda candle: candle.timestamp,
+                              sort_key=lambda candle: candle.timestamp)
+                for index, symbol in enumerate(symbols)}
+
+    def trades(
+        self,
+        symbols: List[str],
+        since: Time,
+        till: Time,
+        window: timedelta = timedelta(hours=1),
+    ) -> Dict[str, List[PublicTrade]]:
+        """Get all the public trades of the symbols in a time range
+
+        The amount of trades in a window is unknown beforehand, so each window is paginated until exhausted
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbols: A list of symbol ids
+        :param since: Initial value of the queried interval
+        :param till: Last value of the queried interval
+        :param window: Optional. Time span fetched by each task. Default is one hour
+
+        :return: A dict with the trades of each symbol in ascending order. indexed by symbol
+        """
+        windows = split_range(since, till, window)
+
+        def fetch_page(symbol: str, page: PageRequest) -> List[PublicTrade]:
+            return self._request(lambda: self.client.get_trades_of_symbol(
+                symbol, sort_by=args.SortBy.TIMESTAMP, sort=args.Sort.ASCENDING, since=page.since, till=page.till, limit=page.limit, offset=page.offset))
+
+        def fetch(symbol: str, start: datetime, end: datetime):
+            paginator = Paginator(
+                cursor_of=lambda trade: trade.timestamp,
+                id_of=lambda trade: trade.id,
+                ascending=True,
+                since=to_iso(start),
+                till=to_iso(end))
+            return lambda: list(paginate(lambda page: fetch_page(symbol, page), paginator))
+        tasks = [fetch(symbol, start, end)
+                 for symbol in symbols for start, end in windows]
+        pages = self._run(tasks)
+        return {symbol: merge(pages[index * len(windows):(index + 1) * len(windows)],
+                              key=lambda trade: trade.id,
+                              sort_key=lambda trade: (trade.timestamp, trade.id))
+                for index, symbol in enumerate(symbols)}
+
+    def prices_history(
+        self,
+        to: str,
+        period: Union[args.Period, Literal[
+            'M1', 'M3', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+        ]],
+        since: Time,
+        till: Time,
+        source: Optional[str] = None,
+    ) -> Dict[str, PriceHistory]:
+        """Get the quotation prices history in a time range
+
+        https://api.exchange.cryptomkt.com/#prices
+
+        :param to: Target currency code
+        :param period: A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month)
+        :param since: Initial value of the queried interval
+        :param till: Last value of the queried interval
+        :param source: Optional. Source currency rate
+
+        :return: A dict of quotation prices histories in ascending order, indexed by source currency code
+        """
+        args.Period.check_value(period)
+        windows = split_range(since, till, PERIOD_DURATIONS[period] * MAX_LIMIT)
+
+        def fetch(start: datetime, end: datetime):
+            return lambda: self._request(lambda: self.client.get_prices_history(
+                to, source=source, since=to_iso(start), until=to_iso(end), period=period, sort=args.Sort.ASCENDING, limit=MAX_LIMIT))
+        results = self._run([fetch(start, end) for start, end in windows])
+        currencies = {currency for result in results for currency in result}
+        return {currency: PriceHistory(
+            currency=currency,
+            history=merge([result[currency].history for result in results if currency in result],
+                          key=lambda point: point.timestamp,
+                          sort_key=lambda point: point.timestamp))
+                for currency in sorted(currencies)}
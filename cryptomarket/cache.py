@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# seconds a response of each endpoint is kept, by endpoint prefix
+DEFAULT_TTLS = {
+    'public/currency': 300.0,
+    'public/symbol': 300.0,
+    'spot/fee': 60.0,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Hashable]:
+    """Builds a cache key from an endpoint and its params. List params are order sensitive"""
+    if not params:
+        return (endpoint, ())
+    return (endpoint, tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in params.items())))
+
+
+def _copy_json(value: Any) -> Any:
+    # decoded json only nests dicts and lists, so this is a deep copy, faster than copy.deepcopy
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class ResponseCache:
+    """A cache of raw responses, with a time to live by endpoint and least recently used eviction.
+
+    Only endpoints with a time to live are cached. The ttl of an endpoint is
+    the one of its longest matching prefix. Each caller gets its own copy of a
+    cached response, so changing it does not change the cache.
+
+    :param ttls: Optional. Seconds to keep the responses, by endpoint prefix. Overrides the defaults for 'public/currency', 'public/symbol' and 'spot/fee'
+    :param max_size: Optional. Maximum number of responses kept. Default is 256
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = 256):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]' = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def ttl_of(self, endpoint: str) -> Optional[float]:
+        """:return: the seconds the responses of the endpoint are kept, or None if they are not cached"""
+        matches = [prefix for prefix in self.ttls if endpoint.startswith(prefix)]
+        if not matches:
+            return None
+        return self.ttls[max(matches, key=len)]
+
+    def get(self, key: Tuple[str, Hashable]) -> Tuple[bool, Any]:
+        """Looks up a response, counting a hit or a miss
+
+        :return: a pair of whether the response was found and the response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._stats.misses += 1
+            return False, None
+
+    def set(self, key: Tuple[str, Hashable], value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_or_fetch(self, endpoint: str, params: Optional[Dict[str, Any]], fetch: Callable[[], Any]) -> Any:
+        """Gets a copy of the cached response of the request, or fetches and caches it
+
+        Requests to endpoints without a ttl are always fetched, and do not count as misses
+        """
+        ttl = self.ttl_of(endpoint)
+        if ttl is None:
+            return fetch()
+        key = make_key(endpoint, params)
+        found, value = self.get(key)
+        if not found:
+            value = fetch()
+            self.set(key, value, ttl)
+        return _copy_json(value)
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Removes cached responses
+
+        :param endpoint: Optional. Removes only the responses of endpoints starting with this prefix. Default is to remove all
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0].startswith(endpoint)]:
+                del self._entries[key]
+
+    def stats(self) -> CacheStats:
+        """Gets the hits, misses and evictions since the creation of the cache, and its current size"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries))
@@ -1,11 +1,17 @@
-from dataclasses import asdict
-from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+import functools
+from dataclasses import asdict, replace
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from dacite import Config, from_dict
 from typing_extensions import Literal
 
 import cryptomarket.args as args
+from cryptomarket.cache import ResponseCache
+from cryptomarket.columnar import (CandleColumns, ConvertedCandlesColumns,
+                                  PricePointColumns, TradeColumns,
+                                  candle_columns, price_point_columns,
+                                  trade_columns)
+from cryptomarket.converter import from_dict
 from cryptomarket.dataclasses import (Address, AmountLock, Balance, Candle,
                                       Commission, Currency, Fee, Order,
                                       OrderBook, Price, PriceHistory,
@@ -16,17 +22,60 @@ from cryptomarket.dataclasses.convertedCandles import ConvertedCandles
 from cryptomarket.dataclasses.convertedCandlesOfSymbol import \
     ConvertedCandlesOfSymbol
 from cryptomarket.dataclasses.publicTrade import PublicTrade
-from cryptomarket.http_client import HttpClient
+from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.http_client import HttpClient, api_url
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.lazy import (LazyMapping, LazySequence, lazy_mapping,
+                               lazy_order_book, lazy_order_books,
+                               lazy_sequences)
+from cryptomarket.metrics import CONVERT, LatencyStats, RequestMetrics
+from cryptomarket.pagination import (MAX_LIMIT, PageRequest, Paginator,
+                                     paginate)
+from cryptomarket.rate_limiter import RateLimiter
+from cryptomarket.retry import (ORDER_NOT_FOUND, RetryPolicy,
+                                new_client_order_id)
+
+
+def _timed_conversion(method):
+    """Records the conversion of the response of a method, from its decoding to the return of the method, if there are metrics"""
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        if self.metrics is None:
+            return method(self, *args, **kwargs)
+        before = self.httpClient.last_response
+        result = method(self, *args, **kwargs)
+        endpoint, decoded_at = self.httpClient.last_response
+        if decoded_at is not None and (endpoint, decoded_at) != before:
+            self.metrics.record(endpoint, CONVERT, perf_counter() - decoded_at)
+        return result
+    return timed
 
 
 class Client(object):
     """Cryptomarket rest client.
     :param api_key: The API key
     :param api_secret: The API secret
-    :param window: Maximum difference between the creation of the request and the moment of request processing in milliseconds. Max is 60_000. Defaul is 10_000"""
-
-    def __init__(self, api_key: str = "", secret_key: str = "", window: Optional[int] = None):
-        self.httpClient = HttpClient(api_key, secret_key, window)
+    :param window: Maximum difference between the creation of the request and the moment of request processing in milliseconds. Max is 60_000. Defaul is 10_000
+    :param rate_limiter: Optional. A RateLimiter that delays requests over the exchange rate limits instead of letting them fail. Default is no rate limiting
+    :param cache: Optional. A ResponseCache for the reference data (currencies, symbols and trading commissions). Default is no caching
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode the bodies. Default is the default codec
+    :param coalesce: Optional. If True, identical get requests made concurrently by many threads share one response. Default is False
+    :param pool_maxsize: Optional. Maximum number of connections kept open to the exchange. Default is 10
+    :param timeout: Optional. Seconds to wait for the server in each request, or a (connect, read) tuple. Default is no timeout
+    :param keep_alive: Optional. If False, each request opens a new connection. Default is True
+    :param transport: Optional. 'http1', or 'http2' to multiplex the requests in flight over one connection. Default is 'http1'
+    :param retry_policy: Optional. A RetryPolicy to retry the creation and replacement of orders after failures, without placing them twice. Default is no retries
+    :param metrics: Optional. RequestMetrics that record the build, sign, network, decode and convert latencies of each request, by endpoint. Default is no metrics
+    :param base_url: Optional. The url of the rest api, like the rest_url of a MockExchange. Default is the url of the exchange api"""
+
+    def __init__(self, api_key: str = "", secret_key: str = "", window: Optional[int] = None, rate_limiter: Optional[RateLimiter] = None, cache: Optional[ResponseCache] = None, codec: Optional[Union[JsonCodec, str]] = None, coalesce: bool = False, pool_maxsize: int = 10, timeout: Optional[Union[float, Tuple[float, float]]] = None, keep_alive: bool = True, transport: Optional[Union[str, Any]] = None, retry_policy: Optional[RetryPolicy] = None, metrics: Optional[RequestMetrics] = None, base_url: str = api_url):
+        self.httpClient = HttpClient(
+            api_key, secret_key, window, rate_limiter=rate_limiter, codec=codec, coalesce=coalesce,
+            pool_maxsize=pool_maxsize, timeout=timeout, keep_alive=keep_alive, transport=transport,
+            metrics=metrics, base_url=base_url)
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.metrics = metrics
         if not api_key is None and not secret_key is None:
             self.httpClient.reset_authorization()
 
@@ -41,7 +90,27 @@ class Client(object):
         """
         self.httpClient.close_session()
 
+    def warm_up(self, connections: int = 1, keep_alive_interval: Optional[float] = None) -> None:
+        """Opens connections to the exchange ahead of the first requests, so the first orders skip the TCP and TLS handshakes
+
+        :param connections: Optional. Number of connections to open at once. At most pool_maxsize. Default is 1
+        :param keep_alive_interval: Optional. If given, the connections are used again every keep_alive_interval seconds from a background thread, so they stay open while idle. Default is no keep alive pings
+        """
+        self.httpClient.warm_up(connections, keep_alive_interval)
+
+    def stats(self) -> Optional[Dict[str, Dict[str, LatencyStats]]]:
+        """Gets the latencies of the requests, with the count, sum, p50, p99 and max of each phase. None if there are no metrics
+
+        :return: A dict of latency stats indexed by endpoint label, and then by phase ('build', 'sign', 'network', 'decode' or 'convert')
+        """
+        if self.metrics is None:
+            return None
+        return self.metrics.stats()
+
     def _get(self, endpoint: str, params=None):
+        if self.cache is not None:
+            return self.cache.get_or_fetch(
+                endpoint, params, lambda: self.httpClient.get(endpoint, params))
         return self.httpClient.get(endpoint, params)
 
     def _post(self, endpoint: str, params=None):
@@ -56,6 +125,24 @@ class Client(object):
     def _delete(self, endpoint: str, params=None):
         return self.httpClient.delete(endpoint, params)
 
+    def _place(self, send, recover):
+        if self.retry_policy is None:
+            return send()
+        return self.retry_policy.run(send, recover)
+
+    def _find_order(self, client_order_id: str, symbol: Optional[str] = None) -> Optional[Order]:
+        # looks for a placed order, either active or already in the history
+        try:
+            return self.get_active_spot_order(client_order_id)
+        except CryptomarketAPIException as error:
+            if error.code != ORDER_NOT_FOUND:
+                raise
+        history = self.get_spot_orders_history(symbols=[symbol] if symbol else None, limit=100)
+        for order in history:
+            if order.client_order_id == client_order_id:
+                return order
+        return None
+
     def change_credentials(self, api_key: str, api_secret: str) -> None:
         """
         Changes the user credentials used for authentication in calls
@@ -66,6 +153,9 @@ class Client(object):
         self.httpClient.api_key = api_key
         self.httpClient.api_secret = api_secret
         self.httpClient.reset_authorization()
+        if self.cache is not None:
+            # trading commissions are personal
+            self.cache.invalidate('spot/fee')
 
     def change_window(self, window: int) -> None:
         """
@@ -78,7 +168,8 @@ class Client(object):
 
     # PUBLIC METHOD CALLS
 
-    def get_currencies(self, currencies: Optional[List[str]] = None, preferred_network: Optional[str] = None) -> Dict[str, Currency]:
+    @_timed_conversion
+    def get_currencies(self, currencies: Optional[List[str]] = None, preferred_network: Optional[str] = None, lazy: bool = False) -> Union[Dict[str, Currency], LazyMapping[Currency]]:
         """Get a dict of all currencies or specified currencies
 
         Requires no API key Access Rights
@@ -87,15 +178,19 @@ class Client(object):
 
         :param currencies: Optional. A list of currencies ids
         :param preferred_network: Optional. Code of the default network for currencies
+        :param lazy: Optional. If True, the currencies are converted on first access instead of all at once. Default is False
 
         :return: A dict of available currencies. indexed by currency id
         """
         params = args.DictBuilder().currencies(
             currencies).preferred_network(preferred_network).build()
         response = self._get(endpoint='public/currency', params=params)
+        if lazy:
+            return lazy_mapping(Currency, response)
         return {key: from_dict(data_class=Currency, data=response[key])
                 for key in response}
 
+    @_timed_conversion
     def get_currency(self, currency: Optional[str] = None) -> Currency:
         """Get the data of a currency
 
@@ -107,10 +202,15 @@ class Client(object):
 
         :return: A currency
         """
+        if self.cache is not None:
+            currencies = self._get(endpoint='public/currency', params={})
+            if currency in currencies:
+                return from_dict(data_class=Currency, data=currencies[currency])
         response = self._get(endpoint=f'public/currency/{currency}')
         return from_dict(data_class=Currency, data=response)
 
-    def get_symbols(self, symbols: Optional[List[str]] = None) -> Dict[str, Symbol]:
+    @_timed_conversion
+    def get_symbols(self, symbols: Optional[List[str]] = None, lazy: bool = False) -> Union[Dict[str, Symbol], LazyMapping[Symbol]]:
         """Get a dict of all symbols or for specified symbols
 
         A symbol is the combination of the base currency (first one) and quote currency (second one)
@@ -120,17 +220,20 @@ class Client(object):
         https://api.exchange.cryptomkt.com/#symbols
 
         :param symbols: Optional. A list of symbol ids
+        :param lazy: Optional. If True, the symbols are converted on first access instead of all at once. Default is False
 
         :return: A dict of symbols traded on the exchange, indexed by symbol id
         """
         params = args.DictBuilder().symbols(symbols).build()
         response = self._get(endpoint='public/symbol/', params=params)
+        if lazy:
+            return lazy_mapping(Symbol, response)
         return {key: from_dict(
             data_class=Symbol,
-            data=response[key],
-            config=Config(cast=[Enum]))
+            data=response[key])
             for key in response}
 
+    @_timed_conversion
     def get_symbol(self, symbol: str) -> Symbol:
         """Get a symbol by its id
 
@@ -144,10 +247,15 @@ class Client(object):
 
         :return: A symbol traded on the exchange
         """
+        if self.cache is not None:
+            symbols = self._get(endpoint='public/symbol/', params={})
+            if symbol in symbols:
+                return from_dict(data_class=Symbol, data=symbols[symbol])
         response = self._get(endpoint=f'public/symbol/{symbol}')
-        return from_dict(data_class=Symbol, data=response, config=Config(cast=[Enum]))
+        return from_dict(data_class=Symbol, data=response)
 
-    def get_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Ticker]:
+    @_timed_conversion
+    def get_tickers(self, symbols: Optional[List[str]] = None, lazy: bool = False) -> Union[Dict[str, Ticker], LazyMapping[Ticker]]:
         """Get a dict of tickers for all symbols or for specified symbols
 
         Requires no API key Access Rights
@@ -155,14 +263,18 @@ class Client(object):
         https://api.exchange.cryptomkt.com/#tickers
 
         :param symbols: Optional. A list of symbol ids
+        :param lazy: Optional. If True, the tickers are converted on first access instead of all at once. Default is False
 
         :return: A dict of symbols traded on the exchange, indexed by symbol id
         """
         params = args.DictBuilder().symbols(symbols).build()
         response = self._get(endpoint='public/ticker/', params=params)
+        if lazy:
+            return lazy_mapping(Ticker, response)
         return {key: from_dict(data_class=Ticker, data=response[key])
                 for key in response}
 
+    @_timed_conversion
     def get_ticker(self, symbol: str) -> Ticker:
         """Get the ticker of a symbol
 
@@ -177,7 +289,8 @@ class Client(object):
         response = self._get(endpoint=f'public/ticker/{symbol}')
         return from_dict(data_class=Ticker, data=response)
 
-    def get_prices(self, to: str, source: Optional[str] = None) -> Dict[str, Price]:
+    @_timed_conversion
+    def get_prices(self, to: str, source: Optional[str] = None, lazy: bool = False) -> Union[Dict[str, Price], LazyMapping[Price]]:
         """Get a dict of quotation prices of currencies
 
         Requires no API key Access Rights
@@ -186,6 +299,7 @@ class Client(object):
 
         :param to: Target currency code
         :param source: Optional. Source currency rate
+        :param lazy: Optional. If True, the prices are converted on first access instead of all at once. Default is False
 
         :return: A dict of quotation prices of currencies, indexed by source currency code
         """
@@ -194,9 +308,12 @@ class Client(object):
             endpoint=f'public/price/rate',
             params=params
         )
+        if lazy:
+            return lazy_mapping(Price, response)
         return {key: from_dict(data_class=Price, data=response[key])
                 for key in response}
 
+    @_timed_conversion
     def get_prices_history(
         self,
         to: str,
@@ -209,8 +326,11 @@ class Client(object):
             ]
         ]] = None,
         sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
-        limit: Optional[int] = None
-    ) -> Dict[str, PriceHistory]:
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, PriceHistory], Dict[str, PricePointColumns], LazyMapping[PriceHistory]]:
         """Get quotation prices history
 
         Requires no API key Access Rights
@@ -224,6 +344,9 @@ class Client(object):
         :param since: Optional. Initial value of the queried interval
         :param until: Optional. Last value of the queried interval
         :param limit: Optional. Prices per currency pair. Defaul is 1. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the price histories are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64. Default is float64
+        :param lazy: Optional. If True, the price histories are converted on first access instead of all at once. Default is False
 
         :return: A dict of quotation prices of currencies, indexed by source currency code
         """
@@ -231,10 +354,16 @@ class Client(object):
             until).period(period).sort(sort).limit(limit).build()
         response = self._get(
             endpoint=f'public/price/history', params=params)
+        if columnar:
+            return {key: price_point_columns(response[key]['history'], price_scale)
+                    for key in response}
+        if lazy:
+            return lazy_mapping(PriceHistory, response)
         return {key: from_dict(data_class=PriceHistory, data=response[key])
                 for key in response}
 
-    def get_ticker_last_prices(self, symbols: Optional[List[str]] = None) -> Dict[str, Price]:
+    @_timed_conversion
+    def get_ticker_last_prices(self, symbols: Optional[List[str]] = None, lazy: bool = False) -> Union[Dict[str, Price], LazyMapping[Price]]:
         """Get a dict of the ticker's last prices for all symbols or for the specified symbols
 
         Requires no API key Access Rights
@@ -242,15 +371,19 @@ class Client(object):
         https://api.exchange.cryptomkt.com/#prices
 
         :param symbols: Optional. A list of symbol ids
+        :param lazy: Optional. If True, the prices are converted on first access instead of all at once. Default is False
 
         :return: A dict of ticker prices of currencies, indexed by symbol
         """
         params = args.DictBuilder().symbols(symbols).build()
         response = self._get(
             endpoint=f'public/price/ticker', params=params)
+        if lazy:
+            return lazy_mapping(Price, response)
         return {key: from_dict(data_class=Price, data=response[key])
                 for key in response}
 
+    @_timed_conversion
     def get_ticker_last_price_of_symbol(self, symbol: str) -> Price:
         """Get ticker's last prices of a symbol
 
@@ -265,6 +398,7 @@ class Client(object):
         response = self._get(endpoint=f'public/price/ticker/{symbol}')
         return from_dict(data_class=Price, data=response)
 
+    @_timed_conversion
     def get_trades(
         self,
         symbols: Optional[List[str]] = None,
@@ -273,8 +407,12 @@ class Client(object):
         sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
         since: Optional[str] = None,
         till: Optional[str] = None,
-        limit: Optional[int] = None
-    ) -> Dict[str, List[PublicTrade]]:
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, List[PublicTrade]], Dict[str, TradeColumns], LazyMapping[LazySequence[PublicTrade]]]:
         """Get a dict of trades for all symbols or for specified symbols
 
         'from' param and 'till' param must have the same format, both id or both timestamp
@@ -289,16 +427,25 @@ class Client(object):
         :param since: Optional. Initial value of the queried interval
         :param until: Optional. Last value of the queried interval
         :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the trades are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, quantities are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Default is float64
+        :param lazy: Optional. If True, the trades are converted on first access instead of all at once. Default is False
 
         :return: A dict with a list of trades for each symbol of the query. Indexed by symbol
         """
         params = args.DictBuilder().symbols(symbols).sort(sort).by(
             sort_by).since(since).till(till).limit(limit).build()
         response = self._get(endpoint='public/trades', params=params)
+        if columnar:
+            return {key: trade_columns(response[key], price_scale, quantity_scale) for key in response}
+        if lazy:
+            return lazy_sequences(PublicTrade, response)
         return {key: [from_dict(data_class=PublicTrade, data=trade_data)
                       for trade_data in response[key]]
                 for key in response}
 
+    @_timed_conversion
     def get_trades_of_symbol(
         self,
         symbol: str,
@@ -335,11 +482,52 @@ class Client(object):
         return [from_dict(data_class=PublicTrade, data=trade_data)
                 for trade_data in response]
 
+    @_timed_conversion
+    def iter_trades_of_symbol(
+        self,
+        symbol: str,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> Iterator[PublicTrade]:
+        """Iterates over all the trades of a symbol, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or timestamp of the last trade
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbol: A symbol id
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param page_size: Optional. Trades per request. Default is 1000. Min is 1. Max is 1000
+
+        :return: An iterator of the trades of the symbol
+        """
+        by_id = sort_by == args.SortBy.ID
+        paginator = Paginator(
+            cursor_of=lambda trade: trade.id if by_id else trade.timestamp,
+            id_of=lambda trade: trade.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate(lambda page: self.get_trades_of_symbol(
+            symbol, sort_by=sort_by, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    @_timed_conversion
     def get_order_books(
         self,
         symbols: Optional[List[str]] = None,
-        depth: Optional[int] = None
-    ) -> Dict[str, OrderBook]:
+        depth: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, OrderBook], LazyMapping[OrderBook]]:
         """Get a dict of orderbooks for all symbols or for the specified symbols
 
         An Order Book is an electronic list of buy and sell orders for a specific symbol, structured by price level
@@ -350,17 +538,22 @@ class Client(object):
 
         :param symbols: Optional. A list of symbol ids
         :param depth: Optional. Order Book depth. Default value is 100. Set to 0 to view the full Order Book
+        :param lazy: Optional. If True, the order books and their levels are converted on first access instead of all at once. Default is False
 
         :return: A dict with the order book for each queried symbol. indexed by symbol
         """
         params = args.DictBuilder().symbols(symbols).depth(depth).build()
         response = self._get(endpoint='public/orderbook', params=params)
+        if lazy:
+            return lazy_order_books(response)
         return {key: OrderBook.from_dict(response[key]) for key in response}
 
+    @_timed_conversion
     def get_order_book_of_symbol(
         self,
         symbol: str,
-        depth: Optional[int] = None
+        depth: Optional[int] = None,
+        lazy: bool = False,
     ) -> OrderBook:
         """Get order book of a symbol
 
@@ -372,14 +565,18 @@ class Client(object):
 
         :param symbol: A symbol id
         :param depth: Optional. Order Book depth. Default value is 100. Set to 0 to view the full Order Book
+        :param lazy: Optional. If True, the levels are converted on first access instead of all at once. Default is False
 
         :return: The order book of the symbol
         """
         params = args.DictBuilder().depth(depth).build()
         response = self._get(
             endpoint=f'public/orderbook/{symbol}', params=params)
+        if lazy:
+            return lazy_order_book(response)
         return OrderBook.from_dict(response)
 
+    @_timed_conversion
     def get_order_book_volume_of_symbol(
         self,
         symbol: str,
@@ -403,6 +600,7 @@ class Client(object):
             endpoint=f'public/orderbook/{symbol}', params=params)
         return OrderBook.from_dict(response)
 
+    @_timed_conversion
     def get_candles(
         self,
         symbols: Optional[List[str]] = None,
@@ -414,8 +612,12 @@ class Client(object):
         sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
         since: Optional[str] = None,
         till: Optional[str] = None,
-        limit: Optional[int] = None
-    ) -> Dict[str, List[Candle]]:
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Union[Dict[str, List[Candle]], Dict[str, CandleColumns], LazyMapping[LazySequence[Candle]]]:
         """Get a dict of candles for all symbols or for specified symbols
 
         Candels are used for OHLC representation
@@ -432,16 +634,25 @@ class Client(object):
         :param from: Optional. Initial value of the queried interval. As DateTime
         :param till: Optional. Last value of the queried interval. As DateTime
         :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the candles are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, volumes are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Quote volumes are scaled by price_scale + quantity_scale if both are given. Default is float64
+        :param lazy: Optional. If True, the candles are converted on first access instead of all at once. Default is False
 
         :return: A dict with a list of candles for each symbol of the query. indexed by symbol
         """
         params = args.DictBuilder().symbols(symbols).period(period).sort(
             sort).since(since).till(till).limit(limit).build()
         response = self._get(endpoint='public/candles/', params=params)
+        if columnar:
+            return {key: candle_columns(response[key], price_scale, quantity_scale) for key in response}
+        if lazy:
+            return lazy_sequences(Candle, response)
         return {key: [from_dict(data_class=Candle, data=candle_data)
                       for candle_data in response[key]]
                 for key in response}
 
+    @_timed_conversion
     def get_candles_of_symbol(
         self,
         symbol: str,
@@ -454,8 +665,11 @@ class Client(object):
         since: Optional[str] = None,
         till: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
-    ) -> List[Candle]:
+        offset: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+    ) -> Union[List[Candle], CandleColumns]:
         """Get candles of a symbol
 
         Candels are used for OHLC representation
@@ -473,6 +687,9 @@ class Client(object):
         :param till: Optional. Last value of the queried interval. As DateTime
         :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
         :param offset: Optional. Default is 0. Min is 0. Max is 100000
+        :param columnar: Optional. If True, the candles are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, volumes are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Quote volumes are scaled by price_scale + quantity_scale if both are given. Default is float64
 
         :return: A class with the target_currency and data with a dict with a list of candles for each symbol of the query. indexed by symbol
         """
@@ -480,9 +697,53 @@ class Client(object):
             since).till(till).limit(limit).offset(offset).build()
         response = self._get(
             endpoint=f"public/candles/{symbol}", params=params)
+        if columnar:
+            return candle_columns(response, price_scale, quantity_scale)
         return [from_dict(data_class=Candle, data=candle_data)
                 for candle_data in response]
 
+    @_timed_conversion
+    def iter_candles_of_symbol(
+        self,
+        symbol: str,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> Iterator[Candle]:
+        """Iterates over all the candles of a symbol, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the timestamp of the last candle
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param page_size: Optional. Candles per request. Default is 1000. Min is 1. Max is 1000
+
+        :return: An iterator of the candles of the symbol
+        """
+        paginator = Paginator(
+            cursor_of=lambda candle: candle.timestamp,
+            id_of=lambda candle: candle.timestamp,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate(lambda page: self.get_candles_of_symbol(
+            symbol, period=period, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    @_timed_conversion
     def get_converted_candles(
         self,
         target_currency: str,
@@ -495,8 +756,11 @@ class Client(object):
         sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
         since: Optional[str] = None,
         till: Optional[str] = None,
-        limit: Optional[int] = None
-    ) -> ConvertedCandles:
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+    ) -> Union[ConvertedCandles, ConvertedCandlesColumns]:
         """Gets candles regarding the last price converted to the target currency for all symbols or for the specified symbols
 
         Candles are used for OHLC representation
@@ -516,6 +780,9 @@ class Client(object):
         :param from: Optional. Initial value of the queried interval. As DateTime
         :param till: Optional. Last value of the queried interval. As DateTime
         :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
+        :param columnar: Optional. If True, the candles are returned as arrays by column. Default is False
+        :param price_scale: Optional. With columnar, prices are exact int64 in units of 10**-price_scale instead of float64, like the decimals of the tick size of the symbol. Default is float64
+        :param quantity_scale: Optional. With columnar, volumes are exact int64 in units of 10**-quantity_scale instead of float64, like the decimals of the quantity increment of the symbol. Quote volumes are scaled by price_scale + quantity_scale if both are given. Default is float64
 
         :return: A class with the target_currency and data with a list of candles for the symbol of the query.
         """
@@ -523,8 +790,13 @@ class Client(object):
             since).till(till).limit(limit).build()
         response = self._get(
             endpoint="public/converted/candles", params=params)
+        if columnar:
+            return ConvertedCandlesColumns(
+                target_currency=response['target_currency'],
+                data={key: candle_columns(response['data'][key], price_scale, quantity_scale) for key in response['data']})
         return from_dict(ConvertedCandles, response)
 
+    @_timed_conversion
     def get_converted_candles_of_symbol(
         self,
         target_currency: str,
@@ -569,6 +841,180 @@ class Client(object):
             endpoint=f"public/converted/candles/{symbol}", params=params)
         return from_dict(ConvertedCandlesOfSymbol, response)
 
+    ###########
+    # STREAMS #
+    ###########
+
+    def stream_trades(
+        self,
+        symbols: Optional[List[str]] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Tuple[str, List[PublicTrade]]]:
+        """Get the trades for all symbols or for specified symbols, one symbol at a time as the response is read
+
+        The response is decoded as it is read, so only the list of one symbol is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbols: Optional. A list of symbol ids
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (symbol, list of trades) tuples
+        """
+        params = args.DictBuilder().symbols(symbols).sort(sort).by(
+            sort_by).since(since).till(till).limit(limit).build()
+        for key, trades in self.httpClient.stream_get('public/trades', params, chunk_size):
+            yield key, [from_dict(data_class=PublicTrade, data=trade_data) for trade_data in trades]
+
+    def stream_trades_of_symbol(
+        self,
+        symbol: str,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[PublicTrade]:
+        """Get trades of a symbol, one trade at a time as the response is read
+
+        The response is decoded as it is read, so only one trade is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#trades
+
+        :param symbol: A symbol id
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param until: Optional. Last value of the queried interval
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of the trades of the symbol
+        """
+        params = args.DictBuilder().sort(sort).by(sort_by).since(
+            since).till(till).limit(limit).offset(offset).build()
+        for trade_data in self.httpClient.stream_get(f'public/trades/{symbol}', params, chunk_size):
+            yield from_dict(data_class=PublicTrade, data=trade_data)
+
+    def stream_order_books(
+        self,
+        symbols: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Tuple[str, OrderBook]]:
+        """Get the order books for all symbols or for the specified symbols, one symbol at a time as the response is read
+
+        The response is decoded as it is read, so only the order book of one symbol is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#order-books
+
+        :param symbols: Optional. A list of symbol ids
+        :param depth: Optional. Order Book depth. Default value is 100. Set to 0 to view the full Order Book
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (symbol, order book) tuples
+        """
+        params = args.DictBuilder().symbols(symbols).depth(depth).build()
+        for key, order_book in self.httpClient.stream_get('public/orderbook', params, chunk_size):
+            yield key, OrderBook.from_dict(order_book)
+
+    def stream_candles(
+        self,
+        symbols: Optional[List[str]] = None,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Tuple[str, List[Candle]]]:
+        """Get the candles for all symbols or for specified symbols, one symbol at a time as the response is read
+
+        The response is decoded as it is read, so only the list of one symbol is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbols: Optional. A list of symbol ids
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 10. Min is 1. Max is 1000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (symbol, list of candles) tuples
+        """
+        params = args.DictBuilder().symbols(symbols).period(period).sort(
+            sort).since(since).till(till).limit(limit).build()
+        for key, candles in self.httpClient.stream_get('public/candles/', params, chunk_size):
+            yield key, [from_dict(data_class=Candle, data=candle_data) for candle_data in candles]
+
+    def stream_candles_of_symbol(
+        self,
+        symbol: str,
+        period: Optional[Union[
+            args.Period, Literal[
+                'M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M'
+            ]
+        ]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Candle]:
+        """Get candles of a symbol, one candle at a time as the response is read
+
+        The response is decoded as it is read, so only one candle is kept in memory at a time. Responses are never cached nor coalesced
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#candles
+
+        :param symbol: A symbol id
+        :param period: Optional. A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month). Default is 'M30'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param from: Optional. Initial value of the queried interval. As DateTime
+        :param till: Optional. Last value of the queried interval. As DateTime
+        :param limit: Optional. Prices per currency pair. Defaul is 100. Min is 1. Max is 1000
+        :param offset: Optional. Default is 0. Min is 0. Max is 100000
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of the candles of the symbol
+        """
+        params = args.DictBuilder().period(period).sort(sort).since(
+            since).till(till).limit(limit).offset(offset).build()
+        for candle_data in self.httpClient.stream_get(f'public/candles/{symbol}', params, chunk_size):
+            yield from_dict(data_class=Candle, data=candle_data)
+
     #################
     # AUTHENTICATED #
     #################
@@ -577,6 +1023,7 @@ class Client(object):
     # TRADING #
     ###########
 
+    @_timed_conversion
     def get_spot_trading_balances(self) -> List[Balance]:
         """Get the user's spot trading balance for all currencies with balance
 
@@ -591,6 +1038,7 @@ class Client(object):
         return [from_dict(data_class=Balance, data=balance_data)
                 for balance_data in response]
 
+    @_timed_conversion
     def get_spot_trading_balance_of_currency(self, currency: str) -> Balance:
         """Get the user spot trading balance of a currency
 
@@ -605,6 +1053,7 @@ class Client(object):
         response = self._get(endpoint=f'spot/balance/{currency}')
         return from_dict(data_class=Balance, data=response)
 
+    @_timed_conversion
     def get_all_active_spot_orders(self, symbol: Optional[str] = None) -> List[Order]:
         """Get the user's active spot orders
 
@@ -618,9 +1067,10 @@ class Client(object):
         """
         params = args.DictBuilder().symbol(symbol).build()
         response = self._get(endpoint='spot/order', params=params)
-        return [from_dict(data_class=Order, data=data, config=Config(cast=[Enum]))
+        return [from_dict(data_class=Order, data=data)
                 for data in response]
 
+    @_timed_conversion
     def get_active_spot_order(self, client_order_id: str) -> Order:
         """Get an active spot order by its client order id
 
@@ -633,8 +1083,9 @@ class Client(object):
         :return: A spot order of the account
         """
         response = self._get(endpoint=f'spot/order/{client_order_id}')
-        return from_dict(data_class=Order, data=response, config=Config(cast=[Enum]))
+        return from_dict(data_class=Order, data=response)
 
+    @_timed_conversion
     def create_spot_order(
         self,
         symbol: str,
@@ -666,7 +1117,7 @@ class Client(object):
         :param symbol: Trading symbol
         :param side: Either 'buy' or 'sell'
         :param quantity: Order quantity
-        :param client order id: Optional. If given must be unique within the trading day, including all active orders. If not given, is generated by the server
+        :param client order id: Optional. If given must be unique within the trading day, including all active orders. If not given, is generated by the server, or by the client if the client has a retry policy
         :param type: Optional. 'limit', 'market', 'stopLimit', 'stopMarket', 'takeProfitLimit' or 'takeProfitMarket'. Default is 'limit'
         :param time in force: Optional. 'GTC', 'IOC', 'FOK', 'Day', 'GTD'. Default to 'GTC'
         :param price: Optional. Required for 'limit' and 'stopLimit'. limit price of the order
@@ -679,13 +1130,17 @@ class Client(object):
 
         :return: A new spot order
         """
+        if client_order_id is None and self.retry_policy is not None:
+            client_order_id = new_client_order_id()
         builder = args.DictBuilder().client_order_id(client_order_id).symbol(symbol).side(
             side).quantity(quantity).order_type(type).price(price).stop_price(stop_price)
         params = builder.time_in_force(time_in_force).expire_time(expire_time).strict_validate(
             strict_validate).post_only(post_only).take_rate(take_rate).make_rate(make_rate).build()
-        response = self._post(endpoint='spot/order', params=params)
-        return from_dict(data_class=Order, data=response, config=Config(cast=[Enum]))
+        return self._place(
+            lambda: from_dict(data_class=Order, data=self._post(endpoint='spot/order', params=params)),
+            lambda: self._find_order(client_order_id, symbol))
 
+    @_timed_conversion
     def create_spot_order_list(
         self,
         contingency_type: Union[args.ContingencyType, Literal['allOrNone', 'oneCancelOther', 'oneTriggerOneCancelOther']],
@@ -734,14 +1189,27 @@ class Client(object):
         :param orders: the list of orders
         :param order_list_id: order list identifier. If not provided, it will be generated by the system. Must be equal to the client order id of the first order in the request
 
+        With a retry policy, the missing client order ids and the order list id are generated by the client
+
         :return: the list of the created orders
         """
+        if self.retry_policy is not None:
+            orders = [order if order.client_order_id else replace(order, client_order_id=new_client_order_id())
+                      for order in orders]
+            if order_list_id is None:
+                order_list_id = orders[0].client_order_id
         params = args.DictBuilder().contingency_type(contingency_type).orders(
             orders).order_list_id(order_list_id).build()
-        response = self._post(endpoint='spot/order/list', params=params)
-        return [from_dict(data_class=Order, data=data, config=Config(cast=[Enum]))
-                for data in response]
 
+        def recover():
+            found = [self._find_order(order.client_order_id, order.symbol) for order in orders]
+            return None if None in found else found
+        return self._place(
+            lambda: [from_dict(data_class=Order, data=data)
+                     for data in self._post(endpoint='spot/order/list', params=params)],
+            recover)
+
+    @_timed_conversion
     def replace_spot_order(
         self,
         client_order_id: str,
@@ -770,10 +1238,12 @@ class Client(object):
         """
         params = args.DictBuilder().new_client_order_id(new_client_order_id).quantity(
             quantity).price(price).stop_price(stop_price).strict_validate(strict_validate).build()
-        response = self._patch(
-            endpoint=f'spot/order/{client_order_id}', params=params)
-        return from_dict(data_class=Order, data=response, config=Config(cast=[Enum]))
+        return self._place(
+            lambda: from_dict(data_class=Order, data=self._patch(
+                endpoint=f'spot/order/{client_order_id}', params=params)),
+            lambda: self._find_order(new_client_order_id))
 
+    @_timed_conversion
     def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Order]:
         """Cancel all active spot orders, or all active orders for a specified symbol
 
@@ -786,9 +1256,10 @@ class Client(object):
         """
         params = args.DictBuilder().symbol(symbol).build()
         response = self._delete(endpoint='spot/order', params=params)
-        return [from_dict(data_class=Order, data=data, config=Config(cast=[Enum]))
+        return [from_dict(data_class=Order, data=data)
                 for data in response]
 
+    @_timed_conversion
     def cancel_spot_order(self, client_order_id: str) -> Order:
         """Cancel the order with the client order id
 
@@ -801,8 +1272,9 @@ class Client(object):
         :return: The canceled spot order
         """
         response = self._delete(endpoint=f'spot/order/{client_order_id}')
-        return from_dict(data_class=Order, data=response, config=Config(cast=[Enum]))
+        return from_dict(data_class=Order, data=response)
 
+    @_timed_conversion
     def get_all_trading_commissions(self) -> List[Commission]:
         """Get the personal trading commission rates for all symbols
 
@@ -816,6 +1288,7 @@ class Client(object):
         response = self._get(endpoint='spot/fee')
         return [from_dict(data_class=Commission, data=data) for data in response]
 
+    @_timed_conversion
     def get_trading_commission(self, symbol: str) -> Commission:
         """Get the personal trading commission rate of a symbol
 
@@ -827,6 +1300,10 @@ class Client(object):
 
         :return: The commission rate of a symbol
         """
+        if self.cache is not None:
+            for commission in self._get(endpoint='spot/fee'):
+                if commission.get('symbol') == symbol:
+                    return from_dict(data_class=Commission, data=commission)
         response = self._get(endpoint=f'spot/fee/{symbol}')
         return from_dict(data_class=Commission, data=response)
 
@@ -834,6 +1311,7 @@ class Client(object):
     # TRADING HISTORY #
     ###################
 
+    @_timed_conversion
     def get_spot_orders_history(
         self,
         symbols: Optional[List[str]] = None,
@@ -868,9 +1346,49 @@ class Client(object):
         params = args.DictBuilder().symbols(symbols).sort(sort).by(
             sort_by).since(since).till(till).limit(limit).offset(offset).build()
         response = self._get(endpoint='spot/history/order', params=params)
-        return [from_dict(data_class=Order, data=data, config=Config(cast=[Enum]))
+        return [from_dict(data_class=Order, data=data)
                 for data in response]
 
+    @_timed_conversion
+    def iter_spot_orders_history(
+        self,
+        symbols: Optional[List[str]] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> Iterator[Order]:
+        """Iterates over all the spot orders, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or creation time of the last order
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#spot-orders-history
+
+        :param symbols: Optional. Filter orders by symbol
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param page_size: Optional. Orders per request. Default is 1000. Max is 1000
+
+        :return: An iterator of orders
+        """
+        by_id = sort_by == args.SortBy.ID
+        paginator = Paginator(
+            cursor_of=lambda order: order.id if by_id else order.created_at,
+            id_of=lambda order: order.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate(lambda page: self.get_spot_orders_history(
+            symbols, sort_by=sort_by, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
+    @_timed_conversion
     def get_spot_trades_history(
         self,
         order_id: Optional[str] = None,
@@ -905,10 +1423,52 @@ class Client(object):
         response = self._get(endpoint='spot/history/trade', params=params)
         return [from_dict(data_class=Trade, data=data) for data in response]
 
+    @_timed_conversion
+    def iter_spot_trades_history(
+        self,
+        order_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        sort_by: Optional[Union[args.SortBy,
+                                Literal['id', 'timestamp']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        page_size: int = MAX_LIMIT
+    ) -> Iterator[Trade]:
+        """Iterates over all the user's spot trades, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or timestamp of the last trade
+
+        Requires the "Orderbook, History, Trading balance" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#spot-trades-history
+
+        :param order id: Optional. Order unique identifier as assigned by the exchange
+        :param symbol: Optional. Filter trades by symbol
+        :param sort_by: Optional. Sorting parameter. 'id' or 'timestamp'. Default is 'timestamp'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param since: Optional. Initial value of the queried interval
+        :param till: Optional. Last value of the queried interval
+        :param page_size: Optional. Trades per request. Default is 1000. Max is 1000
+
+        :return: An iterator of trades
+        """
+        by_id = sort_by == args.SortBy.ID
+        paginator = Paginator(
+            cursor_of=lambda trade: trade.id if by_id else trade.timestamp,
+            id_of=lambda trade: trade.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=since,
+            till=till,
+            page_size=page_size)
+        return paginate(lambda page: self.get_spot_trades_history(
+            order_id, symbol, sort_by=sort_by, sort=sort, since=page.since, till=page.till, limit=page.limit, offset=page.offset), paginator)
+
     ######################
     # WALLET MANAGEMENT  #
     ######################
 
+    @_timed_conversion
     def get_wallet_balances(self) -> List[Balance]:
         """Get the user's wallet balances for all currencies with balance
 
@@ -922,6 +1482,7 @@ class Client(object):
         response = self._get(endpoint='wallet/balance')
         return [from_dict(data_class=Balance, data=data) for data in response]
 
+    @_timed_conversion
     def get_wallet_balance_of_currency(self, currency: Optional[str] = None) -> Balance:
         """Get the user's wallet balance of a currency
 
@@ -936,6 +1497,7 @@ class Client(object):
         response = self._get(endpoint=f'wallet/balance/{currency}')
         return from_dict(data_class=Balance, data=response)
 
+    @_timed_conversion
     def get_whitelisted_addresses(self) -> List[WhitelistedAddress]:
         """Gets the list of whitelisted addresses
 
@@ -948,6 +1510,7 @@ class Client(object):
         response = self._get(endpoint=f'wallet/crypto/address/white-list')
         return [from_dict(data_class=WhitelistedAddress, data=data) for data in response]
 
+    @_timed_conversion
     def get_deposit_crypto_addresses(self) -> List[Address]:
         """Get the current addresses of the user
 
@@ -961,6 +1524,7 @@ class Client(object):
         response = self._get(endpoint=f'wallet/crypto/address')
         return [from_dict(data_class=Address, data=data) for data in response]
 
+    @_timed_conversion
     def get_deposit_crypto_address_of_currency(self, currency: str) -> Address:
         """Get the current addresses of a currency of the user
 
@@ -976,6 +1540,7 @@ class Client(object):
         response = self._get(endpoint='wallet/crypto/address', params=params)
         return [from_dict(data_class=Address, data=data) for data in response][0]
 
+    @_timed_conversion
     def create_deposit_crypto_address(self, currency: str) -> Address:
         """Creates a new address for a currency
 
@@ -992,6 +1557,7 @@ class Client(object):
             endpoint=f'wallet/crypto/address', params=params)
         return from_dict(data_class=Address, data=response)
 
+    @_timed_conversion
     def last_10_deposit_crypto_address(self, currency: str) -> List[Address]:
         """Get the last 10 unique addresses used for deposit, by currency
 
@@ -1010,6 +1576,7 @@ class Client(object):
             endpoint=f'wallet/crypto/address/recent-deposit', params=params)
         return [from_dict(data_class=Address, data=data) for data in response]
 
+    @_timed_conversion
     def last_10_withdrawal_crypto_address(self, currency: str) -> List[Address]:
         """Get the last 10 unique addresses used for withdrawals, by currency
 
@@ -1028,6 +1595,7 @@ class Client(object):
             endpoint=f'wallet/crypto/address/recent-withdraw', params=params)
         return [from_dict(data_class=Address, data=data) for data in response]
 
+    @_timed_conversion
     def withdraw_crypto(
         self,
         currency: str,
@@ -1071,6 +1639,7 @@ class Client(object):
             payment_id).include_fee(include_fee).auto_commit(auto_commit).public_comment(public_comment).build()
         return self._post(endpoint='wallet/crypto/withdraw', params=params)['id']
 
+    @_timed_conversion
     def withdraw_crypto_commit(self, id: str) -> bool:
         """Commit a withdrawal
 
@@ -1084,6 +1653,7 @@ class Client(object):
         """
         return self._put(endpoint=f'wallet/crypto/withdraw/{id}')['result']
 
+    @_timed_conversion
     def withdraw_crypto_rollback(self, id: str) -> bool:
         """Rollback a withdrawal
 
@@ -1097,6 +1667,7 @@ class Client(object):
         """
         return self._delete(endpoint=f'wallet/crypto/withdraw/{id}')['result']
 
+    @_timed_conversion
     def get_estimate_withdrawal_fee(self, currency: str, amount: str, network_code: Optional[str] = None) -> str:
         """Get an estimate of the withdrawal fee
 
@@ -1114,6 +1685,7 @@ class Client(object):
             currency).network_code(network_code).build()
         return self._get(endpoint='wallet/crypto/fee/estimate', params=params)['fee']
 
+    @_timed_conversion
     def get_estimate_withdrawal_fees(self, fee_requests: List[args.FeeRequest]) -> List[Fee]:
         """Get a list of estimates of withdrawal fees
 
@@ -1130,6 +1702,7 @@ class Client(object):
             endpoint='wallet/crypto/fees/estimate', params=params)
         return [Fee.from_dict(fee_data) for fee_data in result]
 
+    @_timed_conversion
     def get_bulk_estimate_withdrawal_fees(self, fee_requests: List[args.FeeRequest]) -> List[Fee]:
         """Get a list of estimates of withdrawal fees
 
@@ -1146,6 +1719,7 @@ class Client(object):
             endpoint='wallet/crypto/fee/estimate/bulk', params=params)
         return [Fee.from_dict(fee_data) for fee_data in result]
 
+    @_timed_conversion
     def get_withdrawal_fees_hash(self) -> str:
         """Gets the hash of withdrawal fees
 
@@ -1188,6 +1762,7 @@ class Client(object):
     #         endpoint='wallet/crypto/fee/deposit/estimate/bulk', params=params)
     #     return [Fee.from_dict(fee_data) for fee_data in result]
 
+    @_timed_conversion
     def check_if_crypto_address_belong_to_current_account(self, address: str) -> bool:
         """Check if an address is from this account
 
@@ -1202,6 +1777,7 @@ class Client(object):
         params = args.DictBuilder().address(address).build()
         return self._get(endpoint=f'wallet/crypto/address/check-mine', params=params)['result']
 
+    @_timed_conversion
     def convert_between_currencies(
         self,
         from_currency: str,
@@ -1228,6 +1804,7 @@ class Client(object):
             to_currency).amount(amount).build()
         return self._post(endpoint='wallet/convert', params=params)['result']
 
+    @_timed_conversion
     def transfer_between_wallet_and_exchange(
         self,
         currency: str,
@@ -1254,6 +1831,7 @@ class Client(object):
             amount).source(source).destination(destination).build()
         return self._post(endpoint='wallet/transfer', params=params)[0]
 
+    @_timed_conversion
     def transfer_money_to_another_user(
         self,
         currency: str,
@@ -1278,6 +1856,7 @@ class Client(object):
             amount).identify_by(identify_by).identifier(identifier).build()
         return self._post(endpoint='wallet/internal/withdraw', params=params)['result']
 
+    @_timed_conversion
     def get_transaction_history(
         self,
         ids: Optional[List[str]] = None,
@@ -1329,9 +1908,81 @@ class Client(object):
         params = args.DictBuilder().currencies(currencies).transaction_types(types).transaction_subtypes(subtypes).transaction_statuses(statuses).id_from(
             id_from).id_till(id_till).tx_ids(ids).order_by(order_by).sort(sort).since(since).till(till).limit(limit).offset(offset).group_transactions(group_transactions).build()
         response = self._get(endpoint='wallet/transactions', params=params)
-        return [from_dict(data_class=Transaction, data=data, config=Config(cast=[Enum]))
+        return [from_dict(data_class=Transaction, data=data)
                 for data in response]
 
+    @_timed_conversion
+    def iter_transaction_history(
+        self,
+        ids: Optional[List[str]] = None,
+        currencies: Optional[List[str]] = None,
+        types: Optional[List[args.TransactionType]] = None,
+        subtypes: Optional[List[args.TransactionSubType]] = None,
+        statuses: Optional[List[args.TransactionStatus]] = None,
+        order_by: Optional[Union[args.OrderBy, Literal[
+            'created_at', 'updated_at', 'last_updated_at', 'id']]] = None,
+        sort: Optional[Union[args.Sort, Literal['ASC', 'DESC']]] = None,
+        id_from: Optional[int] = None,
+        id_till: Optional[int] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        group_transactions: Optional[bool] = None,
+        page_size: int = MAX_LIMIT
+    ) -> Iterator[Transaction]:
+        """Iterates over the transaction history of the account, requesting one page at a time
+
+        When the offset limit is reached, the query continues from the id or the ordering time of the last transaction
+
+        Requires the "Payment information" API key Access Right
+
+        https://api.exchange.cryptomkt.com/#get-transactions-history
+
+        :param ids: Optional. List of transaction identifiers to query
+        :param types: Optional. List of types to query. valid types are: 'DEPOSIT', 'WITHDRAW', 'TRANSFER' and 'SWAP'
+        :param subtyes: Optional. List of subtypes to query. valid subtypes are: 'UNCLASSIFIED', 'BLOCKCHAIN', 'AIRDROP', 'AFFILIATE', 'STAKING', 'BUY_CRYPTO', 'OFFCHAIN', 'FIAT', 'SUB_ACCOUNT', 'WALLET_TO_SPOT', 'SPOT_TO_WALLET', 'WALLET_TO_DERIVATIVES', 'DERIVATIVES_TO_WALLET', 'CHAIN_SWITCH_FROM', 'CHAIN_SWITCH_TO' and 'INSTANT_EXCHANGE'
+        :param statuses: Optional. List of statuses to query. valid subtypes are: 'CREATED', 'PENDING', 'FAILED', 'SUCCESS' and 'ROLLED_BACK'
+        :param order_by: Optional. sorting parameter.'created_at', 'updated_at', 'last_activity_at' or 'id'. Default is 'created_at'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param id_from: Optional. Interval initial value when ordering by id. Min is 0
+        :param id_till: Optional. Interval end value when ordering by id. Min is 0
+        :param since: Optional. Interval initial value (inclusive). The value type depends on order_by.
+        :param till: Optional. Interval end value (inclusive). The value type depends on order_by.
+        :param group_transactions: Optional. Flag indicating whether the returned transactions will be parts of a single operation. Default is false.
+        :param page_size: Optional. Transactions per request. Default is 1000. Max is 1000
+
+        :return: An iterator of transactions
+        """
+        order_field = getattr(order_by, 'value', order_by)
+        by_id = order_field == args.OrderBy.ID
+        if order_field not in ('updated_at', 'last_activity_at', 'id'):
+            order_field = 'created_at'
+        paginator = Paginator(
+            cursor_of=lambda transaction: getattr(transaction, order_field),
+            id_of=lambda transaction: transaction.id,
+            ascending=sort == args.Sort.ASCENDING,
+            since=id_from if by_id else since,
+            till=id_till if by_id else till,
+            page_size=page_size)
+
+        def fetch_page(page: PageRequest):
+            return self.get_transaction_history(
+                ids=ids,
+                currencies=currencies,
+                types=types,
+                subtypes=subtypes,
+                statuses=statuses,
+                order_by=order_by,
+                sort=sort,
+                id_from=page.since if by_id else id_from,
+                id_till=page.till if by_id else id_till,
+                since=since if by_id else page.since,
+                till=till if by_id else page.till,
+                limit=page.limit,
+                offset=page.offset,
+                group_transactions=group_transactions)
+        return paginate(fetch_page, paginator)
+
+    @_timed_conversion
     def get_transaction(self, id: str) -> Transaction:
         """Get a transaction by its identifier
 
@@ -1344,8 +1995,9 @@ class Client(object):
         :return: A transaction of the account
         """
         response = self._get(endpoint=f'wallet/transactions/{id}')
-        return from_dict(data_class=Transaction, data=response, config=Config(cast=[Enum]))
+        return from_dict(data_class=Transaction, data=response)
 
+    @_timed_conversion
     def check_if_offchain_is_available(
         self,
         currency: str,
@@ -1371,6 +2023,7 @@ class Client(object):
             address).payment_id(payment_id).build()
         return self._post(endpoint='wallet/crypto/check-offchain-available', params=params)
 
+    @_timed_conversion
     def get_amount_locks(self, currency, active, limit, offset, since, till) -> List[AmountLock]:
         """Get the list of amount locks
 
@@ -1397,6 +2050,7 @@ class Client(object):
     #    SUBACCOUNTS     #
     ######################
 
+    @_timed_conversion
     def get_sub_account_list(self) -> List[SubAccount]:
         """Get the list of sub accounts
 
@@ -1408,6 +2062,7 @@ class Client(object):
         return [from_dict(data_class=SubAccount, data=data)
                 for data in response["result"]]
 
+    @_timed_conversion
     def freeze_sub_accounts(self, sub_account_ids: List[str]) -> bool:
         """Freezes the sub accounts listed.
         A frozen wouldn't be able to:
@@ -1430,6 +2085,7 @@ class Client(object):
         params = args.DictBuilder().sub_account_ids(sub_account_ids).build()
         return self._post(endpoint='sub-account/freeze', params=params)["result"]
 
+    @_timed_conversion
     def activate_sub_accounts(self, sub_account_ids: List[str]):
         """Activates sub accounts listed
 
@@ -1446,6 +2102,7 @@ class Client(object):
         params = args.DictBuilder().sub_account_ids(sub_account_ids).build()
         return self._post(endpoint='sub-account/activate', params=params)["result"]
 
+    @_timed_conversion
     def transfer_funds(
         self,
         sub_account_id: str,
@@ -1472,6 +2129,7 @@ class Client(object):
             amount).currency(currency).type(type).build()
         return self._post(endpoint='sub-account/transfer', params=params)['result']
 
+    @_timed_conversion
     def transfer_to_super_account(self, amount: str, currency: str) -> str:
         """Creates and commits a transfer from a subaccount to its super account
 
@@ -1492,6 +2150,7 @@ class Client(object):
         params = args.DictBuilder().amount(amount).currency(currency).build()
         return self._post(endpoint='sub-account/transfer/sub-to-super', params=params)['result']
 
+    @_timed_conversion
     def transfer_to_another_subaccount(self, sub_account_id: str, amount: str, currency: str) -> str:
         """Creates and commits a transfer between the user (subaccount) and another
         subaccount.
@@ -1515,6 +2174,7 @@ class Client(object):
             amount).currency(currency).build()
         return self._post(endpoint='sub-account/transfer/sub-to-sub', params=params)['result']
 
+    @_timed_conversion
     def get_ACL_settings(self, sub_account_ids: List[str]) -> List[ACLSettings]:
         """Get a list of withdrawal settings for all sub-accounts or for the specified sub-accounts
 
@@ -1531,6 +2191,7 @@ class Client(object):
         return [from_dict(data_class=ACLSettings, data=data)
                 for data in response["result"]]
 
+    @_timed_conversion
     def change_ACL_settings(self, sub_account_ids: List[str], acl_settings: args.ACLSettings) -> List[ACLSettings]:
         """Change the ACL settings of sub-accounts
 
@@ -1551,6 +2212,7 @@ class Client(object):
         return [from_dict(data_class=ACLSettings, data=data)
                 for data in response["result"]]
 
+    @_timed_conversion
     def get_sub_account_balance(self, sub_account_id: str) -> Dict[str, List[Balance]]:
         """Get the non-zero balances of a sub-account
 
@@ -1571,6 +2233,7 @@ class Client(object):
                       for data in response["result"][key]]
                 for key in response["result"]}
 
+    @_timed_conversion
     def get_sub_account_crypto_address(self, sub_account_id: str, currency: str) -> str:
         """Get the sub-account crypto address for a currency.
 
@@ -1601,7 +2264,7 @@ class Client(object):
     get_order_book = get_order_book_of_symbol
     get_order_book_volume_by_symbol = get_order_book_volume_of_symbol
     get_order_book_volume = get_order_book_volume_of_symbol
-    get_candles_by_symbol = get_order_book_volume_of_symbol
+    get_candles_by_symbol = get_candles_of_symbol
     get_converted_candles_by_symbol = get_converted_candles_of_symbol
 
     # spot trading
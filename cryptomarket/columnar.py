@@ -0,0 +1,133 @@
+"""Struct of arrays results for the history endpoints.
+
+Each column is a NumPy array if NumPy is installed, and an array.array
+otherwise. Timestamps are int64 milliseconds since epoch. Prices and volumes
+are float64, or exact int64 if a scale is given: prices scaled by
+10**price_scale, quantities and volumes by 10**quantity_scale, and quote
+volumes by 10**(price_scale + quantity_scale). Separate scales keep large
+volumes from overflowing int64 with the many decimals of small prices.
+"""
+from array import array
+from calendar import timegm
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from cryptomarket.fixed_point import to_scaled_int
+
+Column = Any
+"""A numpy.ndarray, or an array.array if NumPy is not installed"""
+
+
+@dataclass
+class CandleColumns:
+    timestamp: Column
+    open: Column
+    close: Column
+    min: Column
+    max: Column
+    volume: Column
+    volume_quote: Column
+
+    def __len__(self):
+        return len(self.timestamp)
+
+
+@dataclass
+class ConvertedCandlesColumns:
+    target_currency: str
+    data: Dict[str, CandleColumns]
+
+
+@dataclass
+class TradeColumns:
+    id: Column
+    timestamp: Column
+    price: Column
+    qty: Column
+    side: Column
+    """1 for buy, -1 for sell"""
+
+    def __len__(self):
+        return len(self.timestamp)
+
+
+@dataclass
+class PricePointColumns:
+    timestamp: Column
+    open: Column
+    close: Column
+    min: Column
+    max: Column
+
+    def __len__(self):
+        return len(self.timestamp)
+
+
+def _iso_to_millis(timestamp: str) -> int:
+    # the exchange format: 2021-06-20T20:00:00.000Z
+    seconds = timegm((int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                      int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])))
+    millis = int(timestamp[20:23]) if len(timestamp) > 20 and timestamp[19] == '.' else 0
+    return seconds * 1000 + millis
+
+
+def timestamp_column(timestamps: Sequence[str]) -> Column:
+    if numpy is not None:
+        return numpy.array([timestamp.rstrip('Z') for timestamp in timestamps],
+                           dtype='datetime64[ms]').astype(numpy.int64)
+    return array('q', [_iso_to_millis(timestamp) for timestamp in timestamps])
+
+
+def number_column(values: Sequence[str], scale: Optional[int] = None) -> Column:
+    if scale is not None:
+        scaled = [to_scaled_int(value, scale) for value in values]
+        return numpy.array(scaled, dtype=numpy.int64) if numpy is not None else array('q', scaled)
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.float64)
+    return array('d', [float(value) for value in values])
+
+
+def int_column(values: Sequence[int], type_code: str = 'q') -> Column:
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.dtype(type_code))
+    return array(type_code, values)
+
+
+def _quote_scale(price_scale: Optional[int], quantity_scale: Optional[int]) -> Optional[int]:
+    # the scale of price times quantity, as SymbolScale.quote
+    if price_scale is None or quantity_scale is None:
+        return None
+    return price_scale + quantity_scale
+
+
+def candle_columns(candles: List[Dict[str, str]], price_scale: Optional[int] = None, quantity_scale: Optional[int] = None) -> CandleColumns:
+    """Builds the columns of a list of raw candles"""
+    scales = {'open': price_scale, 'close': price_scale, 'min': price_scale, 'max': price_scale,
+              'volume': quantity_scale, 'volume_quote': _quote_scale(price_scale, quantity_scale)}
+    return CandleColumns(
+        timestamp=timestamp_column([candle['timestamp'] for candle in candles]),
+        **{name: number_column([candle[name] for candle in candles], scale)
+           for name, scale in scales.items()})
+
+
+def trade_columns(trades: List[Dict[str, Any]], price_scale: Optional[int] = None, quantity_scale: Optional[int] = None) -> TradeColumns:
+    """Builds the columns of a list of raw public trades"""
+    return TradeColumns(
+        id=int_column([trade['id'] for trade in trades]),
+        timestamp=timestamp_column([trade['timestamp'] for trade in trades]),
+        price=number_column([trade['price'] for trade in trades], price_scale),
+        qty=number_column([trade['qty'] for trade in trades], quantity_scale),
+        side=int_column([1 if trade['side'] == 'buy' else -1 for trade in trades], 'b'))
+
+
+def price_point_columns(points: List[Dict[str, str]], price_scale: Optional[int] = None) -> PricePointColumns:
+    """Builds the columns of a list of raw price points"""
+    return PricePointColumns(
+        timestamp=timestamp_column([point['timestamp'] for point in points]),
+        **{name: number_column([point[name] for point in points], price_scale)
+           for name in ('open', 'close', 'min', 'max')})
@@ -0,0 +1,153 @@
+"""Conversion of decoded json into the dataclasses of the sdk.
+
+A converter is compiled once per dataclass, from its fields and type hints,
+into a plain function that builds the dataclass from a dict. Enums are always
+cast from their values, nested dataclasses, lists, dicts and optional values
+get their own compiled converters, and fields that need no conversion are
+passed as they come. Unknown keys are ignored, missing fields take their
+defaults, or None if optional.
+"""
+import collections.abc
+import dataclasses
+import threading
+from enum import Enum
+from typing import (Any, Callable, Dict, Optional, Type, TypeVar, Union,
+                    get_type_hints)
+
+from typing_extensions import get_args, get_origin
+
+from cryptomarket.exceptions import CryptomarketSDKException
+
+T = TypeVar('T')
+
+Converter = Callable[[Any], Any]
+
+_MISSING = dataclasses.MISSING
+_NONE_TYPE = type(None)
+
+_converters: Dict[type, Converter] = {}
+_lock = threading.Lock()
+
+
+class ConversionError(CryptomarketSDKException):
+    pass
+
+
+def from_dict(data_class: Type[T], data: Dict[str, Any]) -> T:
+    """Builds a dataclass from a dict, with the converter compiled for the dataclass
+
+    :param data_class: The dataclass to build
+    :param data: The decoded json of the dataclass
+
+    :return: An instance of the dataclass
+    """
+    converter = _converters.get(data_class)
+    if converter is None:
+        converter = get_converter(data_class)
+    return converter(data)
+
+
+def get_converter(data_class: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """Gets the converter of a dataclass, compiling it on first use"""
+    converter = _converters.get(data_class)
+    if converter is not None:
+        return converter
+    with _lock:
+        if data_class not in _converters:
+            _converters[data_class] = _compile_dataclass(data_class)
+        return _converters[data_class]
+
+
+def _is_optional(type_: Any) -> bool:
+    return get_origin(type_) is Union and _NONE_TYPE in get_args(type_)
+
+
+def _value_converter(type_: Any) -> Optional[Converter]:
+    """:return: a converter for values of the type, or None if values are used as they come"""
+    if _is_optional(type_):
+        args = [arg for arg in get_args(type_) if arg is not _NONE_TYPE]
+        if len(args) != 1:
+            return None
+        inner = _value_converter(args[0])
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    origin = get_origin(type_)
+    if origin is list:
+        item_converter = _value_converter(get_args(type_)[0])
+        if item_converter is None:
+            return None
+        return lambda value: [item_converter(item) for item in value]
+    if origin in (dict, collections.abc.Mapping):
+        value_converter = _value_converter(get_args(type_)[1])
+        if value_converter is None:
+            return None
+        return lambda value: {key: value_converter(item) for key, item in value.items()}
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        members = {member.value: member for member in type_}
+        # unknown values go through the enum, to raise its ValueError
+        return lambda value: members[value] if value in members else type_(value)
+    if dataclasses.is_dataclass(type_):
+        return _nested_converter(type_)
+    return None
+
+
+def _nested_converter(data_class: type) -> Converter:
+    # resolved on first call, so self referencing dataclasses can be compiled
+    def convert(value):
+        return from_dict(data_class, value)
+    return convert
+
+
+def _compile_dataclass(data_class: type) -> Converter:
+    if not dataclasses.is_dataclass(data_class):
+        raise ConversionError(f'{data_class} is not a dataclass')
+    if 'from_dict' in vars(data_class):
+        # dataclasses with their own conversion, like the order books
+        return data_class.from_dict
+    hints = get_type_hints(data_class)
+    namespace: Dict[str, Any] = {'_cls': data_class, '_ConversionError': ConversionError}
+    arguments = []
+    for field in dataclasses.fields(data_class):
+        if not field.init:
+            continue
+        name = field.name
+        type_ = hints[name]
+        converter = _value_converter(type_)
+        if converter is not None:
+            namespace[f'_convert_{name}'] = converter
+        if field.default is None or (field.default is _MISSING and field.default_factory is _MISSING and _is_optional(type_)):
+            default = 'None'
+        elif field.default is not _MISSING:
+            namespace[f'_default_{name}'] = field.default
+            default = f'_default_{name}'
+        elif field.default_factory is not _MISSING:
+            namespace[f'_factory_{name}'] = field.default_factory
+            default = f'_factory_{name}()'
+        else:
+            default = None
+        if default is None:
+            value = f'data[{name!r}]'
+        elif default == 'None':
+            value = f'get({name!r})'
+        else:
+            value = f'(data[{name!r}] if {name!r} in data else {default})'
+        if converter is not None:
+            if default is None:
+                value = f'_convert_{name}({value})'
+            else:
+                # a missing key takes the default without conversion
+                value = f'(_convert_{name}(data[{name!r}]) if {name!r} in data else {default})'
+        arguments.append(f'        {name}={value},')
+    source = '\n'.join([
+        'def convert(data):',
+        '    get = data.get',
+        '    try:',
+        '        return _cls(',
+        *arguments,
+        '        )',
+        '    except KeyError as error:',
+        f'        raise _ConversionError("missing value for field {{}} of {data_class.__name__}".format(error)) from None',
+    ])
+    exec(compile(source, f'<converter of {data_class.__name__}>', 'exec'), namespace)
+    return namespace['convert']
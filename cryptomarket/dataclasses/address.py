@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from cryptomarket.dataclasses.slots import slotted
 
+
+@slotted
 @dataclass
 class Address:
     address: str
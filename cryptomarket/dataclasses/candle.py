@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 
+from cryptomarket.dataclasses.slots import slotted
+
+
+@slotted
 @dataclass
 class Candle:
     timestamp: str
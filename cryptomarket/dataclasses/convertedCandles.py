@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Dict, List
 from cryptomarket.dataclasses.candle import Candle
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class ConvertedCandles:
     target_currency: str
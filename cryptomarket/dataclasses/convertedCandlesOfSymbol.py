@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import List
 
 from cryptomarket.dataclasses.candle import Candle
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class ConvertedCandlesOfSymbol:
     target_currency: str
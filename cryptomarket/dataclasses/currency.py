@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from cryptomarket.dataclasses.network import Network
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class Currency:
     full_name: str
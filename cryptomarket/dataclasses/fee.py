@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from cryptomarket.dataclasses.slots import slotted
 
+
+@slotted
 @dataclass
 class Fee:
     fee: str
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional
 
+from cryptomarket.dataclasses.slots import slotted
+
 
 class ErrorCode(str, Enum):
     INVALID_ADDRESS = 'INVALID_ADDRESS'
@@ -9,6 +11,7 @@ class ErrorCode(str, Enum):
     BAD_PRECISION = 'BAD_PRECISION'
 
 
+@slotted
 @dataclass
 class NativeTransaction:
     tx_id: str
@@ -4,8 +4,10 @@ from typing import List, Optional
 
 from cryptomarket.args import ContingencyType, OrderStatus, OrderType, Side, TimeInForce
 from cryptomarket.dataclasses.tradeOfOrder import TradeOfOrder
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class Order:
     id: int
@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import List
 
 from cryptomarket.dataclasses.pricePoint import PricePoint
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class PriceHistory:
     currency: str
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
+from cryptomarket.dataclasses.slots import slotted
 
+
+@slotted
 @dataclass
 class PublicTrade:
     id: int
@@ -4,6 +4,7 @@ from typing import Optional
 
 from cryptomarket.args import ContingencyType, OrderType, Side, TimeInForce
 from cryptomarket.dataclasses.order import OrderStatus
+from cryptomarket.dataclasses.slots import slotted
 
 
 class ReportType(str, Enum):
@@ -17,6 +18,7 @@ class ReportType(str, Enum):
     TRADE = 'trade'
 
 
+@slotted
 @dataclass
 class Report:
     id: int
@@ -0,0 +1,73 @@
+"""Slotted dataclasses, for python versions without dataclass(slots=True).
+
+Instances of slotted dataclasses store their fields in slots instead of a
+__dict__, and pickle as the arguments of their constructor.
+"""
+import dataclasses
+import importlib
+import sys
+from typing import Dict, Type, TypeVar
+
+T = TypeVar('T')
+
+_frozen_versions: Dict[type, type] = {}
+
+
+def _reduce(self):
+    return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Rebuilds a dataclass with __slots__ for its fields. Applied over @dataclass"""
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # class level defaults conflict with the slots, the generated __init__ keeps its own
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__reduce__'] = _reduce
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def frozen(cls: Type[T]) -> Type[T]:
+    """Gets a frozen version of a slotted dataclass, with the same name, fields and methods.
+
+    Instances of the frozen version are immutable, and hashable if the values of their
+    fields are, which is not the case of fields holding lists. The frozen version is
+    created on first use, and is importable from this module as Frozen<name>, so its
+    instances can be pickled, and unpickled in another process.
+    """
+    frozen_cls = _frozen_versions.get(cls)
+    if frozen_cls is not None:
+        return frozen_cls
+    namespace = {name: value for name, value in cls.__dict__.items()
+                 if name not in ('__slots__', '__dict__', '__weakref__', '__dataclass_fields__',
+                                 '__dataclass_params__', '__init__', '__repr__', '__eq__', '__hash__')
+                 and name not in cls.__slots__}
+    namespace['__annotations__'] = {field.name: field.type for field in dataclasses.fields(cls)}
+    for field in dataclasses.fields(cls):
+        if field.default is not dataclasses.MISSING:
+            namespace[field.name] = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[field.name] = dataclasses.field(default_factory=field.default_factory)
+    name = f'Frozen{cls.__name__}'
+    namespace['__module__'] = __name__
+    namespace['__qualname__'] = name
+    frozen_cls = slotted(dataclasses.dataclass(frozen=True)(type(name, (), namespace)))
+    setattr(sys.modules[__name__], name, frozen_cls)
+    _frozen_versions[cls] = frozen_cls
+    return frozen_cls
+
+
+def __getattr__(name: str) -> type:
+    # Frozen<name> of a model, created on its first import, like when an instance is unpickled in another process
+    if name.startswith('Frozen'):
+        models = importlib.import_module('cryptomarket.dataclasses')
+        cls = getattr(models, name[len('Frozen'):], None)
+        if isinstance(cls, type) and dataclasses.is_dataclass(cls):
+            return frozen(cls)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
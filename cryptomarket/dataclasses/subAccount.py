@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from cryptomarket.dataclasses.slots import slotted
+
 
 class SubAccountStatus(str, Enum):
     NEW = 'new'
@@ -8,6 +10,7 @@ class SubAccountStatus(str, Enum):
     DISABLE = 'disable'
 
 
+@slotted
 @dataclass
 class SubAccount:
     sub_account_id: str
@@ -1,12 +1,15 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from cryptomarket.dataclasses.slots import slotted
+
 
 class SymbolStatus(str, Enum):
     WORKING = 'working'
     SUSPENDED = 'suspended'
 
 
+@slotted
 @dataclass
 class Symbol:
     type: str
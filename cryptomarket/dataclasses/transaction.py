@@ -6,8 +6,10 @@ from cryptomarket.args import (TransactionStatus, TransactionSubType,
 from cryptomarket.dataclasses.CommitRisk import CommitRisk
 from cryptomarket.dataclasses.metaTransaction import MetaTransaction
 from cryptomarket.dataclasses.nativeTransaction import NativeTransaction
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class Transaction:
     id: int
@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import Any, Dict, List
 
 from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+from cryptomarket.dataclasses.slots import slotted
 
 
+@slotted
 @dataclass
 class WSOrderBook:
     t: int
@@ -0,0 +1,155 @@
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import cryptomarket.args as args
+from cryptomarket.client import Client
+from cryptomarket.dataclasses import Fee
+
+
+@dataclass
+class FeeCacheStats:
+    hits: int = 0
+    misses: int = 0
+    hash_checks: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+def exact_amount(amount: str) -> Hashable:
+    """Buckets an amount by its value, so only equal amounts like 1.5 and 1.50 share a bucket"""
+    return Decimal(amount)
+
+
+def order_of_magnitude(amount: str) -> Hashable:
+    """Buckets an amount by its power of ten, so 120 and 950 share a bucket, and 1000 does not"""
+    value = Decimal(amount)
+    if value == 0:
+        return None
+    return value.adjusted()
+
+
+class WithdrawalFeeCache:
+    """A cache of withdrawal fee estimates, valid while the withdrawal fees hash does not change.
+
+    Fees are cached by currency, network code and amount bucket. All the
+    amounts in a bucket are assumed to pay the same fee, the one estimated for
+    the first amount requested in the bucket. By default a bucket holds a
+    single amount, so the cache never changes the estimates. Coarser buckets,
+    like bucket_of=order_of_magnitude, save requests, but only give the right
+    fees for currencies whose fees do not depend on the amount.
+
+    The hash is checked at most once every hash_ttl seconds, and the cache is
+    cleared when it changes.
+
+    :param client: The rest client used for the requests
+    :param bucket_of: Optional. Gets the bucket of an amount. Default is the exact amount
+    :param hash_ttl: Optional. Seconds between checks of the fees hash. 0 to check before every lookup. Default is 60
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        bucket_of: Callable[[str], Hashable] = exact_amount,
+        hash_ttl: float = 60.0,
+    ):
+        self.client = client
+        self.bucket_of = bucket_of
+        self.hash_ttl = hash_ttl
+        self._fees: Dict[Tuple[str, Optional[str], Hashable], Tuple[str, Optional[str]]] = {}
+        self._hash: Optional[str] = None
+        self._hash_checked_at: Optional[float] = None
+        self._stats = FeeCacheStats()
+        self._lock = threading.Lock()
+
+    def _key(self, fee_request: args.FeeRequest) -> Tuple[str, Optional[str], Hashable]:
+        return (fee_request.currency, fee_request.network_code, self.bucket_of(fee_request.amount))
+
+    def validate(self, force: bool = False) -> bool:
+        """Checks the withdrawal fees hash, and clears the cache if it changed
+
+        :param force: Optional. Checks the hash even if it was checked less than hash_ttl seconds ago
+        :return: True if the cache was cleared
+        """
+        now = time.monotonic()
+        if not force and self._hash_checked_at is not None and now - self._hash_checked_at < self.hash_ttl:
+            return False
+        fees_hash = self.client.get_withdrawal_fees_hash()
+        with self._lock:
+            self._stats.hash_checks += 1
+            self._hash_checked_at = now
+            changed = fees_hash != self._hash
+            if changed and self._hash is not None:
+                self._stats.invalidations += 1
+            if changed:
+                self._fees.clear()
+                self._hash = fees_hash
+            return changed
+
+    def get_estimate_withdrawal_fees(self, fee_requests: List[args.FeeRequest]) -> List[Fee]:
+        """Get a list of estimates of withdrawal fees
+
+        Only one estimate is requested for each missing bucket, and all of them in a single bulk request
+
+        :param fee_requests: A list of fee requests
+
+        :return: A list of expected withdrawal fees, in the order of the requests
+        """
+        self.validate()
+        keys = [self._key(fee_request) for fee_request in fee_requests]
+        with self._lock:
+            missing = {}
+            for key, fee_request in zip(keys, fee_requests):
+                if key in self._fees:
+                    self._stats.hits += 1
+                elif key not in missing:
+                    missing[key] = fee_request
+                    self._stats.misses += 1
+                else:
+                    self._stats.hits += 1
+        if missing:
+            fees = self.client.get_bulk_estimate_withdrawal_fees(list(missing.values()))
+            with self._lock:
+                for key, fee in zip(missing, fees):
+                    self._fees[key] = (fee.fee, fee.network_fee)
+        with self._lock:
+            estimates = [self._fees.get(key) for key in keys]
+        result = []
+        for key, fee_request, estimate in zip(keys, fee_requests, estimates):
+            if estimate is None:
+                # the cache was cleared by a concurrent validation
+                return self.get_estimate_withdrawal_fees(fee_requests)
+            result.append(Fee(fee=estimate[0], network_fee=estimate[1],
+                              amount=fee_request.amount, currency=fee_request.currency))
+        return result
+
+    def get_estimate_withdrawal_fee(self, currency: str, amount: str, network_code: Optional[str] = None) -> str:
+        """Get an estimate of the withdrawal fee
+
+        :param currency: the currency code for withdrawal
+        :param amount: the expected withdraw amount
+        :param network_code: Optional. network code
+
+        :return: The expected fee
+        """
+        fee_request = args.FeeRequest(currency=currency, amount=amount, network_code=network_code)
+        return self.get_estimate_withdrawal_fees([fee_request])[0].fee
+
+    def invalidate(self):
+        """Clears the cache. The hash is checked again on the next lookup"""
+        with self._lock:
+            self._fees.clear()
+            self._hash = None
+            self._hash_checked_at = None
+
+    def stats(self) -> FeeCacheStats:
+        """Gets the hits, misses, hash checks and invalidations since the creation of the cache, and its current size"""
+        with self._lock:
+            return FeeCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                hash_checks=self._stats.hash_checks,
+                invalidations=self._stats.invalidations,
+                size=len(self._fees))
@@ -0,0 +1,162 @@
+"""Exact fixed point numbers for prices, quantities and balances.
+
+A value is an integer of units of 10**-scale. The scale of the prices of a
+symbol is the number of decimals of its tick_size, the scale of its
+quantities the number of decimals of its quantity_increment, and the scale
+of a currency the number of decimals of its precision_transfer. Values with
+more decimals than their scale are rounded half to even.
+"""
+from dataclasses import dataclass, replace
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Dict, Optional, TypeVar
+
+from cryptomarket.dataclasses import Balance, Currency, Symbol
+from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+from cryptomarket.dataclasses.report import Report
+from cryptomarket.dataclasses.wsOrderBook import WSOrderBook
+from cryptomarket.dataclasses.wsOrderBookTop import WSOrderBookTop
+from cryptomarket.dataclasses.wsTicker import WSTicker
+from cryptomarket.exceptions import CryptomarketSDKException
+
+T = TypeVar('T')
+
+
+def scale_of(step: str) -> int:
+    """Gets the number of decimals of a step, like a tick size. '0.000001' has a scale of 6, '10' of 0"""
+    exponent = Decimal(step).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def to_scaled_int(value: str, scale: int) -> int:
+    """Converts a decimal string to an integer of units of 10**-scale, rounding half to even if needed"""
+    whole, _, fraction = value.partition('.')
+    if len(fraction) <= scale and 'e' not in value and 'E' not in value:
+        return int(whole + fraction.ljust(scale, '0'))
+    return int((Decimal(value).scaleb(scale)).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+
+def to_wire(value: int, scale: int) -> str:
+    """Converts an integer of units of 10**-scale to a decimal string, with scale decimals"""
+    if scale == 0:
+        return str(value)
+    sign = '-' if value < 0 else ''
+    digits = str(abs(value)).rjust(scale + 1, '0')
+    return f'{sign}{digits[:-scale]}.{digits[-scale:]}'
+
+
+@dataclass(frozen=True)
+class SymbolScale:
+    price: int
+    quantity: int
+
+    @property
+    def quote(self) -> int:
+        """Scale of amounts of the quote currency, like price times quantity"""
+        return self.price + self.quantity
+
+
+class FixedPoint:
+    """Converts the prices and quantities of parsed objects to exact scaled integers, and back to wire strings.
+
+    The converted objects are copies of the originals, with integers in their
+    numeric fields instead of strings.
+
+    :param symbols: The symbols of the exchange, indexed by symbol id, as returned by get_symbols
+    :param currencies: Optional. The currencies of the exchange, indexed by currency id, as returned by get_currencies. Required for balances
+    """
+
+    def __init__(self, symbols: Dict[str, Symbol], currencies: Optional[Dict[str, Currency]] = None):
+        self.symbol_scales = {symbol_id: SymbolScale(price=scale_of(symbol.tick_size),
+                                                     quantity=scale_of(symbol.quantity_increment))
+                              for symbol_id, symbol in symbols.items()}
+        self.currency_scales = {currency_id: scale_of(currency.precision_transfer)
+                                for currency_id, currency in (currencies or {}).items()}
+
+    @classmethod
+    def from_client(cls, client) -> 'FixedPoint':
+        """Builds the scales from the symbols and currencies of the exchange
+
+        :param client: A rest Client
+        """
+        return cls(client.get_symbols(), client.get_currencies())
+
+    def scale(self, symbol: str) -> SymbolScale:
+        try:
+            return self.symbol_scales[symbol]
+        except KeyError:
+            raise CryptomarketSDKException(f'unknown symbol: {symbol}') from None
+
+    def currency_scale(self, currency: str) -> int:
+        try:
+            return self.currency_scales[currency]
+        except KeyError:
+            raise CryptomarketSDKException(f'unknown currency: {currency}') from None
+
+    # WIRE STRINGS #
+
+    def price(self, symbol: str, value: str) -> int:
+        return to_scaled_int(value, self.scale(symbol).price)
+
+    def quantity(self, symbol: str, value: str) -> int:
+        return to_scaled_int(value, self.scale(symbol).quantity)
+
+    def price_to_wire(self, symbol: str, value: int) -> str:
+        return to_wire(value, self.scale(symbol).price)
+
+    def quantity_to_wire(self, symbol: str, value: int) -> str:
+        return to_wire(value, self.scale(symbol).quantity)
+
+    # OBJECTS #
+
+    def order_book_level(self, symbol: str, level: OrderBookLevel) -> OrderBookLevel:
+        scale = self.scale(symbol)
+        return OrderBookLevel(price=to_scaled_int(level.price, scale.price),
+                              quantity=to_scaled_int(level.quantity, scale.quantity))
+
+    def ws_order_book(self, symbol: str, order_book: WSOrderBook) -> WSOrderBook:
+        scale = self.scale(symbol)
+        return WSOrderBook(
+            t=order_book.t,
+            s=order_book.s,
+            a=[OrderBookLevel(to_scaled_int(level.price, scale.price), to_scaled_int(level.quantity, scale.quantity))
+               for level in order_book.a],
+            b=[OrderBookLevel(to_scaled_int(level.price, scale.price), to_scaled_int(level.quantity, scale.quantity))
+               for level in order_book.b])
+
+    def ws_order_book_top(self, symbol: str, top: WSOrderBookTop) -> WSOrderBookTop:
+        scale = self.scale(symbol)
+        return replace(top,
+                       a=to_scaled_int(top.a, scale.price), A=to_scaled_int(top.A, scale.quantity),
+                       b=to_scaled_int(top.b, scale.price), B=to_scaled_int(top.B, scale.quantity))
+
+    def ws_ticker(self, symbol: str, ticker: WSTicker) -> WSTicker:
+        """Converts prices, quantities and the base volume. The quote volume has the quote scale, and the change percent stays a string"""
+        scale = self.scale(symbol)
+        prices = {name: to_scaled_int(getattr(ticker, name), scale.price)
+                  for name in ('a', 'b', 'c', 'o', 'h', 'l', 'p')}
+        quantities = {name: to_scaled_int(getattr(ticker, name), scale.quantity)
+                      for name in ('A', 'B', 'v')}
+        return replace(ticker, q=to_scaled_int(ticker.q, scale.quote), **prices, **quantities)
+
+    def report(self, report: Report) -> Report:
+        """Converts prices and quantities. The trade fee stays a string"""
+        scale = self.scale(report.symbol)
+        return replace(
+            report,
+            quantity=to_scaled_int(report.quantity, scale.quantity),
+            quantity_cumulative=to_scaled_int(report.quantity_cumulative, scale.quantity),
+            price=_optional(report.price, scale.price),
+            stop_price=_optional(report.stop_price, scale.price),
+            trade_quantity=_optional(report.trade_quantity, scale.quantity),
+            trade_price=_optional(report.trade_price, scale.price))
+
+    def balance(self, balance: Balance, currency: Optional[str] = None) -> Balance:
+        """:param currency: Optional. The currency of the balance, if the balance does not have it"""
+        scale = self.currency_scale(currency or balance.currency)
+        return replace(balance,
+                       available=to_scaled_int(balance.available, scale),
+                       reserved=to_scaled_int(balance.reserved, scale))
+
+
+def _optional(value: Optional[str], scale: int) -> Optional[int]:
+    return None if value is None else to_scaled_int(value, scale)
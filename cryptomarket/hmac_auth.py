@@ -2,43 +2,119 @@ from base64 import b64encode
 from hashlib import sha256
 from hmac import HMAC
 from time import time
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import urlsplit
 
 from requests.auth import AuthBase
 
+_BLOCK_SIZE = sha256().block_size
+_INNER_PAD = bytes(byte ^ 0x36 for byte in range(256))
+_OUTER_PAD = bytes(byte ^ 0x5C for byte in range(256))
+
+
+class HmacSigner:
+    """Signs messages with HMAC SHA256 and a fixed key.
+
+    The inner and outer hashes of the HMAC construction (RFC 2104) are keyed
+    once, and each message is signed on copies of them, instead of keying a
+    new HMAC for every message.
+
+    :param secret_key: The key of the signatures
+    """
+
+    def __init__(self, secret_key: str):
+        key = secret_key.encode()
+        if len(key) > _BLOCK_SIZE:
+            key = sha256(key).digest()
+        key = key.ljust(_BLOCK_SIZE, b'\0')
+        self._inner = sha256(key.translate(_INNER_PAD))
+        self._outer = sha256(key.translate(_OUTER_PAD))
+
+    def sign(self, message: bytes) -> str:
+        """:return: the hex digest of the signature of the message"""
+        inner = self._inner.copy()
+        inner.update(message)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
 
 class HmacAuth(AuthBase):
     def __init__(self, api_key: str, secret_key: str, window: Optional[int] = None):
-        self.api_key = api_key
-        self.secret_key = secret_key
-        self.window = window
+        self._api_key = api_key
+        self._secret_key = secret_key
+        self._window = window
+        self._prepare()
+
+    def _prepare(self):
+        # everything that does not change between requests is computed here
+        self._signer = HmacSigner(self._secret_key)
+        self._window_str = str(self._window) if self._window else ''
+        self._key_prefix = self._api_key.encode() + b':'
+        self._window_suffix = b':' + self._window_str.encode() if self._window_str else b''
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str):
+        self._api_key = api_key
+        self._prepare()
+
+    @property
+    def secret_key(self) -> str:
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, secret_key: str):
+        self._secret_key = secret_key
+        self._prepare()
+
+    @property
+    def window(self) -> Optional[int]:
+        return self._window
+
+    @window.setter
+    def window(self, window: Optional[int]):
+        self._window = window
+        self._prepare()
 
     def __call__(self, r):
         url = urlsplit(r.url)
-        message = [r.method, url.path]
-        if url.query:
-            message.append('?')
-            message.append(url.query)
-        if r.body:
-            message.append(r.body)
+        r.headers['Authorization'] = self.get_credential(
+            r.method, url.path, url.query, r.body)
+        return r
+
+    def get_credential(
+        self,
+        method: str,
+        path: str,
+        query: Optional[str] = None,
+        body: Optional[Union[str, bytes]] = None
+    ) -> str:
+        """Builds the value of the Authorization header of a request
 
+        :param method: The http method of the request
+        :param path: The path of the request url
+        :param query: Optional. The encoded query string of the request url, without the '?'
+        :param body: Optional. The body of the request
+
+        :return: The authorization header value
+        """
         timestamp = str(int(time() * 1000))
-        window = str(self.window) if self.window else None
-        message.append(timestamp)
-        if window:
-            message.append(window)
-
-        signature = HMAC(key=self.secret_key.encode(),
-                         msg=''.join(message).encode(),
-                         digestmod=sha256).hexdigest()
-        data = [self.api_key, signature, timestamp]
-        if window:
-            data.append(window)
-
-        base64_encoded = b64encode(':'.join(data).encode()).decode()
-        r.headers['Authorization'] = f'HS256 {base64_encoded}'
-        return r
+        message = f'{method}{path}?{query}' if query else f'{method}{path}'
+        if body:
+            message = message.encode()
+            if not isinstance(body, bytes):
+                body = body.encode()
+            message += body + (timestamp + self._window_str).encode()
+        else:
+            message = (message + timestamp + self._window_str).encode()
+        signature = self._signer.sign(message)
+        credential = self._key_prefix + signature.encode() + b':' + \
+            timestamp.encode() + self._window_suffix
+        return 'HS256 ' + b64encode(credential).decode()
 
     @staticmethod
     def get_signature(message, password):
@@ -1,57 +1,269 @@
-import json
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
 
-from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.cache import make_key
+from cryptomarket.exceptions import (CryptomarketAPIException,
+                                     CryptomarketSDKException)
 from cryptomarket.hmac_auth import HmacAuth
+from cryptomarket.json_codec import JsonCodec, resolve_codec
+from cryptomarket.json_stream import iter_items
+from cryptomarket.metrics import BUILD, DECODE, NETWORK, SIGN, RequestMetrics
+from cryptomarket.rate_limiter import RateLimiter
+from cryptomarket.single_flight import CoalescingStats, SingleFlight
+from cryptomarket.transport import Http2Transport, httpx
 
 api_url = 'https://api.exchange.cryptomkt.com/api/3/'
 
+# the errors of a failed request, of a requests session or of an Http2Transport
+_TRANSPORT_ERRORS = (requests.RequestException,) if httpx is None else (requests.RequestException, httpx.HTTPError)
+
+
+class _TimedAuth(AuthBase):
+    # signs with an HmacAuth, adding the seconds spent to the sign time of the current thread,
+    # that can be one of the warm up or keep alive threads, which send untimed requests
+    def __init__(self, auth: HmacAuth, local: threading.local):
+        self.auth = auth
+        self._local = local
+
+    def __call__(self, r):
+        started = perf_counter()
+        try:
+            return self.auth(r)
+        finally:
+            self._local.sign = getattr(self._local, 'sign', 0.0) + perf_counter() - started
+
+    def get_credential(self, *args, **kwargs) -> str:
+        started = perf_counter()
+        try:
+            return self.auth.get_credential(*args, **kwargs)
+        finally:
+            self._local.sign = getattr(self._local, 'sign', 0.0) + perf_counter() - started
+
 
 class HttpClient:
+    """http client, with a pool of keep alive connections shared by all the requests.
+
+    :param pool_connections: Optional. Number of connection pools to cache, one per host. Default is 10
+    :param pool_maxsize: Optional. Maximum number of connections kept open to the exchange. Default is 10
+    :param timeout: Optional. Seconds to wait for the server in each request, or a (connect, read) tuple. Default is no timeout
+    :param keep_alive: Optional. If False, each request opens a new connection. Default is True
+    :param transport: Optional. 'http1' for a requests session, 'http2' for an Http2Transport that multiplexes the requests in flight over one connection, or a transport with the interface of a requests session. Default is 'http1'
+    :param metrics: Optional. RequestMetrics that record the build, sign, network and decode latencies of each request. Default is no metrics
+    :param base_url: Optional. The url the endpoints are relative to, like the one of a MockExchange. Default is the url of the exchange api
+    """
 
-    def __init__(self, api_key: str, api_secret: str, window: Optional[int] = None):
+    def __init__(self, api_key: str, api_secret: str, window: Optional[int] = None, rate_limiter: Optional[RateLimiter] = None, codec: Optional[Union[JsonCodec, str]] = None, coalesce: bool = False, pool_connections: int = 10, pool_maxsize: int = 10, timeout: Optional[Union[float, Tuple[float, float]]] = None, keep_alive: bool = True, transport: Optional[Union[str, Any]] = None, metrics: Optional[RequestMetrics] = None, base_url: str = api_url):
         self.api_key = api_key
         self.api_secret = api_secret
         self.window = window
+        self.rate_limiter = rate_limiter
+        self.codec = resolve_codec(codec)
+        self.single_flight = SingleFlight() if coalesce else None
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.metrics = metrics
+        self.base_url = base_url.rstrip('/') + '/'
+        self._local = threading.local()
+        self._keep_alive_stop: Optional[threading.Event] = None
         self.session_is_open = False
-        session = requests.session()
+        if transport is None or transport == 'http1':
+            session = requests.session()
+            if not keep_alive:
+                session.headers['Connection'] = 'close'
+            session.mount('https://', HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize))
+        elif transport == 'http2':
+            session = Http2Transport(max_connections=pool_maxsize, keep_alive=keep_alive)
+        elif isinstance(transport, str):
+            raise CryptomarketSDKException(f'unknown transport: {transport}')
+        else:
+            session = transport
         session.headers.update({'User-Agent': 'cryptomarket/python'})
         self.session = session
         self.session_is_open = True
 
     def close_session(self):
+        self._stop_keep_alive()
         self.session.close()
         self.session_is_open = False
 
+    def warm_up(self, connections: int = 1, keep_alive_interval: Optional[float] = None):
+        """Opens connections to the exchange ahead of the first requests, so they skip the TCP and TLS handshakes
+
+        :param connections: Optional. Number of connections to open at once. At most pool_maxsize. Default is 1
+        :param keep_alive_interval: Optional. If given, the connections are used again every keep_alive_interval seconds from a background thread, so the server does not close them while idle. Default is no keep alive pings
+        """
+        connections = max(1, min(connections, self.pool_maxsize))
+        self._open_connections(connections)
+        self._stop_keep_alive()
+        if keep_alive_interval is not None:
+            stop = threading.Event()
+
+            def keep_alive():
+                while not stop.wait(keep_alive_interval):
+                    try:
+                        self._open_connections(connections)
+                    except _TRANSPORT_ERRORS:
+                        pass  # the next request opens a new connection
+            self._keep_alive_stop = stop
+            threading.Thread(target=keep_alive, name='cryptomarket-keep-alive', daemon=True).start()
+
+    def _open_connections(self, connections: int):
+        if connections == 1:
+            self._ping()
+            return
+        # concurrent requests take one connection each from the pool, opening the missing ones
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            for future in [executor.submit(self._ping) for _ in range(connections)]:
+                future.result()
+
+    def _ping(self):
+        # the response does not matter, only the connection left in the pool
+        self.session.head(self.base_url, timeout=self.timeout).close()
+
+    def _stop_keep_alive(self):
+        if self._keep_alive_stop is not None:
+            self._keep_alive_stop.set()
+            self._keep_alive_stop = None
+
     def reset_authorization(self):
         assert self.session_is_open == True
-        self.session.auth = HmacAuth(
-            self.api_key, self.api_secret, window=self.window)
+        auth = HmacAuth(self.api_key, self.api_secret, window=self.window)
+        self.session.auth = auth if self.metrics is None else _TimedAuth(auth, self._local)
+
+    @property
+    def last_wait(self) -> float:
+        """Seconds the last request of the current thread waited for the rate limiter"""
+        return getattr(self._local, 'last_wait', 0.0)
+
+    def _wait_rate_limit(self, endpoint):
+        if self.rate_limiter is not None:
+            self._local.last_wait = self.rate_limiter.acquire(endpoint)
+
+    def coalescing_stats(self) -> Optional[CoalescingStats]:
+        """Gets the get requests and how many shared an in flight response. None if coalescing is off"""
+        if self.single_flight is None:
+            return None
+        return self.single_flight.stats()
 
     def get(self, endpoint, params=None):
-        response = self.session.get(api_url + endpoint, params=params)
-        return self._handle_response(response)
+        if self.single_flight is not None:
+            return self.single_flight.do(
+                make_key(endpoint, params), lambda: self._get(endpoint, params))
+        return self._get(endpoint, params)
+
+    def _get(self, endpoint, params=None):
+        self._wait_rate_limit(endpoint)
+        started = perf_counter()
+        return self._send(endpoint, started, 'GET', params=params)
+
+    def stream_get(self, endpoint, params=None, chunk_size: int = 65536) -> Iterator[Any]:
+        """Makes a get request, and decodes the top level items of the response as they are read
+
+        :param chunk_size: Optional. Bytes read from the connection at a time. Default is 65536
+
+        :return: An iterator of (key, value) tuples if the response is an object, or of elements if it is an array
+        """
+        self._wait_rate_limit(endpoint)
+        started = perf_counter()
+        # only the time to the headers is recorded, as the body is read with the items
+        response = self._timed(endpoint, started, 'GET', dict(params=params, stream=True))
+        try:
+            if not str(response.status_code).startswith('2'):
+                raise CryptomarketAPIException(response)
+            try:
+                yield from iter_items(response.iter_content(chunk_size))
+            except ValueError:
+                raise Exception(f'Invalid Response: {response}')
+        finally:
+            response.close()
 
     def post(self, endpoint, params=None):
-        response = self.session.post(
-            api_url + endpoint,
-            data=json.dumps(params),
-            headers={'Content-Type': 'application/json'})
-        return self._handle_response(response)
+        self._wait_rate_limit(endpoint)
+        started = perf_counter()
+        data = self.codec.dumps(params)
+        return self._send(endpoint, started, 'POST', data=data, headers={'Content-Type': 'application/json'})
 
     def put(self, endpoint, params=None):
-        response = self.session.put(api_url + endpoint, params=params)
-        return self._handle_response(response)
+        self._wait_rate_limit(endpoint)
+        started = perf_counter()
+        return self._send(endpoint, started, 'PUT', params=params)
 
     def patch(self, endpoint, params=None):
-        response = self.session.patch(api_url + endpoint, data=params)
-        return self._handle_response(response)
+        self._wait_rate_limit(endpoint)
+        started = perf_counter()
+        return self._send(endpoint, started, 'PATCH', data=params)
 
     def delete(self, endpoint, params=None):
-        response = self.session.delete(api_url + endpoint, params=params)
-        return self._handle_response(response)
+        self._wait_rate_limit(endpoint)
+        started = perf_counter()
+        return self._send(endpoint, started, 'DELETE', params=params)
+
+    def _send(self, endpoint, started: float, method: str, **kwargs):
+        """Sends a request built since started, and decodes its response, recording the latencies if there are metrics"""
+        if self.metrics is None:
+            return self._handle_response(self._request(method, endpoint, kwargs))
+        response = self._timed(endpoint, started, method, kwargs)
+        received = perf_counter()
+        result = self._handle_response(response)
+        decoded = perf_counter()
+        self.metrics.record(self._local.endpoint, DECODE, decoded - received)
+        self._local.decoded_at = decoded
+        return result
+
+    def _request(self, method: str, endpoint, kwargs: Dict[str, Any]):
+        # through the methods of the transport, like session.get
+        return getattr(self.session, method.lower())(self.base_url + endpoint, timeout=self.timeout, **kwargs)
+
+    def _prepare(self, method: str, endpoint, kwargs: Dict[str, Any]) -> Optional[Callable[[], Any]]:
+        """Builds and signs a request, as the transport would when sending it
+
+        :return: A function that sends the request, or None if the transport does not build requests apart
+        """
+        url = self.base_url + endpoint
+        session = self.session
+        if isinstance(session, requests.Session):
+            stream = kwargs.get('stream', False)
+            request = session.prepare_request(requests.Request(
+                method, url, params=kwargs.get('params'), data=kwargs.get('data'), headers=kwargs.get('headers')))
+            settings = session.merge_environment_settings(request.url, {}, stream, None, None)
+            return lambda: session.send(request, timeout=self.timeout, allow_redirects=True, **settings)
+        if isinstance(session, Http2Transport):
+            stream = kwargs.get('stream', False)
+            request = session.build_request(
+                method, url, params=kwargs.get('params'), data=kwargs.get('data'), headers=kwargs.get('headers'),
+                timeout=self.timeout)
+            return lambda: session.send(request, stream=stream)
+        return None
+
+    def _timed(self, endpoint, started: float, method: str, kwargs: Dict[str, Any]):
+        if self.metrics is None:
+            return self._request(method, endpoint, kwargs)
+        self._local.sign = 0.0
+        send = self._prepare(method, endpoint, kwargs)
+        built = perf_counter()
+        # the signature is made while building, or inside the call of a transport that does not build apart
+        build_sign = self._local.sign
+        response = send() if send is not None else self._request(method, endpoint, kwargs)
+        network = perf_counter() - built
+        sign = self._local.sign
+        label = self.metrics.label(endpoint)
+        self.metrics.record(label, BUILD, built - started - build_sign)
+        if isinstance(self.session.auth, _TimedAuth):
+            self.metrics.record(label, SIGN, sign)
+        self.metrics.record(label, NETWORK, network - (sign - build_sign))
+        self._local.endpoint = label
+        return response
+
+    @property
+    def last_response(self) -> Tuple[Optional[str], Optional[float]]:
+        """The endpoint label and the perf_counter time at which the last decoded response of the current thread was ready, if there are metrics"""
+        return getattr(self._local, 'endpoint', None), getattr(self._local, 'decoded_at', None)
 
     def _handle_response(self, response):
         """Internal helper for handling API responses from the CryptoMarket server.
@@ -61,6 +273,7 @@ class HttpClient:
         if not str(response.status_code).startswith('2'):
             raise CryptomarketAPIException(response)
         try:
-            return response.json()
+            # decoded from the raw bytes, without building the text first
+            return self.codec.loads(response.content)
         except ValueError:
             raise Exception(f'Invalid Response: {response}')
@@ -0,0 +1,84 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from cryptomarket.exceptions import CryptomarketSDKException
+
+
+class JsonCodec:
+    """Encodes and decodes json with the standard library.
+
+    Decodes both str and bytes, so responses can be decoded as they are read
+    """
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def dumps_str(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes json with orjson (pip install cryptomarket[fast])"""
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise CryptomarketSDKException(
+                'orjson is not installed. install it with: pip install cryptomarket[fast]')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_str(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+
+def get_codec(name: str = 'auto') -> JsonCodec:
+    """Gets a json codec by name
+
+    :param name: Optional. 'json' for the standard library, 'orjson', or 'auto' for orjson if it is installed and the standard library otherwise. Default is 'auto'
+
+    :return: A json codec
+    """
+    if name == 'auto':
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    if name == 'orjson':
+        return OrjsonCodec()
+    if name == 'json':
+        return JsonCodec()
+    raise CryptomarketSDKException(f'unknown json codec: {name}')
+
+
+_default_codec = get_codec()
+
+
+def get_default_codec() -> JsonCodec:
+    """Gets the codec used by the clients created without one"""
+    return _default_codec
+
+
+def set_default_codec(codec: Union[JsonCodec, str]):
+    """Sets the codec used by the clients created without one
+
+    :param codec: A json codec, or the name of one
+    """
+    global _default_codec
+    _default_codec = get_codec(codec) if isinstance(codec, str) else codec
+
+
+def resolve_codec(codec: Optional[Union[JsonCodec, str]]) -> JsonCodec:
+    if codec is None:
+        return _default_codec
+    return get_codec(codec) if isinstance(codec, str) else codec
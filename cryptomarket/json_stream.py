@@ -0,0 +1,162 @@
+"""Incremental decoding of the top level items of a json body, as its chunks arrive.
+
+The body must be a json object or a json array. Each member of the object,
+or element of the array, is decoded as soon as its last byte is read, so only
+one of them is kept in memory at a time.
+
+Items are decoded with the scanner of the standard library, which can decode
+a value from the middle of a buffer and tell where it ends.
+"""
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_CLOSING = {'{': '}', '[': ']'}
+
+
+class _Incomplete(Exception):
+    pass
+
+
+class JsonStreamDecoder:
+    """Decodes the top level items of a json object or array, from the chunks of its body.
+
+    Items of an object are (key, value) tuples, and items of an array are its
+    elements. An item cut by the end of a chunk is decoded again with the
+    next chunk, or once the buffered part of it doubles if it is longer than
+    a chunk, so each byte of a long item is decoded a bounded number of times.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pending = 0
+        self._container = ''
+        self.count = 0
+        """the number of items decoded"""
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds the next chunk of the body
+
+        :return: the items completed by the chunk
+        """
+        self._buffer += self._utf8.decode(chunk)
+        if self.done:
+            self._check_end()
+            return []
+        if self._pending > len(chunk) and len(self._buffer) < 2 * self._pending:
+            return []
+        return self._decode_items(final=False)
+
+    def close(self) -> List[Any]:
+        """Decodes the items left at the end of the body, and checks the body is complete
+
+        :return: the last items
+        """
+        self._buffer += self._utf8.decode(b'', final=True)
+        items = [] if self.done else self._decode_items(final=True)
+        self._check_end()
+        return items
+
+    def _check_end(self):
+        if self._buffer.strip(' \t\n\r'):
+            raise ValueError('data after the end of the json value')
+        self._buffer = ''
+
+    def _decode_items(self, final: bool) -> List[Any]:
+        buffer = self._buffer
+        items = []
+        position = start = 0
+        try:
+            if not self._container:
+                position = self._skip(buffer, position, final)
+                if buffer[position] not in _CLOSING:
+                    raise ValueError('the json value is not an object nor an array')
+                self._container = buffer[position]
+                position = start = position + 1
+            closing = _CLOSING[self._container]
+            while True:
+                position = self._skip(buffer, position, final)
+                if buffer[position] == closing:
+                    self.done = True
+                    self._buffer = buffer[position + 1:]
+                    self._check_end()
+                    return items
+                if self.count:
+                    if buffer[position] != ',':
+                        raise ValueError(f'expecting a comma at: {buffer[position:position + 20]!r}')
+                    position = self._skip(buffer, position + 1, final)
+                    if buffer[position] == closing:
+                        raise ValueError('trailing comma before the end of the json value')
+                item, position = self._decode_item(buffer, position, final)
+                items.append(item)
+                self.count += 1
+                start = position
+        except _Incomplete:
+            # keeps what follows the last decoded item
+            self._buffer = buffer[start:]
+            self._pending = len(self._buffer)
+            return items
+
+    def _skip(self, buffer: str, position: int, final: bool) -> int:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position == len(buffer):
+            if final:
+                raise ValueError('incomplete json value')
+            raise _Incomplete()
+        return position
+
+    def _decode_item(self, buffer: str, position: int, final: bool):
+        try:
+            if self._container == '{':
+                key, position = self._decoder.raw_decode(buffer, position)
+                if not isinstance(key, str):
+                    raise ValueError('the keys of a json object must be strings')
+                position = self._skip(buffer, position, final)
+                if buffer[position] != ':':
+                    raise ValueError(f'expecting a colon at: {buffer[position:position + 20]!r}')
+                position = self._skip(buffer, position + 1, final)
+                value, position = self._decoder.raw_decode(buffer, position)
+                item = (key, value)
+            else:
+                item, position = self._decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            raise _Incomplete() from None
+        # a number at the end of the buffer may continue in the next chunk
+        if position == len(buffer) and not final:
+            raise _Incomplete()
+        return item, position
+
+
+def iter_items(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Decodes the top level items of a json body, from the chunks of the body
+
+    :param chunks: The chunks of the body, as they are read
+
+    :return: An iterator of (key, value) tuples for an object, or of elements for an array
+    """
+    decoder = JsonStreamDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_items(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Decodes the top level items of a json body, from the chunks of the body, as an async iterator
+
+    :param chunks: The chunks of the body, as they are read
+
+    :return: An async iterator of (key, value) tuples for an object, or of elements for an array
+    """
+    decoder = JsonStreamDecoder()
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
@@ -0,0 +1,137 @@
+"""Read only views over decoded json, that convert their items on first access.
+
+A view keeps the decoded json it wraps, and builds the dataclass of an item
+only when the item is accessed, caching it for the next accesses. Items that
+are never read are never converted.
+"""
+from typing import (Any, Callable, Dict, Iterator, List, Mapping, Sequence,
+                    TypeVar, Union, overload)
+
+from cryptomarket.converter import get_converter
+from cryptomarket.dataclasses import OrderBook
+from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+
+V = TypeVar('V')
+
+_MISSING = object()
+
+
+class LazyMapping(Mapping[str, V]):
+    """A read only dict, with the items converted on first access
+
+    :param raw: The decoded json of the items, indexed by key
+    :param convert: Converts the decoded json of one item
+    """
+    __slots__ = ('_raw', '_convert', '_cache')
+
+    def __init__(self, raw: Dict[str, Any], convert: Callable[[Any], V]):
+        self._raw = raw
+        self._convert = convert
+        self._cache: Dict[str, V] = {}
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The decoded json of the items"""
+        return self._raw
+
+    def __getitem__(self, key: str) -> V:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._convert(self._raw[key])
+            self._cache[key] = value
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({len(self)} items, {len(self._cache)} converted)'
+
+
+class LazySequence(Sequence[V]):
+    """A read only list, with the items converted on first access
+
+    :param raw: The decoded json of the items
+    :param convert: Converts the decoded json of one item
+    """
+    __slots__ = ('_raw', '_convert', '_cache')
+
+    def __init__(self, raw: List[Any], convert: Callable[[Any], V]):
+        self._raw = raw
+        self._convert = convert
+        self._cache: List[Any] = [_MISSING] * len(raw)
+
+    @property
+    def raw(self) -> List[Any]:
+        """The decoded json of the items"""
+        return self._raw
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[V]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[V, List[V]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        value = self._cache[index]
+        if value is _MISSING:
+            value = self._convert(self._raw[index])
+            self._cache[index] = value
+        return value
+
+    def __iter__(self) -> Iterator[V]:
+        for index in range(len(self._raw)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, LazySequence)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        converted = sum(1 for value in self._cache if value is not _MISSING)
+        return f'{type(self).__name__}({len(self)} items, {converted} converted)'
+
+
+def lazy_mapping(data_class: type, raw: Dict[str, Any]) -> LazyMapping:
+    """Views a dict of decoded dataclasses, indexed by key"""
+    return LazyMapping(raw, get_converter(data_class))
+
+
+def lazy_sequence(data_class: type, raw: List[Any]) -> LazySequence:
+    """Views a list of decoded dataclasses"""
+    return LazySequence(raw, get_converter(data_class))
+
+
+def lazy_sequences(data_class: type, raw: Dict[str, List[Any]]) -> LazyMapping:
+    """Views a dict of lists of decoded dataclasses, indexed by key"""
+    converter = get_converter(data_class)
+    return LazyMapping(raw, lambda items: LazySequence(items, converter))
+
+
+def _order_book_level(level: List[str]) -> OrderBookLevel:
+    return OrderBookLevel(price=level[0], quantity=level[1])
+
+
+def lazy_order_book(raw: Dict[str, Any]) -> OrderBook:
+    """Builds an order book with its levels parsed on first access"""
+    return OrderBook(timestamp=raw['timestamp'],
+                     ask=LazySequence(raw['ask'], _order_book_level),
+                     bid=LazySequence(raw['bid'], _order_book_level))
+
+
+def lazy_order_books(raw: Dict[str, Dict[str, Any]]) -> LazyMapping:
+    """Views a dict of decoded order books, indexed by symbol"""
+    return LazyMapping(raw, lazy_order_book)
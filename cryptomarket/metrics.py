@@ -0,0 +1,227 @@
+"""Latency of the phases of the rest requests, by endpoint.
+
+Each request is timed in phases: building the request, signing it, the
+network round trip (connection, server time and download of the body),
+decoding the json body, and converting it to dataclasses. The latencies
+are kept in rolling windows with their quantiles, and can be read as
+stats or exported in the Prometheus text format, to a file or on a port.
+"""
+import math
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+BUILD = 'build'
+SIGN = 'sign'
+NETWORK = 'network'
+DECODE = 'decode'
+CONVERT = 'convert'
+PHASES = (BUILD, SIGN, NETWORK, DECODE, CONVERT)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+ROUTES = (
+    # before the routes with a parameter in their place
+    'spot/order/list',
+    'public/currency/{currency}',
+    'public/symbol/{symbol}',
+    'public/ticker/{symbol}',
+    'public/price/ticker/{symbol}',
+    'public/trades/{symbol}',
+    'public/orderbook/{symbol}',
+    'public/candles/{symbol}',
+    'public/converted/candles/{symbol}',
+    'spot/balance/{currency}',
+    'spot/fee/{symbol}',
+    'spot/order/{client_order_id}',
+    'sub-account/balance/{sub_account_id}',
+    'sub-account/crypto/address/{sub_account_id}/{currency}',
+    'wallet/balance/{currency}',
+    'wallet/crypto/withdraw/{id}',
+    'wallet/transactions/{id}',
+)
+"""templates of the endpoints with parameters in their path"""
+
+_ROUTE_SEGMENTS = [(route, route.split('/')) for route in ROUTES]
+
+Hook = Callable[[str, str, float], None]
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Labels an endpoint with the template of its route, or with its path if it matches none of the ROUTES
+
+    e.g. 'public/ticker/EOSETH' is labeled 'public/ticker/{symbol}'
+    """
+    path = endpoint.strip('/')
+    segments = path.split('/')
+    for route, route_segments in _ROUTE_SEGMENTS:
+        if len(route_segments) == len(segments) and all(
+                template.startswith('{') or template == segment
+                for template, segment in zip(route_segments, segments)):
+            return route
+    return path
+
+
+@dataclass
+class LatencyStats:
+    count: int = 0
+    """samples since the creation"""
+    total: float = 0.0
+    """seconds of all the samples since the creation"""
+    p50: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+    """maximum of the rolling window"""
+
+
+class LatencyHistogram:
+    """The latencies of the last samples, with their quantiles.
+
+    :param window: Optional. Number of recent samples the quantiles are computed from. Default is 1024
+    """
+
+    def __init__(self, window: int = 1024):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def stats(self) -> LatencyStats:
+        samples = sorted(self._samples)
+        if not samples:
+            return LatencyStats()
+        return LatencyStats(count=self.count, total=self.total, p50=_quantile(samples, 0.5),
+                            p99=_quantile(samples, 0.99), max=samples[-1])
+
+
+def _quantile(samples: List[float], q: float) -> float:
+    # nearest rank of sorted samples
+    return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+
+class RequestMetrics:
+    """Latencies of the phases of the requests, by endpoint.
+
+    The phases are 'build', 'sign', 'network', 'decode' and 'convert'.
+
+    :param window: Optional. Number of recent samples of each endpoint and phase the quantiles are computed from. Default is 1024
+    :param label: Optional. Labels the endpoints, so all the requests to a path share a histogram. Default is endpoint_label
+    :param hooks: Optional. Functions called with the endpoint label, the phase and the seconds of every sample. Default is no hooks
+    """
+
+    def __init__(self, window: int = 1024, label: Callable[[str], str] = endpoint_label, hooks: Optional[List[Hook]] = None):
+        self.window = window
+        self.label = label
+        self.hooks: List[Hook] = list(hooks or [])
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Hook):
+        """Adds a function called with the endpoint label, the phase and the seconds of every sample"""
+        self.hooks.append(hook)
+
+    def record(self, endpoint: str, phase: str, seconds: float):
+        """Records the latency of a phase of a request
+
+        :param endpoint: The label of the endpoint
+        :param phase: The phase of the request
+        :param seconds: The latency
+        """
+        key = (endpoint, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram(self.window)
+            histogram.add(seconds)
+        for hook in self.hooks:
+            hook(endpoint, phase, seconds)
+
+    def stats(self) -> Dict[str, Dict[str, LatencyStats]]:
+        """Gets the latencies of the requests
+
+        :return: A dict of latency stats indexed by endpoint label, and then by phase
+        """
+        with self._lock:
+            stats: Dict[str, Dict[str, LatencyStats]] = {}
+            for (endpoint, phase), histogram in sorted(self._histograms.items()):
+                stats.setdefault(endpoint, {})[phase] = histogram.stats()
+            return stats
+
+    def reset(self):
+        """Drops all the samples"""
+        with self._lock:
+            self._histograms.clear()
+
+    def to_prometheus(self, prefix: str = 'cryptomarket') -> str:
+        """Formats the latencies in the Prometheus text format, as a summary of the quantiles, sum and count, and a gauge of the max
+
+        :param prefix: Optional. Prefix of the metric names. Default is 'cryptomarket'
+
+        :return: the text of the metrics
+        """
+        name = f'{prefix}_request_seconds'
+        summary = [f'# HELP {name} Latency of the phases of the rest requests, over the last {self.window} samples.',
+                   f'# TYPE {name} summary']
+        gauge = [f'# HELP {name}_max Maximum latency of the phases of the rest requests, over the last {self.window} samples.',
+                 f'# TYPE {name}_max gauge']
+        for endpoint, phases in self.stats().items():
+            for phase, stats in phases.items():
+                labels = f'endpoint="{_escape(endpoint)}",phase="{phase}"'
+                summary.append(f'{name}{{{labels},quantile="0.5"}} {stats.p50!r}')
+                summary.append(f'{name}{{{labels},quantile="0.99"}} {stats.p99!r}')
+                summary.append(f'{name}_sum{{{labels}}} {stats.total!r}')
+                summary.append(f'{name}_count{{{labels}}} {stats.count}')
+                gauge.append(f'{name}_max{{{labels}}} {stats.max!r}')
+        return '\n'.join(summary + gauge) + '\n'
+
+    def write_prometheus(self, path: str, prefix: str = 'cryptomarket'):
+        """Writes the latencies in the Prometheus text format to a file, like one read by the textfile collector of the node exporter
+
+        The file is replaced at once, so readers never see a partial file.
+
+        :param path: The path of the file
+        :param prefix: Optional. Prefix of the metric names. Default is 'cryptomarket'
+        """
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w') as file:
+            file.write(self.to_prometheus(prefix))
+        os.replace(temporary, path)
+
+    def serve_prometheus(self, port: int, host: str = '127.0.0.1', prefix: str = 'cryptomarket') -> ThreadingHTTPServer:
+        """Serves the latencies in the Prometheus text format on a port, from a background thread
+
+        :param port: The port to listen on. 0 for any free port
+        :param host: Optional. The address to listen on. Default is '127.0.0.1'
+        :param prefix: Optional. Prefix of the metric names. Default is 'cryptomarket'
+
+        :return: The server. Its server_address has the port, and shutdown() stops it
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.to_prometheus(prefix).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='cryptomarket-metrics', daemon=True).start()
+        return server
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
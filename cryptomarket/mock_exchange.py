@@ -0,0 +1,1243 @@
+"""A local stand in of the exchange, for benchmarks and offline tests.
+
+The MockExchange serves the rest api and the public, trading and wallet
+websocket apis on a local port. Its market data is synthetic: the price of
+each symbol follows a random walk, with an order book and trades that change
+a configurable number of times per second. Authenticated requests are
+verified with the HMAC signatures of the exchange. Orders are matched against
+the synthetic book: market orders and crossing limit orders fill at once, and
+resting limit orders fill at random.
+
+Filters of the requests other than symbols, currencies, limits, offsets and
+sorting are ignored, and unsupported endpoints answer with a 404 error.
+
+Requires aiohttp (pip install cryptomarket[async])
+
+It can also be run on its own, to point other processes at it:
+python -m cryptomarket.mock_exchange --port 8080
+"""
+import argparse
+import asyncio
+import hmac
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from base64 import b64decode
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl
+
+try:
+    from aiohttp import WSMsgType, web
+except ImportError:  # pragma: no cover
+    web = None
+
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.hmac_auth import HmacSigner
+
+API_KEY = 'mock_api_key'
+API_SECRET = 'mock_api_secret'
+
+DEFAULT_WINDOW = 10_000
+TAKE_RATE = Decimal('0.0025')
+MAKE_RATE = Decimal('0.001')
+
+# https://api.exchange.cryptomkt.com/#error-codes
+AUTHORIZATION_REQUIRED = 1001
+AUTHORIZATION_FAILED = 1002
+SYMBOL_NOT_FOUND = 2001
+CURRENCY_NOT_FOUND = 2002
+INSUFFICIENT_FUNDS = 20001
+ORDER_NOT_FOUND = 20002
+DUPLICATE_CLIENT_ORDER_ID = 20008
+VALIDATION_ERROR = 10001
+NOT_FOUND = 404
+
+_MULTI_RESPONSE_METHODS = {'spot_new_order_list'}
+
+_PERIODS = {'M1': 1, 'M3': 3, 'M5': 5, 'M15': 15, 'M30': 30, 'H1': 60,
+            'H4': 240, 'D1': 1440, 'D7': 10080, '1M': 43200}
+
+
+@dataclass
+class MockSymbol:
+    symbol: str
+    base_currency: str
+    quote_currency: str
+    price: str
+    """the price the random walk starts from"""
+    tick_size: str
+    quantity_increment: str
+
+
+DEFAULT_SYMBOLS = [
+    MockSymbol('ETHBTC', 'ETH', 'BTC', '0.046', '0.000001', '0.0001'),
+    MockSymbol('BTCUSDT', 'BTC', 'USDT', '30000', '0.01', '0.00001'),
+    MockSymbol('EOSETH', 'EOS', 'ETH', '0.0007', '0.0000001', '0.01'),
+]
+
+
+class _ApiError(Exception):
+    def __init__(self, code: int, message: str, description: Optional[str] = None, status: int = 400):
+        self.code = code
+        self.message = message
+        self.description = description
+        self.status = status
+
+    def to_dict(self) -> Dict[str, Any]:
+        error = {'code': self.code, 'message': self.message}
+        if self.description:
+            error['description'] = self.description
+        return error
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _iso(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.') + f'{ms % 1000:03d}Z'
+
+
+def _fmt(value: Decimal) -> str:
+    return format(value.normalize(), 'f')
+
+
+def _list_param(params: Dict[str, Any], key: str) -> Optional[List[str]]:
+    # comma separated in the rest api, lists in the websocket api
+    value = params.get(key)
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        return value.split(',')
+    return list(value)
+
+
+def _decimal_param(params: Dict[str, Any], key: str) -> Decimal:
+    try:
+        value = Decimal(str(params[key]))
+    except KeyError:
+        raise _ApiError(VALIDATION_ERROR, 'Validation error', f'{key} is required')
+    except ArithmeticError:
+        raise _ApiError(VALIDATION_ERROR, 'Validation error', f'{key} is not a number')
+    if not value.is_finite() or value <= 0:
+        raise _ApiError(VALIDATION_ERROR, 'Validation error', f'{key} must be positive')
+    return value
+
+
+def _page(items: List[Any], params: Dict[str, Any], default_limit: int) -> List[Any]:
+    # items are in ascending order, and DESC is the default sort
+    if params.get('sort', 'DESC') != 'ASC':
+        items = items[::-1]
+    offset = int(params.get('offset', 0))
+    limit = int(params.get('limit', default_limit))
+    return items[offset:offset + limit]
+
+
+class _Market:
+    """The synthetic market of a symbol: a random walk of the price over a grid of tick sizes"""
+
+    def __init__(self, spec: MockSymbol, rng: random.Random, depth: int):
+        self.spec = spec
+        self.rng = rng
+        self.depth = depth
+        self.tick = Decimal(spec.tick_size)
+        self.increment = Decimal(spec.quantity_increment)
+        self.mid = int(Decimal(spec.price) / self.tick)
+        """the mid price, in ticks"""
+        self.asks: Dict[Decimal, Decimal] = {}
+        self.bids: Dict[Decimal, Decimal] = {}
+        self.sequence = 0
+        self.timestamp = _now_ms()
+        self.trades: Deque[Dict[str, Any]] = deque(maxlen=1000)
+        self.open = self.high = self.low = self.last = self.mid_price
+        self.volume = self.volume_quote = Decimal(0)
+        self.candles: Dict[int, Dict[str, Any]] = {}
+        """the current candle of each period in minutes"""
+        self._move_book()
+
+    @property
+    def mid_price(self) -> Decimal:
+        return self.mid * self.tick
+
+    @property
+    def best_ask(self) -> Decimal:
+        return min(self.asks)
+
+    @property
+    def best_bid(self) -> Decimal:
+        return max(self.bids)
+
+    def _quantity(self) -> Decimal:
+        return self.rng.randint(1, 1000) * self.increment * 10
+
+    def _move_book(self) -> Tuple[Dict[Decimal, Decimal], Dict[Decimal, Decimal]]:
+        """Moves the book around the mid price, and changes some quantities
+
+        :return: the changed levels of the asks and the bids, with quantity 0 for removed levels
+        """
+        changes = []
+        for book, sign in ((self.asks, 1), (self.bids, -1)):
+            levels = {}
+            for k in range(1, self.depth + 1):
+                price = (self.mid + sign * k) * self.tick
+                quantity = book.get(price)
+                if quantity is None or self.rng.random() < 0.1:
+                    quantity = self._quantity()
+                levels[price] = quantity
+            changed = {price: quantity for price, quantity in levels.items() if book.get(price) != quantity}
+            changed.update({price: Decimal(0) for price in book if price not in levels})
+            book.clear()
+            book.update(levels)
+            changes.append(changed)
+        return changes[0], changes[1]
+
+    def step(self, trade_ids: Callable[[], int]) -> Tuple[Dict[Decimal, Decimal], Dict[Decimal, Decimal], List[Dict[str, Any]]]:
+        """Moves the market one step
+
+        :return: the changed asks, the changed bids, and the new trades
+        """
+        self.mid = max(self.depth + 1, self.mid + self.rng.choice((-1, 0, 0, 1)))
+        asks, bids = self._move_book()
+        self.sequence += 1
+        self.timestamp = _now_ms()
+        trades = []
+        for _ in range(self.rng.randint(0, 3)):
+            side = self.rng.choice(('buy', 'sell'))
+            trade = {'id': trade_ids(), 'price': self.best_ask if side == 'buy' else self.best_bid,
+                     'qty': self._quantity() / 10, 'side': side, 'timestamp': self.timestamp}
+            self.record_trade(trade['price'], trade['qty'])
+            self.trades.append(trade)
+            trades.append(trade)
+        return asks, bids, trades
+
+    def record_trade(self, price: Decimal, quantity: Decimal):
+        self.last = price
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        self.volume += quantity
+        self.volume_quote += price * quantity
+        for minutes, candle in self.candles.items():
+            start = self.timestamp - self.timestamp % (minutes * 60_000)
+            if candle['t'] != start:
+                candle = self.candles[minutes] = self._new_candle(start, candle['c'])
+            candle['c'] = price
+            candle['h'] = max(candle['h'], price)
+            candle['l'] = min(candle['l'], price)
+            candle['v'] += quantity
+            candle['q'] += price * quantity
+
+    @staticmethod
+    def _new_candle(start: int, price: Decimal) -> Dict[str, Any]:
+        return {'t': start, 'o': price, 'c': price, 'h': price, 'l': price, 'v': Decimal(0), 'q': Decimal(0)}
+
+    def candle(self, minutes: int) -> Dict[str, Any]:
+        if minutes not in self.candles:
+            start = self.timestamp - self.timestamp % (minutes * 60_000)
+            self.candles[minutes] = self._new_candle(start, self.last)
+        return self.candles[minutes]
+
+    def candle_history(self, minutes: int, limit: int) -> List[Dict[str, Any]]:
+        """The last candles of the period, the current one last. The previous ones are synthetic"""
+        current = self.candle(minutes)
+        candles = [current]
+        close = current['o']
+        for _ in range(limit - 1):
+            open_ = max(self.tick, close + self.rng.randint(-5, 5) * self.tick)
+            volume = self._quantity()
+            candles.append({'t': candles[-1]['t'] - minutes * 60_000, 'o': open_, 'c': close,
+                            'h': max(open_, close) + self.tick, 'l': max(self.tick, min(open_, close) - self.tick),
+                            'v': volume, 'q': volume * close})
+            close = open_
+        return candles[::-1]
+
+    # json of the rest api
+
+    def levels(self, side: str, depth: Optional[int] = None) -> List[List[str]]:
+        book = self.asks if side == 'ask' else self.bids
+        prices = sorted(book, reverse=side == 'bid')
+        if depth:
+            prices = prices[:depth]
+        return [[_fmt(price), _fmt(book[price])] for price in prices]
+
+    def ticker(self) -> Dict[str, Any]:
+        return {'timestamp': _iso(self.timestamp), 'ask': _fmt(self.best_ask), 'bid': _fmt(self.best_bid),
+                'open': _fmt(self.open), 'last': _fmt(self.last), 'high': _fmt(self.high), 'low': _fmt(self.low),
+                'volume': _fmt(self.volume), 'volume_quote': _fmt(self.volume_quote)}
+
+    @staticmethod
+    def public_trade(trade: Dict[str, Any]) -> Dict[str, Any]:
+        return {'id': trade['id'], 'price': _fmt(trade['price']), 'qty': _fmt(trade['qty']),
+                'side': trade['side'], 'timestamp': _iso(trade['timestamp'])}
+
+    @staticmethod
+    def rest_candle(candle: Dict[str, Any]) -> Dict[str, Any]:
+        return {'timestamp': _iso(candle['t']), 'open': _fmt(candle['o']), 'close': _fmt(candle['c']),
+                'min': _fmt(candle['l']), 'max': _fmt(candle['h']), 'volume': _fmt(candle['v']),
+                'volume_quote': _fmt(candle['q'])}
+
+    # json of the websocket api
+
+    def ws_ticker(self) -> Dict[str, Any]:
+        change = self.last - self.open
+        return {'t': self.timestamp, 'a': _fmt(self.best_ask), 'A': _fmt(self.asks[self.best_ask]),
+                'b': _fmt(self.best_bid), 'B': _fmt(self.bids[self.best_bid]), 'c': _fmt(self.last),
+                'o': _fmt(self.open), 'h': _fmt(self.high), 'l': _fmt(self.low), 'v': _fmt(self.volume),
+                'q': _fmt(self.volume_quote), 'p': _fmt(change),
+                'P': _fmt((change * 100 / self.open).quantize(Decimal('0.01'))),
+                'L': self.trades[-1]['id'] if self.trades else 0}
+
+    def ws_mini_ticker(self) -> Dict[str, Any]:
+        return {'t': self.timestamp, 'o': _fmt(self.open), 'c': _fmt(self.last), 'h': _fmt(self.high),
+                'l': _fmt(self.low), 'v': _fmt(self.volume), 'q': _fmt(self.volume_quote)}
+
+    def ws_top(self) -> Dict[str, Any]:
+        return {'t': self.timestamp, 'a': _fmt(self.best_ask), 'A': _fmt(self.asks[self.best_ask]),
+                'b': _fmt(self.best_bid), 'B': _fmt(self.bids[self.best_bid])}
+
+    def ws_book(self, depth: Optional[int] = None) -> Dict[str, Any]:
+        return {'t': self.timestamp, 's': self.sequence, 'a': self.levels('ask', depth), 'b': self.levels('bid', depth)}
+
+    def ws_book_update(self, asks: Dict[Decimal, Decimal], bids: Dict[Decimal, Decimal]) -> Dict[str, Any]:
+        return {'t': self.timestamp, 's': self.sequence,
+                'a': [[_fmt(price), _fmt(asks[price])] for price in sorted(asks)],
+                'b': [[_fmt(price), _fmt(bids[price])] for price in sorted(bids, reverse=True)]}
+
+    @staticmethod
+    def ws_trade(trade: Dict[str, Any]) -> Dict[str, Any]:
+        return {'t': trade['timestamp'], 'i': trade['id'], 'p': _fmt(trade['price']),
+                'q': _fmt(trade['qty']), 's': trade['side']}
+
+    @staticmethod
+    def ws_candle(candle: Dict[str, Any]) -> Dict[str, Any]:
+        return {'t': candle['t'], 'o': _fmt(candle['o']), 'c': _fmt(candle['c']), 'h': _fmt(candle['h']),
+                'l': _fmt(candle['l']), 'v': _fmt(candle['v']), 'q': _fmt(candle['q'])}
+
+
+class _Order:
+    def __init__(self, id: int, client_order_id: str, symbol: str, side: str, type: str, time_in_force: str,
+                 quantity: Decimal, price: Optional[Decimal], post_only: bool, now: int):
+        self.id = id
+        self.client_order_id = client_order_id
+        self.symbol = symbol
+        self.side = side
+        self.type = type
+        self.time_in_force = time_in_force
+        self.quantity = quantity
+        self.price = price
+        self.post_only = post_only
+        self.status = 'new'
+        self.quantity_cumulative = Decimal(0)
+        self.price_average = Decimal(0)
+        self.reserved = Decimal(0)
+        self.created_at = self.updated_at = now
+        self.original_client_order_id: Optional[str] = None
+        self.order_list_id: Optional[str] = None
+        self.contingency_type: Optional[str] = None
+        self.trades: List[Dict[str, Any]] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        order = {'id': self.id, 'client_order_id': self.client_order_id, 'symbol': self.symbol, 'side': self.side,
+                 'status': self.status, 'type': self.type, 'time_in_force': self.time_in_force,
+                 'quantity': _fmt(self.quantity), 'quantity_cumulative': _fmt(self.quantity_cumulative),
+                 'price_average': _fmt(self.price_average), 'post_only': self.post_only,
+                 'created_at': _iso(self.created_at), 'updated_at': _iso(self.updated_at)}
+        if self.price is not None:
+            order['price'] = _fmt(self.price)
+        for key in ('original_client_order_id', 'order_list_id', 'contingency_type'):
+            if getattr(self, key) is not None:
+                order[key] = getattr(self, key)
+        return order
+
+    def report(self, report_type: str, trade: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        report = self.to_dict()
+        del report['price_average']
+        report['report_type'] = report_type
+        if trade is not None:
+            report.update({'trade_id': trade['id'], 'trade_quantity': trade['quantity'],
+                           'trade_price': trade['price'], 'trade_fee': trade['fee'],
+                           'trade_taker': trade['taker']})
+        return report
+
+
+class _Account:
+    def __init__(self, api_key: str, currencies: List[str], balance: Decimal, now: int):
+        self.api_key = api_key
+        self.spot = {currency: [balance, Decimal(0)] for currency in currencies}
+        """available and reserved of each currency"""
+        self.wallet = {currency: [balance, Decimal(0)] for currency in currencies}
+        self.active: Dict[str, _Order] = {}
+        self.orders: List[_Order] = []
+        self.trades: List[Dict[str, Any]] = []
+        self.transactions = [
+            {'id': index + 1, 'status': 'SUCCESS', 'type': 'DEPOSIT', 'subtype': 'BLOCKCHAIN',
+             'created_at': _iso(now), 'updated_at': _iso(now), 'last_activity_at': _iso(now),
+             'native': {'tx_id': str(uuid.UUID(int=index + 1)), 'index': 0, 'currency': currency,
+                        'amount': _fmt(balance), 'hash': f'{index + 1:064x}', 'address': f'mock-{currency.lower()}-address'}}
+            for index, currency in enumerate(currencies)]
+        self.sessions: Set['_Session'] = set()
+
+    @staticmethod
+    def balances(balances: Dict[str, List[Decimal]]) -> List[Dict[str, str]]:
+        return [{'currency': currency, 'available': _fmt(available), 'reserved': _fmt(reserved)}
+                for currency, (available, reserved) in balances.items() if available or reserved]
+
+    @staticmethod
+    def balance(balances: Dict[str, List[Decimal]], currency: str) -> Dict[str, str]:
+        if currency not in balances:
+            raise _ApiError(CURRENCY_NOT_FOUND, 'Currency not found')
+        available, reserved = balances[currency]
+        return {'currency': currency, 'available': _fmt(available), 'reserved': _fmt(reserved)}
+
+
+class _Session:
+    """A websocket connection, with its subscriptions, and a queue that keeps the order of its messages"""
+
+    def __init__(self, kind: str, ws: 'web.WebSocketResponse'):
+        self.kind = kind
+        self.ws = ws
+        self.account: Optional[_Account] = None
+        self.channels: Dict[str, Tuple[Set[str], Dict[str, Any]]] = {}
+        """the symbols and params of each subscribed channel"""
+        self.subscriptions: Set[str] = set()
+        self.queue: 'asyncio.Queue[str]' = asyncio.Queue()
+
+    def send(self, message: Dict[str, Any]):
+        self.queue.put_nowait(json.dumps(message, separators=(',', ':')))
+
+    def notify(self, method: str, params: Any):
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    async def write(self):
+        while True:
+            await self.ws.send_str(await self.queue.get())
+
+
+def _channel_kind(channel: str) -> Optional[str]:
+    """The kind of the data of a market data channel, from its name. None for an unknown channel"""
+    parts = channel.split('/')
+    if parts[-1] == 'batch':
+        parts = parts[:-1]
+    if parts[0] == 'trades':
+        return 'trades'
+    if parts[-2:-1] == ['candles'] and parts[-1] in _PERIODS:
+        return 'candles'
+    if parts[:2] == ['ticker', 'price'] and len(parts) == 3:
+        return 'mini_ticker'
+    if parts[0] == 'ticker' and len(parts) == 2:
+        return 'ticker'
+    if parts == ['orderbook', 'full']:
+        return 'full_book'
+    if parts[:2] == ['orderbook', 'top'] and len(parts) == 3:
+        return 'top'
+    if parts[0] == 'orderbook' and len(parts) == 3 and parts[1] in ('D5', 'D10', 'D20'):
+        return 'partial_book'
+    if parts[:2] == ['price', 'rate'] and len(parts) == 3:
+        return 'rate'
+    return None
+
+
+class MockExchange:
+    """A local stand in of the exchange, with the rest api and the websocket apis on one port, and synthetic market data.
+
+    Requires aiohttp (pip install cryptomarket[async])
+
+    .. code-block:: python
+
+        with MockExchange() as exchange:
+            client = Client(API_KEY, API_SECRET, base_url=exchange.rest_url)
+            market_data = MarketDataClient(base_url=exchange.ws_url)
+
+    :param credentials: Optional. The api secrets of the accounts, indexed by api key. Default is one account, of API_KEY and API_SECRET
+    :param symbols: Optional. The symbols of the market. Default is DEFAULT_SYMBOLS
+    :param market_data_rate: Optional. Updates of the market per second, and so of each subscribed channel, regardless of their speed. Default is 10
+    :param fill_probability: Optional. Chance of a resting limit order to be filled on each update of the market. Default is 0.05
+    :param initial_balance: Optional. Available balance of each currency in each account, both in the spot and the wallet balances. Default is 1000
+    :param depth: Optional. Price levels of each side of the order books. Default is 50
+    :param host: Optional. Address to listen on. Default is '127.0.0.1'
+    :param port: Optional. Port to listen on. 0 for any free port. Default is 0
+    :param seed: Optional. Seed of the random market, for repeatable data. Default is a random seed
+    """
+
+    def __init__(
+        self,
+        credentials: Optional[Dict[str, str]] = None,
+        symbols: Optional[List[MockSymbol]] = None,
+        market_data_rate: float = 10.0,
+        fill_probability: float = 0.05,
+        initial_balance: str = '1000',
+        depth: int = 50,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        seed: Optional[int] = None,
+    ):
+        if web is None:
+            raise CryptomarketSDKException(
+                'aiohttp is required for the mock exchange. install it with: pip install cryptomarket[async]')
+        self.credentials = dict(credentials) if credentials is not None else {API_KEY: API_SECRET}
+        self.market_data_rate = market_data_rate
+        self.fill_probability = fill_probability
+        self.host = host
+        self.port = port
+        self.rng = random.Random(seed)
+        self.markets = {spec.symbol: _Market(spec, self.rng, depth) for spec in (symbols or DEFAULT_SYMBOLS)}
+        self.currencies = sorted({currency for market in self.markets.values()
+                                  for currency in (market.spec.base_currency, market.spec.quote_currency)})
+        now = _now_ms()
+        self.accounts = {api_key: _Account(api_key, self.currencies, Decimal(initial_balance), now)
+                         for api_key in self.credentials}
+        self._signers = {api_key: HmacSigner(secret) for api_key, secret in self.credentials.items()}
+        self._ids = 0
+        self._sessions: Set[_Session] = set()
+        self._routes = self._rest_routes()
+        self._ws_methods = self._websocket_methods()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional['web.AppRunner'] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def rest_url(self) -> str:
+        """The base url of the rest api, for the base_url of the Client and the AsyncClient"""
+        return f'http://{self.host}:{self.port}/api/3/'
+
+    @property
+    def ws_url(self) -> str:
+        """The base url of the websocket apis, for the base_url of the websocket clients"""
+        return f'ws://{self.host}:{self.port}/api/3/ws/'
+
+    # LIFETIME #
+
+    def start(self) -> 'MockExchange':
+        """Starts serving from a background thread, with its own event loop
+
+        :return: the exchange, once it accepts connections
+        """
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started,), name='cryptomarket-mock-exchange', daemon=True)
+        self._thread.start()
+        started.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def stop(self):
+        """Closes the connections and stops serving"""
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'MockExchange':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def drop_connections(self, code: int = 1012) -> int:
+        """Closes every websocket connection from the exchange side, like on a restart of the exchange
+
+        :param code: Optional. The close code sent to the clients. Default is 1012, service restart
+
+        :return: the number of connections closed
+        """
+        async def drop() -> int:
+            sessions = list(self._sessions)
+            for session in sessions:
+                await session.ws.close(code=code, message=b'mock exchange restart')
+            return len(sessions)
+        return asyncio.run_coroutine_threadsafe(drop(), self._loop).result()
+
+    def _run(self, started: threading.Event):
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            ticker = loop.run_until_complete(self._serve())
+        except BaseException as error:
+            self._error = error
+            loop.close()
+            started.set()
+            return
+        started.set()
+        try:
+            loop.run_forever()
+        finally:
+            ticker.cancel()
+            loop.run_until_complete(self._shutdown())
+            loop.close()
+
+    async def _serve(self) -> 'asyncio.Task':
+        app = web.Application()
+        app.router.add_get('/api/3/ws/{kind}', self._handle_websocket)
+        app.router.add_route('*', '/api/3/{path:.*}', self._handle_rest)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        return asyncio.ensure_future(self._tick_forever())
+
+    async def _shutdown(self):
+        for session in list(self._sessions):
+            await session.ws.close()
+        await self._runner.cleanup()
+
+    def _next_id(self) -> int:
+        self._ids += 1
+        return self._ids
+
+    # AUTHENTICATION #
+
+    def _authenticate_request(self, header: Optional[str], method: str, raw_path: str, body: bytes) -> _Account:
+        """Verifies the Authorization header of a rest request, as built by HmacAuth"""
+        if not header or not header.startswith('HS256 '):
+            raise _ApiError(AUTHORIZATION_REQUIRED, 'Authorization is required', status=401)
+        try:
+            api_key, signature, timestamp, *window = b64decode(header[6:]).decode().split(':')
+        except ValueError:
+            raise _ApiError(AUTHORIZATION_FAILED, 'Authorization failed', 'malformed credential', status=401)
+        window = window[0] if window else ''
+        path, _, query = raw_path.partition('?')
+        message = f'{method}{path}?{query}' if query else f'{method}{path}'
+        self._verify(api_key, message.encode() + body + (timestamp + window).encode(), signature, timestamp, window)
+        return self.accounts[api_key]
+
+    def _authenticate_session(self, params: Dict[str, Any]) -> _Account:
+        """Verifies the params of a websocket login, as built by ClientAuthenticable.authenticate"""
+        api_key = str(params.get('api_key', ''))
+        timestamp = str(params.get('timestamp', ''))
+        window = str(params.get('window', ''))
+        self._verify(api_key, (timestamp + window).encode(), str(params.get('signature', '')), timestamp, window)
+        return self.accounts[api_key]
+
+    def _verify(self, api_key: str, message: bytes, signature: str, timestamp: str, window: str):
+        signer = self._signers.get(api_key)
+        if signer is None or not hmac.compare_digest(signer.sign(message), signature):
+            raise _ApiError(AUTHORIZATION_FAILED, 'Authorization failed', 'invalid signature', status=401)
+        try:
+            late = abs(_now_ms() - int(timestamp)) > int(window or DEFAULT_WINDOW)
+        except ValueError:
+            late = True
+        if late:
+            raise _ApiError(AUTHORIZATION_FAILED, 'Authorization failed', 'timestamp out of the window', status=401)
+
+    # REST #
+
+    def _rest_routes(self) -> List[Tuple[str, 're.Pattern', Callable[..., Any]]]:
+        routes = [
+            ('GET', r'public/currency', self._get_currencies),
+            ('GET', r'public/currency/([^/]+)', self._get_currency),
+            ('GET', r'public/symbol', self._get_symbols),
+            ('GET', r'public/symbol/([^/]+)', self._get_symbol),
+            ('GET', r'public/ticker', self._get_tickers),
+            ('GET', r'public/ticker/([^/]+)', self._get_ticker),
+            ('GET', r'public/price/rate', self._get_prices),
+            ('GET', r'public/price/history', self._get_prices_history),
+            ('GET', r'public/price/ticker', self._get_ticker_prices),
+            ('GET', r'public/price/ticker/([^/]+)', self._get_ticker_price),
+            ('GET', r'public/trades', self._get_trades),
+            ('GET', r'public/trades/([^/]+)', self._get_trades_of_symbol),
+            ('GET', r'public/orderbook', self._get_order_books),
+            ('GET', r'public/orderbook/([^/]+)', self._get_order_book),
+            ('GET', r'public/candles', self._get_candles),
+            ('GET', r'public/candles/([^/]+)', self._get_candles_of_symbol),
+            ('GET', r'spot/balance', lambda account, params: _Account.balances(account.spot)),
+            ('GET', r'spot/balance/([^/]+)', lambda account, params, currency: _Account.balance(account.spot, currency)),
+            ('GET', r'spot/order', self._get_active_orders),
+            ('GET', r'spot/order/([^/]+)', lambda account, params, id: self._active_order(account, id).to_dict()),
+            ('POST', r'spot/order', lambda account, params: self._place(account, params).to_dict()),
+            ('POST', r'spot/order/list', lambda account, params: [order.to_dict() for order in self._place_list(account, params)]),
+            ('PATCH', r'spot/order/([^/]+)', lambda account, params, id: self._replace(account, id, params).to_dict()),
+            ('DELETE', r'spot/order', self._cancel_orders),
+            ('DELETE', r'spot/order/([^/]+)', lambda account, params, id: self._cancel(account, id).to_dict()),
+            ('GET', r'spot/fee', self._get_fees),
+            ('GET', r'spot/fee/([^/]+)', lambda account, params, symbol: self._fee(symbol)),
+            ('GET', r'spot/history/order', self._get_orders_history),
+            ('GET', r'spot/history/trade', self._get_trades_history),
+            ('GET', r'wallet/balance', lambda account, params: _Account.balances(account.wallet)),
+            ('GET', r'wallet/balance/([^/]+)', lambda account, params, currency: _Account.balance(account.wallet, currency)),
+            ('GET', r'wallet/crypto/address', self._get_deposit_addresses),
+            ('GET', r'wallet/transactions', lambda account, params: _page(account.transactions, params, 100)),
+            ('GET', r'wallet/transactions/([^/]+)', self._get_transaction),
+        ]
+        return [(method, re.compile(pattern + '/?'), handler) for method, pattern, handler in routes]
+
+    async def _handle_rest(self, request: 'web.Request') -> 'web.Response':
+        path = request.match_info['path'].rstrip('/')
+        body = await request.read()
+        try:
+            handler, args = self._route(request.method, path)
+            account = None
+            if not path.startswith('public/'):
+                account = self._authenticate_request(
+                    request.headers.get('Authorization'), request.method, request.raw_path, body)
+            params: Dict[str, Any] = dict(request.query)
+            if body:
+                if request.content_type == 'application/json':
+                    params.update(json.loads(body))
+                else:
+                    params.update(parse_qsl(body.decode()))
+            return web.json_response(handler(account, params, *args))
+        except _ApiError as error:
+            return web.json_response({'error': error.to_dict()}, status=error.status)
+
+    def _route(self, method: str, path: str) -> Tuple[Callable[..., Any], Tuple[str, ...]]:
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                return handler, match.groups()
+        raise _ApiError(NOT_FOUND, 'Not found', f'{method} {path} is not supported by the mock exchange', status=404)
+
+    def _market(self, symbol: str) -> _Market:
+        if symbol not in self.markets:
+            raise _ApiError(SYMBOL_NOT_FOUND, 'Symbol not found')
+        return self.markets[symbol]
+
+    def _markets(self, params: Dict[str, Any], key: str = 'symbols') -> List[_Market]:
+        symbols = _list_param(params, key)
+        if symbols is None or symbols == ['*']:
+            return list(self.markets.values())
+        return [self._market(symbol) for symbol in symbols]
+
+    def _currency_dict(self, currency: str) -> Dict[str, Any]:
+        network = {'network': currency, 'code': currency, 'network_name': currency, 'default': True,
+                   'payin_enabled': True, 'payout_enabled': True, 'precision_payout': '0.00000001',
+                   'payout_fee': '0.001', 'payout_is_payment_id': False, 'payin_payment_id': False,
+                   'payin_confirmations': 1}
+        return {'full_name': currency, 'crypto': True, 'payin_enabled': True, 'payout_enabled': True,
+                'transfer_enabled': True, 'sign': currency, 'crypto_payment_id_name': '', 'crypto_explorer': '',
+                'precision_transfer': '0.00000001', 'delisted': False, 'networks': [network]}
+
+    def _get_currencies(self, account, params):
+        currencies = _list_param(params, 'currencies') or self.currencies
+        return {currency: self._currency_dict(currency) for currency in currencies if currency in self.currencies}
+
+    def _get_currency(self, account, params, currency):
+        if currency not in self.currencies:
+            raise _ApiError(CURRENCY_NOT_FOUND, 'Currency not found')
+        return self._currency_dict(currency)
+
+    def _symbol_dict(self, market: _Market) -> Dict[str, Any]:
+        spec = market.spec
+        return {'type': 'spot', 'base_currency': spec.base_currency, 'quote_currency': spec.quote_currency,
+                'status': 'working', 'quantity_increment': spec.quantity_increment, 'tick_size': spec.tick_size,
+                'take_rate': _fmt(TAKE_RATE), 'make_rate': _fmt(MAKE_RATE), 'fee_currency': spec.quote_currency}
+
+    def _get_symbols(self, account, params):
+        return {market.spec.symbol: self._symbol_dict(market) for market in self._markets(params)}
+
+    def _get_symbol(self, account, params, symbol):
+        return self._symbol_dict(self._market(symbol))
+
+    def _get_tickers(self, account, params):
+        return {market.spec.symbol: market.ticker() for market in self._markets(params)}
+
+    def _get_ticker(self, account, params, symbol):
+        return self._market(symbol).ticker()
+
+    def _rate(self, currency: str, target: str) -> Optional[Decimal]:
+        if currency == target:
+            return Decimal(1)
+        for market in self.markets.values():
+            if (market.spec.base_currency, market.spec.quote_currency) == (currency, target):
+                return market.last
+            if (market.spec.base_currency, market.spec.quote_currency) == (target, currency):
+                return (Decimal(1) / market.last).quantize(Decimal('1e-12'))
+        return None
+
+    def _rates(self, params: Dict[str, Any], currencies_key: str) -> Dict[str, Decimal]:
+        target = params.get('to') or params.get('target_currency')
+        if not target:
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', 'the target currency is required')
+        currencies = _list_param(params, currencies_key)
+        if currencies is None or currencies == ['*']:
+            currencies = self.currencies
+        rates = {currency: self._rate(currency, target) for currency in currencies if currency != target}
+        return {currency: rate for currency, rate in rates.items() if rate is not None}
+
+    def _get_prices(self, account, params):
+        target = params.get('to')
+        now = _iso(_now_ms())
+        return {currency: {'currency': target, 'price': _fmt(rate), 'timestamp': now}
+                for currency, rate in self._rates(params, 'from').items()}
+
+    def _get_prices_history(self, account, params):
+        target = params.get('to')
+        minutes = _PERIODS.get(params.get('period', 'M30'), 30)
+        limit = int(params.get('limit', 1))
+        history = {}
+        for currency, rate in self._rates(params, 'from').items():
+            now = _now_ms()
+            start = now - now % (minutes * 60_000)
+            points = [{'timestamp': _iso(start - index * minutes * 60_000), 'open': _fmt(rate), 'close': _fmt(rate),
+                       'min': _fmt(rate), 'max': _fmt(rate)} for index in range(limit)]
+            history[currency] = {'currency': target, 'history': points}
+        return history
+
+    def _get_ticker_prices(self, account, params):
+        return {market.spec.symbol: self._ticker_price(market) for market in self._markets(params)}
+
+    def _get_ticker_price(self, account, params, symbol):
+        return self._ticker_price(self._market(symbol))
+
+    @staticmethod
+    def _ticker_price(market: _Market) -> Dict[str, Any]:
+        return {'price': _fmt(market.last), 'timestamp': _iso(market.timestamp)}
+
+    def _get_trades(self, account, params):
+        return {market.spec.symbol: [market.public_trade(trade) for trade in _page(list(market.trades), params, 10)]
+                for market in self._markets(params)}
+
+    def _get_trades_of_symbol(self, account, params, symbol):
+        market = self._market(symbol)
+        return [market.public_trade(trade) for trade in _page(list(market.trades), params, 10)]
+
+    def _order_book(self, market: _Market, params: Dict[str, Any]) -> Dict[str, Any]:
+        depth = int(params.get('depth', 100))
+        return {'timestamp': _iso(market.timestamp), 'ask': market.levels('ask', depth), 'bid': market.levels('bid', depth)}
+
+    def _get_order_books(self, account, params):
+        return {market.spec.symbol: self._order_book(market, params) for market in self._markets(params)}
+
+    def _get_order_book(self, account, params, symbol):
+        return self._order_book(self._market(symbol), params)
+
+    def _candles(self, market: _Market, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        minutes = _PERIODS.get(params.get('period', 'M30'), 30)
+        limit = int(params.get('limit', 10)) + int(params.get('offset', 0))
+        candles = [market.rest_candle(candle) for candle in market.candle_history(minutes, limit)]
+        return _page(candles, params, limit)
+
+    def _get_candles(self, account, params):
+        return {market.spec.symbol: self._candles(market, params) for market in self._markets(params)}
+
+    def _get_candles_of_symbol(self, account, params, symbol):
+        return self._candles(self._market(symbol), params)
+
+    def _get_active_orders(self, account, params):
+        symbol = params.get('symbol')
+        return [order.to_dict() for order in account.active.values() if symbol is None or order.symbol == symbol]
+
+    def _cancel_orders(self, account, params):
+        symbol = params.get('symbol')
+        return [self._cancel(account, order.client_order_id).to_dict() for order in list(account.active.values())
+                if symbol is None or order.symbol == symbol]
+
+    def _fee(self, symbol: str) -> Dict[str, str]:
+        self._market(symbol)
+        return {'symbol': symbol, 'take_rate': _fmt(TAKE_RATE), 'make_rate': _fmt(MAKE_RATE)}
+
+    def _get_fees(self, account, params):
+        return [self._fee(symbol) for symbol in self.markets]
+
+    def _get_orders_history(self, account, params):
+        symbols = _list_param(params, 'symbols')
+        orders = [order.to_dict() for order in account.orders if symbols is None or order.symbol in symbols]
+        return _page(orders, params, 100)
+
+    def _get_trades_history(self, account, params):
+        symbol = params.get('symbol')
+        trades = [trade for trade in account.trades if symbol is None or trade['symbol'] == symbol]
+        return _page(trades, params, 100)
+
+    def _get_deposit_addresses(self, account, params):
+        currencies = [params['currency']] if params.get('currency') else self.currencies
+        return [{'currency': currency, 'address': f'mock-{currency.lower()}-address'} for currency in currencies]
+
+    def _get_transaction(self, account, params, id):
+        for transaction in account.transactions:
+            if str(transaction['id']) == id:
+                return transaction
+        raise _ApiError(NOT_FOUND, 'Transaction not found', status=404)
+
+    # ORDERS #
+
+    def _active_order(self, account: _Account, client_order_id: str) -> _Order:
+        if client_order_id not in account.active:
+            raise _ApiError(ORDER_NOT_FOUND, 'Order not found', status=400)
+        return account.active[client_order_id]
+
+    def _place(self, account: _Account, params: Dict[str, Any]) -> _Order:
+        market = self._market(str(params.get('symbol')))
+        side = params.get('side')
+        if side not in ('buy', 'sell'):
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', 'side must be buy or sell')
+        type = params.get('type', 'limit')
+        quantity = _decimal_param(params, 'quantity')
+        price = _decimal_param(params, 'price') if type != 'market' else None
+        client_order_id = str(params.get('client_order_id') or uuid.uuid4().hex)
+        if client_order_id in account.active:
+            raise _ApiError(DUPLICATE_CLIENT_ORDER_ID, 'Duplicate clientOrderId')
+        now = _now_ms()
+        order = _Order(self._next_id(), client_order_id, market.spec.symbol, side, type,
+                       params.get('time_in_force', 'GTC'), quantity, price,
+                       str(params.get('post_only', False)).lower() == 'true', now)
+        order.order_list_id = params.get('order_list_id')
+        order.contingency_type = params.get('contingency_type')
+        best = market.best_ask if side == 'buy' else market.best_bid
+        crossing = type == 'market' or (
+            type == 'limit' and (price >= best if side == 'buy' else price <= best))
+        self._reserve(account, market, order, best if type == 'market' else price)
+        account.active[client_order_id] = order
+        account.orders.append(order)
+        self._report(account, order, 'new')
+        if crossing and order.post_only:
+            self._close(account, market, order, 'canceled')
+        elif crossing:
+            self._fill(account, market, order, best, taker=True)
+        elif order.time_in_force in ('IOC', 'FOK'):
+            self._close(account, market, order, 'expired')
+        return order
+
+    def _place_list(self, account: _Account, params: Dict[str, Any]) -> List[_Order]:
+        orders = params.get('orders') or []
+        if not isinstance(orders, list) or not orders:
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', 'orders are required')
+        order_list_id = params.get('order_list_id') or orders[0].get('client_order_id') or uuid.uuid4().hex
+        placed = []
+        for order in orders:
+            if not order.get('client_order_id') and not placed:
+                order = dict(order, client_order_id=order_list_id)
+            placed.append(self._place(account, dict(
+                order, order_list_id=order_list_id, contingency_type=params.get('contingency_type'))))
+        return placed
+
+    def _replace(self, account: _Account, client_order_id: str, params: Dict[str, Any]) -> _Order:
+        old = self._active_order(account, client_order_id)
+        new_client_order_id = params.get('new_client_order_id')
+        if not new_client_order_id:
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', 'new_client_order_id is required')
+        if new_client_order_id in account.active:
+            raise _ApiError(DUPLICATE_CLIENT_ORDER_ID, 'Duplicate clientOrderId')
+        self._close(account, self.markets[old.symbol], old, 'canceled', report_type='replaced')
+        order = self._place(account, {
+            'symbol': old.symbol, 'side': old.side, 'type': old.type, 'time_in_force': old.time_in_force,
+            'quantity': params.get('quantity'), 'price': params.get('price'), 'client_order_id': new_client_order_id})
+        order.original_client_order_id = client_order_id
+        return order
+
+    def _cancel(self, account: _Account, client_order_id: str) -> _Order:
+        order = self._active_order(account, client_order_id)
+        self._close(account, self.markets[order.symbol], order, 'canceled')
+        return order
+
+    def _reserve(self, account: _Account, market: _Market, order: _Order, price: Decimal):
+        if order.side == 'buy':
+            currency, amount = market.spec.quote_currency, order.quantity * price * (1 + TAKE_RATE)
+        else:
+            currency, amount = market.spec.base_currency, order.quantity
+        balance = account.spot[currency]
+        if balance[0] < amount:
+            raise _ApiError(INSUFFICIENT_FUNDS, 'Insufficient funds')
+        balance[0] -= amount
+        balance[1] += amount
+        order.reserved = amount
+        self._notify_balances(account)
+
+    def _release(self, account: _Account, market: _Market, order: _Order):
+        currency = market.spec.quote_currency if order.side == 'buy' else market.spec.base_currency
+        balance = account.spot[currency]
+        balance[0] += order.reserved
+        balance[1] -= order.reserved
+        order.reserved = Decimal(0)
+
+    def _close(self, account: _Account, market: _Market, order: _Order, status: str, report_type: Optional[str] = None):
+        self._release(account, market, order)
+        order.status = status
+        order.updated_at = _now_ms()
+        del account.active[order.client_order_id]
+        self._report(account, order, report_type or status)
+        self._notify_balances(account)
+
+    def _fill(self, account: _Account, market: _Market, order: _Order, price: Decimal, taker: bool):
+        self._release(account, market, order)
+        volume = order.quantity * price
+        fee = volume * (TAKE_RATE if taker else MAKE_RATE)
+        base, quote = account.spot[market.spec.base_currency], account.spot[market.spec.quote_currency]
+        if order.side == 'buy':
+            base[0] += order.quantity
+            quote[0] -= volume + fee
+        else:
+            base[0] -= order.quantity
+            quote[0] += volume - fee
+        now = _now_ms()
+        order.status = 'filled'
+        order.quantity_cumulative = order.quantity
+        order.price_average = price
+        order.updated_at = now
+        trade = {'id': self._next_id(), 'order_id': order.id, 'client_order_id': order.client_order_id,
+                 'symbol': order.symbol, 'side': order.side, 'quantity': _fmt(order.quantity), 'price': _fmt(price),
+                 'fee': _fmt(fee), 'timestamp': _iso(now), 'taker': taker}
+        account.trades.append(trade)
+        del account.active[order.client_order_id]
+        self._report(account, order, 'trade', trade)
+        self._notify_balances(account)
+
+    def _fill_resting_orders(self):
+        for account in self.accounts.values():
+            for order in list(account.active.values()):
+                if order.type != 'limit':
+                    continue
+                market = self.markets[order.symbol]
+                crossed = order.price >= market.best_ask if order.side == 'buy' else order.price <= market.best_bid
+                if crossed or self.rng.random() < self.fill_probability:
+                    self._fill(account, market, order, order.price, taker=False)
+
+    # WEBSOCKET NOTIFICATIONS #
+
+    def _report(self, account: _Account, order: _Order, report_type: str, trade: Optional[Dict[str, Any]] = None):
+        report = None
+        for session in account.sessions:
+            if 'reports' in session.subscriptions:
+                report = report or order.report(report_type, trade)
+                session.notify('spot_order', report)
+
+    def _notify_balances(self, account: _Account):
+        for session in account.sessions:
+            if 'spot_balance' in session.subscriptions:
+                session.notify('spot_balance', _Account.balances(account.spot))
+
+    # WEBSOCKET #
+
+    async def _handle_websocket(self, request: 'web.Request') -> 'web.WebSocketResponse':
+        kind = request.match_info['kind']
+        if kind not in ('public', 'trading', 'wallet'):
+            raise web.HTTPNotFound()
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        session = _Session(kind, ws)
+        writer = asyncio.ensure_future(session.write())
+        self._sessions.add(session)
+        try:
+            async for message in ws:
+                if message.type == WSMsgType.TEXT:
+                    self._handle_message(session, message.data)
+        finally:
+            self._sessions.discard(session)
+            if session.account is not None:
+                session.account.sessions.discard(session)
+            writer.cancel()
+        return ws
+
+    def _handle_message(self, session: _Session, data: str):
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return
+        id = message.get('id')
+        try:
+            result, follow_up = self._handle_request(session, message)
+        except _ApiError as error:
+            if id is not None:
+                session.send({'jsonrpc': '2.0', 'error': error.to_dict(), 'id': id})
+            return
+        if id is not None and message.get('method') in _MULTI_RESPONSE_METHODS:
+            # one response per order, all with the id of the request
+            for item in result:
+                session.send({'jsonrpc': '2.0', 'result': item, 'id': id})
+        elif id is not None:
+            session.send({'jsonrpc': '2.0', 'result': result, 'id': id})
+        if follow_up is not None:
+            follow_up()
+
+    def _handle_request(self, session: _Session, message: Dict[str, Any]) -> Tuple[Any, Optional[Callable[[], None]]]:
+        method = message.get('method')
+        params = message.get('params') or {}
+        if session.kind == 'public':
+            if method == 'subscribe':
+                return self._subscribe_channel(session, message.get('ch', ''), params)
+            if method == 'unsubscribe':
+                return self._unsubscribe_channel(session, message.get('ch', ''), params), None
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', f'unknown method {method}')
+        if method == 'login':
+            session.account = self._authenticate_session(params)
+            session.account.sessions.add(session)
+            return True, None
+        if session.account is None:
+            raise _ApiError(AUTHORIZATION_REQUIRED, 'Authorization is required', status=401)
+        handler = self._ws_methods[session.kind].get(method)
+        if handler is None:
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', f'unknown method {method}')
+        return handler(session, session.account, params)
+
+    def _websocket_methods(self) -> Dict[str, Dict[str, Callable[..., Tuple[Any, Optional[Callable[[], None]]]]]]:
+        def subscribe(name: str, snapshot: Optional[Callable[[_Session, _Account], None]] = None):
+            def handler(session, account, params):
+                session.subscriptions.add(name)
+                return True, (lambda: snapshot(session, account)) if snapshot else None
+            return handler
+
+        def unsubscribe(name: str):
+            def handler(session, account, params):
+                session.subscriptions.discard(name)
+                return True, None
+            return handler
+
+        def result(compute: Callable[[_Account, Dict[str, Any]], Any]):
+            return lambda session, account, params: (compute(account, params), None)
+
+        reports = lambda order: order.report(order.status if order.status != 'filled' else 'trade')
+        return {
+            'trading': {
+                'spot_subscribe': subscribe('reports', lambda session, account: session.notify(
+                    'spot_orders', [order.report('status') for order in account.active.values()])),
+                'spot_unsubscribe': unsubscribe('reports'),
+                'spot_balance_subscribe': subscribe('spot_balance', lambda session, account: session.notify(
+                    'spot_balance', _Account.balances(account.spot))),
+                'spot_balance_unsubscribe': unsubscribe('spot_balance'),
+                'spot_get_orders': result(lambda account, params: [
+                    order.report('status') for order in account.active.values()]),
+                'spot_new_order': result(lambda account, params: reports(self._place(account, params))),
+                'spot_new_order_list': result(lambda account, params: [
+                    reports(order) for order in self._place_list(account, params)]),
+                'spot_cancel_order': result(lambda account, params: reports(
+                    self._cancel(account, str(params.get('client_order_id'))))),
+                'spot_replace_order': result(lambda account, params: reports(
+                    self._replace(account, str(params.get('client_order_id')), params))),
+                'spot_cancel_orders': result(lambda account, params: [
+                    reports(self._cancel(account, id)) for id in list(account.active)]),
+                'spot_balances': result(lambda account, params: _Account.balances(account.spot)),
+                'spot_balance': result(lambda account, params: _Account.balance(account.spot, params.get('currency'))),
+                'spot_fees': result(lambda account, params: self._get_fees(account, params)),
+                'spot_fee': result(lambda account, params: self._fee(str(params.get('symbol')))),
+            },
+            'wallet': {
+                'subscribe_transactions': subscribe('transactions'),
+                'unsubscribe_transactions': unsubscribe('transactions'),
+                'subscribe_wallet_balances': subscribe('wallet_balances', lambda session, account: session.notify(
+                    'wallet_balances', _Account.balances(account.wallet))),
+                'unsubscribe_wallet_balances': unsubscribe('wallet_balances'),
+                'wallet_balances': result(lambda account, params: _Account.balances(account.wallet)),
+                'wallet_balance': result(lambda account, params: _Account.balance(account.wallet, params.get('currency'))),
+                'get_transactions': result(lambda account, params: _page(account.transactions, params, 100)),
+            },
+        }
+
+    def _subscribe_channel(self, session: _Session, channel: str, params: Dict[str, Any]):
+        parts = channel.split('/')
+        if parts[0] == 'price':
+            keys = list(self._rates(params, 'currencies'))
+        else:
+            keys = [market.spec.symbol for market in self._markets(params)]
+        if _channel_kind(channel) is None:
+            raise _ApiError(VALIDATION_ERROR, 'Validation error', f'unknown channel {channel}')
+        # each subscription adds its keys to the ones of the channel
+        subscribed, _ = session.channels.get(channel, (set(), params))
+        session.channels[channel] = (subscribed | set(keys), params)
+
+        def snapshot():
+            if parts[0] == 'trades':
+                limit = int(params.get('limit') or 0)
+                session.send({'ch': channel, 'snapshot': {
+                    symbol: [_Market.ws_trade(trade) for trade in list(self.markets[symbol].trades)[-limit:]] if limit else []
+                    for symbol in keys}})
+            elif 'candles' in parts:
+                minutes = _PERIODS.get(parts[-1], 30)
+                limit = int(params.get('limit') or 1)
+                session.send({'ch': channel, 'snapshot': {
+                    symbol: [_Market.ws_candle(candle) for candle in self.markets[symbol].candle_history(minutes, limit)]
+                    for symbol in keys}})
+            elif channel == 'orderbook/full':
+                for symbol in keys:
+                    session.send({'ch': channel, 'snapshot': {symbol: self.markets[symbol].ws_book()}})
+        return {'ch': channel, 'subscriptions': sorted(keys)}, snapshot
+
+    def _unsubscribe_channel(self, session: _Session, channel: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Removes the listed keys from a channel, or all of them if none are listed, and returns the keys still subscribed"""
+        keys, channel_params = session.channels.get(channel, (set(), params))
+        removed = _list_param(params, 'currencies' if channel.startswith('price/') else 'symbols')
+        keys = set() if removed is None else keys - set(removed)
+        if keys:
+            session.channels[channel] = (keys, channel_params)
+        else:
+            session.channels.pop(channel, None)
+        return {'ch': channel, 'subscriptions': sorted(keys)}
+
+    def _channel_data(self, channel: str, keys: List[str], params: Dict[str, Any], changes=None) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """The data of a channel for the keys, and whether it is an update or data. None for an unknown channel"""
+        kind = _channel_kind(channel)
+        if kind == 'trades':
+            new_trades = (changes or {}).get('trades', {})
+            return 'update', {symbol: [_Market.ws_trade(trade) for trade in new_trades.get(symbol, [])] for symbol in keys}
+        if kind == 'candles':
+            minutes = _PERIODS[channel.split('/')[-1]]
+            return 'update', {symbol: [_Market.ws_candle(self.markets[symbol].candle(minutes))] for symbol in keys}
+        if kind == 'mini_ticker':
+            return 'data', {symbol: self.markets[symbol].ws_mini_ticker() for symbol in keys}
+        if kind == 'ticker':
+            return 'data', {symbol: self.markets[symbol].ws_ticker() for symbol in keys}
+        if kind == 'full_book':
+            books = (changes or {}).get('books', {})
+            return 'update', {symbol: self.markets[symbol].ws_book_update(*books[symbol]) for symbol in keys if symbol in books}
+        if kind == 'top':
+            return 'data', {symbol: self.markets[symbol].ws_top() for symbol in keys}
+        if kind == 'partial_book':
+            depth = int(channel.split('/')[1][1:])
+            return 'data', {symbol: self.markets[symbol].ws_book(depth) for symbol in keys}
+        if kind == 'rate':
+            now = _now_ms()
+            rates = self._rates(params, 'currencies')
+            return 'data', {currency: {'t': now, 'r': _fmt(rates[currency])} for currency in keys if currency in rates}
+        return None
+
+    # MARKET DATA #
+
+    async def _tick_forever(self):
+        interval = 1 / self.market_data_rate
+        next_tick = time.monotonic()
+        while True:
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            self._tick()
+
+    def _tick(self):
+        changes: Dict[str, Dict[str, Any]] = {'books': {}, 'trades': {}}
+        for symbol, market in self.markets.items():
+            asks, bids, trades = market.step(self._next_id)
+            changes['books'][symbol] = (asks, bids)
+            if trades:
+                changes['trades'][symbol] = trades
+        self._fill_resting_orders()
+        for session in self._sessions:
+            for channel, (keys, params) in session.channels.items():
+                channel_data = self._channel_data(channel, sorted(keys), params, changes)
+                if channel_data is None:
+                    continue
+                data_type, data = channel_data
+                if channel.startswith('trades'):
+                    data = {symbol: trades for symbol, trades in data.items() if trades}
+                if not data:
+                    continue
+                if channel.endswith('/batch'):
+                    session.send({'ch': channel, data_type: data})
+                else:
+                    for key, value in data.items():
+                        session.send({'ch': channel, data_type: {key: value}})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serves a mock of the cryptomarket exchange api')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--rate', type=float, default=10.0, help='market data updates per second')
+    parser.add_argument('--fill-probability', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=None)
+    options = parser.parse_args()
+    exchange = MockExchange(host=options.host, port=options.port, market_data_rate=options.rate,
+                            fill_probability=options.fill_probability, seed=options.seed).start()
+    print(f'rest api at {exchange.rest_url}, websocket apis at {exchange.ws_url}')
+    print(f'api key: {API_KEY}, api secret: {API_SECRET}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        exchange.stop()
+
+
+if __name__ == '__main__':
+    main()
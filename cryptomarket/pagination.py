@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from typing import (Any, AsyncIterator, Awaitable, Callable, Generic, Iterator,
+                    List, Optional, Set, TypeVar)
+
+from cryptomarket.exceptions import CryptomarketSDKException
+
+T = TypeVar('T')
+
+MAX_LIMIT = 1000
+"""Maximum number of entries per page of the history endpoints"""
+MAX_OFFSET = 100_000
+"""Maximum offset accepted by the history endpoints"""
+
+
+@dataclass
+class PageRequest:
+    since: Optional[Any]
+    till: Optional[Any]
+    offset: int
+    limit: int
+
+
+class Paginator(Generic[T]):
+    """Walks a sorted history endpoint page by page.
+
+    Pages are requested by offset. Once the next page would pass the offset
+    ceiling, the interval is narrowed to start at the cursor of the last entry
+    (its timestamp or id) and the offset starts again from zero. The bounds of
+    the interval are inclusive, so entries already returned at the cursor are
+    skipped. If more entries than the offset ceiling share a cursor, the ones
+    past the ceiling cannot be reached, and a CryptomarketSDKException is raised.
+
+    :param cursor_of: gets the value the endpoint sorts by from an entry
+    :param id_of: gets an unique identifier of an entry
+    :param ascending: whether the endpoint returns entries in ascending order
+    :param since: Optional. Initial value of the queried interval
+    :param till: Optional. Last value of the queried interval
+    :param page_size: Entries per page. Default is 1000
+    :param max_offset: Maximum offset accepted by the endpoint. Default is 100000
+    """
+
+    def __init__(
+        self,
+        cursor_of: Callable[[T], Any],
+        id_of: Callable[[T], Any],
+        ascending: bool,
+        since: Optional[Any] = None,
+        till: Optional[Any] = None,
+        page_size: int = MAX_LIMIT,
+        max_offset: int = MAX_OFFSET,
+    ):
+        self.cursor_of = cursor_of
+        self.id_of = id_of
+        self.ascending = ascending
+        self.since = since
+        self.till = till
+        self.page_size = page_size
+        self.max_offset = max_offset
+        self.offset = 0
+        self.done = False
+        self._last_cursor: Optional[Any] = None
+        self._ids_at_last_cursor: Set[Any] = set()
+        self._boundary: Optional[Any] = None
+        self._ids_at_boundary: Set[Any] = set()
+        self._new_entries = 0
+
+    def next_page(self) -> Optional[PageRequest]:
+        """:return: the parameters of the next page, or None when there are no more entries"""
+        if self.done:
+            return None
+        if self.offset + self.page_size > self.max_offset and self._last_cursor is not None:
+            if self._last_cursor == self._boundary and self._new_entries == 0:
+                # the same window would be fetched again
+                raise CryptomarketSDKException(
+                    f'more than {self.max_offset} entries share the cursor {self._boundary}, the rest cannot be paginated')
+            self._boundary = self._last_cursor
+            self._ids_at_boundary = set(self._ids_at_last_cursor)
+            if self.ascending:
+                self.since = self._boundary
+            else:
+                self.till = self._boundary
+            self.offset = 0
+            self._new_entries = 0
+        return PageRequest(self.since, self.till, self.offset, self.page_size)
+
+    def add_page(self, page: List[T]) -> List[T]:
+        """Registers a fetched page
+
+        :return: the entries of the page that were not returned before
+        """
+        self.offset += len(page)
+        if len(page) < self.page_size:
+            self.done = True
+        entries = []
+        for entry in page:
+            cursor = self.cursor_of(entry)
+            entry_id = self.id_of(entry)
+            if cursor == self._boundary and entry_id in self._ids_at_boundary:
+                continue
+            if cursor != self._last_cursor:
+                self._last_cursor = cursor
+                self._ids_at_last_cursor = set()
+            self._ids_at_last_cursor.add(entry_id)
+            entries.append(entry)
+        self._new_entries += len(entries)
+        return entries
+
+
+def paginate(fetch_page: Callable[[PageRequest], List[T]], paginator: Paginator[T]) -> Iterator[T]:
+    """Lazily yields the entries of all the pages, one at a time"""
+    request = paginator.next_page()
+    while request is not None:
+        yield from paginator.add_page(fetch_page(request))
+        request = paginator.next_page()
+
+
+async def paginate_async(fetch_page: Callable[[PageRequest], Awaitable[List[T]]], paginator: Paginator[T]) -> AsyncIterator[T]:
+    """Lazily yields the entries of all the pages, one at a time"""
+    request = paginator.next_page()
+    while request is not None:
+        for entry in paginator.add_page(await fetch_page(request)):
+            yield entry
+        request = paginator.next_page()
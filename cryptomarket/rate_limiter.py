@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+PUBLIC = 'public'
+TRADING = 'trading'
+WALLET = 'wallet'
+
+# requests per second allowed by the exchange for each category of endpoints
+# https://api.exchange.cryptomkt.com/#rate-limiting
+DEFAULT_RATES = {
+    PUBLIC: 30,
+    TRADING: 300,
+    WALLET: 20,
+}
+
+
+@dataclass
+class RateLimitStats:
+    requests: int = 0
+    delayed_requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class TokenBucket:
+    """A token bucket that hands out reservations instead of rejections.
+
+    Every reservation takes one token, and the bucket may go into debt. The
+    debt is the time the caller has to wait for its turn, so concurrent callers
+    are queued in the order they reserved.
+
+    :param rate: tokens added per second
+    :param capacity: Optional. Maximum number of tokens, the size of a burst. Default is the rate
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Takes tokens from the bucket
+
+        :return: the seconds to wait before using the reserved tokens
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Client side rate limiter, with one token bucket per category of endpoints.
+
+    Requests over the limit are delayed until their bucket allows them, instead of being sent and rejected by the exchange.
+
+    Categories are 'public' for public/* endpoints, 'trading' for spot/* endpoints, and 'wallet' for the rest (wallet and sub-account endpoints)
+
+    :param rates: Optional. Requests per second by category. Missing categories use the exchange limits
+    :param bursts: Optional. Maximum burst of requests by category. Default is one second of requests
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, bursts: Optional[Dict[str, float]] = None):
+        rates = {**DEFAULT_RATES, **(rates or {})}
+        bursts = bursts or {}
+        self.buckets = {category: TokenBucket(rate, bursts.get(category))
+                        for category, rate in rates.items()}
+        self._stats = {category: RateLimitStats() for category in rates}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def category_of(endpoint: str) -> str:
+        if endpoint.startswith('public/'):
+            return PUBLIC
+        if endpoint.startswith('spot/'):
+            return TRADING
+        return WALLET
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserves a request to the endpoint, without waiting
+
+        :return: the seconds to wait before sending the request
+        """
+        category = self.category_of(endpoint)
+        wait = self.buckets[category].reserve()
+        with self._stats_lock:
+            stats = self._stats[category]
+            stats.requests += 1
+            if wait > 0:
+                stats.delayed_requests += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+        return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """Blocks until a request to the endpoint is allowed
+
+        :return: the seconds waited
+        """
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """Waits without blocking the event loop until a request to the endpoint is allowed
+
+        :return: the seconds waited
+        """
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Gets the requests and the accumulated waits of each category
+
+        :return: A dict of stats, indexed by category
+        """
+        with self._stats_lock:
+            return {category: RateLimitStats(**vars(stats))
+                    for category, stats in self._stats.items()}
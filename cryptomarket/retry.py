@@ -0,0 +1,164 @@
+"""Retries of order placement that never place an order twice.
+
+Every order sent with a retry policy has a client_order_id, generated if
+missing, so the exchange rejects a second copy of it. A failure is either
+fatal, retryable (the order was not placed), or ambiguous (the order may have
+been placed, like on a read timeout). After an ambiguous failure the order is
+looked up by its client_order_id before it is sent again, and returned if it
+was placed.
+"""
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+import requests
+
+from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.transport import httpx
+
+T = TypeVar('T')
+
+FATAL = 'fatal'
+RETRYABLE = 'retryable'
+AMBIGUOUS = 'ambiguous'
+
+# https://api.exchange.cryptomkt.com/#error-codes
+TOO_MANY_REQUESTS = 429
+INTERNAL_SERVER_ERROR = 500
+SERVICE_UNAVAILABLE = 503
+GATEWAY_TIMEOUT = 504
+ORDER_NOT_FOUND = 20002
+DUPLICATE_CLIENT_ORDER_ID = 20008
+EXCHANGE_TEMPORARY_CLOSED = 20010
+EXECUTION_DEADLINE_EXCEEDED = 20080
+
+# the request was rejected before reaching the matching engine
+RETRYABLE_CODES = frozenset({TOO_MANY_REQUESTS, SERVICE_UNAVAILABLE, EXCHANGE_TEMPORARY_CLOSED})
+# the request may have been processed
+AMBIGUOUS_CODES = frozenset({INTERNAL_SERVER_ERROR, GATEWAY_TIMEOUT, EXECUTION_DEADLINE_EXCEEDED})
+# status codes of responses without an error body, like those of a proxy
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+AMBIGUOUS_STATUS_CODES = frozenset({500, 502, 504})
+
+
+def new_client_order_id() -> str:
+    """Generates a random client order id, of 32 characters"""
+    return uuid.uuid4().hex
+
+
+def classify(error: BaseException) -> str:
+    """Classifies a failure of an order request
+
+    :param error: The exception raised by the request
+
+    :return: 'retryable' if the order was not placed, 'ambiguous' if it may have been placed, or 'fatal'
+    """
+    if isinstance(error, CryptomarketAPIException):
+        if error.code in RETRYABLE_CODES:
+            return RETRYABLE
+        if error.code in AMBIGUOUS_CODES:
+            return AMBIGUOUS
+        if not error.code:
+            status_code = getattr(error, 'status_code', None)
+            if status_code in RETRYABLE_STATUS_CODES:
+                return RETRYABLE
+            if status_code in AMBIGUOUS_STATUS_CODES:
+                return AMBIGUOUS
+        return FATAL
+    # connection failures before sending the request are safe to retry
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return RETRYABLE
+    if httpx is not None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return RETRYABLE
+    if isinstance(error, requests.exceptions.RequestException):
+        return AMBIGUOUS
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return AMBIGUOUS
+    return FATAL
+
+
+@dataclass
+class RetryStats:
+    orders: int = 0
+    retries: int = 0
+    recovered: int = 0
+    """orders found placed after an ambiguous failure"""
+    failed: int = 0
+
+
+class RetryPolicy:
+    """Retries order requests with exponential backoff and full jitter.
+
+    The n-th retry waits a random time between 0 and min(max_delay, base_delay * 2**n) seconds.
+
+    :param max_attempts: Optional. Maximum number of times an order is sent. Default is 5
+    :param base_delay: Optional. Seconds of the backoff of the first retry. Default is 0.1
+    :param max_delay: Optional. Maximum seconds to wait between attempts. Default is 5
+    :param classify: Optional. Classifies the failures as 'retryable', 'ambiguous' or 'fatal'. Default is classify
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.1, max_delay: float = 5.0, classify: Callable[[BaseException], str] = classify):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.classify = classify
+        self._lock = threading.Lock()
+        self._stats = RetryStats()
+
+    def delay(self, retry: int) -> float:
+        """Gets the seconds to wait before a retry
+
+        :param retry: The number of the retry, from 0
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    def run(self, send: Callable[[], T], recover: Callable[[], Optional[T]]) -> T:
+        """Sends an order request until it succeeds, fails for good, or runs out of attempts
+
+        :param send: Sends the request, with the same client order ids every time
+        :param recover: Looks up the orders of the request by their client order ids. Returns them if they were placed, or None
+
+        :return: the result of the request, or of recover if the orders were placed by an attempt that failed
+        """
+        self._count('orders')
+        ambiguous = False
+        attempt = 0
+        while True:
+            try:
+                return send()
+            except Exception as error:
+                kind = self.classify(error)
+                attempt += 1
+                ambiguous = ambiguous or kind == AMBIGUOUS
+                if ambiguous and kind != RETRYABLE:
+                    # a previous attempt may have placed the orders, like when the exchange rejects
+                    # a retry because of a duplicate client order id
+                    result = self._recover(recover)
+                    if result is not None:
+                        self._count('recovered')
+                        return result
+                if kind == FATAL or attempt >= self.max_attempts:
+                    self._count('failed')
+                    raise
+            self._count('retries')
+            time.sleep(self.delay(attempt - 1))
+
+    def _recover(self, recover: Callable[[], Optional[T]]) -> Optional[T]:
+        try:
+            return recover()
+        except Exception as error:
+            if self.classify(error) == FATAL:
+                raise
+            return None  # the next attempt tells
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    def stats(self) -> RetryStats:
+        """Gets the orders sent, retries, orders recovered and orders failed since the creation"""
+        with self._lock:
+            return RetryStats(**vars(self._stats))
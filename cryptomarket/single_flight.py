@@ -0,0 +1,70 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class CoalescingStats:
+    requests: int = 0
+    coalesced: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of the requests that shared the response of another one"""
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Shares one in flight call among all the concurrent callers with the same key.
+
+    The first caller of a key makes the call. Callers arriving while it is in
+    flight wait for it, and get the same result, or the same exception. Once
+    the call finishes, the next caller makes a new one.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = CoalescingStats()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Calls fn, or waits for the call in flight with the same key
+
+        :return: the result of the call
+        """
+        with self._lock:
+            self._stats.requests += 1
+            call = self._calls.get(key)
+            in_flight = call is not None
+            if in_flight:
+                self._stats.coalesced += 1
+            else:
+                call = _Call()
+                self._calls[key] = call
+        if in_flight:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> CoalescingStats:
+        """Gets the requests and the coalesced requests since the creation"""
+        with self._lock:
+            return CoalescingStats(requests=self._stats.requests, coalesced=self._stats.coalesced)
@@ -0,0 +1,247 @@
+"""Transports of the rest clients.
+
+The HttpClient sends its requests through a transport with the interface of
+a requests session: the get, post, put, patch, delete and head methods, and
+the auth, headers and close of a session. The Http2Transport can also build a
+request apart from sending it, as a requests session prepares one, so the
+HttpClient times the two apart. A requests session speaks HTTP/1.1,
+with one connection for each request in flight. The Http2Transport speaks
+HTTP/2, with all the requests in flight multiplexed over one connection.
+
+The AsyncHttpClient sends its requests through an async transport, with a
+request coroutine, a stream context manager and a close coroutine. The
+AiohttpTransport speaks HTTP/1.1 and the AsyncHttp2Transport HTTP/2.
+
+The HTTP/2 transports require httpx (pip install cryptomarket[http2])
+"""
+from contextlib import asynccontextmanager
+from typing import (Any, AsyncIterator, Dict, Iterator, Optional, Tuple,
+                    Union)
+from urllib.parse import urlencode
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.hmac_auth import HmacAuth
+
+Timeout = Optional[Union[float, Tuple[float, float]]]
+
+
+def _require_httpx():
+    if httpx is None:
+        raise CryptomarketSDKException(
+            'httpx is required for http2 transports. install it with: pip install cryptomarket[http2]')
+
+
+def _httpx_timeout(timeout: Timeout) -> 'httpx.Timeout':
+    # requests timeouts: None for no timeout, seconds, or a (connect, read) tuple
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _httpx_limits(max_connections: int, keep_alive: bool) -> 'httpx.Limits':
+    return httpx.Limits(max_connections=max_connections,
+                        max_keepalive_connections=max_connections if keep_alive else 0)
+
+
+def _query_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # booleans are sent as requests sends them, 'True' and 'False'
+    if not params:
+        return None
+    return {key: str(value) if isinstance(value, bool) else value for key, value in params.items()}
+
+
+class Http2Response:
+    """A response of the Http2Transport, with the interface of a requests response"""
+
+    def __init__(self, response: 'httpx.Response'):
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def http_version(self) -> str:
+        return self._response.http_version
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        self._response.read()
+        return self._response.text
+
+    def json(self) -> Any:
+        self._response.read()
+        return self._response.json()
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        return self._response.iter_bytes(chunk_size)
+
+    def close(self):
+        self._response.close()
+
+    def __repr__(self) -> str:
+        return f'<Response [{self.status_code}]>'
+
+
+class Http2Transport:
+    """Sends the requests of an HttpClient over HTTP/2, multiplexed over one connection.
+
+    Requires httpx (pip install cryptomarket[http2])
+
+    :param max_connections: Optional. Maximum number of connections. Requests in flight share a connection. Default is 10
+    :param keep_alive: Optional. If False, connections are closed once idle. Default is True
+    :param transport: Optional. The httpx transport to send the requests with. Default is an HTTP/2 connection pool
+    """
+
+    def __init__(self, max_connections: int = 10, keep_alive: bool = True, transport: Optional['httpx.BaseTransport'] = None):
+        _require_httpx()
+        self.auth: Optional[HmacAuth] = None
+        self.client = httpx.Client(
+            http2=True, limits=_httpx_limits(max_connections, keep_alive), transport=transport)
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def get(self, url: str, params=None, stream: bool = False, timeout: Timeout = None) -> Http2Response:
+        return self.request('GET', url, params=params, stream=stream, timeout=timeout)
+
+    def post(self, url: str, data=None, headers=None, timeout: Timeout = None) -> Http2Response:
+        return self.request('POST', url, data=data, headers=headers, timeout=timeout)
+
+    def put(self, url: str, params=None, timeout: Timeout = None) -> Http2Response:
+        return self.request('PUT', url, params=params, timeout=timeout)
+
+    def patch(self, url: str, data=None, timeout: Timeout = None) -> Http2Response:
+        return self.request('PATCH', url, data=data, timeout=timeout)
+
+    def delete(self, url: str, params=None, timeout: Timeout = None) -> Http2Response:
+        return self.request('DELETE', url, params=params, timeout=timeout)
+
+    def head(self, url: str, timeout: Timeout = None) -> Http2Response:
+        return self.request('HEAD', url, timeout=timeout)
+
+    def request(self, method: str, url: str, params=None, data=None, headers=None, stream: bool = False, timeout: Timeout = None) -> Http2Response:
+        return self.send(self.build_request(method, url, params=params, data=data, headers=headers, timeout=timeout), stream=stream)
+
+    def build_request(self, method: str, url: str, params=None, data=None, headers=None, timeout: Timeout = None) -> 'httpx.Request':
+        """Builds and signs a request, without sending it"""
+        headers = dict(headers or {})
+        if isinstance(data, dict):
+            # form encoded, as requests encodes dicts
+            data = urlencode(data, doseq=True)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        request = self.client.build_request(
+            method, url, params=_query_params(params), content=data, headers=headers,
+            timeout=_httpx_timeout(timeout))
+        if self.auth is not None:
+            path, _, query = request.url.raw_path.decode().partition('?')
+            request.headers['Authorization'] = self.auth.get_credential(
+                method, path, query, request.content or None)
+        return request
+
+    def send(self, request: 'httpx.Request', stream: bool = False) -> Http2Response:
+        """Sends a request made by build_request"""
+        return Http2Response(self.client.send(request, stream=stream))
+
+    def close(self):
+        self.client.close()
+
+
+class AiohttpTransport:
+    """Sends the requests of an AsyncHttpClient over HTTP/1.1, with a pool of connections.
+
+    Requires aiohttp (pip install cryptomarket[async])
+
+    :param pool_size: Optional. Maximum number of simultaneous connections. 0 for no limit. Default is 100
+    """
+
+    def __init__(self, pool_size: int = 100):
+        if aiohttp is None:
+            raise CryptomarketSDKException(
+                'aiohttp is required for async clients. install it with: pip install cryptomarket[async]')
+        self.pool_size = pool_size
+        self.session: Optional['aiohttp.ClientSession'] = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # the session is bound to the running event loop, so it is created on first use
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                headers={'User-Agent': 'cryptomarket/python'})
+        return self.session
+
+    async def request(self, method: str, url: str, body=None, headers=None) -> Tuple[int, bytes]:
+        """Sends a request to an encoded url
+
+        :return: the status code and the body of the response
+        """
+        # the url is already encoded, and must be sent as signed
+        async with self._get_session().request(method, URL(url, encoded=True), data=body, headers=headers) as response:
+            return response.status, await response.read()
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers=None, chunk_size: int = 65536) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """Sends a get request to an encoded url, and reads the body in chunks
+
+        :return: a context manager of the status code and the chunks of the body
+        """
+        async with self._get_session().get(URL(url, encoded=True), headers=headers) as response:
+            yield response.status, response.content.iter_chunked(chunk_size)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+class AsyncHttp2Transport:
+    """Sends the requests of an AsyncHttpClient over HTTP/2, multiplexed over one connection.
+
+    Requires httpx (pip install cryptomarket[http2])
+
+    :param max_connections: Optional. Maximum number of connections. Requests in flight share a connection. Default is 10
+    :param transport: Optional. The httpx async transport to send the requests with. Default is an HTTP/2 connection pool
+    """
+
+    def __init__(self, max_connections: int = 10, transport: Optional['httpx.AsyncBaseTransport'] = None):
+        _require_httpx()
+        self.client = httpx.AsyncClient(
+            http2=True, limits=_httpx_limits(max_connections, True), transport=transport,
+            timeout=None, headers={'User-Agent': 'cryptomarket/python'})
+
+    async def request(self, method: str, url: str, body=None, headers=None) -> Tuple[int, bytes]:
+        """Sends a request to an encoded url
+
+        :return: the status code and the body of the response
+        """
+        response = await self.client.request(method, url, content=body, headers=headers)
+        return response.status_code, response.content
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers=None, chunk_size: int = 65536) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """Sends a get request to an encoded url, and reads the body in chunks
+
+        :return: a context manager of the status code and the chunks of the body
+        """
+        async with self.client.stream('GET', url, headers=headers) as response:
+            yield response.status_code, response.aiter_bytes(chunk_size)
+
+    async def close(self):
+        await self.client.aclose()
@@ -1,9 +1,23 @@
 from cryptomarket.websockets.wallet_client import WalletClient
 from cryptomarket.websockets.market_data_client import MarketDataClient
 from cryptomarket.websockets.trading_client import TradingClient
+from cryptomarket.websockets.async_client_base import Subscription
+from cryptomarket.websockets.local_order_book import LocalOrderBook, LocalOrderBooks
+from cryptomarket.websockets.reconnect import ReconnectPolicy, ReconnectStats
+from cryptomarket.websockets.async_market_data_client import AsyncMarketDataClient
+from cryptomarket.websockets.async_trading_client import AsyncTradingClient
+from cryptomarket.websockets.async_wallet_client import AsyncWalletClient
 
 __all__ = [
     MarketDataClient,
     WalletClient,
-    TradingClient
+    TradingClient,
+    AsyncMarketDataClient,
+    AsyncWalletClient,
+    AsyncTradingClient,
+    Subscription,
+    ReconnectPolicy,
+    ReconnectStats,
+    LocalOrderBook,
+    LocalOrderBooks,
 ]
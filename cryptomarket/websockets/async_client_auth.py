@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional, Union
+
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.hmac_auth import HmacSigner
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.websockets.async_client_base import AsyncClientBase, aiohttp
+from cryptomarket.websockets.client_base import AUTHENTICATE
+from cryptomarket.websockets.client_auth import login_params
+from cryptomarket.websockets.subscriptionMethodData import \
+    SubscriptionMethodData
+
+
+class AsyncClientAuthenticable(AsyncClientBase):
+    def __init__(
+        self,
+        uri: str,
+        api_key: str,
+        api_secret: str,
+        window: Optional[int] = None,
+        subscription_methods_data: Dict[str, SubscriptionMethodData] = {},
+        codec: Optional[Union[JsonCodec, str]] = None,
+        session: Optional['aiohttp.ClientSession'] = None,
+    ):
+        super(AsyncClientAuthenticable, self).__init__(
+            uri,
+            subscription_methods_data=subscription_methods_data,
+            codec=codec,
+            session=session,
+        )
+        self.window = window
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self._signer = HmacSigner(api_secret)
+        self.authed: bool = False
+
+    async def connect(self, timeout: float = 30):
+        deadline = time.perf_counter() + timeout
+        await super().connect(timeout)
+        started = time.perf_counter()
+        try:
+            # the timeout covers both the connection and the authentication
+            result = await asyncio.wait_for(self.authenticate(), max(0.0, deadline - started))
+        except asyncio.TimeoutError:
+            await self.close()
+            raise CryptomarketSDKException('authentication timeout')
+        except BaseException:
+            await self.close()
+            raise
+        if not result:
+            await self.close()
+            raise CryptomarketSDKException('authentication failed')
+        self.authed = True
+        self._latencies[AUTHENTICATE].add(time.perf_counter() - started)
+
+    async def close(self):
+        self.authed = False
+        await super().close()
+
+    async def authenticate(self) -> Any:
+        """Authenticates the websocket
+
+        https://api.exchange.cryptomkt.com/#socket-session-authentication
+
+        :return: The result of the authentication, True if successful
+        """
+        return await self._request('login', login_params(self.api_key, self._signer, self.window))
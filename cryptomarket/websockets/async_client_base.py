@@ -0,0 +1,282 @@
+import asyncio
+import time
+from typing import (Any, AsyncIterator, Callable, Dict, List, Optional,
+                    Tuple, TypeVar, Union)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from cryptomarket.exceptions import (CryptomarketAPIException,
+                                     CryptomarketSDKException)
+from cryptomarket.json_codec import JsonCodec, resolve_codec
+from cryptomarket.metrics import LatencyHistogram, LatencyStats
+from cryptomarket.websockets.client_base import AUTHENTICATE, CONNECT
+from cryptomarket.websockets.subscriptionMethodData import \
+    SubscriptionMethodData
+
+T = TypeVar('T')
+
+Convert = Callable[[Any], T]
+
+_CLOSED = object()
+
+
+class Subscription(AsyncIterator[Tuple[T, str]]):
+    """The notifications of a subscription, as an async iterator of (data, notification_type) tuples.
+
+    The notification type is 'snapshot', 'update' or 'data'. Notifications are queued as they arrive, and converted
+    as they are iterated. The iteration ends once the subscription is cancelled or the client is closed, and raises
+    a CryptomarketSDKException if the connection is lost.
+
+    .. code-block:: python
+
+        async for trades, notification_type in await client.subscribe_to_trades(symbols=['EOSETH']):
+            ...
+    """
+
+    def __init__(self, key: str, convert: Convert[T]):
+        self.key = key
+        self.result: Any = None
+        """the result of the subscription, like the list of subscribed symbols"""
+        self._convert = convert
+        self._queue: 'asyncio.Queue[Any]' = asyncio.Queue()
+        self.closed = False
+
+    def __aiter__(self) -> 'Subscription[T]':
+        return self
+
+    async def __anext__(self) -> Tuple[T, str]:
+        item = await self._queue.get()
+        if item is _CLOSED:
+            self._queue.put_nowait(_CLOSED)  # ends any other consumer too
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            self._queue.put_nowait(_CLOSED)
+            raise item
+        feed, notification_type = item
+        return self._convert(feed), notification_type
+
+    def pending(self) -> int:
+        """:return: the number of notifications received and not yet iterated"""
+        return self._queue.qsize()
+
+    def _push(self, feed: Any, notification_type: str):
+        if not self.closed:
+            self._queue.put_nowait((feed, notification_type))
+
+    def _close(self, error: Optional[BaseException] = None):
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(_CLOSED if error is None else error)
+
+
+class _PendingRequest:
+    def __init__(self, future: 'asyncio.Future', call_count: int):
+        self.future = future
+        self.call_count = call_count
+        self.results: List[Any] = []
+
+
+class AsyncClientBase:
+    """Base of the asyncio websocket clients: one connection read by a task of the running event loop.
+
+    Requires aiohttp (pip install cryptomarket[async])
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        subscription_methods_data: Dict[str, SubscriptionMethodData] = {},
+        codec: Optional[Union[JsonCodec, str]] = None,
+        session: Optional['aiohttp.ClientSession'] = None,
+    ):
+        if aiohttp is None:
+            raise CryptomarketSDKException(
+                'aiohttp is required for async clients. install it with: pip install cryptomarket[async]')
+        self.uri = uri
+        self.codec = resolve_codec(codec)
+        self._subscription_methods_data = subscription_methods_data
+        self._session = session
+        self._owns_session = session is None
+        self._ws: Optional['aiohttp.ClientWebSocketResponse'] = None
+        self._reader: Optional['asyncio.Task'] = None
+        self._pending: Dict[int, _PendingRequest] = {}
+        self._subscriptions: Dict[str, Subscription[Any]] = {}
+        self._id = 1
+        self._closing = False
+        self._latencies = {CONNECT: LatencyHistogram(), AUTHENTICATE: LatencyHistogram()}
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and not self._ws.closed
+
+    async def connect(self, timeout: float = 30):
+        """connects via websocket to the exchange.
+
+        If the websocket requires authentication, it also authenticates.
+
+        :param timeout: Optional. Seconds the client has to connect, and then to authenticate. Default is 30
+
+        Raises a CryptomarketSDKException if the connection fails or times out
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        self._closing = False
+        started = time.perf_counter()
+        try:
+            # frames are not limited in size, as full order books can be large
+            self._ws = await asyncio.wait_for(
+                self._session.ws_connect(self.uri, max_msg_size=0), timeout)
+        except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as error:
+            await self.close()
+            raise CryptomarketSDKException(f'connection failed: {error!r}') from error
+        self._latencies[CONNECT].add(time.perf_counter() - started)
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def close(self):
+        """closes the websocket connection with the exchange, and ends the iteration of the subscriptions"""
+        self._closing = True
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await self._reader
+            self._reader = None
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def connection_stats(self) -> Dict[str, LatencyStats]:
+        """Gets the latencies of the connections of the client, with the count, sum, p50, p99 and max of each phase
+
+        :return: A dict of latency stats indexed by phase, 'connect' for the websocket handshake and 'authenticate' for the login of authenticated clients
+        """
+        return {phase: histogram.stats() for phase, histogram in self._latencies.items()}
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    # SENDS #
+
+    def _next_id(self) -> int:
+        self._id += 1
+        return self._id
+
+    async def _send(self, payload: Dict[str, Any]):
+        if not self.connected:
+            raise CryptomarketSDKException('websocket connection is not active')
+        await self._ws.send_str(self.codec.dumps_str(payload))
+
+    async def _request(self, method: str, params=None, call_count: int = 1, payload: Optional[Dict[str, Any]] = None) -> Any:
+        """Sends a request and waits for its response
+
+        :param call_count: Optional. Number of responses of the request. Default is 1
+
+        :return: the result of the response, or a list of the results if there are many
+        """
+        id = self._next_id()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[id] = _PendingRequest(future, call_count)
+        payload = dict(payload or {}, method=method, params=params, id=id)
+        try:
+            await self._send(payload)
+            return await future
+        finally:
+            self._pending.pop(id, None)
+
+    async def _subscribe(self, method: str, convert: Convert[T], params=None) -> Subscription[T]:
+        key = self._build_key(method)
+        subscription = self._register(key, convert)
+        try:
+            subscription.result = await self._request(method, params)
+        except BaseException:
+            self._unregister(subscription)
+            raise
+        return subscription
+
+    async def _unsubscribe(self, method: str, params=None) -> Any:
+        subscription = self._subscriptions.get(self._build_key(method))
+        result = await self._request(method, params)
+        if subscription is not None:
+            self._unregister(subscription)
+        return result
+
+    def _register(self, key: str, convert: Convert[T]) -> Subscription[T]:
+        # registered before the request, as notifications can follow the response at once
+        previous = self._subscriptions.get(key)
+        if previous is not None:
+            previous._close()
+        subscription = self._subscriptions[key] = Subscription(key, convert)
+        return subscription
+
+    def _unregister(self, subscription: Subscription[Any]):
+        if self._subscriptions.get(subscription.key) is subscription:
+            del self._subscriptions[subscription.key]
+        subscription._close()
+
+    # HANDLES #
+
+    async def _read(self):
+        loads = self.codec.loads
+        try:
+            async for message in self._ws:
+                if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    self._handle(loads(message.data))
+                elif message.type == aiohttp.WSMsgType.ERROR:
+                    break
+        finally:
+            self._on_disconnect()
+
+    def _on_disconnect(self):
+        error = None if self._closing else CryptomarketSDKException('websocket connection lost')
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_exception(error or CryptomarketSDKException('websocket connection closed'))
+        for subscription in self._subscriptions.values():
+            subscription._close(error)
+        self._subscriptions.clear()
+
+    def _handle(self, message: Dict[str, Any]):
+        if 'id' in message:
+            self._handle_response(message)
+        elif 'method' in message:
+            self._handle_notification(message)
+
+    def _handle_notification(self, message: Dict[str, Any]):
+        method = message['method']
+        if 'params' not in message:
+            return
+        key = self._build_key(method)
+        method_type = 'update'
+        if key != 'subscription':
+            method_type = self._subscription_methods_data[method].method_type
+        subscription = self._subscriptions.get(key)
+        if subscription is not None:
+            subscription._push(message['params'], method_type)
+
+    def _handle_response(self, response: Dict[str, Any]):
+        pending = self._pending.get(response['id'])
+        if pending is None or pending.future.done():
+            return
+        if 'error' in response:
+            pending.future.set_exception(CryptomarketAPIException.from_dict(response))
+            return
+        result = response.get('result')
+        if type(result) == dict and 'data' in result:
+            result = result['data']
+        if pending.call_count == 1:
+            pending.future.set_result(result)
+            return
+        pending.results.append(result)
+        if len(pending.results) == pending.call_count:
+            pending.future.set_result(pending.results)
+
+    def _build_key(self, method: str) -> str:
+        if not method in self._subscription_methods_data:
+            return "subscription"
+        return self._subscription_methods_data[method].subscription
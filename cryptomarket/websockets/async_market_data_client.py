@@ -0,0 +1,409 @@
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+
+from typing_extensions import Literal
+
+import cryptomarket.args as args
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses.wsCandle import WSCandle
+from cryptomarket.dataclasses.wsMiniTicker import WSMiniTicker
+from cryptomarket.dataclasses.wsOrderBook import WSOrderBook
+from cryptomarket.dataclasses.wsOrderBookTop import WSOrderBookTop
+from cryptomarket.dataclasses.wsPriceRate import WSPriceRate
+from cryptomarket.dataclasses.wsTicker import WSTicker
+from cryptomarket.dataclasses.wsTrade import WSTrade
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.websockets.async_client_base import (AsyncClientBase,
+                                                       Subscription, aiohttp)
+from cryptomarket.websockets.client_base import ws_url
+from cryptomarket.websockets.market_data_client import DATA, SNAPSHOT, UPDATE
+
+T = TypeVar('T')
+
+
+def _by_key(data_class: Type[T]) -> Callable[[Dict[str, Any]], Dict[str, T]]:
+    return lambda feed: {key: from_dict(data_class=data_class, data=feed[key]) for key in feed}
+
+
+def _lists_by_key(data_class: Type[T]) -> Callable[[Dict[str, Any]], Dict[str, List[T]]]:
+    return lambda feed: {key: [from_dict(data_class=data_class, data=data) for data in feed[key]] for key in feed}
+
+
+def _order_books(feed: Dict[str, Any]) -> Dict[str, WSOrderBook]:
+    return {key: WSOrderBook.from_dict(feed[key]) for key in feed}
+
+
+class AsyncMarketDataClient(AsyncClientBase):
+    """AsyncMarketDataClient connects via websocket to cryptomarket to get market information of the exchange, from the running event loop.
+
+    Subscriptions are async iterators of (data, notification_type) tuples. Requires aiohttp (pip install cryptomarket[async])
+
+    .. code-block:: python
+
+        async with AsyncMarketDataClient() as client:
+            trades = await client.subscribe_to_trades(symbols=['EOSETH'])
+            async for trades_by_symbol, notification_type in trades:
+                ...
+
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode messages. Default is the default codec
+    :param base_url: Optional. The url of the websocket api, like the ws_url of a MockExchange. Default is the url of the exchange api
+    :param session: Optional. An aiohttp session to connect with, to share it between clients. Default is a session of the client
+    """
+
+    def __init__(self, codec: Optional[Union[JsonCodec, str]] = None, base_url: str = ws_url, session: Optional['aiohttp.ClientSession'] = None):
+        super(AsyncMarketDataClient, self).__init__(
+            base_url.rstrip('/') + '/public',
+            codec=codec,
+            session=session,
+        )
+
+    def _handle(self, message: Dict[str, Any]):
+        if 'ch' in message:
+            self._handle_channel_feed(message)
+        else:
+            super()._handle(message)
+
+    def _handle_channel_feed(self, message: Dict[str, Any]):
+        subscription = self._subscriptions.get(message['ch'])
+        if subscription is None:
+            return
+        for data_key in (DATA, UPDATE, SNAPSHOT):
+            if data_key in message:
+                subscription._push(message[data_key], data_key)
+                return
+
+    async def _subscribe_channel(self, channel: str, convert: Callable[[Any], T], params=None) -> Subscription[T]:
+        subscription = self._register(channel, convert)
+        try:
+            result = await self._request('subscribe', params, payload={'ch': channel})
+        except BaseException:
+            self._unregister(subscription)
+            raise
+        subscription.result = result['subscriptions']
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription[Any]) -> List[str]:
+        """stops a subscription, and ends its iteration
+
+        :param subscription: The subscription to stop
+
+        :return: The list of the keys still subscribed in the channel of the subscription
+        """
+        try:
+            # the price rate channels are keyed by currency, the others by symbol
+            keys = 'currencies' if subscription.key.startswith('price/rate/') else 'symbols'
+            result = await self._request('unsubscribe', {keys: subscription.result}, payload={'ch': subscription.key})
+        finally:
+            self._unregister(subscription)
+        return result['subscriptions'] if isinstance(result, dict) else result
+
+    async def subscribe_to_trades(
+        self,
+        symbols: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Subscription[Dict[str, List[WSTrade]]]:
+        """Subscribe to a feed of trades
+
+        subscription is for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-trades
+
+        :param symbols: A list of symbol ids to subscribe to
+        :param limit: Number of historical entries returned in the first feed. Min is 0. Max is 1000. Default is 0
+
+        :return: A subscription of dicts of trades, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols).limit(limit).build()
+        return await self._subscribe_channel('trades', _lists_by_key(WSTrade), params)
+
+    async def subscribe_to_candles(
+        self,
+        symbols: List[str],
+        period: Optional[Union[
+            args.Period,
+            Literal['M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M']]] = None,
+        limit: Optional[int] = None,
+    ) -> Subscription[Dict[str, List[WSCandle]]]:
+        """subscribes to a feed of candles
+
+        subscription is for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-candles
+
+        :param symbols: A list of symbol ids to subscribe to
+        :param period: A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month).
+        :param limit: Limit of returned entries. Min is 0. Max is 1000. Default is 0
+
+        :return: A subscription of dicts of candles, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols).limit(limit).build()
+        return await self._subscribe_channel(f'candles/{period}', _lists_by_key(WSCandle), params)
+
+    async def subscribe_to_converted_candles(
+        self,
+        target_currency: str,
+        symbols: List[str],
+        period: Optional[Union[
+            args.Period,
+            Literal['M1', 'M3', 'M15', 'M30', 'H1', 'H4', 'D1', 'D7', '1M']]] = None,
+        limit: Optional[int] = None,
+    ) -> Subscription[Dict[str, List[WSCandle]]]:
+        """subscribes to a feed of candles regarding the last price converted to the target currency for the specified symbols
+
+        subscription is only for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-converted-candles
+
+        :param target_currency: Target currency for conversion
+        :param symbols: A list of symbol ids to subscribe to
+        :param period: A valid tick interval. 'M1' (one minute), 'M3', 'M5', 'M15', 'M30', 'H1' (one hour), 'H4', 'D1' (one day), 'D7', '1M' (one month).
+        :param limit: Limit of returned entries. Min is 0. Max is 1000. Default is 0
+
+        :return: A subscription of dicts of candles, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().target_currency(
+            target_currency).symbols_as_list(symbols).limit(limit).build()
+        return await self._subscribe_channel(f'converted/candles/{period}', _lists_by_key(WSCandle), params)
+
+    async def subscribe_to_mini_ticker(
+        self,
+        speed: Union[args.TickerSpeed, Literal['1s', '3s']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSMiniTicker]]:
+        """subscribe to a feed of mini tickers
+
+        subscription is for all symbols or for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-mini-ticker
+
+        :param speed: The speed of the feed. '1s' or '3s'
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of mini tickers, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'ticker/price/{speed}', _by_key(WSMiniTicker), params)
+
+    async def subscribe_to_mini_ticker_in_batch(
+        self,
+        speed: Union[args.TickerSpeed, Literal['1s', '3s']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSMiniTicker]]:
+        """subscribe to a feed of mini tickers in batches
+
+        subscription is for all symbols or for the specified symbols
+
+        batch subscriptions have a joined update for all symbols
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-mini-ticker-in-batches
+
+        :param speed: The speed of the feed. '1s' or '3s'
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of mini tickers, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'ticker/price/{speed}/batch', _by_key(WSMiniTicker), params)
+
+    async def subscribe_to_ticker(
+        self,
+        speed: Union[args.TickerSpeed, Literal['1s', '3s']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSTicker]]:
+        """subscribe to a feed of tickers
+
+        subscription is for all symbols or for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-ticker
+
+        :param speed: The speed of the feed. '1s' (1 second) or '3s' (3 seconds)
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of tickers, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'ticker/{speed}', _by_key(WSTicker), params)
+
+    async def subscribe_to_ticker_in_batch(
+        self,
+        speed: Union[args.TickerSpeed, Literal['1s', '3s']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSTicker]]:
+        """subscribe to a feed of tickers in batches
+
+        subscription is for all symbols or for the specified symbols
+
+        batch subscriptions have a joined update for all symbols
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-ticker-in-batches
+
+        :param speed: The speed of the feed. '1s' (1 second) or '3s' (3 seconds)
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of tickers, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'ticker/{speed}/batch', _by_key(WSTicker), params)
+
+    async def subscribe_to_full_order_book(
+        self,
+        symbols: List[str],
+    ) -> Subscription[Dict[str, WSOrderBook]]:
+        """subscribe to a feed of a full orderbook
+
+        subscription is for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-full-order-book
+
+        :param symbols: A list of symbol ids to subscribe to.
+
+        :return: A subscription of dicts of order books, indexed by symbol: a snapshot, and then updates. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols).build()
+        return await self._subscribe_channel('orderbook/full', _order_books, params)
+
+    async def subscribe_to_partial_order_book(
+        self,
+        depth: Union[args.Depth, Literal['D5', 'D10', 'D20']],
+        speed: Union[args.OrderbookSpeed, Literal['100ms', '500ms', '1000ms']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSOrderBook]]:
+        """subscribe to a feed of a partial orderbook
+
+        subscription is for all symbols or for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-partial-order-book
+
+        :param depth: The depth of the partial orderbook. 'D5', 'D10' or 'D20'
+        :param speed: The speed of the feed. '100ms', '500ms' or '1000ms'
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of partial order books, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(
+            symbols or ['*']).depth(depth).speed(speed).build()
+        return await self._subscribe_channel(f'orderbook/{depth}/{speed}', _order_books, params)
+
+    async def subscribe_to_partial_order_book_in_batch(
+        self,
+        depth: Union[args.Depth, Literal['D5', 'D10', 'D20']],
+        speed: Union[args.OrderbookSpeed, Literal['100ms', '500ms', '1000ms']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSOrderBook]]:
+        """subscribe to a feed of a partial orderbook in batches
+
+        subscription is for all symbols or for the specified symbols
+
+        batch subscriptions have a joined update for all symbols
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-partial-order-book-in-batches
+
+        :param depth: The depth of the partial orderbook. 'D5', 'D10' or 'D20'
+        :param speed: The speed of the feed. '100ms', '500ms' or '1000ms'
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of partial order books, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'orderbook/{depth}/{speed}/batch', _order_books, params)
+
+    async def subscribe_to_top_of_book(
+        self,
+        speed: Union[args.OrderbookSpeed, Literal['100ms', '500ms', '1000ms']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSOrderBookTop]]:
+        """subscribe to a feed of the top of the orderbook
+
+        subscription is for all symbols or for the specified symbols
+
+        normal subscriptions have one update message per symbol
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-top-of-book
+
+        :param speed: The speed of the feed. '100ms', '500ms' or '1000ms'
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of top of orderbooks, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'orderbook/top/{speed}', _by_key(WSOrderBookTop), params)
+
+    async def subscribe_to_top_of_book_in_batch(
+        self,
+        speed: Union[args.OrderbookSpeed, Literal['100ms', '500ms', '1000ms']],
+        symbols: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSOrderBookTop]]:
+        """subscribe to a feed of the top of the orderbook in batches
+
+        subscription is for all symbols or for the specified symbols
+
+        batch subscriptions have a joined update for all symbols
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-top-of-book-in-batches
+
+        :param speed: The speed of the feed. '100ms', '500ms' or '1000ms'
+        :param symbols: Optional. A list of symbol ids to subscribe to. If not provided it subscribes to all symbols
+
+        :return: A subscription of dicts of top of orderbooks, indexed by symbol. Its result is the list of correctly subscribed symbols
+        """
+        params = args.DictBuilder().symbols_as_list(symbols or ['*']).build()
+        return await self._subscribe_channel(f'orderbook/top/{speed}/batch', _by_key(WSOrderBookTop), params)
+
+    async def subscribe_to_price_rates(
+        self,
+        speed: Union[args.PriceRateSpeed, Literal['1s', '3s']],
+        target_currency: Optional[str],
+        currencies: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSPriceRate]]:
+        """subscribe to a feed of price rates
+
+        subscription is for all currencies or specified currencies (bases), against a target currency (quote). indexed by currency id (bases)
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-price-rates
+
+        :param speed: The speed of the feed. '1s' or '3s'
+        :param target_currency: quote currency for the price rates
+        :param currencies: Optional. A list of currencies ids (as bases) to subscribe to. If not provided it subscribes to all currencies
+
+        :return: A subscription of dicts of price rates, indexed by currency. Its result is the list of correctly subscribed currencies
+        """
+        params = args.DictBuilder().currencies_as_list(currencies or ['*']).speed(
+            speed).target_currency(target_currency).build()
+        return await self._subscribe_channel(f'price/rate/{speed}', _by_key(WSPriceRate), params)
+
+    async def subscribe_to_price_rates_in_batches(
+        self,
+        speed: Union[args.PriceRateSpeed, Literal['1s', '3s']],
+        target_currency: Optional[str],
+        currencies: Optional[List[str]] = None,
+    ) -> Subscription[Dict[str, WSPriceRate]]:
+        """subscribe to a feed of price rates in batches
+
+        subscription is for all currencies or specified currencies (bases), against a target currency (quote). indexed by currency id (bases)
+
+        batch subscriptions have a joined update for all currencies
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-price-rates
+
+        :param speed: The speed of the feed. '1s' or '3s'
+        :param target_currency: quote currency for the price rates
+        :param currencies: Optional. A list of currencies ids (as bases) to subscribe to. If not provided it subscribes to all currencies
+
+        :return: A subscription of dicts of price rates, indexed by currency. Its result is the list of correctly subscribed currencies
+        """
+        params = args.DictBuilder().currencies_as_list(currencies or ['*']).speed(
+            speed).target_currency(target_currency).build()
+        return await self._subscribe_channel(f'price/rate/{speed}/batch', _by_key(WSPriceRate), params)
@@ -0,0 +1,290 @@
+from typing import Any, List, Optional, Union
+
+from typing_extensions import Literal
+
+import cryptomarket.args as args
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses.balance import Balance
+from cryptomarket.dataclasses.commission import Commission
+from cryptomarket.dataclasses.report import Report
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.websockets.async_client_auth import AsyncClientAuthenticable
+from cryptomarket.websockets.async_client_base import Subscription, aiohttp
+from cryptomarket.websockets.client_base import ws_url
+from cryptomarket.websockets.trading_client import TRADING_SUBSCRIPTION_METHODS
+
+
+def _reports(feed: Any) -> List[Report]:
+    if isinstance(feed, list):
+        return [from_dict(data_class=Report, data=data) for data in feed]
+    return [from_dict(data_class=Report, data=feed)]
+
+
+def _balances(feed: Any) -> List[Balance]:
+    if isinstance(feed, list):
+        return [from_dict(data_class=Balance, data=balance) for balance in feed]
+    return [from_dict(data_class=Balance, data=feed)]
+
+
+class AsyncTradingClient(AsyncClientAuthenticable):
+    """AsyncTradingClient connects via websocket to cryptomarket to enable the user to manage orders, from the running event loop. uses SHA256 as auth method and authenticates on connection.
+
+    Requests are coroutines, that raise a CryptomarketAPIException on errors. Subscriptions are async iterators of (data, notification_type) tuples. Requires aiohttp (pip install cryptomarket[async])
+
+    :param api_key: the user api key
+    :param api_secret: the user api secret
+    :param window: Maximum difference between timestamp and the moment of request processing in milliseconds for api calls. Max is 60_000. Default is 10_000
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode messages. Default is the default codec
+    :param base_url: Optional. The url of the websocket api, like the ws_url of a MockExchange. Default is the url of the exchange api
+    :param session: Optional. An aiohttp session to connect with, to share it between clients. Default is a session of the client
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        window: Optional[int] = None,
+        codec: Optional[Union[JsonCodec, str]] = None,
+        base_url: str = ws_url,
+        session: Optional['aiohttp.ClientSession'] = None,
+    ):
+        super(AsyncTradingClient, self).__init__(
+            base_url.rstrip('/') + '/trading',
+            api_key=api_key,
+            api_secret=api_secret,
+            window=window,
+            subscription_methods_data=TRADING_SUBSCRIPTION_METHODS,
+            codec=codec,
+            session=session,
+        )
+
+    async def subscribe_to_reports(self) -> Subscription[List[Report]]:
+        """subscribe to a feed of execution reports of the user's orders
+
+        https://api.exchange.cryptomkt.com/#socket-spot-trading
+
+        :return: A subscription of lists of reports: a snapshot of the active orders, and then updates
+        """
+        return await self._subscribe('spot_subscribe', _reports)
+
+    async def unsubscribe_to_reports(self) -> bool:
+        """stop recieveing the report feed subscription, and ends its iteration
+
+        https://api.exchange.cryptomkt.com/#socket-spot-trading
+
+        :return: The result of the unsubscription. True if successful
+        """
+        return await self._unsubscribe('spot_unsubscribe')
+
+    async def subscribe_to_spot_balance(
+        self,
+        mode: Union[args.SubscriptionMode, Literal['updates', 'batches']],
+    ) -> Subscription[List[Balance]]:
+        """subscribe to a feed of the user's spot balances
+
+        only non-zero values are present
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-spot-balances
+
+        :param mode: Either 'updates' or 'batches'. Update messages arrive after an update. Batch messages arrive at equal intervals after an update
+
+        :return: A subscription of lists of balances
+        """
+        params = args.DictBuilder().subscription_mode(mode).build()
+        return await self._subscribe('spot_balance_subscribe', _balances, params)
+
+    async def unsubscribe_to_spot_balance(self) -> bool:
+        """stop recieving the feed of balances, and ends its iteration
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-spot-balances
+
+        :return: The result of the unsubscription. True if successful
+        """
+        params = args.DictBuilder().subscription_mode(
+            args.SubscriptionMode.UPDATES).build()
+        return await self._unsubscribe('spot_balance_unsubscribe', params)
+
+    async def get_active_spot_orders(self) -> List[Report]:
+        """Get the user's active spot orders
+
+        https://api.exchange.cryptomkt.com/#get-active-spot-orders
+
+        :return: The list of reports of the active spot orders
+        """
+        response = await self._request('spot_get_orders')
+        return [from_dict(data_class=Report, data=report) for report in response]
+
+    async def create_spot_order(
+        self,
+        symbol: str,
+        side: Union[args.Side, Literal['buy', 'sell']],
+        quantity: str,
+        type: Optional[Union[args.OrderType, Literal[
+            'limit', 'market', 'stopLimit', 'stopMarket', 'takeProfitLimit', 'takeProfitMarket'
+        ]]] = None,
+        time_in_force: Optional[Union[args.TimeInForce, Literal[
+            'GTC', 'IOC', 'FOK', 'Day', 'GTD'
+        ]]] = None,
+        client_order_id: Optional[str] = None,
+        price: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        expire_time: Optional[str] = None,
+        post_only: Optional[bool] = None,
+        take_rate: Optional[str] = None,
+        make_rate: Optional[str] = None,
+    ) -> Report:
+        """Creates a new spot order
+
+        For fee, for price accuracy and quantity, and for order status information see the api docs at https://api.exchange.cryptomkt.com/#create-new-spot-order
+
+        https://api.exchange.cryptomkt.com/#place-new-spot-order
+
+        :param symbol: Trading symbol
+        :param side: Either 'buy' or 'sell'
+        :param quantity: Order quantity
+        :param client_order_id: Optional. If given must be unique within the trading day, including all active orders. If not given, is generated by the server
+        :param type: Optional. 'limit', 'market', 'stopLimit', 'stopMarket', 'takeProfitLimit' or 'takeProfitMarket'. Default is 'limit'
+        :param time_in_force: Optional. 'GTC', 'IOC', 'FOK', 'Day' or 'GTD'. Default to 'GTC'
+        :param price: Optional. Required for 'limit' and 'stopLimit'. limit price of the order
+        :param stop_price: Optional. Required for 'stopLimit' and 'stopMarket' orders. stop price of the order
+        :param expire_time: Optional. Required for orders with timeInForce = GDT
+        :param post_only: Optional. If True, your post_only order causes a match with a pre-existing order as a taker, then the order will be cancelled
+        :param take_rate: Optional. Liquidity taker fee, a fraction of order volume, such as 0.001 (for 0.1% fee). Can only increase the fee. Used for fee markup.
+        :param make_rate: Optional. Liquidity provider fee, a fraction of order volume, such as 0.001 (for 0.1% fee). Can only increase the fee. Used for fee markup.
+
+        :return: A report of the created order
+        """
+        params = args.DictBuilder().symbol(symbol).side(side).quantity(quantity).order_type(type).time_in_force(time_in_force).client_order_id(
+            client_order_id).price(price).stop_price(stop_price).expire_time(expire_time).post_only(post_only).take_rate(take_rate).make_rate(make_rate).build()
+        response = await self._request('spot_new_order', params)
+        return from_dict(data_class=Report, data=response)
+
+    async def create_spot_order_list(
+        self,
+        contingency_type: Union[args.ContingencyType, Literal['allOrNone', 'oneCancelOther', 'oneTriggerOneCancelOther']],
+        orders: List[args.OrderRequest],
+        order_list_id: Optional[str] = None,
+    ) -> List[Report]:
+        """creates a list of spot orders
+
+        For the restrictions of each contingency type see TradingClient.create_spot_order_list
+
+        https://api.exchange.cryptomkt.com/#create-new-spot-order-list-2
+
+        :param contingency_type: order list type.
+        :param orders: the list of orders
+        :param order_list_id: order list identifier. If not provided, it will be generated by the system. Must be equal to the client order id of the first order in the request
+
+        :return: The reports of the created orders, one per order
+        """
+        params = args.DictBuilder().order_list_id(
+            order_list_id).contingency_type(contingency_type).orders(orders).build()
+        responses = await self._request('spot_new_order_list', params, call_count=len(orders))
+        if len(orders) == 1:
+            responses = [responses]
+        return [from_dict(data_class=Report, data=response) for response in responses]
+
+    async def cancel_spot_order(self, client_order_id: str) -> Report:
+        """cancels a spot order
+
+        https://api.exchange.cryptomkt.com/#cancel-spot-order-2
+
+        :param client_order_id: the client order id of the order to cancel
+
+        :return: A report of the canceled order
+        """
+        params = args.DictBuilder().client_order_id(client_order_id).build()
+        response = await self._request('spot_cancel_order', params)
+        return from_dict(data_class=Report, data=response)
+
+    async def replace_spot_order(
+        self,
+        client_order_id: str,
+        new_client_order_id: str,
+        quantity: str,
+        price: str,
+        stop_price: Optional[str] = None,
+        strict_validate: Optional[bool] = None,
+    ) -> Report:
+        """changes the parameters of an existing order, quantity or price
+
+        https://api.exchange.cryptomkt.com/#cancel-replace-spot-order
+
+        :param client_order_id: the client order id of the order to change
+        :param new_client_order_id: the new client order id for the modified order. must be unique within the trading day
+        :param quantity: new order quantity
+        :param price: new order price
+        :param stop price: Required if order type is 'stopLimit', 'stopMarket', 'takeProfitLimit', or 'takeProfitMarket'. Order stop price
+        :param strict_validate:  price and quantity will be checked for the incrementation with tick size and quantity step. See symbol's tick_size and quantity_increment
+
+        :return: A report of the new version of the order
+        """
+        params = args.DictBuilder().client_order_id(client_order_id).new_client_order_id(
+            new_client_order_id).quantity(quantity).price(price).stop_price(stop_price).strict_validate(strict_validate).build()
+        response = await self._request('spot_replace_order', params)
+        return from_dict(data_class=Report, data=response)
+
+    async def cancel_spot_orders(self) -> List[Report]:
+        """cancel all active spot orders and return the ones that could not be canceled
+
+        https://api.exchange.cryptomkt.com/#cancel-spot-orders
+
+        :return: A list of reports of the canceled orders
+        """
+        response = await self._request('spot_cancel_orders')
+        return [from_dict(data_class=Report, data=report) for report in response]
+
+    async def get_spot_trading_balances(self) -> List[Balance]:
+        """Get the user's spot trading balance for all currencies with balance
+
+        https://api.exchange.cryptomkt.com/#get-spot-trading-balances
+
+        :return: A list of balances
+        """
+        response = await self._request('spot_balances')
+        return [from_dict(data_class=Balance, data=balance) for balance in response]
+
+    async def get_spot_trading_balance_of_currency(self, currency: str) -> Balance:
+        """Get the user spot trading balance of a currency
+
+        https://api.exchange.cryptomkt.com/#get-spot-trading-balance-2
+
+        :param currency: The currency code to query the balance
+
+        :return: The queried balance
+        """
+        params = args.DictBuilder().currency(currency).build()
+        response = await self._request('spot_balance', params)
+        return from_dict(data_class=Balance, data=response)
+
+    async def get_spot_commisions(self) -> List[Commission]:
+        """Get the personal trading commission rates for all symbols
+
+        https://api.exchange.cryptomkt.com/#get-spot-fees
+
+        :return: A list of commissions
+        """
+        response = await self._request('spot_fees')
+        return [from_dict(data_class=Commission, data=commission) for commission in response]
+
+    async def get_spot_commision_of_symbol(self, symbol: str) -> Commission:
+        """Get the personal trading commission rate of a symbol
+
+        https://api.exchange.cryptomkt.com/#get-spot-fee
+
+        :param symbol: The symbol of the commission rate
+
+        :return: The queried commission
+        """
+        params = args.DictBuilder().symbol(symbol).build()
+        response = await self._request('spot_fee', params)
+        return from_dict(data_class=Commission, data=response)
+
+    ###########
+    # ALIASES #
+    ###########
+
+    get_spot_trading_balance = get_spot_trading_balance_of_currency
+    get_spot_trading_balance_by_currency = get_spot_trading_balance_of_currency
+    get_spot_commision = get_spot_commision_of_symbol
+    get_spot_commision_by_symbol = get_spot_commision_of_symbol
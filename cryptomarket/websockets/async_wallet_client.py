@@ -0,0 +1,172 @@
+from typing import Any, List, Optional, Union
+
+from typing_extensions import Literal
+
+import cryptomarket.args as args
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses.balance import Balance
+from cryptomarket.dataclasses.transaction import Transaction
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.websockets.async_client_auth import AsyncClientAuthenticable
+from cryptomarket.websockets.async_client_base import Subscription, aiohttp
+from cryptomarket.websockets.client_base import ws_url
+from cryptomarket.websockets.wallet_client import WALLET_SUBSCRIPTION_METHODS
+
+
+def _balances(feed: Any) -> List[Balance]:
+    if isinstance(feed, list):
+        return [from_dict(data_class=Balance, data=balance) for balance in feed]
+    return [from_dict(data_class=Balance, data=feed)]
+
+
+def _transaction(feed: Any) -> Transaction:
+    return from_dict(data_class=Transaction, data=feed)
+
+
+class AsyncWalletClient(AsyncClientAuthenticable):
+    """AsyncWalletClient connects via websocket to cryptomarket to get account information of the user, from the running event loop. uses SHA256 as auth method and authenticates on connection.
+
+    Requests are coroutines, that raise a CryptomarketAPIException on errors. Subscriptions are async iterators of (data, notification_type) tuples. Requires aiohttp (pip install cryptomarket[async])
+
+    :param api_key: the user api key
+    :param api_secret: the user api secret
+    :param window: Maximum difference between timestamp and the moment of request processing in milliseconds for api calls. Max is 60_000. Default is 10_000
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode messages. Default is the default codec
+    :param base_url: Optional. The url of the websocket api, like the ws_url of a MockExchange. Default is the url of the exchange api
+    :param session: Optional. An aiohttp session to connect with, to share it between clients. Default is a session of the client
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        window: Optional[int] = None,
+        codec: Optional[Union[JsonCodec, str]] = None,
+        base_url: str = ws_url,
+        session: Optional['aiohttp.ClientSession'] = None,
+    ):
+        super(AsyncWalletClient, self).__init__(
+            base_url.rstrip('/') + '/wallet',
+            api_key=api_key,
+            api_secret=api_secret,
+            window=window,
+            subscription_methods_data=WALLET_SUBSCRIPTION_METHODS,
+            codec=codec,
+            session=session,
+        )
+
+    async def subscribe_to_transactions(self) -> Subscription[Transaction]:
+        """A transaction notification occurs each time a transaction has been changed, such as creating a transaction, updating the pending state (e.g., the hash assigned) or completing a transaction
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-transactions
+
+        :return: A subscription of transactions
+        """
+        return await self._subscribe('subscribe_transactions', _transaction)
+
+    async def unsubscribe_to_transactions(self) -> bool:
+        """stop recieving the feed of transactions changes, and ends its iteration
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-transactions
+
+        :return: The result of the unsubscription. True if successful
+        """
+        return await self._unsubscribe('unsubscribe_transactions')
+
+    async def subscribe_to_wallet_balance(self) -> Subscription[List[Balance]]:
+        """subscribe to a feed of the user's wallet balances
+
+        only non-zero values are present
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-wallet-balance
+
+        :return: A subscription of lists of balances: a snapshot, and then updates
+        """
+        return await self._subscribe('subscribe_wallet_balances', _balances)
+
+    async def unsubscribe_to_wallet_balance(self) -> bool:
+        """stop recieving the feed of balances changes, and ends its iteration
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-wallet-balance
+
+        :return: The result of the unsubscription. True if successful
+        """
+        return await self._unsubscribe('unsubscribe_wallet_balances')
+
+    async def get_wallet_balances(self) -> List[Balance]:
+        """Get the user's wallet balances for all currencies with balance
+
+        https://api.exchange.cryptomkt.com/#request-wallet-balance
+
+        :return: A list of balances
+        """
+        response = await self._request('wallet_balances')
+        return [from_dict(data_class=Balance, data=balance) for balance in response]
+
+    async def get_wallet_balance_of_currency(self, currency: str) -> Balance:
+        """Get the user's wallet balance of a currency
+
+        https://api.exchange.cryptomkt.com/#request-wallet-balance
+
+        :param currency: The currency code to query the balance
+
+        :return: The queried balance
+        """
+        params = args.DictBuilder().currency(currency).build()
+        response = await self._request('wallet_balance', params)
+        return from_dict(data_class=Balance, data=response)
+
+    async def get_transactions(
+        self,
+        transaction_ids: Optional[List[str]] = None,
+        type: Optional[Union[args.TransactionType, Literal[
+            'DEPOSIT', 'WITHDRAW', 'TRANSFER', 'SWAP'
+        ]]] = None,
+        subtype: Optional[Union[args.TransactionSubType, Literal[
+            'UNCLASSIFIED', 'BLOCKCHAIN', 'AIRDROP', 'AFFILIATE', 'STAKING', 'BUY_CRYPTO', 'OFFCHAIN', 'FIAT', 'SUB_ACCOUNT', 'WALLET_TO_SPOT', 'SPOT_TO_WALLET', 'WALLET_TO_DERIVATIVES', 'DERIVATIVES_TO_WALLET', 'CHAIN_SWITCH_FROM', 'CHAIN_SWITCH_TO', 'INSTANT_EXCHANGE'
+        ]]] = None,
+        statuses: Optional[List[args.TransactionStatus]] = None,
+        currencies: Optional[List[str]] = None,
+        order_by: Optional[Union[args.OrderBy, Literal[
+            'created_at', 'updated_at', 'last_updated_at', 'id']]] = None,
+        sort: Optional[args.Sort] = None,
+        id_from: Optional[int] = None,
+        id_till: Optional[int] = None,
+        since: Optional[str] = None,
+        till: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        group_transactions: Optional[bool] = None
+    ) -> List[Transaction]:
+        """Get the transaction history of the account
+
+        https://api.exchange.cryptomkt.com/#get-transactions
+
+        :param transaction_ids: Optional. List of transaction identifiers to query
+        :param type: Optional. valid types are: 'DEPOSIT', 'WITHDRAW', 'TRANSFER' and 'SWAP'
+        :param subtype: Optional. valid subtypes are: 'UNCLASSIFIED', 'BLOCKCHAIN', 'AIRDROP', 'AFFILIATE', 'STAKING', 'BUY_CRYPTO', 'OFFCHAIN', 'FIAT', 'SUB_ACCOUNT', 'WALLET_TO_SPOT', 'SPOT_TO_WALLET', 'WALLET_TO_DERIVATIVES', 'DERIVATIVES_TO_WALLET', 'CHAIN_SWITCH_FROM', 'CHAIN_SWITCH_TO' and 'INSTANT_EXCHANGE'
+        :param statuses: Optional. List of statuses to query. valid subtypes are: 'CREATED', 'PENDING', 'FAILED', 'SUCCESS' and 'ROLLED_BACK'
+        :param currencies: Optional. List of currencies to query. If not provided it queries all currencies
+        :param order_by: Optional. sorting parameter.'created_at', 'updated_at', 'last_activity_at' or 'id'. Default is 'created_at'
+        :param sort: Optional. Sort direction. 'ASC' or 'DESC'. Default is 'DESC'
+        :param id_from: Optional. Interval initial value when ordering by id. Min is 0
+        :param id_till: Optional. Interval end value when ordering by id. Min is 0
+        :param since: Optional. Interval initial value (inclusive). The value type depends on order_by.
+        :param till: Optional. Interval end value (inclusive). The value type depends on order_by.
+        :param limit: Optional. Transactions per query. Defaul is 100. Max is 1000
+        :param offset: Optional. Default is 0. Max is 100000
+        :param group_transactions: Optional. Flag indicating whether the returned transactions will be parts of a single operation. Default is false.
+
+        :return: A list of transactions
+        """
+        params = args.DictBuilder().transaction_type(type).transaction_subtype(subtype).transaction_statuses(statuses).currencies(currencies).id_from(
+            id_from).id_till(id_till).tx_ids(transaction_ids).order_by(order_by).sort(sort).since(since).till(till).limit(limit).offset(offset).group_transactions(group_transactions).build()
+        response = await self._request('get_transactions', params)
+        return [from_dict(data_class=Transaction, data=transaction) for transaction in response]
+
+    ###########
+    # ALIASES #
+    ###########
+
+    get_wallet_balance_by_currency = get_wallet_balance_of_currency
+    get_wallet_balance = get_wallet_balance_of_currency
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from cryptomarket.exceptions import CryptomarketAPIException
 from cryptomarket.websockets.callback import Callback
 from cryptomarket.websockets.reusable_callback import ReusableCallback
@@ -31,6 +31,13 @@ class CallbackCache:
             del self.reusable_callbacks[id]
         return callback
 
+    def pop_callbacks(self) -> List[Callback[Any]]:
+        """removes the callbacks of every request waiting for a response, and returns them"""
+        callbacks = [reusable_callback.callback for reusable_callback in self.reusable_callbacks.values()
+                     if not reusable_callback.is_done()]
+        self.reusable_callbacks.clear()
+        return callbacks
+
     def save_subscription_callback(self, key: str, callback: Callback[Any]):
         self.subscription_callbacks[key] = callback
 
@@ -40,5 +47,5 @@ class CallbackCache:
         return self.subscription_callbacks[key]
 
     def delete_subscription_callback(self, key: str):
-        if key in self.reusable_callbacks:
-            del self.reusable_callbacks[key]
+        if key in self.subscription_callbacks:
+            del self.subscription_callbacks[key]
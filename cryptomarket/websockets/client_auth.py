@@ -1,14 +1,41 @@
+import threading
 import time
-from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, Optional, Union
 
 from cryptomarket.exceptions import (CryptomarketAPIException,
                                      CryptomarketSDKException)
-from cryptomarket.hmac_auth import HmacAuth
-from cryptomarket.websockets.client_base import ClientBase, OnErrorException
+from cryptomarket.hmac_auth import HmacSigner
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.websockets.client_base import (AUTHENTICATE, ClientBase,
+                                                 OnErrorException)
+from cryptomarket.websockets.reconnect import ReconnectPolicy
 from cryptomarket.websockets.subscriptionMethodData import SubscriptionMethodData
 
 
+def login_params(api_key: str, signer: HmacSigner, window: Optional[int] = None) -> Dict[str, Any]:
+    """Builds the params of a login request, signed with the current time
+
+    :param api_key: The api key
+    :param signer: A signer with the api secret
+    :param window: Optional. Maximum difference between timestamp and the moment of request processing in milliseconds
+
+    :return: The params of the login request
+    """
+    timestamp = int(time.time()*1_000)
+    msg = str(timestamp)
+    if window:
+        msg += str(window)
+    params = {
+        'type': 'HS256',
+        'api_key': api_key,
+        'timestamp': timestamp,
+        'signature': signer.sign(msg.encode()),
+    }
+    if window:
+        params['window'] = window
+    return params
+
+
 class ClientAuthenticable(ClientBase):
     def __init__(
         self,
@@ -20,26 +47,38 @@ class ClientAuthenticable(ClientBase):
         on_connect: Optional[Callable[[], None]] = None,
         on_error: Optional[Callable[[OnErrorException], None]] = None,
         on_close: Optional[Callable[[int, str], None]] = None,
+        codec: Optional[Union[JsonCodec, str]] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        on_reconnect: Optional[Callable[[float], None]] = None,
     ):
         super(ClientAuthenticable, self).__init__(
             uri,
             subscription_methods_data=subscription_methods_data,
             on_connect=on_connect,
             on_error=on_error,
-            on_close=on_close
+            on_close=on_close,
+            codec=codec,
+            reconnect_policy=reconnect_policy,
+            on_reconnect=on_reconnect,
         )
         self.window = window
         self.api_key = api_key
         self.api_secret = api_secret
+        self._signer = HmacSigner(api_secret)
         self.authed: bool = False
         self._auth_error: Optional[CryptomarketSDKException] = None
 
-    def connect(self, timeout=30) -> Optional[CryptomarketSDKException]:
-        timeout_time = datetime.now()+timedelta(seconds=timeout)
-        err = super().connect(timeout)
+    def _connect(self, timeout: float) -> Optional[CryptomarketSDKException]:
+        deadline = time.perf_counter() + timeout
+        self.authed = False
+        self._auth_error = None
+        err = super()._connect(timeout)
         if err:
             return err
 
+        started = time.perf_counter()
+        done = threading.Event()
+
         def authenticate_client(err, result):
             if err:
                 self._auth_error = err
@@ -48,20 +87,21 @@ class ClientAuthenticable(ClientBase):
             else:
                 self._auth_error = CryptomarketSDKException(
                     'authentication failed')
+            done.set()
         self.authenticate(authenticate_client)
-
-        def auth_done():
-            return self.authed or self._auth_error or datetime.now() >= timeout_time
-        while not auth_done():
-            time.sleep(1)
+        # the timeout covers both the connection and the authentication
+        if done.wait(max(0.0, deadline - time.perf_counter())) and self.authed:
+            self._latencies[AUTHENTICATE].add(time.perf_counter() - started)
 
         if self._auth_error:
-            self.close()
             return self._auth_error
         if not self.authed:
-            self.close()
             return CryptomarketSDKException('authentication timeout')
 
+    def _on_close(self, code: int, message: str):
+        self.authed = False
+        super()._on_close(code, message)
+
     def authenticate(self, callback: Optional[Callable[[Any, Any], Any]] = None):
         """Authenticates the websocket
 
@@ -74,17 +114,5 @@ class ClientAuthenticable(ClientBase):
         .. code-block:: python
         True
         """
-        timestamp = int(time.time()*1_000)
-        msg = str(timestamp)
-        if self.window:
-            msg += str(self.window)
-        signature = HmacAuth.get_signature(msg, self.api_secret)
-        params = {
-            'type': 'HS256',
-            'api_key': self.api_key,
-            'timestamp': timestamp,
-            'signature': signature,
-        }
-        if self.window:
-            params['window'] = self.window
+        params = login_params(self.api_key, self._signer, self.window)
         return self._send_by_id(method='login', callback=callback, params=params)
@@ -1,16 +1,25 @@
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from cryptomarket.exceptions import (CryptomarketAPIException,
                                      CryptomarketSDKException)
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.metrics import LatencyHistogram, LatencyStats
 from cryptomarket.websockets.callback_cache import CallbackCache
 from cryptomarket.websockets.manager import WebsocketManager
+from cryptomarket.websockets.reconnect import ReconnectPolicy
 from cryptomarket.websockets.subscriptionMethodData import \
     SubscriptionMethodData
 
 OnErrorException = Union[Exception, KeyboardInterrupt, SystemExit]
 
+ws_url = 'wss://api.exchange.cryptomkt.com/api/3/ws/'
+
+# phases of the connection of a client
+CONNECT = 'connect'
+AUTHENTICATE = 'authenticate'
+
 
 class ClientBase:
     def __init__(
@@ -20,6 +29,9 @@ class ClientBase:
         on_connect: Optional[Callable[[], None]] = None,
         on_error: Optional[Callable[[OnErrorException], None]] = None,
         on_close: Optional[Callable[[int, str], None]] = None,
+        codec: Optional[Union[JsonCodec, str]] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        on_reconnect: Optional[Callable[[float], None]] = None,
     ):
         if on_connect is not None:
             self.on_connect = on_connect
@@ -27,17 +39,26 @@ class ClientBase:
             self.on_connect = None
 
         if on_error is not None:
-            self.error = on_error
+            self.on_error = on_error
         else:
-            self._on_error = None
+            self.on_error = None
 
         if on_close is not None:
             self.on_close = on_close
         else:
             self.on_close = None
-        self._ws_manager = WebsocketManager(self, uri)
+        self._ws_manager = WebsocketManager(self, uri, codec=codec)
         self._callback_cache = CallbackCache()
         self._subscription_methods_data = subscription_methods_data
+        self._latencies = {CONNECT: LatencyHistogram(), AUTHENTICATE: LatencyHistogram()}
+        self.reconnect_policy = reconnect_policy
+        self.on_reconnect = on_reconnect
+        # the subscription requests of each active subscription, sent again on reconnection
+        self._subscription_payloads: Dict[str, List[Dict[str, Any]]] = {}
+        self._closing = threading.Event()
+        self._reconnect_lock = threading.Lock()
+        self._reconnecting = False
+        self._open = False
 
     def connect(self, timeout=30) -> Optional[CryptomarketSDKException]:
         """connnects via websocket to the exchange.
@@ -46,40 +67,124 @@ class ClientBase:
 
         :param timeout: Seconds the the client will have to connect and then authenticate (if is an authenticated client).
         """
-        self._ws_manager.connect()
-
-        timeout_time = datetime.now()+timedelta(seconds=timeout)
-
-        def connecting():
-            return not self._ws_manager.connected and datetime.now() < timeout_time
-        while connecting():
-            time.sleep(1)
-        if not self._ws_manager.connected:
+        self._closing.clear()
+        err = self._connect(timeout)
+        if err:
             self.close()
+        return err
+
+    def _connect(self, timeout: float) -> Optional[CryptomarketSDKException]:
+        started = time.perf_counter()
+        self._ws_manager.connect()
+        if not self._ws_manager.wait_open(timeout):
+            error = self._ws_manager.connect_error
+            if error is not None:
+                return CryptomarketSDKException(f'connection failed: {error}')
             return CryptomarketSDKException("connection timeout")
+        self._latencies[CONNECT].add(time.perf_counter() - started)
 
     def close(self):
-        """close the websocket connection with the exchange
+        """close the websocket connection with the exchange, and stops any reconnection
         """
+        self._closing.set()
         self._ws_manager.close()
 
+    def connection_stats(self) -> Dict[str, LatencyStats]:
+        """Gets the latencies of the connections of the client, with the count, sum, p50, p99 and max of each phase
+
+        :return: A dict of latency stats indexed by phase, 'connect' for the websocket handshake and 'authenticate' for the login of authenticated clients
+        """
+        return {phase: histogram.stats() for phase, histogram in self._latencies.items()}
+
     def _on_open(self):
         """
         internal use only
         """
-        if self.on_connect:
+        self._open = True
+        if self.on_connect and not self._reconnecting:
             self.on_connect()
 
+    def _on_close(self, code: int, message: str):
+        """
+        internal use only
+        """
+        dropped = self._open and not self._closing.is_set()
+        self._open = False
+        if self.on_close:
+            self.on_close(code, message)
+        if not dropped:
+            return
+        # the requests waiting for a response will not get one
+        for callback in self._callback_cache.pop_callbacks():
+            callback(CryptomarketSDKException('websocket connection lost'), None)
+        if self.reconnect_policy is None:
+            return
+        with self._reconnect_lock:
+            if self._reconnecting:
+                return  # lost while reconnecting, the reconnection keeps trying
+            self._reconnecting = True
+        threading.Thread(target=self._reconnect, name='cryptomarket-reconnect', daemon=True).start()
+
+    def _reconnect(self):
+        policy = self.reconnect_policy
+        lost_at = time.perf_counter()
+        attempt = 0
+        while True:
+            if policy.max_attempts is not None and attempt >= policy.max_attempts:
+                policy._count('failed')
+                self._reconnecting = False
+                if self.on_error:
+                    self.on_error(CryptomarketSDKException(f'unable to reconnect after {attempt} attempts'))
+                return
+            if self._closing.wait(policy.delay(attempt)):
+                self._reconnecting = False
+                return
+            attempt += 1
+            policy._count('attempts')
+            error = self._connect(policy.timeout)
+            if self._closing.is_set():
+                self._ws_manager.close()
+                self._reconnecting = False
+                return
+            if error is None:
+                downtime = time.perf_counter() - lost_at
+                # before the subscriptions send their new snapshots
+                if self.on_reconnect:
+                    self.on_reconnect(downtime)
+                error = self._resubscribe()
+            if error is not None:
+                self._ws_manager.close()
+                continue
+            with self._reconnect_lock:
+                if self._open:
+                    self._reconnecting = False
+                    policy._reconnected(downtime)
+                    return
+            # lost again while subscribing
+
+    def _resubscribe(self) -> Optional[Exception]:
+        def on_result(err, result):
+            if err and self.on_error:
+                self.on_error(err)
+        try:
+            for payloads in list(self._subscription_payloads.values()):
+                for payload in payloads:
+                    self._ws_manager.send(dict(payload, id=self._callback_cache.save_callback(on_result)))
+        except Exception as error:
+            return error
+
     # SENDS #
 
     def _send_subscription(self, method, callback, params=None, result_callback=None):
         key = self._build_key(method)
         self._callback_cache.save_subscription_callback(key, callback)
+        self._subscription_payloads[key] = [{'method': method, 'params': params}]
         self._send_by_id(method, result_callback, params)
 
     def _send_unsubscription(self, method, callback=None, params=None):
         key = self._build_key(method)
         self._callback_cache.delete_subscription_callback(key)
+        self._subscription_payloads.pop(key, None)
         self._send_by_id(method, callback, params)
 
     def _send_by_id(self, method: str, callback: Optional[Callable[[Any, Any], Any]] = None, params=None, call_count: int = 1):
@@ -1,6 +1,5 @@
-from enum import Enum
 from functools import partial
-from dacite import Config, from_dict
+from cryptomarket.converter import from_dict
 from cryptomarket.dataclasses.report import Report
 
 
@@ -12,6 +11,5 @@ def intercept_report_(err, response, callback):
     if err:
         callback(err, None)
         return
-    reports = from_dict(data_class=Report, data=response,
-                        config=Config(cast=[Enum]))
+    reports = from_dict(data_class=Report, data=response)
     callback(None, reports)
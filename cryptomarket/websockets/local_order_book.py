@@ -0,0 +1,311 @@
+"""Order books kept up to date from the full order book feed.
+
+A LocalOrderBook starts from a snapshot and applies the updates that follow
+it, in sequence. Each side keeps its levels in parallel arrays sorted by
+price: the prices scaled to integers, and the price and quantity strings as
+received, so applying a level allocates no objects, and a level is found by
+bisection. OrderBookLevel objects are only built by the queries. An update
+that skips a sequence number leaves the book out of sync until the next
+snapshot, that LocalOrderBooks requests by subscribing again.
+"""
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from typing_extensions import Literal
+
+import cryptomarket.args as args
+from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+from cryptomarket.dataclasses.wsOrderBook import WSOrderBook
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.websockets.callback import Callback
+
+ASK = 'ask'
+BID = 'bid'
+
+Side = Literal['ask', 'bid']
+
+Levels = Iterable[Tuple[str, str]]
+
+
+def _is_zero(quantity: str) -> bool:
+    # any other digit than zero makes a quantity positive, as the feed has no exponents
+    return not quantity.strip('0.')
+
+
+def _fraction_digits(price: str) -> int:
+    return len(price.partition('.')[2])
+
+
+def _levels(order_book: Union[WSOrderBook, Dict[str, Any]], side: str) -> Levels:
+    if isinstance(order_book, dict):
+        return order_book[side]
+    return ((level.price, level.quantity) for level in getattr(order_book, side))
+
+
+class _BookSide:
+    """The levels of one side of a book, in parallel arrays sorted by key.
+
+    A key is a price scaled to an integer, negated for the asks, so both sides end with their best price, where
+    most changes happen and where inserting or removing a level moves the fewest items.
+    """
+
+    def __init__(self, sign: int):
+        self.sign = sign
+        self.keys = array('q')
+        self.prices: List[str] = []
+        self.quantities: List[str] = []
+
+    def reset(self, keys: List[int], prices: List[str], quantities: List[str]):
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = array('q', [keys[i] for i in order])
+        self.prices = [prices[i] for i in order]
+        self.quantities = [quantities[i] for i in order]
+
+    def rescale(self, factor: int):
+        keys = self.keys
+        for i in range(len(keys)):
+            keys[i] *= factor
+
+    def levels(self, limit: Optional[int]) -> List[OrderBookLevel]:
+        start = 0 if limit is None else max(0, len(self.keys) - limit)
+        return [OrderBookLevel(price, quantity) for price, quantity
+                in zip(reversed(self.prices[start:]), reversed(self.quantities[start:]))]
+
+    def best(self) -> Optional[OrderBookLevel]:
+        if not self.keys:
+            return None
+        return OrderBookLevel(self.prices[-1], self.quantities[-1])
+
+
+class LocalOrderBook:
+    """The order book of a symbol, built from a snapshot and the updates that follow it.
+
+    Updates are applied in sequence: older updates are ignored, and an update that skips a sequence number
+    leaves the book out of sync until the next snapshot. Queries lock the book, so they can be made from any thread.
+
+    :param symbol: The symbol of the book
+    :param price_scale: Optional. Decimals of the prices of the symbol, like the ones of its tick_size. Default is the most decimals of the prices of the snapshot, raised if an update has more
+    """
+
+    def __init__(self, symbol: str, price_scale: Optional[int] = None):
+        self.symbol = symbol
+        self.price_scale = price_scale or 0
+        self.sequence: Optional[int] = None
+        """the sequence number of the last snapshot or update applied"""
+        self.timestamp: Optional[int] = None
+        """the timestamp of the last snapshot or update applied, in milliseconds"""
+        self.synced = False
+        """True if the book has a snapshot and every update since it"""
+        self.lock = threading.Lock()
+        self._asks = _BookSide(-1)
+        self._bids = _BookSide(1)
+
+    def apply_snapshot(self, order_book: Union[WSOrderBook, Dict[str, Any]]):
+        """Replaces the levels of the book with the ones of a snapshot
+
+        :param order_book: A snapshot of the full order book feed, as a WSOrderBook or as received
+        """
+        asks = [level for level in _levels(order_book, 'a') if not _is_zero(level[1])]
+        bids = [level for level in _levels(order_book, 'b') if not _is_zero(level[1])]
+        with self.lock:
+            self.price_scale = max([self.price_scale] + [_fraction_digits(price) for price, _ in asks + bids])
+            for side, levels in ((self._asks, asks), (self._bids, bids)):
+                side.reset([side.sign * self._scaled(price) for price, _ in levels],
+                           [price for price, _ in levels],
+                           [quantity for _, quantity in levels])
+            self.sequence, self.timestamp = self._position(order_book)
+            self.synced = True
+
+    def apply_update(self, order_book: Union[WSOrderBook, Dict[str, Any]]) -> bool:
+        """Applies the changed levels of an update. Levels with a quantity of zero are removed
+
+        :param order_book: An update of the full order book feed, as a WSOrderBook or as received
+
+        :return: False if the update is not the next in sequence, and the book is now out of sync. True otherwise
+        """
+        sequence, timestamp = self._position(order_book)
+        with self.lock:
+            if not self.synced:
+                return False
+            if sequence <= self.sequence:
+                return True  # already applied
+            if sequence != self.sequence + 1:
+                self.synced = False
+                return False
+            self._apply(self._asks, _levels(order_book, 'a'))
+            self._apply(self._bids, _levels(order_book, 'b'))
+            self.sequence = sequence
+            self.timestamp = timestamp
+            return True
+
+    def reset(self):
+        """Marks the book out of sync until the next snapshot, like when the connection is restored"""
+        with self.lock:
+            self.synced = False
+
+    def best_ask(self) -> Optional[OrderBookLevel]:
+        """:return: The level of the lowest ask, or None if there are no asks"""
+        with self.lock:
+            return self._asks.best()
+
+    def best_bid(self) -> Optional[OrderBookLevel]:
+        """:return: The level of the highest bid, or None if there are no bids"""
+        with self.lock:
+            return self._bids.best()
+
+    def asks(self, limit: Optional[int] = None) -> List[OrderBookLevel]:
+        """Gets the asks from the lowest price
+
+        :param limit: Optional. Maximum number of levels. Default is all the levels
+
+        :return: The levels, best first
+        """
+        with self.lock:
+            return self._asks.levels(limit)
+
+    def bids(self, limit: Optional[int] = None) -> List[OrderBookLevel]:
+        """Gets the bids from the highest price
+
+        :param limit: Optional. Maximum number of levels. Default is all the levels
+
+        :return: The levels, best first
+        """
+        with self.lock:
+            return self._bids.levels(limit)
+
+    def price_for_volume(self, side: Side, quantity: str) -> Optional[str]:
+        """Gets the worst price reached by taking a quantity from a side of the book, from its best price
+
+        :param side: Either 'ask', the side taken by a buy, or 'bid', the side taken by a sell
+        :param quantity: The quantity to take
+
+        :return: The price of the last level needed, or None if the side does not have the quantity
+        """
+        remaining = Decimal(quantity)
+        with self.lock:
+            book_side = self._side(side)
+            for i in range(len(book_side.keys) - 1, -1, -1):
+                remaining -= Decimal(book_side.quantities[i])
+                if remaining <= 0:
+                    return book_side.prices[i]
+        return None
+
+    def volume_to_price(self, side: Side, price: str) -> str:
+        """Gets the quantity of a side of the book at prices as good as a price, or better
+
+        :param side: Either 'ask', to sum the asks at the price or lower, or 'bid', to sum the bids at the price or higher
+        :param price: The worst price to include
+
+        :return: The total quantity
+        """
+        with self.lock:
+            book_side = self._side(side)
+            scaled = Decimal(price).scaleb(self.price_scale)
+            # the key of the worst level included, as the price can have more decimals than the scale
+            worst = -math.floor(scaled) if side == ASK else math.ceil(scaled)
+            quantities = book_side.quantities[bisect_left(book_side.keys, worst):]
+        return format(sum(map(Decimal, quantities), Decimal(0)), 'f')
+
+    def _apply(self, side: _BookSide, levels: Levels):
+        sign = side.sign
+        for price, quantity in levels:
+            key = sign * self._scaled(price)
+            keys = side.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                if _is_zero(quantity):
+                    del keys[i]
+                    del side.prices[i]
+                    del side.quantities[i]
+                else:
+                    side.quantities[i] = quantity
+            elif not _is_zero(quantity):
+                keys.insert(i, key)
+                side.prices.insert(i, price)
+                side.quantities.insert(i, quantity)
+
+    def _scaled(self, price: str) -> int:
+        whole, _, fraction = price.partition('.')
+        if len(fraction) > self.price_scale:
+            # more decimals than the scale, that is raised for every price of the book
+            factor = 10 ** (len(fraction) - self.price_scale)
+            self._asks.rescale(factor)
+            self._bids.rescale(factor)
+            self.price_scale = len(fraction)
+        return int(whole + fraction.ljust(self.price_scale, '0'))
+
+    @staticmethod
+    def _position(order_book: Union[WSOrderBook, Dict[str, Any]]) -> Tuple[int, int]:
+        if isinstance(order_book, dict):
+            return int(order_book['s']), int(order_book['t'])
+        return order_book.s, order_book.t
+
+    def _side(self, side: Side) -> _BookSide:
+        if side == ASK:
+            return self._asks
+        if side == BID:
+            return self._bids
+        raise CryptomarketSDKException(f"invalid side: {side}, must be 'ask' or 'bid'")
+
+
+class LocalOrderBooks:
+    """The local order books of some symbols, kept up to date from the full order book feed of a MarketDataClient.
+
+    On a gap in the sequence of a book, the symbols are subscribed again to get new snapshots.
+    Built by MarketDataClient.subscribe_to_local_order_books
+
+    :param client: The client of the feed
+    :param symbols: The symbols of the books
+    :param callback: Optional. A callable called with each book after it changes, and the notification type, 'snapshot' or 'update'
+    """
+
+    def __init__(self, client, symbols: List[str], callback: Optional[Callable[[LocalOrderBook, str], None]] = None):
+        self._client = client
+        self.symbols = list(symbols)
+        self.callback = callback
+        self.books = {symbol: LocalOrderBook(symbol) for symbol in self.symbols}
+        self.gaps = 0
+        """the number of gaps found in the sequences of the books"""
+        self._resyncing = False
+
+    def __getitem__(self, symbol: str) -> LocalOrderBook:
+        return self.books[symbol]
+
+    def reset(self):
+        """Marks every book out of sync until its next snapshot. Can be the on_reconnect of the client"""
+        for book in self.books.values():
+            book.reset()
+
+    def _subscribe(self, result_callback: Optional[Callback[List[str]]] = None):
+        params = args.DictBuilder().symbols_as_list(self.symbols).build()
+        self._client._send_channeled_subscription(
+            channel='orderbook/full',
+            callback=self._on_feed,
+            params=params,
+            result_callback=result_callback,
+        )
+
+    def _on_feed(self, feed, feed_type):
+        gap = False
+        for symbol, data in feed.items():
+            book = self.books.get(symbol)
+            if book is None:
+                continue
+            # applied as received, without building the levels
+            if feed_type == 'snapshot':
+                book.apply_snapshot(data)
+            elif not book.apply_update(data):
+                gap = gap or book.sequence is not None
+                continue
+            if self.callback:
+                self.callback(book, feed_type)
+        if feed_type == 'snapshot':
+            self._resyncing = not all(book.synced for book in self.books.values())
+        elif gap and not self._resyncing:
+            self.gaps += 1
+            self._resyncing = True
+            self._subscribe()
@@ -1,38 +1,63 @@
-import json
 import logging
-from threading import Thread
+from threading import Event, Thread, current_thread
+from typing import Optional, Union
 
 import websocket
 
+from cryptomarket.json_codec import JsonCodec, resolve_codec
+
 
 class WebsocketManager:
-    def __init__(self, handler, uri):
+    def __init__(self, handler, uri, codec: Optional[Union[JsonCodec, str]] = None):
         self._log = logging.getLogger(__name__)
         self._log.setLevel(logging.DEBUG)
         self.uri = uri
-        self.connected = False
+        self.codec = resolve_codec(codec)
+        self._handler = handler
+        self._new_app()
+
+    def _new_app(self):
+        """creates the websocket app and its thread, as a thread can only be started once"""
+        handler = self._handler
+        loads = self.codec.loads
 
         def on_message(ws, message):
-            msg = json.loads(message)
+            msg = loads(message)
             try:
                 handler._handle(msg)
             except Exception as e:
-                handler.on_error(e)
+                if handler.on_error:
+                    handler.on_error(e)
                 self.close()
 
         def on_error(ws, error):
-            self._log.error("websocket error: " + error)
-            handler.on_error(error)
+            if ws is not self.ws:
+                return  # of a replaced connection
+            self._log.error(f'websocket error: {error}')
+            if not self._settled.is_set():
+                self.connect_error = error
+                self._settled.set()
+            if handler.on_error:
+                handler.on_error(error)
 
         def on_close(ws, code: int, message: str):
+            if ws is not self.ws:
+                return
             self._log.debug('websocket connection closed')
-            handler.on_close(code, message)
+            self.connected = False
+            self._settled.set()
+            handler._on_close(code, message)
 
         def on_open(ws):
             self._log.debug(f'websocket connection open at: {ws.url}')
             self.connected = True
+            self._settled.set()
             handler._on_open()
 
+        self.connected = False
+        self.connect_error: Optional[Exception] = None
+        # set once the connection opens or fails, so connect waits for it instead of polling
+        self._settled = Event()
         self.ws = websocket.WebSocketApp(
             self.uri,
             on_message=on_message,
@@ -41,21 +66,50 @@ class WebsocketManager:
             on_open=on_open,
         )
 
-        self.thread = Thread(target=self.ws.run_forever)
+        # frames are validated as utf-8 when decoded, a second validation pass is not needed
+        self.thread = Thread(target=self.ws.run_forever,
+                             kwargs={'skip_utf8_validation': True})
 
     def connect(self):
+        if self.thread.ident is not None:
+            self._new_app()  # reconnecting
         self.thread.start()
 
+    def wait_open(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the connection opens or fails
+
+        :param timeout: Optional. Maximum seconds to wait. Default is no limit
+
+        :return: True if the connection is open
+        """
+        self._settled.wait(timeout)
+        return self.connected
+
     def send(self, msg):
         if not self.thread.is_alive():
             raise ConnectionError('websocket connection is not active')
-        msg_as_str = json.dumps(msg)
+        msg_as_str = self.codec.dumps_str(msg)
         self.ws.send(msg_as_str)
 
     def close(self):
+        self.connected = False
+        # not joined from its own thread, like when a handler closes the connection
+        joinable = self.thread.is_alive() and self.thread is not current_thread()
+        sock = self.ws.sock
+        if joinable and sock is not None:
+            # the reading thread closes the socket once the close frame is answered, as closing it
+            # from here can leave that thread waiting on a closed socket until its select times out
+            self.ws.keep_running = False
+            try:
+                sock.send_close()
+            except Exception as e:
+                self._log.error("unable to close socket: " + str(e))
+            self.thread.join(3)
+            if not self.thread.is_alive():
+                return
         try:
             self.ws.close()
         except Exception as e:
             self._log.error("unable to close socket: " + str(e))
-        self.connected = False
-        self.thread.join(5)
+        if joinable:
+            self.thread.join(5)
@@ -1,9 +1,9 @@
 from typing import Any, Callable, Dict, List, Optional, Union
 
-from dacite import from_dict
 from typing_extensions import Literal
 
 import cryptomarket.args as args
+from cryptomarket.converter import from_dict
 from cryptomarket.dataclasses.wsCandle import WSCandle
 from cryptomarket.dataclasses.wsMiniTicker import WSMiniTicker
 from cryptomarket.dataclasses.wsOrderBook import WSOrderBook
@@ -12,8 +12,12 @@ from cryptomarket.dataclasses.wsPriceRate import WSPriceRate
 from cryptomarket.dataclasses.wsTicker import WSTicker
 from cryptomarket.dataclasses.wsTrade import WSTrade
 from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.json_codec import JsonCodec
 from cryptomarket.websockets.callback import Callback
-from cryptomarket.websockets.client_base import ClientBase
+from cryptomarket.websockets.client_base import ClientBase, ws_url
+from cryptomarket.websockets.local_order_book import (LocalOrderBook,
+                                                      LocalOrderBooks)
+from cryptomarket.websockets.reconnect import ReconnectPolicy
 
 SNAPSHOT = 'snapshot'
 UPDATE = 'update'
@@ -24,14 +28,21 @@ class MarketDataClient(ClientBase):
     """PublicClient connects via websocket to cryptomarket to get market information of the exchange.
 
     :param callback: A callable to call with the client once the connection is established. if an error ocurrs is return as the fist parameter of the callback: callback(err, client)
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode messages. Default is the default codec
+    :param base_url: Optional. The url of the websocket api, like the ws_url of a MockExchange. Default is the url of the exchange api
+    :param reconnect_policy: Optional. A ReconnectPolicy to reconnect when the connection is lost, and subscribe again to the active subscriptions. Default is no reconnection
+    :param on_reconnect: Optional. function called once the connection is restored, before the subscriptions send their new snapshots, to reset any state built from them. it takes one parameter, the seconds without a connection
     """
 
-    def __init__(self, on_connect: Optional[Callable] = None, on_error: Optional[Callable] = None, on_close: Optional[Callable] = None):
+    def __init__(self, on_connect: Optional[Callable] = None, on_error: Optional[Callable] = None, on_close: Optional[Callable] = None, codec: Optional[Union[JsonCodec, str]] = None, base_url: str = ws_url, reconnect_policy: Optional[ReconnectPolicy] = None, on_reconnect: Optional[Callable[[float], None]] = None):
         super(MarketDataClient, self).__init__(
-            "wss://api.exchange.cryptomkt.com/api/3/ws/public",
+            base_url.rstrip('/') + '/public',
             on_connect=on_connect,
             on_error=on_error,
-            on_close=on_close
+            on_close=on_close,
+            codec=codec,
+            reconnect_policy=reconnect_policy,
+            on_reconnect=on_reconnect,
         )
 
     def _handle(self, message):
@@ -72,6 +83,10 @@ class MarketDataClient(ClientBase):
             'ch': channel,
             'params': params,
         }
+        # replayed in order on reconnection, as each subscription to a channel adds symbols to it
+        payloads = self._subscription_payloads.setdefault(key, [])
+        if payload not in payloads:
+            payloads.append(dict(payload))
         if result_callback:
             def intercept_result(err, result):
                 result_callback(err, result['subscriptions'])
@@ -383,6 +398,32 @@ class MarketDataClient(ClientBase):
             result_callback=result_callback
         )
 
+    def subscribe_to_local_order_books(
+        self,
+        symbols: List[str],
+        callback: Optional[Callable[[LocalOrderBook, Literal['snapshot', 'update']], None]] = None,
+        result_callback: Optional[Callback[List[str]]] = None,
+    ) -> LocalOrderBooks:
+        """subscribe to the full orderbook feed, and keep a local order book of each symbol up to date with it
+
+        the books check the sequence of the updates, and the symbols are subscribed again to get new snapshots if an update is missed
+
+        takes the place of any subscription to the full order book feed of the client
+
+        Requires no API key Access Rights
+
+        https://api.exchange.cryptomkt.com/#subscribe-to-full-order-book
+
+        :param symbols: A list of symbol ids to subscribe to
+        :param callback: Optional. A callable called with each book after it changes, and the notification type
+        :param result_callback: A callable of two arguments, takes either a CryptomarketAPIException, or the list of correctly subscribed symbol
+
+        :return: The local order books, indexed by symbol
+        """
+        books = LocalOrderBooks(self, symbols, callback)
+        books._subscribe(result_callback)
+        return books
+
     def subscribe_to_partial_order_book(
         self,
         callback: Callable[[Dict[str, WSOrderBook]], None],
@@ -0,0 +1,68 @@
+"""Reconnection of the websocket clients after the connection is lost.
+
+A client with a reconnect policy opens a new connection when the exchange
+closes it or the network drops it, authenticates again if it is an
+authenticated client, and subscribes again to every active subscription, with
+the params it was subscribed with. Subscriptions that start with a snapshot,
+like the order books, the reports and the balances, send a new one.
+"""
+import random
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ReconnectStats:
+    reconnects: int = 0
+    """connections restored"""
+    attempts: int = 0
+    """connection attempts, successful or not"""
+    failed: int = 0
+    """times the attempts ran out before reconnecting"""
+    downtime: float = 0.0
+    """seconds without a connection, summed over the restored connections"""
+    last_downtime: float = 0.0
+    """seconds without a connection before the last reconnection"""
+
+
+class ReconnectPolicy:
+    """Reconnects websocket clients with exponential backoff and full jitter.
+
+    The n-th attempt waits a random time between 0 and min(max_delay, base_delay * 2**n) seconds.
+
+    :param max_attempts: Optional. Maximum number of attempts to reconnect after a connection is lost. Default is no limit
+    :param base_delay: Optional. Seconds of the backoff of the first attempt. Default is 0.5
+    :param max_delay: Optional. Maximum seconds to wait between attempts. Default is 30
+    :param timeout: Optional. Seconds each attempt has to connect, and then to authenticate. Default is 10
+    """
+
+    def __init__(self, max_attempts: Optional[int] = None, base_delay: float = 0.5, max_delay: float = 30.0, timeout: float = 10.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._stats = ReconnectStats()
+
+    def delay(self, attempt: int) -> float:
+        """Gets the seconds to wait before an attempt
+
+        :param attempt: The number of the attempt, from 0
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    def _reconnected(self, downtime: float):
+        with self._lock:
+            self._stats.reconnects += 1
+            self._stats.downtime += downtime
+            self._stats.last_downtime = downtime
+
+    def stats(self) -> ReconnectStats:
+        """Gets the reconnections, attempts, failures and downtime since the creation, of all the clients of the policy"""
+        with self._lock:
+            return ReconnectStats(**vars(self._stats))
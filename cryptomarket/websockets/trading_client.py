@@ -1,24 +1,37 @@
-from enum import Enum
 from typing import Any, Callable, List, Optional, Union
 
-from dacite import Config, DaciteError, from_dict
 from dacite.data import Data
 from typing_extensions import Literal
 
 import cryptomarket.args as args
+from cryptomarket.converter import from_dict
 from cryptomarket.dataclasses.balance import Balance
 from cryptomarket.dataclasses.commission import Commission
 from cryptomarket.dataclasses.report import Report
 from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.json_codec import JsonCodec
 from cryptomarket.websockets.callback import Callback
 from cryptomarket.websockets.client_auth import ClientAuthenticable
-from cryptomarket.websockets.client_base import OnErrorException
+from cryptomarket.websockets.client_base import OnErrorException, ws_url
+from cryptomarket.websockets.reconnect import ReconnectPolicy
 from cryptomarket.websockets.subscriptionMethodData import \
     SubscriptionMethodData
 
 _REPORTS = 'reports'
 _BALANCES = 'balances'
 
+TRADING_SUBSCRIPTION_METHODS = {
+    # reports
+    'spot_order': SubscriptionMethodData(_REPORTS, 'update'),
+    'spot_orders': SubscriptionMethodData(_REPORTS, 'snapshot'),
+    'spot_subscribe': SubscriptionMethodData(_REPORTS, 'command'),
+    'spot_unsubscribe': SubscriptionMethodData(_REPORTS, 'command'),
+    # spot balance
+    'spot_balance': SubscriptionMethodData(_BALANCES, 'snapshot'),
+    'spot_balance_subscribe': SubscriptionMethodData(_BALANCES, 'command'),
+    'spot_balance_unsubscribe': SubscriptionMethodData(_BALANCES, 'command'),
+}
+
 InterceptResponseCallback = Optional[Callable[[
     Optional[CryptomarketAPIException], Optional[Data]], None]]
 
@@ -32,6 +45,10 @@ class TradingClient(ClientAuthenticable):
     :param on_connect: function called on a successful connection. no parameters
     :param on_error: function called on a websocket error, and called in an authenticated error. it takes one parameter, the error.
     :param on_close: function called on the closing event of the websocket. no parameters
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode messages. Default is the default codec
+    :param base_url: Optional. The url of the websocket api, like the ws_url of a MockExchange. Default is the url of the exchange api
+    :param reconnect_policy: Optional. A ReconnectPolicy to reconnect when the connection is lost, then authenticate and subscribe again to the active subscriptions. Default is no reconnection
+    :param on_reconnect: Optional. function called once the connection is restored, before the subscriptions send their new snapshots, to reset any state built from them. it takes one parameter, the seconds without a connection
     """
 
     def __init__(
@@ -42,26 +59,23 @@ class TradingClient(ClientAuthenticable):
         on_connect: Optional[Callable[[], None]] = None,
         on_error: Optional[Callable[[OnErrorException], None]] = None,
         on_close: Optional[Callable[[int, str], None]] = None,
+        codec: Optional[Union[JsonCodec, str]] = None,
+        base_url: str = ws_url,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        on_reconnect: Optional[Callable[[float], None]] = None,
     ):
         super(TradingClient, self).__init__(
-            "wss://api.exchange.cryptomkt.com/api/3/ws/trading",
+            base_url.rstrip('/') + '/trading',
             api_key=api_key,
             api_secret=api_secret,
             window=window,
-            subscription_methods_data={
-                # reports
-                'spot_order': SubscriptionMethodData(_REPORTS, 'update'),
-                'spot_orders': SubscriptionMethodData(_REPORTS, 'snapshot'),
-                'spot_subscribe': SubscriptionMethodData(_REPORTS, 'command'),
-                'spot_unsubscribe': SubscriptionMethodData(_REPORTS, 'command'),
-                # spot balance
-                'spot_balance': SubscriptionMethodData(_BALANCES, 'snapshot'),
-                'spot_balance_subscribe': SubscriptionMethodData(_BALANCES, 'command'),
-                'spot_balance_unsubscribe': SubscriptionMethodData(_BALANCES, 'command'),
-            },
+            subscription_methods_data=TRADING_SUBSCRIPTION_METHODS,
             on_connect=on_connect,
             on_error=on_error,
-            on_close=on_close
+            on_close=on_close,
+            codec=codec,
+            reconnect_policy=reconnect_policy,
+            on_reconnect=on_reconnect,
         )
 
     def subscribe_to_reports(
@@ -227,7 +241,7 @@ class TradingClient(ClientAuthenticable):
                     callback(err, None)
                     return
                 callback(None, from_dict(data_class=Report,
-                         data=response, config=Config(cast=[Enum])))
+                         data=response))
         self._send_by_id(
             'spot_new_order',
             callback=intercept_response_callback,
@@ -292,7 +306,7 @@ class TradingClient(ClientAuthenticable):
                     callback(err, None)
                     return
                 report = from_dict(data_class=Report,
-                                   data=response, config=Config(cast=[Enum]))
+                                   data=response)
                 callback(None, report)
             intercept_response_callback = intercept_response
         self._send_by_id(
@@ -322,7 +336,7 @@ class TradingClient(ClientAuthenticable):
                     callback(err, None)
                     return
                 callback(None, from_dict(data_class=Report,
-                         data=response, config=Config(cast=[Enum])))
+                         data=response))
             intercept_response_callback = intercept_result
         self._send_by_id(
             'spot_cancel_order',
@@ -360,7 +374,7 @@ class TradingClient(ClientAuthenticable):
                     callback(err, None)
                     return
                 callback(None, from_dict(data_class=Report,
-                         data=response, config=Config(cast=[Enum])))
+                         data=response))
             intercept_response_callback = intercept_result
         self._send_by_id(
             'spot_replace_order',
@@ -380,7 +394,7 @@ class TradingClient(ClientAuthenticable):
                 if err:
                     callback(err, None)
                     return
-                reports = [from_dict(data_class=Report, data=report, config=Config(cast=[Enum]))
+                reports = [from_dict(data_class=Report, data=report)
                            for report in response]
                 callback(None, reports)
             intercept_response_callback = intercept_result
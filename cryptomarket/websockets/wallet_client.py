@@ -1,18 +1,31 @@
-from enum import Enum
 from typing import Any, Callable, List, Optional, Union
 
-from dacite import Config, from_dict
 from typing_extensions import Literal
 
 import cryptomarket.args as args
+from cryptomarket.converter import from_dict
 from cryptomarket.dataclasses.balance import Balance
 from cryptomarket.dataclasses.transaction import Transaction
+from cryptomarket.json_codec import JsonCodec
 from cryptomarket.websockets.callback import Callback
 from cryptomarket.websockets.client_auth import ClientAuthenticable
-from cryptomarket.websockets.client_base import OnErrorException
+from cryptomarket.websockets.client_base import OnErrorException, ws_url
+from cryptomarket.websockets.reconnect import ReconnectPolicy
 from cryptomarket.websockets.subscriptionMethodData import \
     SubscriptionMethodData
 
+WALLET_SUBSCRIPTION_METHODS = {
+    # transaction
+    "subscribe_transactions": SubscriptionMethodData("transaction", 'command'),
+    "unsubscribe_transactions": SubscriptionMethodData("transaction", 'command'),
+    "transaction_update": SubscriptionMethodData("transaction", 'update'),
+    # balance
+    "subscribe_wallet_balances": SubscriptionMethodData("balance", 'command'),
+    "unsubscribe_wallet_balances": SubscriptionMethodData("balance", 'command'),
+    "wallet_balances": SubscriptionMethodData("balance", 'snapshot'),
+    "wallet_balance_update": SubscriptionMethodData("balance", 'update'),
+}
+
 
 class WalletClient(ClientAuthenticable):
     """AccountClient connects via websocket to cryptomarket to get account information of the user. uses SHA256 as auth method and authenticates automatically.
@@ -23,6 +36,10 @@ class WalletClient(ClientAuthenticable):
     :param on_connect: function called on a successful connection. no parameters
     :param on_error: function called on a websocket error, and called in an authenticated error. it takes one parameter, the error.
     :param on_close: function called on the closing event of the websocket. no parameters
+    :param codec: Optional. A JsonCodec, or the name of one ('json', 'orjson' or 'auto'), used to encode and decode messages. Default is the default codec
+    :param base_url: Optional. The url of the websocket api, like the ws_url of a MockExchange. Default is the url of the exchange api
+    :param reconnect_policy: Optional. A ReconnectPolicy to reconnect when the connection is lost, then authenticate and subscribe again to the active subscriptions. Default is no reconnection
+    :param on_reconnect: Optional. function called once the connection is restored, before the subscriptions send their new snapshots, to reset any state built from them. it takes one parameter, the seconds without a connection
     """
 
     def __init__(
@@ -33,26 +50,23 @@ class WalletClient(ClientAuthenticable):
         on_connect: Optional[Callable[[], None]] = None,
         on_error: Optional[Callable[[OnErrorException], None]] = None,
         on_close: Optional[Callable[[int, str], None]] = None,
+        codec: Optional[Union[JsonCodec, str]] = None,
+        base_url: str = ws_url,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        on_reconnect: Optional[Callable[[float], None]] = None,
     ):
         super(WalletClient, self).__init__(
-            "wss://api.exchange.cryptomkt.com/api/3/ws/wallet",
+            base_url.rstrip('/') + '/wallet',
             api_key=api_key,
             api_secret=api_secret,
             window=window,
-            subscription_methods_data={
-                # transaction
-                "subscribe_transactions": SubscriptionMethodData("transaction", 'command'),
-                "unsubscribe_transactions": SubscriptionMethodData("transaction", 'command'),
-                "transaction_update": SubscriptionMethodData("transaction", 'update'),
-                # balance
-                "subscribe_wallet_balances": SubscriptionMethodData("balance", 'command'),
-                "unsubscribe_wallet_balances": SubscriptionMethodData("balance", 'command'),
-                "wallet_balances": SubscriptionMethodData("balance", 'snapshot'),
-                "wallet_balance_update": SubscriptionMethodData("balance", 'update'),
-            },
+            subscription_methods_data=WALLET_SUBSCRIPTION_METHODS,
             on_connect=on_connect,
             on_error=on_error,
-            on_close=on_close
+            on_close=on_close,
+            codec=codec,
+            reconnect_policy=reconnect_policy,
+            on_reconnect=on_reconnect,
         )
 
     def subscribe_to_transactions(
@@ -69,7 +83,7 @@ class WalletClient(ClientAuthenticable):
         """
         def intercept_feed(feed, feed_type):
             callback(from_dict(data_class=Transaction,
-                     data=feed, config=Config(cast=[Enum])))
+                     data=feed))
         self._send_subscription(
             'subscribe_transactions', callback=intercept_feed, result_callback=result_callback)
 
@@ -230,7 +244,7 @@ class WalletClient(ClientAuthenticable):
             if err is not None:
                 callback(err, None)
                 return
-            transactions = [from_dict(data_class=Transaction, data=transaction, config=Config(cast=[Enum]))
+            transactions = [from_dict(data_class=Transaction, data=transaction)
                             for transaction in response]
             callback(None, transactions)
         self._send_by_id(
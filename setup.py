@@ -30,6 +30,12 @@ setuptools.setup(
     keywords=['api', 'cryptomkt', 'cryptomarket', 'bitcoin', 'client'],
     url="https://github.com/cryptomkt/cryptomkt-python",
     install_requires=REQUIREMENTS,
+    extras_require={
+        'async': ['aiohttp>=3.8'],
+        'fast': ['orjson>=3.6'],
+        'http2': ['httpx[http2]>=0.23'],
+        'numpy': ['numpy>=1.17'],
+    },
     author="CryptoMarket",
     python_requires='>=3.8',
     classifiers=[
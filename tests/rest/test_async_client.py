@@ -0,0 +1,66 @@
+import asyncio
+import unittest
+
+from test_helpers import *
+
+from cryptomarket.async_client import AsyncClient
+from cryptomarket.client import Client
+
+
+class AsyncPublicCallsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.client = AsyncClient('', '')
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+
+class Aliases(unittest.TestCase):
+    def test_aliases_match_the_client(self):
+        for name, method in vars(Client).items():
+            if callable(method) and not name.startswith('_') and method.__name__ != name:
+                with self.subTest(name):
+                    self.assertEqual(getattr(AsyncClient, name).__name__, method.__name__)
+
+
+class GetTicker(AsyncPublicCallsTestCase):
+    def test_get_ticker(self):
+        ticker = self.run_async(self.client.get_ticker('EOSETH'))
+        if not good_ticker(ticker):
+            self.fail("not a good ticker")
+
+
+class ConcurrentCalls(AsyncPublicCallsTestCase):
+    def test_fan_out_over_symbols(self):
+        symbols = ['EOSETH', 'ETHBTC', 'XLMETH']
+
+        async def fan_out():
+            return await asyncio.gather(
+                *[self.client.get_order_book_of_symbol(symbol) for symbol in symbols])
+        order_books = self.run_async(fan_out())
+        if len(order_books) != len(symbols):
+            self.fail("wrong number of order books")
+        if not good_list(good_orderbook, order_books):
+            self.fail("not a good order book")
+
+    def test_get_currencies_and_symbols(self):
+        async def fan_out():
+            return await asyncio.gather(
+                self.client.get_currencies(['ETH', 'BTC']),
+                self.client.get_symbols(['ETHBTC']))
+        currencies, symbols = self.run_async(fan_out())
+        for currency in currencies.values():
+            if not good_currency(currency):
+                self.fail("not a good currency")
+        for symbol in symbols.values():
+            if not good_symbol(symbol):
+                self.fail("not a good symbol")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from cryptomarket.backfill import Backfill, merge, split_range, to_datetime, to_iso
+from cryptomarket.client import Client
+from cryptomarket.rate_limiter import RateLimiter
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def candle_at(minute):
+    return {'timestamp': to_iso(START + timedelta(minutes=minute)), 'open': '1', 'close': '1',
+            'min': '1', 'max': '1', 'volume': '1', 'volume_quote': '1'}
+
+
+class FakeHttpClient:
+    """serves one M1 candle per minute, honoring from, till and limit"""
+
+    def __init__(self, minutes):
+        self.candles = [candle_at(minute) for minute in range(minutes)]
+        self.rate_limiter = None
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def get(self, endpoint, params=None):
+        with self.lock:
+            self.requests += 1
+        since = to_datetime(params['from'])
+        till = to_datetime(params['till'])
+        candles = [candle for candle in self.candles
+                   if since <= to_datetime(candle['timestamp']) <= till]
+        return candles[:params['limit']]
+
+
+class TestRanges(unittest.TestCase):
+    def test_split_range(self):
+        windows = split_range(START, START + timedelta(minutes=25), timedelta(minutes=10))
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[0][0], START)
+        self.assertEqual(windows[1][0] - windows[0][1], timedelta(milliseconds=1))
+        self.assertEqual(windows[-1][1], START + timedelta(minutes=25))
+
+    def test_time_formats(self):
+        self.assertEqual(to_datetime('2023-01-01T00:00:00.000Z'), START)
+        self.assertEqual(to_datetime(int(START.timestamp() * 1000)), START)
+        self.assertEqual(to_iso(START), '2023-01-01T00:00:00.000Z')
+
+    def test_merge(self):
+        merged = merge([[3, 1], [2, 3]], key=lambda x: x, sort_key=lambda x: x)
+        self.assertEqual(merged, [1, 2, 3])
+
+
+class TestBackfill(unittest.TestCase):
+    def test_candles(self):
+        client = Client()
+        client.httpClient = FakeHttpClient(minutes=2500)
+        backfill = Backfill(client, max_workers=4,
+                            rate_limiter=RateLimiter(rates={'public': 1000}))
+        candles = backfill.candles(
+            ['EOSETH', 'ETHBTC'], 'M1', START, START + timedelta(minutes=2499))
+        self.assertEqual(client.httpClient.requests, 6)
+        for symbol in ['EOSETH', 'ETHBTC']:
+            timestamps = [candle.timestamp for candle in candles[symbol]]
+            self.assertEqual(len(timestamps), 2500)
+            self.assertEqual(timestamps, sorted(timestamps))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import time
+import unittest
+
+from cryptomarket.cache import ResponseCache
+from cryptomarket.client import Client
+
+
+def symbol_data(base, quote):
+    return {'type': 'spot', 'base_currency': base, 'quote_currency': quote, 'status': 'working',
+            'quantity_increment': '0.01', 'tick_size': '0.000001', 'take_rate': '0.001',
+            'make_rate': '0.001', 'fee_currency': quote}
+
+
+class FakeHttpClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def get(self, endpoint, params=None):
+        self.requests.append(endpoint)
+        return self.responses[endpoint]
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_ttl(self):
+        cache = ResponseCache(ttls={'public/symbol': 0.05})
+        calls = []
+        fetch = lambda: calls.append(1) or len(calls)
+        self.assertEqual(cache.get_or_fetch('public/symbol/', {}, fetch), 1)
+        self.assertEqual(cache.get_or_fetch('public/symbol/', {}, fetch), 1)
+        time.sleep(0.06)
+        self.assertEqual(cache.get_or_fetch('public/symbol/', {}, fetch), 2)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 2))
+
+    def test_not_cached_endpoints(self):
+        cache = ResponseCache()
+        calls = []
+        cache.get_or_fetch('public/ticker', {}, lambda: calls.append(1))
+        cache.get_or_fetch('public/ticker', {}, lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.stats().misses, 0)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+        cache.get_or_fetch('public/currency/BTC', None, lambda: 'BTC')
+        cache.get_or_fetch('public/currency/ETH', None, lambda: 'ETH')
+        cache.get_or_fetch('public/currency/BTC', None, lambda: 'again')
+        cache.get_or_fetch('public/currency/EOS', None, lambda: 'EOS')
+        self.assertEqual(cache.get_or_fetch('public/currency/BTC', None, lambda: 'again'), 'BTC')
+        self.assertEqual(cache.get_or_fetch('public/currency/ETH', None, lambda: 'again'), 'again')
+        self.assertEqual(cache.stats().evictions, 2)
+
+    def test_callers_get_copies(self):
+        cache = ResponseCache()
+        first = cache.get_or_fetch('public/currency', None, lambda: {'ETH': {'networks': [{'code': 'ETH'}]}})
+        first['ETH']['networks'].clear()
+        del first['ETH']
+        second = cache.get_or_fetch('public/currency', None, lambda: {})
+        self.assertEqual(second, {'ETH': {'networks': [{'code': 'ETH'}]}})
+        second['BTC'] = {}
+        self.assertEqual(list(cache.get_or_fetch('public/currency', None, lambda: {})), ['ETH'])
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        cache.get_or_fetch('public/symbol/', None, lambda: 1)
+        cache.get_or_fetch('spot/fee', None, lambda: 1)
+        cache.invalidate('spot/fee')
+        self.assertEqual(cache.stats().size, 1)
+        cache.invalidate()
+        self.assertEqual(cache.stats().size, 0)
+
+
+class TestClientCache(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(cache=ResponseCache())
+        self.client.httpClient = FakeHttpClient({
+            'public/symbol/': {'ETHBTC': symbol_data('ETH', 'BTC'), 'EOSETH': symbol_data('EOS', 'ETH')},
+            'spot/fee': [{'symbol': 'ETHBTC', 'take_rate': '0.001', 'make_rate': '0.0005'}],
+        })
+
+    def test_get_symbol_from_symbols(self):
+        self.assertEqual(self.client.get_symbol('ETHBTC').base_currency, 'ETH')
+        self.assertEqual(self.client.get_symbol('EOSETH').base_currency, 'EOS')
+        self.assertEqual(len(self.client.get_symbols()), 2)
+        self.assertEqual(self.client.httpClient.requests, ['public/symbol/'])
+
+    def test_lazy_views_do_not_share_the_cache(self):
+        self.client.get_symbols(lazy=True).raw.clear()
+        self.assertEqual(self.client.get_symbol('ETHBTC').base_currency, 'ETH')
+
+    def test_get_trading_commission_from_all(self):
+        self.assertEqual(self.client.get_trading_commission('ETHBTC').make_rate, '0.0005')
+        self.client.get_all_trading_commissions()
+        self.assertEqual(self.client.httpClient.requests, ['spot/fee'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from array import array
+from unittest import mock
+
+import cryptomarket.columnar as columnar
+from cryptomarket.client import Client
+
+CANDLES = [
+    {'timestamp': '2021-06-20T20:00:00.000Z', 'open': '0.050459', 'close': '0.050087', 'min': '0.05',
+     'max': '0.050511', 'volume': '1326.628', 'volume_quote': '66.555987736'},
+    {'timestamp': '2021-06-20T20:01:00.250Z', 'open': '0.050087', 'close': '0.0501', 'min': '0.050087',
+     'max': '0.0502', 'volume': '12', 'volume_quote': '0.6012'},
+]
+TRADES = [
+    {'id': 1555634969, 'price': '30881.96', 'qty': '12.66828', 'side': 'buy', 'timestamp': '2021-07-21T10:31:49.494Z'},
+    {'id': 1555634970, 'price': '30881.95', 'qty': '0.1', 'side': 'sell', 'timestamp': '2021-07-21T10:31:50.000Z'},
+]
+
+
+class FakeHttpClient:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, endpoint, params=None):
+        return self.response
+
+
+class TestColumnar(unittest.TestCase):
+    def check_candles(self, columns):
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(list(columns.timestamp), [1624219200000, 1624219260250])
+        self.assertEqual(list(columns.open), [0.050459, 0.050087])
+
+    def test_numpy(self):
+        if columnar.numpy is None:
+            self.skipTest('numpy is not installed')
+        columns = columnar.candle_columns(CANDLES)
+        self.assertEqual(str(columns.timestamp.dtype), 'int64')
+        self.assertEqual(str(columns.volume.dtype), 'float64')
+        self.check_candles(columns)
+
+    def test_array_fallback(self):
+        with mock.patch.object(columnar, 'numpy', None):
+            columns = columnar.candle_columns(CANDLES)
+            self.assertIsInstance(columns.timestamp, array)
+            self.check_candles(columns)
+
+    def test_scaled(self):
+        for numpy in [columnar.numpy, None]:
+            with mock.patch.object(columnar, 'numpy', numpy):
+                columns = columnar.trade_columns(TRADES, price_scale=2, quantity_scale=5)
+                self.assertEqual(list(columns.price), [3088196, 3088195])
+                self.assertEqual(list(columns.qty), [1266828, 10000])
+                self.assertEqual(list(columns.side), [1, -1])
+                columns = columnar.candle_columns(CANDLES, price_scale=6, quantity_scale=3)
+                self.assertEqual(list(columns.open), [50459, 50087])
+                self.assertEqual(list(columns.volume), [1326628, 12000])
+                self.assertEqual(list(columns.volume_quote), [66555987736, 601200000])
+                self.assertEqual(list(columnar.candle_columns(CANDLES, price_scale=6).volume), [1326.628, 12.0])
+
+    def test_large_volumes_with_small_prices(self):
+        trades = [{'id': 1, 'price': '0.00000001', 'qty': '50000000000', 'side': 'buy',
+                   'timestamp': '2021-07-21T10:31:49.494Z'}]
+        for numpy in [columnar.numpy, None]:
+            with mock.patch.object(columnar, 'numpy', numpy):
+                columns = columnar.trade_columns(trades, price_scale=8, quantity_scale=0)
+                self.assertEqual((list(columns.price), list(columns.qty)), ([1], [50000000000]))
+
+    def test_client(self):
+        client = Client()
+        client.httpClient = FakeHttpClient(CANDLES)
+        self.check_candles(client.get_candles_of_symbol('ETHBTC', columnar=True))
+        client.httpClient = FakeHttpClient({'ETHBTC': CANDLES})
+        self.check_candles(client.get_candles(columnar=True)['ETHBTC'])
+        client.httpClient = FakeHttpClient({'target_currency': 'USDT', 'data': {'ETHBTC': CANDLES}})
+        converted = client.get_converted_candles('USDT', columnar=True)
+        self.check_candles(converted.data['ETHBTC'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import time
+import unittest
+
+from cryptomarket.client import Client
+
+
+class FakeResponse:
+    status_code = 200
+    content = b'{}'
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.heads = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.timeouts = []
+
+    def head(self, url, timeout=None):
+        with self.lock:
+            self.heads += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return FakeResponse()
+
+    def get(self, url, params=None, timeout=None):
+        self.timeouts.append(timeout)
+        return FakeResponse()
+
+    def close(self):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_pool_options(self):
+        client = Client(pool_maxsize=4, timeout=(3.05, 10), keep_alive=False)
+        adapter = client.httpClient.session.get_adapter('https://api.exchange.cryptomkt.com/')
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(client.httpClient.session.headers['Connection'], 'close')
+        client.httpClient.session = FakeSession()
+        client.get_currencies()
+        self.assertEqual(client.httpClient.session.timeouts, [(3.05, 10)])
+
+    def test_warm_up_opens_connections_at_once(self):
+        client = Client(pool_maxsize=3)
+        client.httpClient.session = session = FakeSession(delay=0.05)
+        client.warm_up(connections=5)
+        self.assertEqual(session.heads, 3)
+        self.assertEqual(session.max_in_flight, 3)
+
+    def test_keep_alive_pings(self):
+        client = Client()
+        client.httpClient.session = session = FakeSession()
+        client.warm_up(keep_alive_interval=0.01)
+        time.sleep(0.1)
+        client.close()
+        pings = session.heads
+        self.assertGreater(pings, 2)
+        time.sleep(0.05)
+        self.assertEqual(session.heads, pings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import dataclasses
+import inspect
+import unittest
+from enum import Enum
+from typing import get_type_hints
+
+from dacite import Config
+from dacite import from_dict as dacite_from_dict
+from typing_extensions import get_args, get_origin
+
+import cryptomarket.dataclasses as dataclasses_module
+from cryptomarket.converter import ConversionError, from_dict
+from cryptomarket.dataclasses import Order, Transaction
+
+
+def sample_of(type_, optional_fields=True):
+    origin = get_origin(type_)
+    if origin is not None and type(None) in get_args(type_):
+        return sample_of(get_args(type_)[0], optional_fields)
+    if origin is list:
+        return [sample_of(get_args(type_)[0], optional_fields) for _ in range(2)]
+    if origin is not None:
+        return {'key': sample_of(get_args(type_)[1], optional_fields)}
+    if inspect.isclass(type_) and issubclass(type_, Enum):
+        return list(type_)[-1].value
+    if dataclasses.is_dataclass(type_):
+        hints = get_type_hints(type_)
+        return {field.name: sample_of(hints[field.name], optional_fields)
+                for field in dataclasses.fields(type_)
+                if optional_fields or field.default is dataclasses.MISSING}
+    return {str: 'text', int: 7, bool: True}[type_]
+
+
+def converted_dataclasses():
+    for _, data_class in inspect.getmembers(dataclasses_module, dataclasses.is_dataclass):
+        if 'from_dict' not in vars(data_class):
+            yield data_class
+
+
+class TestConverter(unittest.TestCase):
+    def test_same_as_dacite(self):
+        for data_class in converted_dataclasses():
+            for optional_fields in [True, False]:
+                with self.subTest(data_class=data_class.__name__, optional_fields=optional_fields):
+                    data = sample_of(data_class, optional_fields)
+                    self.assertEqual(
+                        from_dict(data_class, data),
+                        dacite_from_dict(data_class, data, config=Config(cast=[Enum])))
+
+    def test_nested(self):
+        transaction = from_dict(Transaction, sample_of(Transaction))
+        self.assertIsInstance(transaction.native.hash, str)
+        self.assertIsInstance(transaction.status, Enum)
+        order = from_dict(Order, sample_of(Order))
+        self.assertEqual(len(order.trades), 2)
+
+    def test_missing_value(self):
+        data = sample_of(Order)
+        del data['symbol']
+        with self.assertRaises(ConversionError):
+            from_dict(Order, data)
+
+
+if __name__ == '__main__':
+    unittest.main()
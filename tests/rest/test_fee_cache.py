@@ -0,0 +1,59 @@
+import unittest
+
+import cryptomarket.args as args
+from cryptomarket.client import Client
+from cryptomarket.fee_cache import WithdrawalFeeCache, order_of_magnitude
+
+
+class FakeHttpClient:
+    def __init__(self):
+        self.fees_hash = 'first'
+        self.requests = []
+
+    def get(self, endpoint, params=None):
+        self.requests.append(endpoint)
+        return {'hash': self.fees_hash}
+
+    def post(self, endpoint, params=None):
+        self.requests.append(endpoint)
+        return [{'fee': '0.1', 'networkFee': '0.01', 'amount': fee['amount'], 'currency': fee['currency']}
+                for fee in params]
+
+
+class TestWithdrawalFeeCache(unittest.TestCase):
+    def setUp(self):
+        client = Client()
+        client.httpClient = FakeHttpClient()
+        self.http = client.httpClient
+        self.cache = WithdrawalFeeCache(client, hash_ttl=0)
+
+    def test_exact_amounts_by_default(self):
+        requests = [args.FeeRequest(currency='ETH', amount=amount) for amount in ['150', '150.0', '950']]
+        fees = self.cache.get_estimate_withdrawal_fees(requests)
+        self.assertEqual([fee.amount for fee in fees], ['150', '150.0', '950'])
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 2, 2))
+
+    def test_buckets(self):
+        self.cache = WithdrawalFeeCache(self.cache.client, bucket_of=order_of_magnitude, hash_ttl=0)
+        requests = [args.FeeRequest(currency='ETH', amount=str(amount)) for amount in range(100, 1000, 10)]
+        requests.append(args.FeeRequest(currency='ETH', amount='1000'))
+        requests.append(args.FeeRequest(currency='ETH', amount='150', network_code='ETH'))
+        fees = self.cache.get_estimate_withdrawal_fees(requests)
+        self.assertEqual([fee.amount for fee in fees], [request.amount for request in requests])
+        self.assertEqual(self.http.requests, ['wallet/crypto/fee/withdraw/hash', 'wallet/crypto/fee/estimate/bulk'])
+        stats = self.cache.stats()
+        self.assertEqual((stats.misses, stats.size), (3, 3))
+
+    def test_hash_change(self):
+        self.assertEqual(self.cache.get_estimate_withdrawal_fee('ETH', '1'), '0.1')
+        self.cache.get_estimate_withdrawal_fee('ETH', '1.0')
+        self.assertEqual(self.http.requests.count('wallet/crypto/fee/estimate/bulk'), 1)
+        self.http.fees_hash = 'second'
+        self.cache.get_estimate_withdrawal_fee('ETH', '3')
+        self.assertEqual(self.http.requests.count('wallet/crypto/fee/estimate/bulk'), 2)
+        self.assertEqual(self.cache.stats().invalidations, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
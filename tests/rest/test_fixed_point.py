@@ -0,0 +1,69 @@
+import unittest
+
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses import Balance, Currency, Symbol
+from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+from cryptomarket.dataclasses.report import Report
+from cryptomarket.dataclasses.wsTicker import WSTicker
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.fixed_point import (FixedPoint, scale_of, to_scaled_int,
+                                      to_wire)
+
+SYMBOLS = {'ETHBTC': Symbol(type='spot', base_currency='ETH', quote_currency='BTC', status='working',
+                            quantity_increment='0.0001', tick_size='0.000001', take_rate='0.001',
+                            make_rate='0.001', fee_currency='BTC')}
+CURRENCIES = {'ETH': from_dict(Currency, {
+    'full_name': 'Ethereum', 'crypto': True, 'payin_enabled': True, 'payout_enabled': True,
+    'transfer_enabled': True, 'sign': 'E', 'crypto_payment_id_name': '', 'crypto_explorer': '',
+    'precision_transfer': '0.000000000001', 'delisted': False})}
+
+
+class TestConversions(unittest.TestCase):
+    def test_scale_of(self):
+        self.assertEqual([scale_of(step) for step in ['0.000001', '0.01', '1', '10', '0.50']], [6, 2, 0, 0, 1])
+
+    def test_to_scaled_int(self):
+        self.assertEqual(to_scaled_int('0.050459', 6), 50459)
+        self.assertEqual(to_scaled_int('-1.5', 2), -150)
+        self.assertEqual(to_scaled_int('12', 0), 12)
+        self.assertEqual(to_scaled_int('0.125', 2), 12)
+        self.assertEqual(to_scaled_int('1e-3', 4), 10)
+
+    def test_round_trip(self):
+        for value, scale in [('0.050459', 6), ('12.0000', 4), ('-0.001', 3), ('7', 0), ('123456789.12345678', 8)]:
+            self.assertEqual(to_wire(to_scaled_int(value, scale), scale), value)
+
+
+class TestFixedPoint(unittest.TestCase):
+    def setUp(self):
+        self.fixed_point = FixedPoint(SYMBOLS, CURRENCIES)
+
+    def test_level(self):
+        level = self.fixed_point.order_book_level('ETHBTC', OrderBookLevel('0.046001', '1.5'))
+        self.assertEqual((level.price, level.quantity), (46001, 15000))
+        self.assertEqual(self.fixed_point.price_to_wire('ETHBTC', level.price), '0.046001')
+        self.assertEqual(self.fixed_point.quantity_to_wire('ETHBTC', level.quantity), '1.5000')
+
+    def test_ticker(self):
+        ticker = WSTicker(t=1, a='0.031175', A='0.0333', b='0.031148', B='0.1056', c='0.031210', o='0.030781',
+                          h='0.031788', l='0.030733', v='62.587', q='1.951420577', p='0.000429', P='1.39', L=1)
+        fixed = self.fixed_point.ws_ticker('ETHBTC', ticker)
+        self.assertEqual((fixed.a, fixed.A, fixed.q, fixed.P), (31175, 333, 19514205770, '1.39'))
+
+    def test_report(self):
+        report = from_dict(Report, {
+            'id': 1, 'client_order_id': 'a', 'symbol': 'ETHBTC', 'side': 'buy', 'status': 'new', 'type': 'limit',
+            'time_in_force': 'GTC', 'quantity': '0.01', 'quantity_cumulative': '0', 'post_only': False,
+            'created_at': '', 'updated_at': '', 'price': '0.046001'})
+        fixed = self.fixed_point.report(report)
+        self.assertEqual((fixed.quantity, fixed.price, fixed.stop_price), (100, 46001, None))
+
+    def test_balance(self):
+        balance = self.fixed_point.balance(Balance(available='1.5', reserved='0', currency='ETH'))
+        self.assertEqual(balance.available, 1_500_000_000_000)
+        with self.assertRaises(CryptomarketSDKException):
+            self.fixed_point.balance(Balance(available='1', reserved='0'), currency='DOGE')
+
+
+if __name__ == '__main__':
+    unittest.main()
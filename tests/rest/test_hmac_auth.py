@@ -0,0 +1,47 @@
+import unittest
+from base64 import b64decode
+from hashlib import sha256
+from hmac import HMAC
+
+from cryptomarket.hmac_auth import HmacAuth, HmacSigner
+
+
+class TestHmacSigner(unittest.TestCase):
+    def test_same_as_hmac(self):
+        for secret in ['', 'short', 'x' * 64, 'a long secret ' * 10, 'ñandú']:
+            signer = HmacSigner(secret)
+            for message in [b'', b'GET/api/3/public/ticker', 'ñ'.encode() * 100]:
+                with self.subTest(secret=secret, message=message):
+                    self.assertEqual(signer.sign(message),
+                                     HMAC(secret.encode(), message, sha256).hexdigest())
+
+
+class TestHmacAuth(unittest.TestCase):
+    def check_credential(self, auth, message_without_timestamp, query=None, body=None):
+        credential = auth.get_credential('POST', '/api/3/spot/order', query, body)
+        self.assertTrue(credential.startswith('HS256 '))
+        parts = b64decode(credential[len('HS256 '):]).decode().split(':')
+        api_key, signature, timestamp = parts[:3]
+        window = parts[3] if len(parts) > 3 else ''
+        self.assertEqual(api_key, auth.api_key)
+        self.assertEqual(window, str(auth.window or ''))
+        expected = HMAC(auth.secret_key.encode(),
+                        (message_without_timestamp + timestamp + window).encode(), sha256).hexdigest()
+        self.assertEqual(signature, expected)
+
+    def test_credentials(self):
+        for window in [None, 15_000]:
+            auth = HmacAuth('key', 'secret', window=window)
+            self.check_credential(auth, 'POST/api/3/spot/order')
+            self.check_credential(auth, 'POST/api/3/spot/order?a=1', query='a=1')
+            self.check_credential(auth, 'POST/api/3/spot/order{"a": "ñ"}', body='{"a": "ñ"}')
+            self.check_credential(auth, 'POST/api/3/spot/order{"a": "ñ"}', body='{"a": "ñ"}'.encode())
+
+    def test_change_secret(self):
+        auth = HmacAuth('key', 'secret')
+        auth.secret_key = 'another secret'
+        self.check_credential(auth, 'POST/api/3/spot/order')
+
+
+if __name__ == '__main__':
+    unittest.main()
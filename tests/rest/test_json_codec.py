@@ -0,0 +1,32 @@
+import unittest
+
+import cryptomarket.args as args
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.json_codec import JsonCodec, get_codec, resolve_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    def check_codec(self, codec):
+        message = {'id': 1, 'params': {'side': args.Side.BUY, 'quantity': '0.01', 'post_only': True}}
+        encoded = codec.dumps(message)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(codec.loads(encoded), {'id': 1, 'params': {'side': 'buy', 'quantity': '0.01', 'post_only': True}})
+        self.assertEqual(codec.loads(codec.dumps_str(message)), codec.loads(encoded))
+        self.assertEqual(codec.loads('{"price": "ñ"}'.encode()), {'price': 'ñ'})
+
+    def test_json(self):
+        self.check_codec(get_codec('json'))
+
+    def test_auto(self):
+        self.check_codec(get_codec('auto'))
+
+    def test_resolve(self):
+        codec = JsonCodec()
+        self.assertIs(resolve_codec(codec), codec)
+        self.assertEqual(resolve_codec('json').name, 'json')
+        with self.assertRaises(CryptomarketSDKException):
+            get_codec('yaml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import unittest
+
+from cryptomarket.client import Client
+from cryptomarket.dataclasses import OrderBook
+from cryptomarket.http_client import HttpClient
+from cryptomarket.json_codec import JsonCodec
+from cryptomarket.json_stream import JsonStreamDecoder, iter_items
+
+ORDER_BOOKS = {
+    'ETHBTC': {'timestamp': '2021-07-21T10:31:50.000Z',
+               'ask': [['0.046002', '0.0021'], ['0.046003', '0.05']],
+               'bid': [['0.046001', '0.005']]},
+    'EOS"ETH\\': {'timestamp': '2021-07-21T10:31:51.000Z', 'ask': [], 'bid': [['0.0025', '1']]},
+}
+TRADES = [
+    {'id': 1555634969, 'price': '30881.96', 'qty': '12.66828', 'side': 'buy', 'timestamp': '2021-07-21T10:31:49.494Z'},
+    {'id': 1555634970, 'price': '30881.95', 'qty': '0.1', 'side': 'sell', 'timestamp': '2021-07-21T10:31:50.000Z'},
+]
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200):
+        self.body = body
+        self.status_code = status_code
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        return iter(chunked(self.body, 3))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, params=None, stream=False, timeout=None):
+        return self.response
+
+
+class TestJsonStreamDecoder(unittest.TestCase):
+    def test_any_chunk_size(self):
+        for value in [ORDER_BOOKS, TRADES, {}, [], [1, 'a,]}', None, {'b': [2, {}]}, 'ñ€', 10.5]]:
+            body = json.dumps(value, indent=1, ensure_ascii=False).encode()
+            for size in range(1, 12):
+                items = list(iter_items(chunked(body, size)))
+                decoded = dict(items) if isinstance(value, dict) else items
+                self.assertEqual(decoded, value)
+
+    def test_items_complete_as_they_arrive(self):
+        decoder = JsonStreamDecoder()
+        self.assertEqual(decoder.feed(b'{"a": [1], "b": 2'), [('a', [1])])
+        self.assertEqual(decoder.feed(b'3, "c": 1'), [('b', 23)])
+        # short chunks wait for the buffered item to double, or for the end
+        self.assertEqual(decoder.feed(b'}'), [])
+        self.assertEqual(decoder.close(), [('c', 1)])
+        self.assertTrue(decoder.done)
+
+    def test_invalid(self):
+        for body in [b'"text"', b'12', b'[1, 2', b'[1] [2]', b'[1,]', b'{"a" 1}', b'[1 2]']:
+            with self.assertRaises(ValueError):
+                list(iter_items([body]))
+
+
+class TestStreamClient(unittest.TestCase):
+    def client_with_body(self, value):
+        client = Client()
+        client.httpClient = HttpClient('', '', codec=JsonCodec())
+        response = FakeResponse(json.dumps(value).encode())
+        client.httpClient.session = FakeSession(response)
+        return client, response
+
+    def test_order_books(self):
+        client, response = self.client_with_body(ORDER_BOOKS)
+        order_books = dict(client.stream_order_books(depth=0))
+        self.assertEqual(order_books, {key: OrderBook.from_dict(value) for key, value in ORDER_BOOKS.items()})
+        self.assertTrue(response.closed)
+
+    def test_trades_of_symbol(self):
+        client, response = self.client_with_body(TRADES)
+        trades = client.stream_trades_of_symbol('ETHBTC')
+        self.assertEqual(next(trades).id, 1555634969)
+        self.assertEqual([trade.side for trade in trades], ['sell'])
+
+
+if __name__ == '__main__':
+    unittest.main()
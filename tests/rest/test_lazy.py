@@ -0,0 +1,94 @@
+import unittest
+
+from cryptomarket.client import Client
+from cryptomarket.dataclasses import OrderBook, Ticker
+from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+from cryptomarket.dataclasses.publicTrade import PublicTrade
+from cryptomarket.lazy import LazyMapping, LazySequence
+
+TICKER = {'ask': '0.050043', 'bid': '0.050042', 'last': '0.050042', 'low': '0.047052', 'high': '0.051679',
+          'open': '0.047800', 'volume': '36456.720', 'volume_quote': '1782.625000',
+          'timestamp': '2021-06-12T14:57:19.999Z'}
+TRADES = [
+    {'id': 1555634969, 'price': '30881.96', 'qty': '12.66828', 'side': 'buy', 'timestamp': '2021-07-21T10:31:49.494Z'},
+    {'id': 1555634970, 'price': '30881.95', 'qty': '0.1', 'side': 'sell', 'timestamp': '2021-07-21T10:31:50.000Z'},
+]
+ORDER_BOOK = {'timestamp': '2021-07-21T10:31:50.000Z',
+              'ask': [['0.046002', '0.0021'], ['0.046003', '0.05']],
+              'bid': [['0.046001', '0.005']]}
+
+
+class FakeHttpClient:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, endpoint, params=None):
+        return self.response
+
+
+class CountingConvert:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return value * 10
+
+
+class TestLazyViews(unittest.TestCase):
+    def test_mapping_converts_on_first_access(self):
+        convert = CountingConvert()
+        view = LazyMapping({'a': 1, 'b': 2, 'c': 3}, convert)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(list(view), ['a', 'b', 'c'])
+        self.assertIn('b', view)
+        self.assertEqual(convert.calls, 0)
+        self.assertEqual(view['b'], 20)
+        self.assertEqual(view['b'], 20)
+        self.assertEqual(convert.calls, 1)
+        self.assertEqual(view.get('missing'), None)
+        self.assertEqual(dict(view), {'a': 10, 'b': 20, 'c': 30})
+        self.assertEqual(convert.calls, 3)
+
+    def test_sequence_converts_on_first_access(self):
+        convert = CountingConvert()
+        view = LazySequence([1, 2, 3, 4], convert)
+        self.assertEqual(view[-1], 40)
+        self.assertEqual(view[1:3], [20, 30])
+        self.assertEqual(convert.calls, 3)
+        self.assertEqual(view, [10, 20, 30, 40])
+        self.assertEqual(convert.calls, 4)
+        with self.assertRaises(IndexError):
+            view[4]
+
+
+class TestLazyClient(unittest.TestCase):
+    def test_tickers(self):
+        client = Client()
+        client.httpClient = FakeHttpClient({'ETHBTC': TICKER, 'EOSETH': TICKER})
+        tickers = client.get_tickers(lazy=True)
+        self.assertEqual(tickers['ETHBTC'], client.get_tickers()['ETHBTC'])
+        self.assertIsInstance(tickers['ETHBTC'], Ticker)
+        self.assertIs(tickers['ETHBTC'], tickers['ETHBTC'])
+
+    def test_trades(self):
+        client = Client()
+        client.httpClient = FakeHttpClient({'ETHBTC': TRADES})
+        trades = client.get_trades(lazy=True)
+        self.assertEqual(trades['ETHBTC'][1].side, 'sell')
+        self.assertIsInstance(trades['ETHBTC'][0], PublicTrade)
+        self.assertEqual(trades['ETHBTC'], client.get_trades()['ETHBTC'])
+
+    def test_order_books(self):
+        client = Client()
+        client.httpClient = FakeHttpClient({'ETHBTC': ORDER_BOOK})
+        order_book = client.get_order_books(lazy=True)['ETHBTC']
+        self.assertIsInstance(order_book, OrderBook)
+        self.assertEqual(order_book.ask[0], OrderBookLevel(price='0.046002', quantity='0.0021'))
+        self.assertEqual(order_book, client.get_order_books()['ETHBTC'])
+        client.httpClient = FakeHttpClient(ORDER_BOOK)
+        self.assertEqual(client.get_order_book_of_symbol('ETHBTC', lazy=True).bid[0].price, '0.046001')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import time
+import unittest
+import urllib.request
+
+import requests
+from requests.adapters import BaseAdapter
+
+from cryptomarket.client import Client
+from cryptomarket.metrics import (LatencyHistogram, RequestMetrics,
+                                  endpoint_label)
+
+
+class FakeAdapter(BaseAdapter):
+    """answers every request with a json body, keeping the requests"""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class SlowValue:
+    """a query param that takes its time to encode"""
+    seconds = 0.05
+
+    def __str__(self):
+        time.sleep(self.seconds)
+        return 'slow'
+
+
+def client_answering(body, metrics):
+    client = Client('key', 'secret', metrics=metrics)
+    adapter = FakeAdapter(body)
+    client.httpClient.session.mount('https://', adapter)
+    return client, adapter
+
+
+CURRENCY = b'{"full_name": "Ethereum", "crypto": true, "payin_enabled": true, "payout_enabled": true, "transfer_enabled": true, "precision_transfer": "0.000000000001", "sign": "ETH", "crypto_payment_id_name": "", "crypto_explorer": "", "delisted": false, "networks": []}'
+
+
+class TestMetrics(unittest.TestCase):
+    def test_endpoint_label(self):
+        self.assertEqual(endpoint_label('public/ticker/EOSETH'), 'public/ticker/{symbol}')
+        self.assertEqual(endpoint_label('public/candles/'), 'public/candles')
+        self.assertEqual(endpoint_label('spot/order/a1b2c3'), 'spot/order/{client_order_id}')
+        self.assertEqual(endpoint_label('spot/order/resting'), 'spot/order/{client_order_id}')
+        self.assertEqual(endpoint_label('spot/order/list'), 'spot/order/list')
+        self.assertEqual(endpoint_label('sub-account/crypto/address/123/ETH'),
+                         'sub-account/crypto/address/{sub_account_id}/{currency}')
+        self.assertEqual(endpoint_label('wallet/crypto/address/recent-deposit'), 'wallet/crypto/address/recent-deposit')
+
+    def test_histogram_quantiles_over_the_window(self):
+        histogram = LatencyHistogram(window=100)
+        for millis in range(1, 201):
+            histogram.add(millis / 1000)
+        stats = histogram.stats()
+        self.assertEqual(stats.count, 200)
+        self.assertEqual(stats.p50, 0.15)
+        self.assertEqual(stats.p99, 0.199)
+        self.assertEqual(stats.max, 0.2)
+        self.assertAlmostEqual(stats.total, 20.1)
+
+    def test_client_records_every_phase(self):
+        samples = []
+        metrics = RequestMetrics(hooks=[lambda *sample: samples.append(sample)])
+        client, adapter = client_answering(CURRENCY, metrics)
+        currency = client.get_currency('ETH')
+        self.assertEqual(currency.full_name, 'Ethereum')
+        self.assertIn('Authorization', adapter.requests[0].headers)
+        stats = client.stats()
+        self.assertEqual(list(stats), ['public/currency/{currency}'])
+        self.assertEqual(sorted(stats['public/currency/{currency}']), ['build', 'convert', 'decode', 'network', 'sign'])
+        for phase in stats['public/currency/{currency}'].values():
+            self.assertEqual(phase.count, 1)
+            self.assertGreaterEqual(phase.max, 0)
+        self.assertEqual(len(samples), 5)
+
+    def test_warm_up_with_metrics(self):
+        client, adapter = client_answering(CURRENCY, RequestMetrics())
+        client.warm_up(connections=3, keep_alive_interval=0.01)
+        try:
+            deadline = time.monotonic() + 5
+            while len(adapter.requests) < 6 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertGreaterEqual(len(adapter.requests), 6)
+            self.assertEqual(client.get_currency('ETH').full_name, 'Ethereum')
+        finally:
+            client.close()
+        self.assertTrue(all('Authorization' in request.headers for request in adapter.requests))
+        self.assertEqual(list(client.stats()), ['public/currency/{currency}'])
+
+    def test_build_is_timed_apart_from_the_network(self):
+        client, _ = client_answering(CURRENCY, RequestMetrics())
+        client.httpClient.get('public/currency/ETH', {'slow': SlowValue()})
+        phases = client.stats()['public/currency/{currency}']
+        # the params are encoded while building the request, before it is sent
+        self.assertGreaterEqual(phases['build'].max, SlowValue.seconds)
+        self.assertLess(phases['network'].max, SlowValue.seconds)
+
+    def test_conversions_timed_by_the_methods_of_the_class(self):
+        class ConvertingClient(Client):
+            def get_currency(self, currency):
+                return super().get_currency(currency).full_name
+
+        client = ConvertingClient('key', 'secret', metrics=RequestMetrics())
+        client.httpClient.session.mount('https://', FakeAdapter(CURRENCY))
+        self.assertNotIn('get_currency', vars(client))
+        self.assertEqual(client.get_currency('ETH'), 'Ethereum')
+        self.assertEqual(client.stats()['public/currency/{currency}']['convert'].count, 1)
+
+    def test_requests_without_conversion(self):
+        client, _ = client_answering(b'{}', RequestMetrics())
+        client.get_currencies(lazy=True)
+        client.get_currencies(lazy=True)
+        self.assertEqual(client.stats()['public/currency']['network'].count, 2)
+        self.assertEqual(Client().stats(), None)
+
+    def test_prometheus_export(self):
+        metrics = RequestMetrics()
+        metrics.record('spot/order', 'network', 0.25)
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE cryptomarket_request_seconds summary', text)
+        self.assertIn('cryptomarket_request_seconds{endpoint="spot/order",phase="network",quantile="0.99"} 0.25', text)
+        self.assertIn('cryptomarket_request_seconds_count{endpoint="spot/order",phase="network"} 1', text)
+        self.assertIn('cryptomarket_request_seconds_max{endpoint="spot/order",phase="network"} 0.25', text)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cryptomarket.prom')
+            metrics.write_prometheus(path)
+            with open(path) as file:
+                self.assertEqual(file.read(), text)
+        server = metrics.serve_prometheus(0)
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{server.server_address[1]}/metrics') as response:
+                self.assertEqual(response.read().decode(), text)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import unittest
+from decimal import Decimal
+
+from cryptomarket.client import Client
+from cryptomarket.exceptions import CryptomarketAPIException
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    from cryptomarket.async_client import AsyncClient
+    from cryptomarket.mock_exchange import API_KEY, API_SECRET, MockExchange
+    from cryptomarket.websockets import MarketDataClient, TradingClient
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestMockExchange(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.exchange = MockExchange(market_data_rate=50, fill_probability=0, seed=1).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exchange.stop()
+
+    def setUp(self):
+        self.client = Client(API_KEY, API_SECRET, base_url=self.exchange.rest_url)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_public_market_data(self):
+        ticker = self.client.get_ticker('ETHBTC')
+        self.assertLess(Decimal(ticker.bid), Decimal(ticker.ask))
+        order_book = self.client.get_order_book_of_symbol('ETHBTC', depth=5)
+        self.assertEqual(len(order_book.ask), 5)
+        self.assertEqual(order_book.ask[0].price, ticker.ask)
+        self.assertEqual(set(self.client.get_symbols()), {'ETHBTC', 'BTCUSDT', 'EOSETH'})
+        self.assertEqual(len(self.client.get_candles_of_symbol('ETHBTC', limit=3)), 3)
+
+    def test_unknown_symbol(self):
+        with self.assertRaises(CryptomarketAPIException) as context:
+            self.client.get_ticker('NOTASYMBOL')
+        self.assertEqual(context.exception.code, 2001)
+
+    def test_resting_order_reserves_funds_until_canceled(self):
+        order = self.client.create_spot_order('ETHBTC', 'sell', '10', price='1', client_order_id='resting')
+        self.assertEqual(order.status, 'new')
+        self.assertEqual(self.client.get_spot_trading_balance('ETH').reserved, '10')
+        self.assertEqual([order.client_order_id for order in self.client.get_all_active_spot_orders()], ['resting'])
+        with self.assertRaises(CryptomarketAPIException) as context:
+            self.client.create_spot_order('ETHBTC', 'sell', '10', price='1', client_order_id='resting')
+        self.assertEqual(context.exception.code, 20008)
+        self.assertEqual(self.client.cancel_spot_order('resting').status, 'canceled')
+        self.assertEqual(self.client.get_spot_trading_balance('ETH').reserved, '0')
+
+    def test_market_order_fills(self):
+        before = Decimal(self.client.get_spot_trading_balance('EOS').available)
+        order = self.client.create_spot_order('EOSETH', 'buy', '1', type='market')
+        self.assertEqual(order.status, 'filled')
+        self.assertEqual(Decimal(self.client.get_spot_trading_balance('EOS').available), before + 1)
+        trades = self.client.get_spot_trades_history(symbol='EOSETH')
+        self.assertEqual(trades[0].order_id, order.id)
+
+    def test_insufficient_funds(self):
+        with self.assertRaises(CryptomarketAPIException) as context:
+            self.client.create_spot_order('BTCUSDT', 'buy', '1', price='30000')
+        self.assertEqual(context.exception.code, 20001)
+
+    def test_wrong_signature_is_rejected(self):
+        client = Client(API_KEY, 'not the secret', base_url=self.exchange.rest_url)
+        with self.assertRaises(CryptomarketAPIException) as context:
+            client.get_spot_trading_balances()
+        self.assertEqual(context.exception.code, 1002)
+
+    def test_async_client(self):
+        async def get_balance():
+            client = AsyncClient(API_KEY, API_SECRET, base_url=self.exchange.rest_url)
+            try:
+                return await client.get_wallet_balance('BTC')
+            finally:
+                await client.close()
+        self.assertEqual(asyncio.run(get_balance()).available, '1000')
+
+    def test_full_order_book_updates_follow_the_snapshot(self):
+        notifications = []
+        received = threading.Event()
+
+        def callback(order_books, notification_type):
+            notifications.append((notification_type, order_books['ETHBTC'].s))
+            if len(notifications) == 5:
+                received.set()
+        client = MarketDataClient(base_url=self.exchange.ws_url)
+        client.connect()
+        try:
+            client.subscribe_to_full_order_book(callback, symbols=['ETHBTC'])
+            self.assertTrue(received.wait(5))
+        finally:
+            client.close()
+        self.assertEqual(notifications[0][0], 'snapshot')
+        sequences = [sequence for _, sequence in notifications[:5]]
+        self.assertEqual(sequences, list(range(sequences[0], sequences[0] + 5)))
+
+    def test_unknown_channels_are_rejected(self):
+        async def subscribe():
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(self.exchange.ws_url + 'public') as ws:
+                    await ws.send_json({'method': 'subscribe', 'ch': 'unknown/1s', 'params': {'symbols': []}, 'id': 1})
+                    rejected = await ws.receive_json(timeout=5)
+                    # the market data keeps flowing after the rejection
+                    await ws.send_json({'method': 'subscribe', 'ch': 'ticker/1s', 'params': {'symbols': ['ETHBTC']}, 'id': 2})
+                    while True:
+                        message = await ws.receive_json(timeout=5)
+                        if message.get('ch') == 'ticker/1s':
+                            return rejected, message
+        rejected, message = asyncio.run(subscribe())
+        self.assertEqual(rejected['id'], 1)
+        self.assertIn('error', rejected)
+        self.assertEqual(list(message['data']), ['ETHBTC'])
+
+    def test_trading_client_reports(self):
+        reports = []
+        received = threading.Event()
+
+        def callback(feed, notification_type):
+            reports.append((notification_type, [report.status for report in feed]))
+            if feed and feed[-1].status == 'canceled':
+                received.set()
+        client = TradingClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url)
+        client.connect()
+        try:
+            client.subscribe_to_reports(callback)
+            client.create_spot_order(client_order_id='reported', symbol='ETHBTC', side='sell', quantity='1', price='1')
+            client.cancel_spot_order('reported')
+            self.assertTrue(received.wait(5))
+        finally:
+            client.close()
+        self.assertEqual(reports[0], ('snapshot', []))
+        self.assertEqual(reports[1:], [('update', ['new']), ('update', ['canceled'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from dataclasses import dataclass
+
+from cryptomarket.client import Client
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.pagination import Paginator, paginate
+
+
+@dataclass
+class Entry:
+    id: int
+    timestamp: int
+
+
+def make_history(size, per_timestamp):
+    return [Entry(id=i, timestamp=i // per_timestamp) for i in range(size)]
+
+
+def fetch_from(history, ascending, max_offset):
+    requests = []
+
+    def fetch_page(page):
+        requests.append(page)
+        if page.offset + page.limit > max_offset:
+            raise AssertionError('offset over the limit')
+        entries = [entry for entry in history
+                   if (page.since is None or entry.timestamp >= page.since)
+                   and (page.till is None or entry.timestamp <= page.till)]
+        entries.sort(key=lambda entry: (entry.timestamp, entry.id),
+                     reverse=not ascending)
+        return entries[page.offset:page.offset + page.limit]
+    return fetch_page, requests
+
+
+class TestPaginator(unittest.TestCase):
+    def check_walk(self, ascending):
+        history = make_history(size=95, per_timestamp=3)
+        fetch_page, requests = fetch_from(history, ascending, max_offset=20)
+        paginator = Paginator(
+            cursor_of=lambda entry: entry.timestamp,
+            id_of=lambda entry: entry.id,
+            ascending=ascending,
+            page_size=7,
+            max_offset=20)
+        ids = [entry.id for entry in paginate(fetch_page, paginator)]
+        self.assertEqual(sorted(ids), list(range(95)))
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertTrue(any(page.since is not None or page.till is not None
+                            for page in requests))
+
+    def test_descending_walk_switches_to_cursor(self):
+        self.check_walk(ascending=False)
+
+    def test_ascending_walk_switches_to_cursor(self):
+        self.check_walk(ascending=True)
+
+    def test_too_many_entries_at_a_cursor(self):
+        fetch_page, requests = fetch_from(make_history(50, 50), ascending=False, max_offset=20)
+        paginator = Paginator(lambda entry: entry.timestamp, lambda entry: entry.id, False, page_size=7, max_offset=20)
+        ids = []
+        with self.assertRaises(CryptomarketSDKException):
+            for entry in paginate(fetch_page, paginator):
+                ids.append(entry.id)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertLess(len(requests), 20)
+
+    def test_iteration_is_lazy(self):
+        fetch_page, requests = fetch_from(
+            make_history(50, 1), ascending=False, max_offset=100)
+        iterator = paginate(fetch_page, Paginator(
+            lambda entry: entry.timestamp, lambda entry: entry.id, False, page_size=10))
+        next(iterator)
+        self.assertEqual(len(requests), 1)
+
+
+class FakeHttpClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.params = []
+
+    def get(self, endpoint, params=None):
+        self.params.append(params)
+        return self.pages.pop(0) if self.pages else []
+
+
+class TestClientIterators(unittest.TestCase):
+    def test_iter_candles_of_symbol(self):
+        candle = {'timestamp': '', 'open': '1', 'close': '1', 'min': '1',
+                  'max': '1', 'volume': '1', 'volume_quote': '1'}
+        pages = [[dict(candle, timestamp=f'2021-01-01T00:0{i}:00.000Z') for i in range(page * 2, page * 2 + 2)]
+                 for page in range(3)]
+        pages[-1] = pages[-1][:1]
+        client = Client()
+        client.httpClient = FakeHttpClient(pages)
+        candles = list(client.iter_candles_of_symbol(
+            'EOSETH', period='M1', page_size=2))
+        self.assertEqual(len(candles), 5)
+        self.assertEqual([params['offset'] for params in client.httpClient.params], [0, 2, 4])
+        self.assertEqual(client.httpClient.params[0]['limit'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import asyncio
+import time
+import unittest
+
+from cryptomarket.rate_limiter import (PUBLIC, TRADING, WALLET, RateLimiter,
+                                       TokenBucket)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_is_not_delayed(self):
+        bucket = TokenBucket(rate=10, capacity=5)
+        waits = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(waits, [0.0] * 5)
+
+    def test_requests_over_the_burst_are_queued(self):
+        bucket = TokenBucket(rate=10, capacity=1)
+        bucket.reserve()
+        first = bucket.reserve()
+        second = bucket.reserve()
+        self.assertAlmostEqual(first, 0.1, delta=0.01)
+        self.assertAlmostEqual(second, 0.2, delta=0.01)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_categories(self):
+        self.assertEqual(RateLimiter.category_of('public/ticker/EOSETH'), PUBLIC)
+        self.assertEqual(RateLimiter.category_of('spot/order'), TRADING)
+        self.assertEqual(RateLimiter.category_of('wallet/balance'), WALLET)
+        self.assertEqual(RateLimiter.category_of('sub-account/acl'), WALLET)
+
+    def test_buckets_are_independent(self):
+        limiter = RateLimiter(rates={PUBLIC: 1, TRADING: 1, WALLET: 1})
+        self.assertEqual(limiter.reserve('public/symbol'), 0.0)
+        self.assertEqual(limiter.reserve('spot/order'), 0.0)
+        self.assertEqual(limiter.reserve('wallet/balance'), 0.0)
+        self.assertGreater(limiter.reserve('public/symbol'), 0.0)
+
+    def test_acquire_waits_and_records_stats(self):
+        limiter = RateLimiter(rates={PUBLIC: 20}, bursts={PUBLIC: 1})
+        start = time.monotonic()
+        waits = [limiter.acquire('public/ticker') for _ in range(3)]
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.09)
+        stats = limiter.stats()[PUBLIC]
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.delayed_requests, 2)
+        self.assertAlmostEqual(stats.total_wait, sum(waits))
+        self.assertEqual(limiter.stats()[TRADING].requests, 0)
+
+    def test_acquire_async(self):
+        limiter = RateLimiter(rates={TRADING: 20}, bursts={TRADING: 1})
+
+        async def acquire_many():
+            return await asyncio.gather(*[limiter.acquire_async('spot/order') for _ in range(3)])
+        waits = asyncio.run(acquire_many())
+        self.assertEqual(sorted(waits)[0], 0.0)
+        self.assertEqual(limiter.stats()[TRADING].delayed_requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
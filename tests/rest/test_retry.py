@@ -0,0 +1,137 @@
+import unittest
+
+import requests
+
+from cryptomarket.args import OrderRequest
+from cryptomarket.client import Client
+from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.retry import (AMBIGUOUS, FATAL, RETRYABLE, RetryPolicy,
+                                classify)
+
+
+def order(client_order_id, symbol='ETHBTC'):
+    return {'id': 828680665, 'client_order_id': client_order_id, 'symbol': symbol, 'side': 'sell',
+            'status': 'new', 'type': 'limit', 'time_in_force': 'GTC', 'quantity': '0.012',
+            'quantity_cumulative': '0', 'price_average': '0', 'price': '0.046001', 'post_only': False,
+            'created_at': '2021-04-13T12:38:43.317Z', 'updated_at': '2021-04-13T12:38:43.317Z'}
+
+
+def api_error(code):
+    return CryptomarketAPIException.from_dict({'error': {'code': code, 'message': 'error'}})
+
+
+class FakeHttpClient:
+    """answers each request with the next scripted outcome of its method, an exception or a response"""
+
+    def __init__(self, **outcomes):
+        self.outcomes = outcomes
+        self.requests = []
+
+    def _next(self, method, endpoint, params):
+        self.requests.append((method, endpoint, params))
+        outcome = self.outcomes[method].pop(0)
+        if callable(outcome):
+            outcome = outcome(endpoint, params)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def get(self, endpoint, params=None):
+        return self._next('get', endpoint, params)
+
+    def post(self, endpoint, params=None):
+        return self._next('post', endpoint, params)
+
+    def patch(self, endpoint, params=None):
+        return self._next('patch', endpoint, params)
+
+
+def retrying_client(**outcomes):
+    client = Client(retry_policy=RetryPolicy(base_delay=0))
+    client.httpClient = FakeHttpClient(**outcomes)
+    return client
+
+
+class TestClassify(unittest.TestCase):
+    def test_classify(self):
+        self.assertEqual(classify(api_error(429)), RETRYABLE)
+        self.assertEqual(classify(api_error(504)), AMBIGUOUS)
+        self.assertEqual(classify(api_error(20001)), FATAL)
+        self.assertEqual(classify(requests.exceptions.ConnectTimeout()), RETRYABLE)
+        self.assertEqual(classify(requests.exceptions.ReadTimeout()), AMBIGUOUS)
+        self.assertEqual(classify(ValueError()), FATAL)
+
+
+class TestOrderRetries(unittest.TestCase):
+    def test_generates_client_order_id_and_retries(self):
+        client = retrying_client(post=[api_error(429), lambda endpoint, params: order(params['client_order_id'])])
+        placed = client.create_spot_order('ETHBTC', 'sell', '0.012', price='0.046001')
+        sent_ids = [params['client_order_id'] for _, _, params in client.httpClient.requests]
+        self.assertEqual(len(sent_ids[0]), 32)
+        self.assertEqual(sent_ids, [sent_ids[0]] * 2)
+        self.assertEqual(placed.client_order_id, sent_ids[0])
+        self.assertEqual(client.retry_policy.stats().retries, 1)
+
+    def test_ambiguous_failure_finds_the_placed_order(self):
+        client = retrying_client(
+            post=[requests.exceptions.ReadTimeout()],
+            get=[lambda endpoint, params: order(endpoint.split('/')[-1])])
+        placed = client.create_spot_order('ETHBTC', 'sell', '0.012', client_order_id='abc', price='0.046001')
+        self.assertEqual(placed.client_order_id, 'abc')
+        self.assertEqual([request[:2] for request in client.httpClient.requests],
+                         [('post', 'spot/order'), ('get', 'spot/order/abc')])
+        self.assertEqual(client.retry_policy.stats().recovered, 1)
+
+    def test_ambiguous_failure_sends_again_if_not_placed(self):
+        client = retrying_client(
+            post=[api_error(504), order('abc')],
+            get=[api_error(20002), []])
+        placed = client.create_spot_order('ETHBTC', 'sell', '0.012', client_order_id='abc', price='0.046001')
+        self.assertEqual(placed.client_order_id, 'abc')
+        self.assertEqual([request[:2] for request in client.httpClient.requests],
+                         [('post', 'spot/order'), ('get', 'spot/order/abc'),
+                          ('get', 'spot/history/order'), ('post', 'spot/order')])
+
+    def test_duplicate_after_ambiguous_failure_finds_filled_order(self):
+        filled = dict(order('abc'), status='filled')
+        client = retrying_client(
+            post=[requests.exceptions.ConnectionError(), api_error(20008)],
+            get=[api_error(20002), [], api_error(20002), [order('other'), filled]])
+        placed = client.create_spot_order('ETHBTC', 'sell', '0.012', client_order_id='abc', price='0.046001')
+        self.assertEqual(placed.status, 'filled')
+
+    def test_fatal_errors_are_raised(self):
+        client = retrying_client(post=[api_error(20001)])
+        with self.assertRaises(CryptomarketAPIException):
+            client.create_spot_order('ETHBTC', 'sell', '0.012', price='0.046001')
+        self.assertEqual(len(client.httpClient.requests), 1)
+
+    def test_gives_up_after_max_attempts(self):
+        client = retrying_client(post=[api_error(503)] * 5)
+        with self.assertRaises(CryptomarketAPIException):
+            client.create_spot_order('ETHBTC', 'sell', '0.012', price='0.046001')
+        self.assertEqual(client.retry_policy.stats().failed, 1)
+
+    def test_order_list(self):
+        client = retrying_client(
+            post=[requests.exceptions.ReadTimeout()],
+            get=[lambda endpoint, params: order(endpoint.split('/')[-1])] * 2)
+        orders = client.create_spot_order_list('allOrNone', [
+            OrderRequest(symbol='ETHBTC', side='sell', quantity='0.012', price='0.046001'),
+            OrderRequest(symbol='ETHBTC', side='buy', quantity='0.012', price='0.04', client_order_id='second'),
+        ])
+        params = client.httpClient.requests[0][2]
+        self.assertEqual(params['order_list_id'], params['orders'][0]['client_order_id'])
+        self.assertEqual([placed.client_order_id for placed in orders],
+                         [params['order_list_id'], 'second'])
+
+    def test_replace(self):
+        client = retrying_client(
+            patch=[requests.exceptions.ReadTimeout(), api_error(20002)],
+            get=[api_error(20002), [], lambda endpoint, params: order('new')])
+        placed = client.replace_spot_order('old', 'new', '0.012', price='0.046')
+        self.assertEqual(placed.client_order_id, 'new')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptomarket.http_client import HttpClient
+from cryptomarket.single_flight import SingleFlight
+
+
+class SlowResponse:
+    status_code = 200
+    content = b'{"ask": "0.05"}'
+
+
+class SlowSession:
+    def __init__(self):
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        with self.lock:
+            self.requests += 1
+        time.sleep(0.1)
+        return SlowResponse()
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_shares_result(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def call():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: single_flight.do('key', call), range(8)))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        stats = single_flight.stats()
+        self.assertEqual((stats.requests, stats.coalesced), (8, 7))
+        self.assertAlmostEqual(stats.ratio, 7 / 8)
+
+    def test_shares_error(self):
+        single_flight = SingleFlight()
+
+        def call():
+            time.sleep(0.1)
+            raise ValueError('failed')
+
+        def do(_):
+            try:
+                single_flight.do('key', call)
+            except ValueError as error:
+                return error
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            errors = list(executor.map(do, range(4)))
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+        self.assertEqual(single_flight.do('key', lambda: 'next call'), 'next call')
+
+
+class TestHttpClientCoalescing(unittest.TestCase):
+    def test_identical_gets(self):
+        http_client = HttpClient('', '', coalesce=True)
+        http_client.session = SlowSession()
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            params = [{'symbols': ['ETHBTC']}] * 4 + [{'symbols': ['EOSETH']}] * 2
+            results = list(executor.map(lambda param: http_client.get('public/ticker', param), params))
+        self.assertEqual(results[0], {'ask': '0.05'})
+        self.assertEqual(http_client.session.requests, 2)
+        self.assertEqual(http_client.coalescing_stats().coalesced, 4)
+
+    def test_off_by_default(self):
+        self.assertIsNone(HttpClient('', '').coalescing_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import dataclasses
+import inspect
+import pickle
+import subprocess
+import sys
+import unittest
+
+import cryptomarket.dataclasses as dataclasses_module
+from cryptomarket.converter import from_dict
+from cryptomarket.dataclasses import Candle, OrderBookLevel, Report
+from cryptomarket.dataclasses.slots import frozen
+
+CANDLE = Candle(timestamp='2021-06-20T20:00:00.000Z', open='0.050459', close='0.050087',
+                min='0.05', max='0.050511', volume='1326.628', volume_quote='66.555987736')
+
+
+class TestSlots(unittest.TestCase):
+    def test_every_model_is_slotted(self):
+        for name, data_class in inspect.getmembers(dataclasses_module, dataclasses.is_dataclass):
+            with self.subTest(name):
+                self.assertEqual(data_class.__slots__,
+                                 tuple(field.name for field in dataclasses.fields(data_class)))
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(CANDLE, '__dict__'))
+        with self.assertRaises(AttributeError):
+            CANDLE.unknown = 1
+
+    def test_api(self):
+        self.assertEqual(dataclasses.asdict(CANDLE)['open'], '0.050459')
+        self.assertEqual(dataclasses.replace(CANDLE, open='1').open, '1')
+        report = from_dict(Report, {
+            'id': 1, 'client_order_id': 'a', 'symbol': 'ETHBTC', 'side': 'buy', 'status': 'new', 'type': 'limit',
+            'time_in_force': 'GTC', 'quantity': '0.01', 'quantity_cumulative': '0', 'post_only': False,
+            'created_at': '', 'updated_at': ''})
+        self.assertIsNone(report.price)
+
+    def test_pickle(self):
+        for value in [CANDLE, OrderBookLevel('1', '2'), [CANDLE, CANDLE]]:
+            self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+
+    def test_frozen(self):
+        FrozenCandle = frozen(Candle)
+        self.assertIs(frozen(Candle), FrozenCandle)
+        candle = FrozenCandle(**dataclasses.asdict(CANDLE))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            candle.open = '1'
+        self.assertEqual(len({candle, FrozenCandle(**dataclasses.asdict(CANDLE))}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(candle)), candle)
+        self.assertFalse(hasattr(candle, '__dict__'))
+        self.assertEqual(from_dict(FrozenCandle, dataclasses.asdict(CANDLE)), candle)
+
+    def test_frozen_unpickled_in_another_process(self):
+        candle = frozen(Candle)(**dataclasses.asdict(CANDLE))
+        result = subprocess.run(
+            [sys.executable, '-c', 'import pickle, sys; print(pickle.loads(sys.stdin.buffer.read()).open)'],
+            input=pickle.dumps(candle), capture_output=True, check=True)
+        self.assertEqual(result.stdout.decode().strip(), CANDLE.open)
+
+
+if __name__ == '__main__':
+    unittest.main()
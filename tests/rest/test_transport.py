@@ -0,0 +1,124 @@
+import asyncio
+import time
+import unittest
+from base64 import b64decode
+from urllib.parse import parse_qs
+
+from cryptomarket.async_client import AsyncClient
+from cryptomarket.client import Client
+from cryptomarket.exceptions import CryptomarketAPIException
+from cryptomarket.hmac_auth import HmacAuth
+from cryptomarket.metrics import RequestMetrics
+from cryptomarket.transport import AsyncHttp2Transport, Http2Transport, httpx
+
+TICKER = {'ask': '0.050043', 'bid': '0.050042', 'last': '0.050042', 'low': '0.047052', 'high': '0.051679',
+          'open': '0.047800', 'volume': '36456.720', 'volume_quote': '1782.625000',
+          'timestamp': '2021-06-12T14:57:19.999Z'}
+
+
+def check_signature(request: 'httpx.Request', api_key: str, secret_key: str):
+    """raises an AssertionError if the request is not signed as the exchange expects"""
+    key, signature, timestamp = b64decode(request.headers['Authorization'][len('HS256 '):]).decode().split(':')
+    assert key == api_key
+    path, _, query = request.url.raw_path.decode().partition('?')
+    message = f'{request.method}{path}?{query}' if query else f'{request.method}{path}'
+    expected = HmacAuth.get_signature(message + request.content.decode() + timestamp, secret_key)
+    assert signature == expected, 'wrong signature'
+
+
+class FakeExchange:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: 'httpx.Request') -> 'httpx.Response':
+        self.requests.append(request)
+        check_signature(request, 'key', 'secret')
+        if request.url.path.endswith('/public/ticker/NOTASYMBOL'):
+            return httpx.Response(400, json={'error': {'code': 2001, 'message': 'Symbol not found'}})
+        if request.url.path.endswith('/public/ticker/ETHBTC'):
+            return httpx.Response(200, json=TICKER)
+        return httpx.Response(200, json={'ETHBTC': TICKER, 'EOSETH': TICKER})
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestHttp2Transport(unittest.TestCase):
+    def setUp(self):
+        self.exchange = FakeExchange()
+        transport = Http2Transport(transport=httpx.MockTransport(self.exchange))
+        self.client = Client('key', 'secret', transport=transport)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_signed_requests(self):
+        self.assertEqual(self.client.get_ticker('ETHBTC').ask, '0.050043')
+        self.assertEqual(set(self.client.get_tickers(['ETHBTC', 'EOSETH'])), {'ETHBTC', 'EOSETH'})
+        query = parse_qs(self.exchange.requests[-1].url.query.decode())
+        self.assertEqual(query, {'symbols': ['ETHBTC,EOSETH']})
+        self.client.httpClient.patch('sub-account/acl', {'sub_account_ids': 'a,b', 'deposit_address_generation_enabled': True})
+        request = self.exchange.requests[-1]
+        self.assertEqual(request.headers['Content-Type'], 'application/x-www-form-urlencoded')
+        self.assertEqual(parse_qs(request.content.decode())['deposit_address_generation_enabled'], ['True'])
+
+    def test_errors(self):
+        with self.assertRaises(CryptomarketAPIException) as context:
+            self.client.get_ticker('NOTASYMBOL')
+        self.assertEqual(context.exception.code, 2001)
+
+    def test_stream(self):
+        tickers = dict(self.client.httpClient.stream_get('public/ticker/'))
+        self.assertEqual(set(tickers), {'ETHBTC', 'EOSETH'})
+
+    def test_keep_alive_survives_failed_pings(self):
+        pings = []
+
+        def unreachable(request):
+            pings.append(request)
+            if len(pings) > 1:
+                raise httpx.ConnectError('unreachable', request=request)
+            return httpx.Response(200)
+        client = Client('key', 'secret', transport=Http2Transport(transport=httpx.MockTransport(unreachable)))
+        try:
+            client.warm_up(keep_alive_interval=0.01)
+            deadline = time.monotonic() + 5
+            while len(pings) < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            client.close()
+        self.assertGreaterEqual(len(pings), 4)
+
+    def test_metrics(self):
+        transport = Http2Transport(transport=httpx.MockTransport(self.exchange))
+        client = Client('key', 'secret', transport=transport, metrics=RequestMetrics())
+        try:
+            self.assertEqual(client.get_ticker('ETHBTC').ask, '0.050043')
+        finally:
+            client.close()
+        self.assertEqual(sorted(client.stats()['public/ticker/{symbol}']), ['build', 'convert', 'decode', 'network', 'sign'])
+        check_signature(self.exchange.requests[-1], 'key', 'secret')
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncHttp2Transport(unittest.TestCase):
+    def test_signed_requests(self):
+        exchange = FakeExchange()
+
+        async def handler(request):
+            return exchange(request)
+
+        async def fan_out():
+            transport = AsyncHttp2Transport(transport=httpx.MockTransport(handler))
+            async with AsyncClient('key', 'secret', transport=transport) as client:
+                tickers = await asyncio.gather(*[client.get_ticker('ETHBTC') for _ in range(5)])
+                with self.assertRaises(CryptomarketAPIException):
+                    await client.get_ticker('NOTASYMBOL')
+                streamed = [key async for key, _ in client.httpClient.stream_get('public/ticker/')]
+            return tickers, streamed
+        tickers, streamed = asyncio.run(fan_out())
+        self.assertEqual([ticker.bid for ticker in tickers], ['0.050042'] * 5)
+        self.assertEqual(streamed, ['ETHBTC', 'EOSETH'])
+        self.assertEqual(len(exchange.requests), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
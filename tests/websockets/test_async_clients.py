@@ -0,0 +1,145 @@
+import asyncio
+import unittest
+
+from cryptomarket.args import OrderRequest
+from cryptomarket.exceptions import (CryptomarketAPIException,
+                                     CryptomarketSDKException)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    from cryptomarket.mock_exchange import API_KEY, API_SECRET, MockExchange
+    from cryptomarket.websockets import (AsyncMarketDataClient,
+                                         AsyncTradingClient,
+                                         AsyncWalletClient)
+
+
+def run(coroutine, timeout=10):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout))
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncClients(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.exchange = MockExchange(market_data_rate=50, fill_probability=0, seed=1).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exchange.stop()
+
+    def test_order_book_subscription(self):
+        async def first_notifications():
+            async with AsyncMarketDataClient(base_url=self.exchange.ws_url) as client:
+                subscription = await client.subscribe_to_full_order_book(symbols=['ETHBTC'])
+                self.assertEqual(subscription.result, ['ETHBTC'])
+                notifications = []
+                async for order_books, notification_type in subscription:
+                    notifications.append((notification_type, order_books['ETHBTC'].s))
+                    if len(notifications) == 3:
+                        break
+                return notifications
+        notifications = run(first_notifications())
+        self.assertEqual([notification_type for notification_type, _ in notifications], ['snapshot', 'update', 'update'])
+        sequence = notifications[0][1]
+        self.assertEqual([s for _, s in notifications], [sequence, sequence + 1, sequence + 2])
+
+    def test_many_subscriptions_on_one_connection(self):
+        async def one_of_each():
+            async with AsyncMarketDataClient(base_url=self.exchange.ws_url) as client:
+                tickers = await client.subscribe_to_ticker('1s', symbols=['ETHBTC'])
+                tops = await client.subscribe_to_top_of_book_in_batch('100ms', symbols=['ETHBTC', 'EOSETH'])
+                (ticker, _), (top, _) = await asyncio.gather(tickers.__anext__(), tops.__anext__())
+                await client.unsubscribe(tickers)
+                return ticker, top, [item async for item in tickers]
+        ticker, top, after_unsubscribe = run(one_of_each())
+        self.assertEqual(list(ticker), ['ETHBTC'])
+        self.assertEqual(sorted(top), ['EOSETH', 'ETHBTC'])
+        # the iteration ends, after the notifications queued before the unsubscription
+        self.assertTrue(all(notification_type == 'data' for _, notification_type in after_unsubscribe))
+
+    def test_unsubscribe_removes_only_the_keys_of_the_subscription(self):
+        async def subscribe_twice():
+            async with AsyncMarketDataClient(base_url=self.exchange.ws_url) as client:
+                btc = await client.subscribe_to_price_rates('1s', 'ETH', currencies=['BTC'])
+                eos = await client.subscribe_to_price_rates('1s', 'ETH', currencies=['EOS'])
+                rates_left = await client.unsubscribe(btc)
+                tickers = await client.subscribe_to_ticker('1s', symbols=['ETHBTC', 'EOSETH'])
+                tickers_left = await client.unsubscribe(tickers)
+                await client.unsubscribe(eos)
+                return rates_left, tickers_left
+        rates_left, tickers_left = run(subscribe_twice())
+        self.assertEqual(rates_left, ['EOS'])
+        self.assertEqual(tickers_left, [])
+
+    def test_iteration_ends_on_close(self):
+        async def close_while_iterating():
+            client = AsyncMarketDataClient(base_url=self.exchange.ws_url)
+            await client.connect()
+            subscription = await client.subscribe_to_trades(symbols=['ETHBTC'])
+            asyncio.get_running_loop().call_later(0.1, lambda: asyncio.ensure_future(client.close()))
+            return [item async for item in subscription]
+        self.assertIsInstance(run(close_while_iterating()), list)
+
+    def test_trading_requests_and_reports(self):
+        async def place_and_cancel():
+            async with AsyncTradingClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url) as client:
+                reports = await client.subscribe_to_reports()
+                snapshot, notification_type = await reports.__anext__()
+                self.assertEqual((snapshot, notification_type), ([], 'snapshot'))
+                created = await client.create_spot_order(
+                    'ETHBTC', 'sell', '1', price='1', client_order_id='async-order')
+                with self.assertRaises(CryptomarketAPIException) as context:
+                    await client.create_spot_order('ETHBTC', 'sell', '1', price='1', client_order_id='async-order')
+                self.assertEqual(context.exception.code, 20008)
+                canceled = await client.cancel_spot_order('async-order')
+                statuses = [(await reports.__anext__())[0][0].status for _ in range(2)]
+                order_list = await client.create_spot_order_list('allOrNone', [
+                    OrderRequest('ETHBTC', 'sell', '1', price='1', client_order_id='listed-1'),
+                    OrderRequest('EOSETH', 'sell', '1', price='1', client_order_id='listed-2'),
+                ], order_list_id='listed-1')
+                await client.cancel_spot_orders()
+                balance = await client.get_spot_trading_balance('ETH')
+                return created, canceled, statuses, order_list, balance
+        created, canceled, statuses, order_list, balance = run(place_and_cancel())
+        self.assertEqual((created.status, canceled.status), ('new', 'canceled'))
+        self.assertEqual(statuses, ['new', 'canceled'])
+        self.assertEqual([report.client_order_id for report in order_list], ['listed-1', 'listed-2'])
+        self.assertEqual(balance.reserved, '0')
+
+    def test_wallet_requests_are_concurrent(self):
+        async def balances_and_transactions():
+            async with AsyncWalletClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url) as client:
+                return await asyncio.gather(client.get_wallet_balances(), client.get_transactions())
+        balances, transactions = run(balances_and_transactions())
+        self.assertEqual(len(balances), len(transactions))
+
+    def test_failed_authentication_raises(self):
+        async def connect():
+            await AsyncWalletClient(API_KEY, 'not the secret', base_url=self.exchange.ws_url).connect()
+        with self.assertRaises(CryptomarketAPIException) as context:
+            run(connect())
+        self.assertEqual(context.exception.code, 1002)
+
+    def test_clients_share_a_session(self):
+        async def two_clients():
+            async with aiohttp.ClientSession() as session:
+                market_data = AsyncMarketDataClient(base_url=self.exchange.ws_url, session=session)
+                wallet = AsyncWalletClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url, session=session)
+                await asyncio.gather(market_data.connect(), wallet.connect())
+                await asyncio.gather(market_data.close(), wallet.close())
+                return session.closed
+        self.assertFalse(run(two_clients()))
+
+    def test_requests_fail_when_not_connected(self):
+        async def request():
+            await AsyncTradingClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url).get_spot_trading_balances()
+        with self.assertRaises(CryptomarketSDKException):
+            run(request())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import socket
+import time
+import unittest
+
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.websockets import MarketDataClient, TradingClient
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    from cryptomarket.mock_exchange import API_KEY, API_SECRET, MockExchange
+    from cryptomarket.websockets import AsyncWalletClient
+
+
+def closed_port_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f'ws://127.0.0.1:{port}/api/3/ws/'
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestConnect(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.exchange = MockExchange(seed=1).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exchange.stop()
+
+    def test_connect_returns_once_open(self):
+        client = MarketDataClient(base_url=self.exchange.ws_url)
+        started = time.perf_counter()
+        self.assertIsNone(client.connect())
+        elapsed = time.perf_counter() - started
+        client.close()
+        self.assertLess(elapsed, 0.5)
+        stats = client.connection_stats()
+        self.assertEqual(stats['connect'].count, 1)
+        self.assertLessEqual(stats['connect'].max, elapsed)
+        self.assertEqual(stats['authenticate'].count, 0)
+
+    def test_authenticated_connect_returns_once_logged_in(self):
+        client = TradingClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url)
+        started = time.perf_counter()
+        self.assertIsNone(client.connect())
+        elapsed = time.perf_counter() - started
+        self.assertTrue(client.authed)
+        client.close()
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(client.connection_stats()['authenticate'].count, 1)
+
+    def test_failed_authentication_returns_at_once(self):
+        client = TradingClient(API_KEY, 'not the secret', base_url=self.exchange.ws_url)
+        started = time.perf_counter()
+        error = client.connect()
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(error.code, 1002)
+        self.assertEqual(client.connection_stats()['authenticate'].count, 0)
+
+    def test_refused_connection_returns_at_once(self):
+        client = MarketDataClient(base_url=closed_port_url())
+        started = time.perf_counter()
+        error = client.connect(timeout=10)
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertIsInstance(error, CryptomarketSDKException)
+        self.assertTrue(error.message.startswith('connection failed'))
+
+    def test_async_connect_latencies(self):
+        async def connect():
+            async with AsyncWalletClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url) as client:
+                return client.connection_stats()
+        stats = asyncio.run(connect())
+        self.assertEqual((stats['connect'].count, stats['authenticate'].count), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import queue
+import unittest
+
+from cryptomarket.dataclasses.orderBookLevel import OrderBookLevel
+from cryptomarket.dataclasses.wsOrderBook import WSOrderBook
+from cryptomarket.exceptions import CryptomarketSDKException
+from cryptomarket.websockets import LocalOrderBook, MarketDataClient
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    from cryptomarket.mock_exchange import MockExchange
+
+
+def order_book(sequence, asks=(), bids=()):
+    return WSOrderBook(t=sequence * 1000, s=sequence,
+                       a=[OrderBookLevel(price, quantity) for price, quantity in asks],
+                       b=[OrderBookLevel(price, quantity) for price, quantity in bids])
+
+
+def levels(levels):
+    return [(level.price, level.quantity) for level in levels]
+
+
+class TestLocalOrderBook(unittest.TestCase):
+    def setUp(self):
+        self.book = LocalOrderBook('ETHBTC')
+        self.book.apply_snapshot(order_book(
+            10,
+            asks=[('0.0502', '2'), ('0.0501', '1'), ('0.0503', '3')],
+            bids=[('0.0499', '1'), ('0.0498', '2'), ('0.0497', '3')]))
+
+    def test_snapshot(self):
+        self.assertTrue(self.book.synced)
+        self.assertEqual((self.book.sequence, self.book.timestamp), (10, 10000))
+        self.assertEqual(levels([self.book.best_ask(), self.book.best_bid()]), [('0.0501', '1'), ('0.0499', '1')])
+        self.assertEqual(levels(self.book.asks()), [('0.0501', '1'), ('0.0502', '2'), ('0.0503', '3')])
+        self.assertEqual(levels(self.book.bids(2)), [('0.0499', '1'), ('0.0498', '2')])
+        self.assertEqual(self.book.bids(0), [])
+
+    def test_updates_add_change_and_remove_levels(self):
+        self.assertTrue(self.book.apply_update(order_book(
+            11, asks=[('0.0501', '0'), ('0.0504', '4')], bids=[('0.05', '5'), ('0.0498', '0.5')])))
+        self.assertEqual(levels(self.book.asks()), [('0.0502', '2'), ('0.0503', '3'), ('0.0504', '4')])
+        self.assertEqual(levels(self.book.bids()), [('0.05', '5'), ('0.0499', '1'), ('0.0498', '0.5'), ('0.0497', '3')])
+        self.assertTrue(self.book.apply_update(order_book(12, bids=[('0.0500', '0'), ('0.06', '0')])))
+        self.assertEqual(self.book.best_bid().price, '0.0499')
+        self.assertEqual(self.book.sequence, 12)
+
+    def test_old_updates_are_ignored(self):
+        self.assertTrue(self.book.apply_update(order_book(10, asks=[('0.0501', '0')])))
+        self.assertEqual(self.book.best_ask().price, '0.0501')
+
+    def test_gap_leaves_the_book_out_of_sync(self):
+        self.assertFalse(self.book.apply_update(order_book(12, asks=[('0.0501', '0')])))
+        self.assertFalse(self.book.synced)
+        self.assertFalse(self.book.apply_update(order_book(13)))
+        self.assertEqual(self.book.best_ask().price, '0.0501')
+        self.book.apply_snapshot(order_book(20, asks=[('0.06', '1')]))
+        self.assertTrue(self.book.synced)
+        self.assertIsNone(self.book.best_bid())
+
+    def test_updates_before_a_snapshot_are_not_applied(self):
+        book = LocalOrderBook('ETHBTC')
+        self.assertFalse(book.apply_update(order_book(1, asks=[('1', '1')])))
+        self.assertIsNone(book.best_ask())
+
+    def test_levels_as_received(self):
+        book = LocalOrderBook('ETHBTC')
+        book.apply_snapshot({'t': 1, 's': 5, 'a': [['0.0502', '2'], ['0.0501', '1']], 'b': [['0.0499', '1']]})
+        self.assertTrue(book.apply_update({'t': 2, 's': 6, 'a': [['0.0501', '0.000']], 'b': [['0.0500', '3']]}))
+        self.assertEqual(levels(book.asks()), [('0.0502', '2')])
+        self.assertEqual(levels(book.bids()), [('0.0500', '3'), ('0.0499', '1')])
+        self.assertFalse(book.apply_update({'t': 3, 's': 8, 'a': [], 'b': []}))
+
+    def test_prices_with_more_decimals_raise_the_scale(self):
+        self.assertEqual(self.book.price_scale, 4)
+        self.assertTrue(self.book.apply_update(order_book(11, asks=[('0.05015', '5')], bids=[('0.04985', '5')])))
+        self.assertEqual(self.book.price_scale, 5)
+        self.assertEqual(levels(self.book.asks(3)), [('0.0501', '1'), ('0.05015', '5'), ('0.0502', '2')])
+        self.assertEqual(levels(self.book.bids(3)), [('0.0499', '1'), ('0.04985', '5'), ('0.0498', '2')])
+        self.assertEqual(self.book.volume_to_price('ask', '0.050155'), '6')
+        book = LocalOrderBook('ETHBTC', price_scale=6)
+        book.apply_snapshot(order_book(1, asks=[('0.05', '1')]))
+        self.assertEqual(book.price_scale, 6)
+
+    def test_volume_queries(self):
+        self.assertEqual(self.book.price_for_volume('ask', '1'), '0.0501')
+        self.assertEqual(self.book.price_for_volume('ask', '2.5'), '0.0502')
+        self.assertIsNone(self.book.price_for_volume('ask', '7'))
+        self.assertEqual(self.book.price_for_volume('bid', '3'), '0.0498')
+        self.assertEqual(self.book.volume_to_price('ask', '0.0502'), '3')
+        self.assertEqual(self.book.volume_to_price('bid', '0.04975'), '3')
+        self.assertEqual(self.book.volume_to_price('bid', '0.05'), '0')
+        with self.assertRaises(CryptomarketSDKException):
+            self.book.volume_to_price('buy', '1')
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestLocalOrderBooks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.exchange = MockExchange(market_data_rate=50, seed=1).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exchange.stop()
+
+    def test_books_match_the_snapshots_of_the_exchange(self):
+        states = queue.Queue()
+        client = MarketDataClient(base_url=self.exchange.ws_url)
+        self.assertIsNone(client.connect())
+        snapshots = queue.Queue()
+        other = MarketDataClient(base_url=self.exchange.ws_url)
+        self.assertIsNone(other.connect())
+        try:
+            books = client.subscribe_to_local_order_books(
+                ['ETHBTC', 'EOSETH'],
+                lambda book, notification_type: states.put(
+                    (book.symbol, book.sequence, levels(book.asks()), levels(book.bids()))))
+            symbol, sequence, _, _ = states.get(timeout=5)
+            for _ in range(10):
+                states.get(timeout=5)
+            # a snapshot of a later sequence than the first state of the books
+            other.subscribe_to_full_order_book(
+                lambda feed, notification_type: snapshots.put(feed['ETHBTC']), symbols=['ETHBTC'])
+            snapshot = snapshots.get(timeout=5)
+            self.assertGreater(snapshot.s, sequence)
+            while True:
+                symbol, sequence, asks, bids = states.get(timeout=5)
+                if symbol == 'ETHBTC' and sequence == snapshot.s:
+                    break
+        finally:
+            client.close()
+            other.close()
+        self.assertEqual((asks, bids), (levels(snapshot.a), levels(snapshot.b)))
+        self.assertEqual(books.gaps, 0)
+
+    def test_gap_subscribes_again(self):
+        notifications = queue.Queue()
+        client = MarketDataClient(base_url=self.exchange.ws_url)
+        self.assertIsNone(client.connect())
+        try:
+            books = client.subscribe_to_local_order_books(
+                ['ETHBTC'], lambda book, notification_type: notifications.put(notification_type))
+            self.assertEqual(notifications.get(timeout=5), 'snapshot')
+            book = books['ETHBTC']
+            sequence = book.sequence
+            books._on_feed({'ETHBTC': {'t': 0, 's': sequence + 100, 'a': [], 'b': []}}, 'update')
+            self.assertEqual(books.gaps, 1)
+            while notifications.get(timeout=5) != 'snapshot':
+                pass
+            self.assertTrue(book.synced)
+            self.assertGreaterEqual(book.sequence, sequence)
+        finally:
+            client.close()
+        self.assertEqual(len(client._subscription_payloads['orderbook/full']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
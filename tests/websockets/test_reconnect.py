@@ -0,0 +1,125 @@
+import queue
+import threading
+import unittest
+
+from cryptomarket.websockets import (MarketDataClient, ReconnectPolicy,
+                                     TradingClient)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    from cryptomarket.mock_exchange import API_KEY, API_SECRET, MockExchange
+
+
+class TestReconnectPolicy(unittest.TestCase):
+    def test_delay_is_bounded_by_the_backoff(self):
+        policy = ReconnectPolicy(base_delay=0.5, max_delay=3)
+        for attempt, bound in [(0, 0.5), (1, 1), (2, 2), (3, 3), (10, 3)]:
+            for _ in range(50):
+                self.assertLessEqual(policy.delay(attempt), bound)
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestReconnect(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.exchange = MockExchange(market_data_rate=50, fill_probability=0, seed=1).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exchange.stop()
+
+    def test_market_data_subscriptions_are_replayed(self):
+        policy = ReconnectPolicy(base_delay=0.01)
+        events = queue.Queue()
+        client = MarketDataClient(base_url=self.exchange.ws_url, reconnect_policy=policy,
+                                  on_reconnect=lambda downtime: events.put(('reconnect', downtime)))
+        self.assertIsNone(client.connect())
+        try:
+            client.subscribe_to_full_order_book(
+                lambda books, notification_type: events.put((notification_type, sorted(books))), symbols=['ETHBTC'])
+            client.subscribe_to_full_order_book(
+                lambda books, notification_type: events.put((notification_type, sorted(books))), symbols=['EOSETH'])
+            snapshots = set()
+            while snapshots != {'ETHBTC', 'EOSETH'}:
+                event, symbols = events.get(timeout=5)
+                if event == 'snapshot':
+                    snapshots.update(symbols)
+            self.assertEqual(self.exchange.drop_connections(), 1)
+
+            event, downtime = events.get(timeout=5)
+            while event != 'reconnect':
+                event, downtime = events.get(timeout=5)
+            snapshots = set()
+            while snapshots != {'ETHBTC', 'EOSETH'}:
+                event, symbols = events.get(timeout=5)
+                self.assertNotEqual(event, 'reconnect')
+                if event == 'snapshot':
+                    snapshots.update(symbols)
+        finally:
+            client.close()
+        stats = policy.stats()
+        self.assertEqual((stats.reconnects, stats.attempts, stats.failed), (1, 1, 0))
+        self.assertEqual(stats.last_downtime, downtime)
+        self.assertGreater(downtime, 0)
+
+    def test_trading_client_authenticates_again(self):
+        policy = ReconnectPolicy(base_delay=0.01)
+        reports = queue.Queue()
+        client = TradingClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url, reconnect_policy=policy)
+        self.assertIsNone(client.connect())
+        try:
+            client.subscribe_to_reports(lambda feed, notification_type: reports.put(notification_type))
+            self.assertEqual(reports.get(timeout=5), 'snapshot')
+            self.exchange.drop_connections()
+            self.assertEqual(reports.get(timeout=5), 'snapshot')
+            self.assertTrue(client.authed)
+
+            created = queue.Queue()
+            client.get_spot_trading_balances(lambda err, balances: created.put(err))
+            self.assertIsNone(created.get(timeout=5))
+        finally:
+            client.close()
+        self.assertEqual(policy.stats().reconnects, 1)
+
+    def test_close_stops_the_reconnection(self):
+        policy = ReconnectPolicy(base_delay=60)
+        closed = threading.Event()
+        client = MarketDataClient(base_url=self.exchange.ws_url, reconnect_policy=policy,
+                                  on_close=lambda code, message: closed.set())
+        self.assertIsNone(client.connect())
+        self.exchange.drop_connections()
+        self.assertTrue(closed.wait(5))
+        client.close()
+        self.assertEqual(policy.stats().attempts, 0)
+
+    def test_pending_requests_fail_when_the_connection_is_lost(self):
+        errors = queue.Queue()
+        client = TradingClient(API_KEY, API_SECRET, base_url=self.exchange.ws_url)
+        self.assertIsNone(client.connect())
+        client._callback_cache.save_callback(lambda err, result: errors.put(err))
+        self.exchange.drop_connections()
+        self.assertEqual(errors.get(timeout=5).message, 'websocket connection lost')
+        self.assertFalse(client.authed)
+        client.close()
+
+    def test_attempts_run_out(self):
+        exchange = MockExchange().start()
+        errors = queue.Queue()
+        policy = ReconnectPolicy(max_attempts=2, base_delay=0.01, timeout=1)
+        client = MarketDataClient(base_url=exchange.ws_url, reconnect_policy=policy, on_error=errors.put)
+        self.assertIsNone(client.connect())
+        exchange.stop()
+        error = errors.get(timeout=5)
+        while 'unable to reconnect' not in str(error):
+            error = errors.get(timeout=5)
+        client.close()
+        stats = policy.stats()
+        self.assertEqual((stats.attempts, stats.failed, stats.reconnects), (2, 1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()